@@ -8,6 +8,7 @@ Provides endpoints for:
 """
 
 import asyncio
+import dataclasses
 import json
 import time
 from pathlib import Path
@@ -15,7 +16,7 @@ from pathlib import Path
 from fastapi import APIRouter, HTTPException, Query, Request
 from sse_starlette.sse import EventSourceResponse
 
-from adkflow_runner import Compiler, RunEvent
+from adkflow_runner.runner.event_hub import Subscription
 
 from backend.src.api.execution_models import (
     RunRequest,
@@ -28,6 +29,7 @@ from backend.src.api.execution_models import (
     UserInputSubmission,
     UserInputSubmissionResponse,
 )
+from backend.src.api.project_compiler import project_compiler
 from backend.src.api.run_manager import run_manager
 
 router = APIRouter(prefix="/api/execution", tags=["execution"])
@@ -78,16 +80,16 @@ async def stream_events(run_id: str, request: Request):
         raise HTTPException(status_code=404, detail=f"Run not found: {run_id}")
 
     async def event_generator():
-        queue: asyncio.Queue[RunEvent | None] | None = None
+        subscription: Subscription | None = None
         try:
-            queue = await run_manager.subscribe(run_id)
+            subscription = await run_manager.subscribe(run_id)
 
             while True:
                 if await request.is_disconnected():
                     break
 
                 try:
-                    event = await asyncio.wait_for(queue.get(), timeout=30)
+                    event = await asyncio.wait_for(subscription.get(), timeout=30)
 
                     if event is None:
                         yield {
@@ -122,8 +124,8 @@ async def stream_events(run_id: str, request: Request):
                 "data": json.dumps({"run_id": run_id}),
             }
         finally:
-            if queue is not None:
-                run_manager.unsubscribe(run_id, queue)
+            if subscription is not None:
+                run_manager.unsubscribe(run_id, subscription)
 
     return EventSourceResponse(event_generator())
 
@@ -186,13 +188,10 @@ async def validate_workflow(request: ValidateRequest) -> ValidateResponse:
             status_code=404, detail=f"Project path not found: {request.project_path}"
         )
 
-    compiler = Compiler()
-
     try:
-        project = compiler.load(project_path)
-        parsed = compiler.parse(project)
-        graph = compiler.build_graph(parsed)
-        result = compiler.validate_graph(graph, project)
+        project, graph, result = await asyncio.to_thread(
+            project_compiler.validate, project_path
+        )
 
         error_node_ids = [
             e.location.node_id
@@ -257,10 +256,8 @@ async def get_topology(request: TopologyRequest) -> TopologyResponse:
             status_code=404, detail=f"Project path not found: {request.project_path}"
         )
 
-    compiler = Compiler()
-
     try:
-        ir = compiler.compile(project_path)
+        ir = await project_compiler.compile_async(project_path)
         mermaid = render_mermaid(ir)
         ascii_tree = render_ascii(ir)
 
@@ -296,6 +293,7 @@ async def list_runs(
                 "status": run_status,
                 "project_path": str(active_run.config.project_path),
                 "event_count": len(active_run.events),
+                "subscribers": [dataclasses.asdict(s) for s in active_run.hub.stats()],
             }
         )
 
@@ -5,7 +5,7 @@ import logging
 import time
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Literal
+from typing import Callable, Literal
 
 logger = logging.getLogger(__name__)
 
@@ -53,8 +53,38 @@ class FileWatcherManager:
         """
         self._poll_interval = poll_interval
         self._watchers: dict[str, WatcherState] = {}
+        self._listeners: list[Callable[[str, FileChangeEvent], None]] = []
         self._lock = asyncio.Lock()
 
+    def add_listener(self, listener: Callable[[str, FileChangeEvent], None]) -> None:
+        """
+        Register a callback invoked for every change event of any project.
+
+        Unlike subscribers, listeners are called synchronously with the
+        project path and the event, and never miss an event to a full queue.
+
+        Args:
+            listener: Callable taking (project_path, event)
+        """
+        self._listeners.append(listener)
+
+    def _broadcast(self, project_path: str, event: FileChangeEvent) -> None:
+        """Deliver an event to listeners and subscriber queues."""
+        for listener in self._listeners:
+            try:
+                listener(project_path, event)
+            except Exception:
+                logger.exception("File change listener failed")
+
+        state = self._watchers.get(project_path)
+        if not state:
+            return
+        for queue in state.subscribers:
+            try:
+                queue.put_nowait(event)
+            except asyncio.QueueFull:
+                logger.warning("Queue full, skipping notification")
+
     async def start_watching(self, project_path: str) -> None:
         """
         Start watching a project directory for file changes.
@@ -172,15 +202,16 @@ class FileWatcherManager:
             file_path: Relative path to the changed file
             change_type: Type of change
         """
+        event = FileChangeEvent(
+            file_path=file_path, change_type=change_type, timestamp=time.time()
+        )
+
         state = self._watchers.get(project_path)
         if not state:
             logger.debug("No watcher for project: %s", project_path)
+            self._broadcast(project_path, event)
             return
 
-        event = FileChangeEvent(
-            file_path=file_path, change_type=change_type, timestamp=time.time()
-        )
-
         # Update mtime cache to avoid duplicate detection in poll
         full_path = state.project_path / file_path
         if full_path.exists():
@@ -193,12 +224,8 @@ class FileWatcherManager:
             file_path,
         )
 
-        # Broadcast to all subscribers
-        for queue in state.subscribers:
-            try:
-                queue.put_nowait(event)
-            except asyncio.QueueFull:
-                logger.warning("Queue full, skipping notification")
+        # Broadcast to listeners and all subscribers
+        self._broadcast(project_path, event)
 
     def _scan_files(self, project_path: Path) -> dict[str, float]:
         """
@@ -297,11 +324,7 @@ class FileWatcherManager:
 
         # Broadcast events
         for event in events:
-            for queue in state.subscribers:
-                try:
-                    queue.put_nowait(event)
-                except asyncio.QueueFull:
-                    pass
+            self._broadcast(project_path, event)
 
 
 # Global singleton instance
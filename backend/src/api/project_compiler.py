@@ -0,0 +1,20 @@
+"""Shared incremental compiler for the execution API.
+
+Validation, topology and runs all compile through one IncrementalCompiler,
+so each reuses the project load of the others. Changes seen by the file
+watcher (polled files and API saves) are forwarded as changed paths.
+"""
+
+from adkflow_runner.compiler import IncrementalCompiler
+
+from backend.src.api.file_watcher import FileChangeEvent, file_watcher_manager
+
+
+def _on_file_change(project_path: str, event: FileChangeEvent) -> None:
+    """Forward a watched file change to the compiler."""
+    project_compiler.notify_changed(project_path, [event.file_path])
+
+
+# Global singleton instance
+project_compiler = IncrementalCompiler()
+file_watcher_manager.add_listener(_on_file_change)
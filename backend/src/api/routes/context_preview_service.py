@@ -1,9 +1,11 @@
 """Context Aggregator Preview Service.
 
 Business logic for previewing context aggregation results.
+
+File contents come from the runner's shared content cache, so previewing
+and running the same aggregator decode each file once.
 """
 
-import glob as glob_module
 import os
 import re
 from datetime import datetime
@@ -11,6 +13,9 @@ from pathlib import Path
 
 import httpx
 
+from adkflow_runner.runner.content_cache import content_cache
+from adkflow_runner.runner.directory_scan import scan_directory
+
 from backend.src.api.routes.context_preview_models import (
     ComputedOutput,
     FileInfo,
@@ -27,6 +32,9 @@ except ImportError:
     GEMTOKEN_AVAILABLE = False
     _TokenCounter = None  # type: ignore
 
+# Files counted at most when previewing a directory
+_PREVIEW_COUNT_LIMIT = 10_000
+
 
 # -----------------------------------------------------------------------------
 # Environment and Configuration Helpers
@@ -225,24 +233,6 @@ def _get_url_metadata(url: str, response: httpx.Response) -> dict[str, str]:
     }
 
 
-def _matches_exclude_pattern(
-    file_path: Path, base_dir: Path, patterns: list[str]
-) -> bool:
-    """Check if a file path matches any exclusion pattern."""
-    try:
-        rel_path = file_path.relative_to(base_dir)
-    except ValueError:
-        return False
-
-    rel_parts = rel_path.parts
-    for pattern in patterns:
-        if pattern in rel_parts:
-            return True
-        if any(Path(part).match(pattern) for part in rel_parts):
-            return True
-    return False
-
-
 # -----------------------------------------------------------------------------
 # Preview Functions
 # -----------------------------------------------------------------------------
@@ -273,7 +263,7 @@ async def preview_file(
             )
 
     try:
-        content = full_path.read_text(encoding="utf-8")
+        content = content_cache.read_text(full_path, fallback=None).content
         content, truncated, total_size = _truncate_content(content, max_size)
 
         metadata = None
@@ -324,24 +314,18 @@ async def preview_directory(
                 error=f"Directory not found: {directory_path}",
             )
 
-    # Handle recursive mode
-    effective_pattern = glob_pattern
-    if recursive and not glob_pattern.startswith("**/"):
-        effective_pattern = f"**/{glob_pattern}"
-
-    pattern = str(full_dir / effective_pattern)
-    files = sorted(glob_module.glob(pattern, recursive=True))
-    files = [Path(f) for f in files if Path(f).is_file()]
-
-    # Apply exclusion patterns
-    if exclude_patterns:
-        files = [
-            f
-            for f in files
-            if not _matches_exclude_pattern(f, full_dir, exclude_patterns)
-        ]
+    # Counting stops at _PREVIEW_COUNT_LIMIT so huge trees stay cheap
+    scan = scan_directory(
+        full_dir,
+        glob_pattern,
+        recursive=recursive,
+        exclude_patterns=exclude_patterns,
+        max_files=max_files,
+        max_file_size=max_file_size,
+        count_limit=max(max_files + 1, _PREVIEW_COUNT_LIMIT),
+    )
 
-    if not files:
+    if not scan.matched and not scan.skipped_large:
         return PreviewResult(
             variableName="",
             content="",
@@ -351,29 +335,18 @@ async def preview_directory(
             error=f"No files matched pattern: {glob_pattern}",
         )
 
-    # Apply limits
+    # Report limits
     warnings: list[str] = []
-    skipped_large = 0
-
-    size_filtered = []
-    for f in files:
-        try:
-            if f.stat().st_size > max_file_size:
-                skipped_large += 1
-            else:
-                size_filtered.append(f)
-        except OSError:
-            continue
-
-    if skipped_large > 0:
+    if scan.skipped_large > 0:
         warnings.append(
-            f"Skipped {skipped_large} file(s) exceeding {max_file_size // 1024}KB"
+            f"Skipped {scan.skipped_large} file(s) exceeding {max_file_size // 1024}KB"
         )
 
-    original_count = len(size_filtered)
-    if len(size_filtered) > max_files:
-        warnings.append(f"Found {len(size_filtered)} files, showing first {max_files}")
-        size_filtered = size_filtered[:max_files]
+    original_count = scan.matched
+    if scan.matched > max_files:
+        found = f"{scan.matched}" if scan.complete else f"{scan.matched}+"
+        warnings.append(f"Found {found} files, showing first {max_files}")
+    size_filtered = [f.path for f in scan.files]
 
     # Read file contents
     file_infos: list[FileInfo] = []
@@ -389,7 +362,7 @@ async def preview_directory(
             rel_path = str(file_path)
 
         try:
-            content = file_path.read_text(encoding="utf-8")
+            content = content_cache.read_text(file_path, fallback=None).content
             content_truncated, _, file_size = _truncate_content(content, per_file_max)
 
             file_infos.append(
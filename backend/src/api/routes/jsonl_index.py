@@ -0,0 +1,305 @@
+"""Incremental line indexes of JSONL files for the explorer routes.
+
+Log and trace files only grow until they are rotated away, so an index of
+their lines is built once and extended on each request:
+- Only complete lines past the indexed end are parsed
+- Indexes are saved in logs/.index/ as one JSONL chunk per refresh and
+  survive restarts
+- Indexes are keyed by inode and a fingerprint of the first line, so a
+  file renamed by rotation (adkflow.jsonl -> adkflow.jsonl.1) keeps its
+  index; a file truncated or replaced in place is indexed again
+
+Subclasses choose what is extracted from each line (_add) and how a
+chunk of extracted values is applied to their in-memory columns (_apply).
+
+Indexes are shared by concurrent requests and refreshed from worker
+threads, so readers hold locked() while they read columns.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from array import array
+from collections import OrderedDict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, ClassVar, Iterator, Sequence, TypeVar
+
+INDEX_DIR_NAME = ".index"
+
+# Bytes of the first line hashed to recognize a file after rotation
+FINGERPRINT_BYTES = 1024
+
+# Lines per saved chunk while indexing a large file
+CHUNK_LINES = 50_000
+
+# File indexes kept in memory across requests
+MAX_CACHED_INDEXES = 32
+
+IndexT = TypeVar("IndexT", bound="JsonlIndex")
+
+
+class JsonlIndex:
+    """Byte offsets of a JSONL file's records plus subclass-defined columns.
+
+    Usage:
+        index = open_index(LogIndex, path)
+        with index.locked():
+            for row, record in index.read_records(rows):
+                ...
+    """
+
+    kind: ClassVar[str] = "jsonl"
+    version: ClassVar[int] = 1
+
+    def __init__(self, path: Path, sidecar: Path) -> None:
+        self.path = path
+        self.sidecar = sidecar
+        self._lock = threading.Lock()
+        self._reset()
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    @contextmanager
+    def locked(self) -> Iterator[None]:
+        """Keep refresh() from changing the columns while reading them."""
+        with self._lock:
+            yield
+
+    def refresh(self) -> None:
+        """Index the complete lines appended since the last refresh."""
+        with self._lock:
+            try:
+                size = self.path.stat().st_size
+            except OSError:
+                return
+            if size < self.end:
+                # Truncated in place: start over
+                self._reset()
+                self.sidecar.unlink(missing_ok=True)
+            if size > self.end:
+                for chunk in self._scan(size):
+                    self._apply_chunk(chunk)
+                    self._save(chunk)
+
+    def read_records(self, rows: Sequence[int]) -> Iterator[tuple[int, dict[str, Any]]]:
+        """Read and parse the records of rows, in the given order."""
+        if not rows:
+            return
+        with open(self.path, "rb") as f:
+            for row in rows:
+                f.seek(self.offsets[row])
+                record = _parse(f.readline())
+                if record is not None:
+                    yield row, record
+
+    def read_lines(self, rows: Iterator[int]) -> Iterator[tuple[int, bytes]]:
+        """Read the raw lines of rows, in the given order."""
+        with open(self.path, "rb") as f:
+            for row in rows:
+                f.seek(self.offsets[row])
+                yield row, f.readline()
+
+    # Subclass interface
+
+    def _reset(self) -> None:
+        """Clear all columns; subclasses clear theirs and call this."""
+        self.end = 0  # Bytes of the file indexed
+        self.line_count = 0  # Lines seen, blank and unparseable included
+        self.offsets = array("q")
+        self.line_numbers = array("l")
+
+    def _add(self, chunk: dict[str, Any], record: dict[str, Any]) -> None:
+        """Extract a record's values into chunk."""
+
+    def _apply(self, chunk: dict[str, Any]) -> None:
+        """Append a chunk's extracted values to the in-memory columns."""
+
+    # Scanning and persistence
+
+    def _new_chunk(self) -> dict[str, Any]:
+        return {"start": self.end, "offsets": [], "line_numbers": []}
+
+    def _scan(self, size: int) -> Iterator[dict[str, Any]]:
+        chunk = self._new_chunk()
+        offset = self.end
+        line_number = self.line_count
+        with open(self.path, "rb") as f:
+            f.seek(offset)
+            for line in f:
+                if offset + len(line) > size or not line.endswith(b"\n"):
+                    break  # Written after stat() or not yet complete
+                offset += len(line)
+                line_number += 1
+                record = _parse(line)
+                if record is None:
+                    continue
+                chunk["offsets"].append(offset - len(line))
+                chunk["line_numbers"].append(line_number)
+                self._add(chunk, record)
+                if len(chunk["offsets"]) >= CHUNK_LINES:
+                    chunk["end"], chunk["line_count"] = offset, line_number
+                    yield chunk
+                    chunk = self._new_chunk()
+                    chunk["start"] = offset
+        if offset > chunk["start"]:
+            chunk["end"], chunk["line_count"] = offset, line_number
+            yield chunk
+
+    def _apply_chunk(self, chunk: dict[str, Any]) -> None:
+        self.offsets.extend(chunk["offsets"])
+        self.line_numbers.extend(chunk["line_numbers"])
+        self._apply(chunk)
+        self.end = chunk["end"]
+        self.line_count = chunk["line_count"]
+
+    def _load(self) -> None:
+        """Restore the index saved in the sidecar, if it is usable."""
+        try:
+            with open(self.sidecar, encoding="utf-8") as f:
+                header = json.loads(f.readline())
+                if header != self._header():
+                    raise ValueError("index from another version")
+                for line in f:
+                    chunk = json.loads(line)
+                    if chunk["start"] != self.end:
+                        raise ValueError("index chunks are not contiguous")
+                    self._apply_chunk(chunk)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError, KeyError, TypeError):
+            self._reset()
+            self.sidecar.unlink(missing_ok=True)
+
+    def _save(self, chunk: dict[str, Any]) -> None:
+        try:
+            self.sidecar.parent.mkdir(parents=True, exist_ok=True)
+            new = not self.sidecar.exists() or chunk["start"] == 0
+            with open(self.sidecar, "w" if new else "a", encoding="utf-8") as f:
+                if new:
+                    f.write(json.dumps(self._header()) + "\n")
+                f.write(json.dumps(chunk, separators=(",", ":")) + "\n")
+        except OSError:
+            # Only costs a rescan after a restart
+            pass
+
+    def _header(self) -> dict[str, Any]:
+        return {"kind": self.kind, "version": self.version}
+
+
+def rotation_set(path: Path) -> list[Path]:
+    """Get a file and its rotated backups (name.1 ... name.N), oldest first."""
+    backups: list[Path] = []
+    i = 1
+    while (backup := path.with_name(f"{path.name}.{i}")).is_file():
+        backups.append(backup)
+        i += 1
+    files = backups[::-1]
+    if path.is_file():
+        files.append(path)
+    return files
+
+
+def open_index(
+    cls: type[IndexT], path: Path, base_name: str | None = None
+) -> IndexT | None:
+    """Get the refreshed index of a file.
+
+    Args:
+        cls: Index class, which decides the indexed columns
+        path: File to index
+        base_name: Name of the file before rotation; defaults to path's name
+
+    Returns:
+        The index, or None for a missing file or one without a complete
+        first line yet
+    """
+    key = _file_key(path)
+    if key is None:
+        return None
+    base_name = base_name or path.name
+    sidecar = path.parent / INDEX_DIR_NAME / f"{base_name}.{cls.kind}.{key}.idx"
+    cache_key = str(sidecar)
+
+    with _cache_lock:
+        index = _cache.get(cache_key)
+        if index is None:
+            index = cls(path, sidecar)
+            index._load()
+            _cache[cache_key] = index
+            while len(_cache) > MAX_CACHED_INDEXES:
+                _cache.popitem(last=False)
+        else:
+            _cache.move_to_end(cache_key)
+        index.path = path  # Renamed by rotation since last use
+    index.refresh()
+    return index  # type: ignore[return-value]
+
+
+def open_indexes(
+    cls: type[IndexT], path: Path, include_rotated: bool = True
+) -> list[IndexT]:
+    """Get the refreshed indexes of a file and its rotated backups, oldest first.
+
+    Saved indexes of this file's rotation set that no longer match any
+    file are deleted.
+    """
+    files = rotation_set(path) if include_rotated else [path]
+    indexes = [
+        index
+        for file in files
+        if (index := open_index(cls, file, base_name=path.name)) is not None
+    ]
+    if include_rotated:
+        _prune(path, cls.kind, {index.sidecar.name for index in indexes})
+    return indexes
+
+
+def clear_cache() -> None:
+    """Forget all in-memory indexes (for testing)."""
+    with _cache_lock:
+        _cache.clear()
+
+
+_cache: OrderedDict[str, JsonlIndex] = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def _file_key(path: Path) -> str | None:
+    try:
+        st = path.stat()
+        with open(path, "rb") as f:
+            head = f.read(FINGERPRINT_BYTES)
+    except OSError:
+        return None
+    newline = head.find(b"\n")
+    if newline >= 0:
+        head = head[: newline + 1]
+    elif len(head) < FINGERPRINT_BYTES:
+        return None
+    return f"{st.st_ino}-{hashlib.sha1(head).hexdigest()[:16]}"
+
+
+def _prune(path: Path, kind: str, keep: set[str]) -> None:
+    index_dir = path.parent / INDEX_DIR_NAME
+    if not index_dir.is_dir():
+        return
+    for sidecar in index_dir.glob(f"{path.name}.{kind}.*.idx"):
+        if sidecar.name not in keep:
+            sidecar.unlink(missing_ok=True)
+            with _cache_lock:
+                _cache.pop(str(sidecar), None)
+
+
+def _parse(line: bytes) -> dict[str, Any] | None:
+    line = line.strip()
+    if not line:
+        return None
+    try:
+        record = json.loads(line)
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return None
+    return record if isinstance(record, dict) else None
@@ -2,19 +2,36 @@
 
 These routes are only registered when ADKFLOW_DEV_MODE=1.
 They provide read access to JSONL log files from the project's logs/ directory.
+
+Queries are answered from an index of each file (see log_index), which is
+extended as the file grows, and cover the file's rotated backups
+(adkflow.jsonl.1 ... .N) too:
+- Entries are paged from the index and only the returned lines are read;
+  newest-first paging starts from the end of the newest file
+- Stats and run listings are served from the index alone
+
+Runs logged with the per-run layout (logs/runs/<run_id>.jsonl) are listed
+from the run index and read from their own file, for the default log file.
 """
 
 from __future__ import annotations
 
+import asyncio
 import json
 from datetime import datetime
-from fnmatch import fnmatch
+from itertools import islice
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator, Literal
 
 from fastapi import APIRouter, HTTPException, Query, status
 from pydantic import BaseModel, Field
 
+from adkflow_runner.logging import read_run_index, run_log_path
+from adkflow_runner.logging.constants import DEFAULT_LOG_FILE_NAME, RUNS_DIR_NAME
+
+from backend.src.api.routes.jsonl_index import open_indexes, rotation_set
+from backend.src.api.routes.log_index import LogIndex, LogQuery
+
 router = APIRouter(prefix="/api/debug/logs", tags=["log-explorer"])
 
 
@@ -58,6 +75,9 @@ class LogEntry(BaseModel):
     duration_ms: float | None = Field(None, description="Operation duration in ms")
     exception: LogEntryException | None = Field(None, description="Exception info")
     run_id: str | None = Field(None, description="Run identifier")
+    file_name: str | None = Field(
+        None, description="File the entry was read from (may be a rotated backup)"
+    )
 
 
 class LogEntriesResponse(BaseModel):
@@ -109,6 +129,14 @@ def _get_logs_dir(project_path: str) -> Path:
     return Path(project_path) / "logs"
 
 
+def _run_log_file(logs_dir: Path, file_name: str, run_id: str | None) -> Path | None:
+    """Get a run's own log file, if the run was logged with the per-run layout."""
+    if not run_id or file_name != DEFAULT_LOG_FILE_NAME:
+        return None
+    path = run_log_path(logs_dir / RUNS_DIR_NAME, run_id)
+    return path if path.is_file() else None
+
+
 def _count_lines_fast(file_path: Path, max_lines: int = 100000) -> int | None:
     """Count lines in a file, returning None if over max_lines."""
     count = 0
@@ -123,77 +151,30 @@ def _count_lines_fast(file_path: Path, max_lines: int = 100000) -> int | None:
     return count
 
 
-def _parse_record(line: str) -> dict[str, Any] | None:
+def _parse_record(line: str | bytes) -> dict[str, Any] | None:
     """Parse a JSON log line."""
     try:
         return json.loads(line)
-    except json.JSONDecodeError:
+    except (json.JSONDecodeError, UnicodeDecodeError):
         return None
 
 
-def _matches_filters(
-    record: dict[str, Any],
-    level: str | None,
-    category: str | None,
-    search: str | None,
-    start_time: datetime | None,
-    end_time: datetime | None,
-    run_id: str | None = None,
-) -> bool:
-    """Check if a log record matches the given filters."""
-    # Run ID filter
-    if run_id:
-        record_run_id = record.get("run_id", "")
-        if record_run_id != run_id:
-            return False
-
-    # Level filter
-    if level:
-        levels = [lv.strip().upper() for lv in level.split(",")]
-        if record.get("level", "").upper() not in levels:
-            return False
+def _parse_time(value: str | None, name: str) -> datetime | None:
+    """Parse an ISO time filter, raising 400 if it is invalid."""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid {name} format: {value}",
+        )
 
-    # Category filter (supports wildcards)
-    if category:
-        record_category = record.get("category", "")
-        if not fnmatch(record_category, category):
-            return False
 
-    # Text search
-    if search:
-        search_lower = search.lower()
-        message = record.get("message", "").lower()
-        if search_lower not in message:
-            # Also search in context
-            context = record.get("context") or {}
-            context_str = json.dumps(context, default=str).lower()
-            if search_lower not in context_str:
-                return False
-
-    # Time range filter
-    if start_time or end_time:
-        timestamp_str = record.get("timestamp", "")
-        try:
-            # Parse timestamp
-            timestamp_str = timestamp_str.replace("Z", "+00:00")
-            # Handle timestamps without timezone
-            if "+" not in timestamp_str and "-" not in timestamp_str[10:]:
-                record_time = datetime.fromisoformat(timestamp_str)
-            else:
-                record_time = datetime.fromisoformat(timestamp_str)
-
-            if start_time and record_time < start_time:
-                return False
-            if end_time and record_time > end_time:
-                return False
-        except (ValueError, TypeError):
-            # If we can't parse the timestamp, skip time filtering
-            pass
-
-    return True
-
-
-def _parse_log_entry(record: dict[str, Any], line_number: int) -> LogEntry:
+def _parse_log_entry(
+    record: dict[str, Any], line_number: int, file_name: str | None = None
+) -> LogEntry:
     """Parse a record dict into a LogEntry."""
     exception = None
     if "exception" in record and record["exception"]:
@@ -214,9 +195,150 @@ def _parse_log_entry(record: dict[str, Any], line_number: int) -> LogEntry:
         duration_ms=record.get("duration_ms"),
         exception=exception,
         run_id=record.get("run_id"),
+        file_name=file_name,
+    )
+
+
+def _search_rows(
+    index: LogIndex, rows: Iterator[int], query: LogQuery
+) -> Iterator[int]:
+    """Rows whose records match the query's text search."""
+    for row, line in index.read_lines(rows):
+        if not query.may_match_line(line):
+            continue
+        record = _parse_record(line)
+        if record is not None and query.matches_record(record):
+            yield row
+
+
+def _read_entries(index: LogIndex, rows: list[int]) -> list[LogEntry]:
+    """Read the entries of index rows."""
+    return [
+        _parse_log_entry(record, index.line_numbers[row], index.path.name)
+        for row, record in index.read_records(rows)
+    ]
+
+
+def _query_entries(
+    indexes: list[LogIndex],
+    query: LogQuery,
+    offset: int,
+    limit: int,
+    descending: bool,
+) -> tuple[int, list[LogEntry]]:
+    """Count the matching entries of files and read one page of them.
+
+    Args:
+        indexes: File indexes, oldest file first
+        query: Entry filters
+        offset: Matching entries to skip
+        limit: Maximum entries to return
+        descending: Page newest entries first
+
+    Returns:
+        Total matching entries and the page's entries
+    """
+    total = 0
+    entries: list[LogEntry] = []
+    for index in reversed(indexes) if descending else indexes:
+        with index.locked():
+            matched, page = _query_index(
+                index, query, max(0, offset - total), limit - len(entries), descending
+            )
+        total += matched
+        entries.extend(page)
+    return total, entries
+
+
+def _query_index(
+    index: LogIndex, query: LogQuery, skip: int, take: int, descending: bool
+) -> tuple[int, list[LogEntry]]:
+    """Count one file's matching entries and read up to take after skip."""
+    rows, count = index.candidates(query, descending)
+    if count is not None:
+        # Every candidate matches: slice the page without visiting the rest
+        if take > 0 and skip < count:
+            return count, _read_entries(index, list(islice(rows, skip, skip + take)))
+        return count, []
+
+    if query.search is not None:
+        rows = _search_rows(index, rows, query)
+    matched = 0
+    page_rows: list[int] = []
+    for row in rows:
+        matched += 1
+        if matched > skip and len(page_rows) < take:
+            page_rows.append(row)
+    return matched, _read_entries(index, page_rows)
+
+
+def _open_log_indexes(
+    log_file: Path, file_name: str, include_rotated: bool
+) -> list[LogIndex]:
+    """Get the refreshed indexes of a log file (and backups), oldest first."""
+    try:
+        return open_indexes(LogIndex, log_file, include_rotated=include_rotated)
+    except PermissionError:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=f"Permission denied reading: {file_name}",
+        )
+
+
+def _log_stats(log_file: Path, file_name: str, include_rotated: bool) -> LogStats:
+    """Refresh the indexes of a log file and total their counts."""
+    indexes = _open_log_indexes(log_file, file_name, include_rotated)
+
+    level_counts: dict[str, int] = {}
+    category_counts: dict[str, int] = {}
+    first_times: list[str] = []
+    last_times: list[str] = []
+    total_lines = 0
+    for index in indexes:
+        with index.locked():
+            for level, count in index.level_counts().items():
+                level_counts[level] = level_counts.get(level, 0) + count
+            for cat, count in index.category_counts().items():
+                category_counts[cat] = category_counts.get(cat, 0) + count
+            if index.first_timestamp:
+                first_times.append(index.first_timestamp)
+            if index.last_timestamp:
+                last_times.append(index.last_timestamp)
+            total_lines += len(index)
+
+    files = rotation_set(log_file) if include_rotated else [log_file]
+    return LogStats(
+        total_lines=total_lines,
+        level_counts=level_counts,
+        category_counts=category_counts,
+        time_range={
+            "start": min(first_times) if first_times else None,
+            "end": max(last_times) if last_times else None,
+        },
+        file_size_bytes=sum(f.stat().st_size for f in files if f.exists()),
     )
 
 
+def _index_runs(
+    log_file: Path, file_name: str, include_rotated: bool
+) -> dict[str, dict[str, Any]]:
+    """Refresh the indexes of a log file and merge their per-run summaries."""
+    runs_data: dict[str, dict[str, Any]] = {}
+    for index in _open_log_indexes(log_file, file_name, include_rotated):
+        with index.locked():
+            for run_id, (first, last, count) in index.runs.items():
+                if run_id not in runs_data:
+                    runs_data[run_id] = {
+                        "first_timestamp": first,
+                        "last_timestamp": last,
+                        "entry_count": count,
+                    }
+                else:
+                    runs_data[run_id]["last_timestamp"] = last
+                    runs_data[run_id]["entry_count"] += count
+    return runs_data
+
+
 @router.get("", response_model=LogFilesResponse)
 async def list_log_files(
     project_path: str = Query(..., description="Project directory path"),
@@ -279,15 +401,23 @@ async def read_log_entries(
         None, description="Filter entries before this time (ISO format)"
     ),
     run_id: str | None = Query(None, description="Filter by run ID"),
+    order: Literal["asc", "desc"] = Query(
+        "asc", description="asc: oldest first, desc: newest first"
+    ),
+    include_rotated: bool = Query(
+        True, description="Include rotated backups (file_name.1 ... .N)"
+    ),
 ) -> LogEntriesResponse:
     """
     Read log entries from a JSONL log file with filtering and pagination.
 
-    Entries are returned in file order (oldest first by default).
-    Use offset and limit for pagination.
+    Entries are returned in file order (oldest first by default), across
+    the rotated backups and then the file itself.
+    Use offset and limit for pagination. A run_id filter on the default
+    file reads only that run's file when it has one.
     """
     logs_dir = _get_logs_dir(project_path)
-    log_file = logs_dir / file_name
+    log_file = _run_log_file(logs_dir, file_name, run_id) or logs_dir / file_name
 
     if not log_file.exists():
         raise HTTPException(
@@ -295,57 +425,24 @@ async def read_log_entries(
             detail=f"Log file not found: {file_name}",
         )
 
-    # Parse time filters
-    parsed_start_time = None
-    parsed_end_time = None
-    if start_time:
-        try:
-            parsed_start_time = datetime.fromisoformat(
-                start_time.replace("Z", "+00:00")
-            )
-        except ValueError:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Invalid start_time format: {start_time}",
-            )
-    if end_time:
-        try:
-            parsed_end_time = datetime.fromisoformat(end_time.replace("Z", "+00:00"))
-        except ValueError:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Invalid end_time format: {end_time}",
-            )
-
-    entries: list[LogEntry] = []
-    matched_count = 0
-    line_number = 0
+    query = LogQuery(
+        levels=(
+            frozenset(lv.strip().upper() for lv in level.split(",")) if level else None
+        ),
+        category=category or None,
+        search=search.lower() if search else None,
+        start_time=_parse_time(start_time, "start_time"),
+        end_time=_parse_time(end_time, "end_time"),
+        run_id=run_id or None,
+    )
 
+    indexes = await asyncio.to_thread(
+        _open_log_indexes, log_file, file_name, include_rotated
+    )
     try:
-        with open(log_file, encoding="utf-8") as f:
-            for line in f:
-                line_number += 1
-                line = line.strip()
-                if not line:
-                    continue
-
-                record = _parse_record(line)
-                if record is None:
-                    continue
-
-                if _matches_filters(
-                    record,
-                    level,
-                    category,
-                    search,
-                    parsed_start_time,
-                    parsed_end_time,
-                    run_id,
-                ):
-                    matched_count += 1
-                    if matched_count > offset and len(entries) < limit:
-                        entries.append(_parse_log_entry(record, line_number))
-
+        matched_count, entries = await asyncio.to_thread(
+            _query_entries, indexes, query, offset, limit, order == "desc"
+        )
     except PermissionError:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -379,12 +476,15 @@ async def read_log_entries(
 async def get_log_stats(
     project_path: str = Query(..., description="Project directory path"),
     file_name: str = Query("adkflow.jsonl", description="Log file name"),
+    include_rotated: bool = Query(
+        True, description="Include rotated backups (file_name.1 ... .N)"
+    ),
 ) -> LogStats:
     """
     Get statistics about a log file.
 
-    Scans the entire file to compute level counts, category counts,
-    and time range. May be slow for very large files.
+    Served from the file's index: level counts, category counts and
+    time range without reading the file.
     """
     logs_dir = _get_logs_dir(project_path)
     log_file = logs_dir / file_name
@@ -395,74 +495,34 @@ async def get_log_stats(
             detail=f"Log file not found: {file_name}",
         )
 
-    total_lines = 0
-    level_counts: dict[str, int] = {}
-    category_counts: dict[str, int] = {}
-    earliest_time: str | None = None
-    latest_time: str | None = None
-
-    try:
-        with open(log_file, encoding="utf-8") as f:
-            line_number = 0
-            for line in f:
-                line_number += 1
-                line = line.strip()
-                if not line:
-                    continue
-
-                record = _parse_record(line)
-                if record is None:
-                    continue
-
-                total_lines += 1
-
-                # Count levels
-                level = record.get("level", "INFO")
-                level_counts[level] = level_counts.get(level, 0) + 1
-
-                # Count categories
-                cat = record.get("category", "")
-                if cat:
-                    category_counts[cat] = category_counts.get(cat, 0) + 1
-
-                # Track time range
-                timestamp = record.get("timestamp", "")
-                if timestamp:
-                    if earliest_time is None or timestamp < earliest_time:
-                        earliest_time = timestamp
-                    if latest_time is None or timestamp > latest_time:
-                        latest_time = timestamp
-
-    except PermissionError:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail=f"Permission denied reading: {file_name}",
-        )
-
-    return LogStats(
-        total_lines=total_lines,
-        level_counts=level_counts,
-        category_counts=category_counts,
-        time_range={"start": earliest_time, "end": latest_time},
-        file_size_bytes=log_file.stat().st_size,
-    )
+    return await asyncio.to_thread(_log_stats, log_file, file_name, include_rotated)
 
 
 @router.get("/runs", response_model=RunListResponse)
 async def list_runs(
     project_path: str = Query(..., description="Project directory path"),
     file_name: str = Query("adkflow.jsonl", description="Log file name"),
+    include_rotated: bool = Query(
+        True, description="Include rotated backups (file_name.1 ... .N)"
+    ),
 ) -> RunListResponse:
     """
     List all unique run IDs in a log file.
 
     Returns runs ordered by first timestamp (newest first).
     Each run includes the first and last timestamp and entry count.
+    For the default file, runs with their own log file are included.
     """
     logs_dir = _get_logs_dir(project_path)
     log_file = logs_dir / file_name
 
-    if not log_file.exists():
+    indexed_runs = []
+    if file_name == DEFAULT_LOG_FILE_NAME:
+        indexed_runs = await asyncio.to_thread(
+            read_run_index, logs_dir / RUNS_DIR_NAME
+        )
+
+    if not log_file.exists() and not indexed_runs:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Log file not found: {file_name}",
@@ -471,39 +531,19 @@ async def list_runs(
     # Track runs: run_id -> {first_timestamp, last_timestamp, count}
     runs_data: dict[str, dict[str, Any]] = {}
 
-    try:
-        with open(log_file, encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-
-                record = _parse_record(line)
-                if record is None:
-                    continue
-
-                run_id = record.get("run_id")
-                if not run_id:
-                    continue
-
-                timestamp = record.get("timestamp", "")
-
-                if run_id not in runs_data:
-                    runs_data[run_id] = {
-                        "first_timestamp": timestamp,
-                        "last_timestamp": timestamp,
-                        "entry_count": 1,
-                    }
-                else:
-                    runs_data[run_id]["last_timestamp"] = timestamp
-                    runs_data[run_id]["entry_count"] += 1
-
-    except PermissionError:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail=f"Permission denied reading: {file_name}",
+    if log_file.exists():
+        runs_data = await asyncio.to_thread(
+            _index_runs, log_file, file_name, include_rotated
         )
 
+    # A run's own file holds all of its records
+    for summary in indexed_runs:
+        runs_data[summary.run_id] = {
+            "first_timestamp": summary.first_timestamp or "",
+            "last_timestamp": summary.last_timestamp or "",
+            "entry_count": summary.entry_count,
+        }
+
     # Convert to list and sort by first_timestamp descending (newest first)
     runs = [
         RunInfo(
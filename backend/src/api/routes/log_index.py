@@ -0,0 +1,261 @@
+"""Index of log JSONL files for the log explorer.
+
+Per record it keeps the timestamp, level, category and run_id, plus:
+- Row lists per level, category and run_id, so a filter on one of them
+  only visits matching rows and can count them without visiting any
+- Level and category counts, time range and per-run first/last
+  timestamp and entry count, which answer stats and run listings
+  without reading the file
+"""
+
+from __future__ import annotations
+
+import heapq
+import json
+import math
+from array import array
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from fnmatch import fnmatch
+from typing import Any, Iterable, Iterator
+
+from backend.src.api.routes.jsonl_index import JsonlIndex
+
+# Characters JSON may escape; a search containing them cannot be
+# pre-checked against the raw line
+_JSON_ESCAPED = frozenset('"\\/') | frozenset(chr(i) for i in range(32))
+
+
+@dataclass
+class LogQuery:
+    """Filters of a log entries request."""
+
+    levels: frozenset[str] | None = None  # Upper-case level names
+    category: str | None = None  # fnmatch pattern
+    search: str | None = None  # Lower-case text
+    start_time: datetime | None = None
+    end_time: datetime | None = None
+    run_id: str | None = None
+
+    def matches_record(self, record: dict[str, Any]) -> bool:
+        """Check the search filter against a parsed record."""
+        if self.search is None:
+            return True
+        if self.search in str(record.get("message", "")).lower():
+            return True
+        context = record.get("context") or {}
+        return self.search in json.dumps(context, default=str).lower()
+
+    def may_match_line(self, line: bytes) -> bool:
+        """Cheap check of the search filter against a raw line.
+
+        False only if the record cannot match; True needs matches_record.
+        """
+        if self.search is None:
+            return True
+        if not self.search.isascii() or not _JSON_ESCAPED.isdisjoint(self.search):
+            return True
+        return self.search.encode() in line.lower()
+
+
+class _Codes:
+    """Interned strings of one column."""
+
+    def __init__(self) -> None:
+        self.values: list[str | None] = []
+        self.codes: dict[str | None, int] = {}
+        self.rows: list[array] = []  # Rows per code, ascending
+
+    def code(self, value: str | None) -> int:
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.values)
+            self.values.append(value)
+            self.rows.append(array("l"))
+        return code
+
+    def counts(self) -> dict[str | None, int]:
+        return {value: len(self.rows[code]) for code, value in enumerate(self.values)}
+
+
+class LogIndex(JsonlIndex):
+    """Log file index with per-level, per-category and per-run rows."""
+
+    kind = "log"
+
+    def _reset(self) -> None:
+        super()._reset()
+        self.levels = _Codes()
+        self.categories = _Codes()
+        self.run_ids = _Codes()
+        self.level_codes = array("l")
+        self.category_codes = array("l")
+        self.run_codes = array("l")
+        # Epoch seconds; naive timestamps are read as UTC and flagged, to
+        # compare them only with naive filter times like datetime does
+        self.epochs = array("d")
+        self.aware = bytearray()
+        self.first_timestamp: str | None = None
+        self.last_timestamp: str | None = None
+        # run_id -> [first timestamp, last timestamp, entry count]
+        self.runs: dict[str, list[Any]] = {}
+
+    def _new_chunk(self) -> dict[str, Any]:
+        chunk = super()._new_chunk()
+        chunk.update(
+            timestamps=[], levels=[], categories=[], run_ids=[], epochs=[], aware=[]
+        )
+        return chunk
+
+    def _add(self, chunk: dict[str, Any], record: dict[str, Any]) -> None:
+        timestamp = record.get("timestamp", "")
+        if not isinstance(timestamp, str):
+            timestamp = ""
+        run_id = record.get("run_id")
+        chunk["timestamps"].append(timestamp)
+        chunk["levels"].append(str(record.get("level", "INFO")))
+        chunk["categories"].append(str(record.get("category", "")))
+        chunk["run_ids"].append(str(run_id) if run_id else None)
+        epoch, aware = _epoch(timestamp)
+        chunk["epochs"].append(epoch)
+        chunk["aware"].append(aware)
+
+    def _apply(self, chunk: dict[str, Any]) -> None:
+        row = len(self.level_codes)
+        for timestamp, level, category, run_id in zip(
+            chunk["timestamps"], chunk["levels"], chunk["categories"], chunk["run_ids"]
+        ):
+            level_code = self.levels.code(level)
+            category_code = self.categories.code(category)
+            run_code = self.run_ids.code(run_id)
+            self.level_codes.append(level_code)
+            self.category_codes.append(category_code)
+            self.run_codes.append(run_code)
+            self.levels.rows[level_code].append(row)
+            self.categories.rows[category_code].append(row)
+            self.run_ids.rows[run_code].append(row)
+            row += 1
+
+            if timestamp:
+                if self.first_timestamp is None or timestamp < self.first_timestamp:
+                    self.first_timestamp = timestamp
+                if self.last_timestamp is None or timestamp > self.last_timestamp:
+                    self.last_timestamp = timestamp
+            if run_id:
+                run = self.runs.get(run_id)
+                if run is None:
+                    self.runs[run_id] = [timestamp, timestamp, 1]
+                else:
+                    run[1] = timestamp
+                    run[2] += 1
+
+        self.epochs.extend(chunk["epochs"])
+        self.aware.extend(chunk["aware"])
+
+    def level_counts(self) -> dict[str, int]:
+        """Records per level."""
+        return {str(k): v for k, v in self.levels.counts().items() if v}
+
+    def category_counts(self) -> dict[str, int]:
+        """Records per non-empty category."""
+        return {str(k): v for k, v in self.categories.counts().items() if k and v}
+
+    def candidates(
+        self, query: LogQuery, descending: bool
+    ) -> tuple[Iterator[int], int | None]:
+        """Rows that may match the query's indexed filters, in order.
+
+        Returns:
+            The rows, and their count if every one of them matches the
+            query (no per-row check needed); None otherwise
+        """
+        sources: list[list[array]] = []
+        if query.run_id is not None:
+            code = self.run_ids.codes.get(query.run_id)
+            sources.append([self.run_ids.rows[code]] if code is not None else [])
+        if query.levels is not None:
+            sources.append(
+                [
+                    self.levels.rows[code]
+                    for code, name in enumerate(self.levels.values)
+                    if str(name).upper() in query.levels
+                ]
+            )
+        if query.category is not None:
+            sources.append(
+                [
+                    self.categories.rows[code]
+                    for code, name in enumerate(self.categories.values)
+                    if fnmatch(name or "", query.category)
+                ]
+            )
+
+        if not sources:
+            count = len(self)
+            rows: Iterable[int] = reversed(range(count)) if descending else range(count)
+        else:
+            # Drive from the smallest filter's rows; check the others per row
+            driver = min(sources, key=lambda lists: sum(len(r) for r in lists))
+            count = sum(len(r) for r in driver)
+            rows = _merge(driver, descending)
+
+        needs_check = (
+            len(sources) > 1
+            or query.start_time is not None
+            or query.end_time is not None
+        )
+        if needs_check:
+            rows = (row for row in rows if self._matches(row, query))
+        exact = not needs_check and query.search is None
+        return iter(rows), count if exact else None
+
+    def _matches(self, row: int, query: LogQuery) -> bool:
+        if query.run_id is not None:
+            if self.run_ids.values[self.run_codes[row]] != query.run_id:
+                return False
+        if query.levels is not None:
+            level = self.levels.values[self.level_codes[row]]
+            if str(level).upper() not in query.levels:
+                return False
+        if query.category is not None:
+            category = self.categories.values[self.category_codes[row]]
+            if not fnmatch(category or "", query.category):
+                return False
+        epoch = self.epochs[row]
+        if math.isnan(epoch):
+            return True
+        for bound, is_start in ((query.start_time, True), (query.end_time, False)):
+            if bound is None:
+                continue
+            bound_aware = bound.tzinfo is not None
+            if bound_aware != bool(self.aware[row]):
+                continue  # Not comparable; datetime would raise
+            bound_epoch = (
+                bound.timestamp()
+                if bound_aware
+                else bound.replace(tzinfo=timezone.utc).timestamp()
+            )
+            if is_start and epoch < bound_epoch:
+                return False
+            if not is_start and epoch > bound_epoch:
+                return False
+        return True
+
+
+def _merge(lists: list[array], descending: bool) -> Iterable[int]:
+    if len(lists) == 1:
+        return reversed(lists[0]) if descending else lists[0]
+    if descending:
+        return heapq.merge(*(reversed(rows) for rows in lists), reverse=True)
+    return heapq.merge(*lists)
+
+
+def _epoch(timestamp: Any) -> tuple[float, int]:
+    """Epoch seconds of an ISO timestamp (naive read as UTC) and whether it is aware."""
+    try:
+        dt = datetime.fromisoformat(str(timestamp).replace("Z", "+00:00"))
+    except (ValueError, TypeError):
+        return math.nan, 0
+    if dt.tzinfo is None:
+        return dt.replace(tzinfo=timezone.utc).timestamp(), 0
+    return dt.timestamp(), 1
@@ -230,7 +230,9 @@ async def update_project_settings(
         # Load or create manifest
         manifest = load_manifest(project_path, create_if_missing=True)
 
-        # Update settings
+        # Update settings, keeping execution limits the editor does not send
+        if request.settings.custom_nodes is None:
+            request.settings.custom_nodes = manifest.settings.custom_nodes
         manifest.settings = request.settings
 
         # Save manifest
@@ -2,11 +2,17 @@
 
 These routes are only registered when ADKFLOW_DEV_MODE=1.
 They provide read access to OpenTelemetry trace JSONL files from the project's logs/ directory.
+
+Requests are answered from an index of each file (see trace_index), which
+is extended as the file grows, and cover the file's rotated backups
+(traces.jsonl.1 ... .N) too:
+- Trace listing and stats use the per-trace summaries only
+- A single trace is read by seeking to its spans' lines
 """
 
 from __future__ import annotations
 
-import json
+import asyncio
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -14,6 +20,13 @@ from typing import Any
 from fastapi import APIRouter, HTTPException, Query, status
 from pydantic import BaseModel, Field
 
+from backend.src.api.routes.jsonl_index import open_indexes, rotation_set
+from backend.src.api.routes.trace_index import (
+    TraceIndex,
+    TraceSummary,
+    merge_summaries,
+)
+
 router = APIRouter(prefix="/api/debug/traces", tags=["trace-explorer"])
 
 
@@ -94,12 +107,81 @@ def _get_trace_file(project_path: str, file_name: str = "traces.jsonl") -> Path:
     return Path(project_path) / "logs" / file_name
 
 
-def _parse_span(line: str) -> dict[str, Any] | None:
-    """Parse a JSON span line."""
+def _duration_ms(start_time: str | None, end_time: str | None) -> float | None:
+    """Milliseconds between two ISO timestamps, if both are valid."""
+    if not start_time or not end_time:
+        return None
     try:
-        return json.loads(line)
-    except json.JSONDecodeError:
+        start_dt = datetime.fromisoformat(start_time.replace("Z", "+00:00"))
+        end_dt = datetime.fromisoformat(end_time.replace("Z", "+00:00"))
+    except ValueError:
         return None
+    return (end_dt - start_dt).total_seconds() * 1000
+
+
+def _open_trace_indexes(file_path: Path, include_rotated: bool) -> list[TraceIndex]:
+    """Get the refreshed indexes of a trace file (and backups), oldest first."""
+    try:
+        return open_indexes(TraceIndex, file_path, include_rotated=include_rotated)
+    except OSError:
+        return []
+
+
+def _read_trace_spans(
+    file_path: Path, trace_id: str, include_rotated: bool
+) -> list[dict[str, Any]]:
+    """Read only the spans the indexes list for a trace."""
+    trace_spans: list[dict[str, Any]] = []
+    for index in _open_trace_indexes(file_path, include_rotated):
+        with index.locked():
+            summary = index.traces.get(trace_id)
+            if summary is not None:
+                trace_spans.extend(
+                    span for _, span in index.read_records(summary.rows)
+                )
+    return trace_spans
+
+
+def _trace_summaries(
+    file_path: Path, include_rotated: bool
+) -> dict[str, TraceSummary]:
+    """Refresh the indexes of a trace file and merge their trace summaries."""
+    return merge_summaries(_open_trace_indexes(file_path, include_rotated))
+
+
+def _trace_stats(file_path: Path, include_rotated: bool) -> TraceStats:
+    """Refresh the indexes of a trace file and total their counts."""
+    indexes = _open_trace_indexes(file_path, include_rotated)
+
+    span_name_counts: dict[str, int] = {}
+    status_counts: dict[str, int] = {}
+    first_times: list[str] = []
+    last_times: list[str] = []
+    total_spans = 0
+    for index in indexes:
+        with index.locked():
+            for name, count in index.span_name_counts.items():
+                span_name_counts[name] = span_name_counts.get(name, 0) + count
+            for span_status, count in index.status_counts.items():
+                status_counts[span_status] = status_counts.get(span_status, 0) + count
+            if index.first_start_time:
+                first_times.append(index.first_start_time)
+            if index.last_start_time:
+                last_times.append(index.last_start_time)
+            total_spans += len(index)
+
+    files = rotation_set(file_path) if include_rotated else [file_path]
+    return TraceStats(
+        total_traces=len(merge_summaries(indexes)),
+        total_spans=total_spans,
+        span_name_counts=span_name_counts,
+        status_counts=status_counts,
+        time_range={
+            "start": min(first_times) if first_times else None,
+            "end": max(last_times) if last_times else None,
+        },
+        file_size_bytes=sum(f.stat().st_size for f in files if f.exists()),
+    )
 
 
 def _build_span_tree(spans: list[dict[str, Any]]) -> list[TraceSpan]:
@@ -151,40 +233,6 @@ def _build_span_tree(spans: list[dict[str, Any]]) -> list[TraceSpan]:
     return roots
 
 
-def _read_all_spans(file_path: Path) -> list[dict[str, Any]]:
-    """Read all spans from a trace file."""
-    spans: list[dict[str, Any]] = []
-    if not file_path.exists():
-        return spans
-
-    try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                span = _parse_span(line)
-                if span:
-                    spans.append(span)
-    except Exception:
-        pass
-
-    return spans
-
-
-def _group_spans_by_trace(
-    spans: list[dict[str, Any]],
-) -> dict[str, list[dict[str, Any]]]:
-    """Group spans by trace_id."""
-    traces: dict[str, list[dict[str, Any]]] = {}
-    for span in spans:
-        trace_id = span.get("trace_id", "unknown")
-        if trace_id not in traces:
-            traces[trace_id] = []
-        traces[trace_id].append(span)
-    return traces
-
-
 @router.get("", response_model=TraceListResponse)
 async def list_traces(
     project_path: str = Query(..., description="Path to the project directory"),
@@ -197,10 +245,14 @@ async def list_traces(
     end_time: datetime | None = Query(
         None, description="Filter: traces before this time"
     ),
+    include_rotated: bool = Query(
+        True, description="Include rotated backups (file_name.1 ... .N)"
+    ),
 ) -> TraceListResponse:
     """List traces from the trace file.
 
     Returns summary information about each trace, sorted by start time (newest first).
+    Served from the per-trace summaries of the index, without reading spans.
     """
     file_path = _get_trace_file(project_path, file_name)
 
@@ -212,22 +264,14 @@ async def list_traces(
             file_name=file_name,
         )
 
-    # Read all spans and group by trace
-    all_spans = _read_all_spans(file_path)
-    traces_map = _group_spans_by_trace(all_spans)
+    summaries = await asyncio.to_thread(
+        _trace_summaries, file_path, include_rotated
+    )
 
     # Build trace summaries
     trace_infos: list[TraceInfo] = []
-    for trace_id, spans in traces_map.items():
-        if not spans:
-            continue
-
-        # Find time range
-        start_times = [s.get("start_time", "") for s in spans if s.get("start_time")]
-        end_times = [s.get("end_time", "") for s in spans if s.get("end_time")]
-
-        trace_start = min(start_times) if start_times else ""
-        trace_end = max(end_times) if end_times else None
+    for trace_id, summary in summaries.items():
+        trace_start = summary.start_time
 
         # Apply time filters
         if start_time and trace_start:
@@ -246,36 +290,16 @@ async def list_traces(
             except ValueError:
                 pass
 
-        # Calculate duration
-        duration_ms = None
-        if trace_start and trace_end:
-            try:
-                start_dt = datetime.fromisoformat(trace_start.replace("Z", "+00:00"))
-                end_dt = datetime.fromisoformat(trace_end.replace("Z", "+00:00"))
-                duration_ms = (end_dt - start_dt).total_seconds() * 1000
-            except ValueError:
-                pass
-
-        # Find root span name
-        root_spans = [s for s in spans if not s.get("parent_span_id")]
-        root_span_name = (
-            root_spans[0].get("name", "unknown") if root_spans else "unknown"
-        )
-
-        # Check for errors
-        has_errors = any(s.get("status") == "ERROR" for s in spans)
-        status = "ERROR" if has_errors else "OK"
-
         trace_infos.append(
             TraceInfo(
                 trace_id=trace_id,
-                span_count=len(spans),
-                root_span_name=root_span_name,
+                span_count=summary.span_count,
+                root_span_name=summary.root_span_name or "unknown",
                 start_time=trace_start,
-                end_time=trace_end,
-                duration_ms=duration_ms,
-                status=status,
-                has_errors=has_errors,
+                end_time=summary.end_time,
+                duration_ms=_duration_ms(trace_start, summary.end_time),
+                status="ERROR" if summary.has_errors else "OK",
+                has_errors=summary.has_errors,
             )
         )
 
@@ -299,10 +323,13 @@ async def list_traces(
 async def get_trace_stats(
     project_path: str = Query(..., description="Path to the project directory"),
     file_name: str = Query("traces.jsonl", description="Trace file name"),
+    include_rotated: bool = Query(
+        True, description="Include rotated backups (file_name.1 ... .N)"
+    ),
 ) -> TraceStats:
     """Get statistics about the trace file.
 
-    Returns counts by span name, status, and overall metrics.
+    Returns counts by span name, status, and overall metrics, from the index.
     """
     file_path = _get_trace_file(project_path, file_name)
 
@@ -316,42 +343,7 @@ async def get_trace_stats(
             file_size_bytes=0,
         )
 
-    # Read all spans
-    all_spans = _read_all_spans(file_path)
-    traces_map = _group_spans_by_trace(all_spans)
-
-    # Count by span name
-    span_name_counts: dict[str, int] = {}
-    status_counts: dict[str, int] = {}
-    all_times: list[str] = []
-
-    for span in all_spans:
-        name = span.get("name", "unknown")
-        span_name_counts[name] = span_name_counts.get(name, 0) + 1
-
-        status = span.get("status", "UNSET")
-        status_counts[status] = status_counts.get(status, 0) + 1
-
-        if span.get("start_time"):
-            all_times.append(span["start_time"])
-
-    # Get time range
-    time_range = {
-        "start": min(all_times) if all_times else None,
-        "end": max(all_times) if all_times else None,
-    }
-
-    # Get file size
-    file_size = file_path.stat().st_size if file_path.exists() else 0
-
-    return TraceStats(
-        total_traces=len(traces_map),
-        total_spans=len(all_spans),
-        span_name_counts=span_name_counts,
-        status_counts=status_counts,
-        time_range=time_range,
-        file_size_bytes=file_size,
-    )
+    return await asyncio.to_thread(_trace_stats, file_path, include_rotated)
 
 
 @router.get("/{trace_id}", response_model=TraceDetailResponse)
@@ -359,10 +351,14 @@ async def get_trace(
     trace_id: str,
     project_path: str = Query(..., description="Path to the project directory"),
     file_name: str = Query("traces.jsonl", description="Trace file name"),
+    include_rotated: bool = Query(
+        True, description="Include rotated backups (file_name.1 ... .N)"
+    ),
 ) -> TraceDetailResponse:
     """Get a single trace with full span hierarchy.
 
     Returns the complete span tree for a trace, with children nested under parents.
+    Only the trace's own spans are read, located through the index.
     """
     file_path = _get_trace_file(project_path, file_name)
 
@@ -372,9 +368,9 @@ async def get_trace(
             detail=f"Trace file not found: {file_name}",
         )
 
-    # Read all spans and find those matching trace_id
-    all_spans = _read_all_spans(file_path)
-    trace_spans = [s for s in all_spans if s.get("trace_id") == trace_id]
+    trace_spans = await asyncio.to_thread(
+        _read_trace_spans, file_path, trace_id, include_rotated
+    )
 
     if not trace_spans:
         raise HTTPException(
@@ -409,14 +405,7 @@ async def get_trace(
     trace_start = min(start_times) if start_times else None
     trace_end = max(end_times) if end_times else None
 
-    duration_ms = None
-    if trace_start and trace_end:
-        try:
-            start_dt = datetime.fromisoformat(trace_start.replace("Z", "+00:00"))
-            end_dt = datetime.fromisoformat(trace_end.replace("Z", "+00:00"))
-            duration_ms = (end_dt - start_dt).total_seconds() * 1000
-        except ValueError:
-            pass
+    duration_ms = _duration_ms(trace_start, trace_end)
 
     return TraceDetailResponse(
         trace_id=trace_id,
@@ -0,0 +1,133 @@
+"""Index of trace JSONL files for the trace explorer.
+
+Per trace it keeps the rows of its spans and a summary maintained as
+spans are indexed, so:
+- Listing traces reads summaries only, never span bodies
+- Reading one trace seeks to its spans' lines and parses nothing else
+- Span name and status counts and the time range answer stats
+"""
+
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass, field
+from typing import Any
+
+from backend.src.api.routes.jsonl_index import JsonlIndex
+
+
+@dataclass
+class TraceSummary:
+    """What the index knows about one trace, in one file or merged across files."""
+
+    trace_id: str
+    rows: array = field(default_factory=lambda: array("l"))  # Rows of its spans
+    span_count: int = 0
+    root_span_name: str | None = None  # Name of the first span without a parent
+    start_time: str = ""  # Earliest span start
+    end_time: str | None = None  # Latest span end
+    has_errors: bool = False
+
+    def add(
+        self,
+        name: str,
+        status: str,
+        start_time: str,
+        end_time: str | None,
+        is_root: bool,
+    ) -> None:
+        """Count one span."""
+        self.span_count += 1
+        if is_root and self.root_span_name is None:
+            self.root_span_name = name
+        if start_time and (not self.start_time or start_time < self.start_time):
+            self.start_time = start_time
+        if end_time and (self.end_time is None or end_time > self.end_time):
+            self.end_time = end_time
+        if status == "ERROR":
+            self.has_errors = True
+
+    def merge(self, later: TraceSummary) -> None:
+        """Add the summary of the same trace's spans in a later file."""
+        self.span_count += later.span_count
+        if self.root_span_name is None:
+            self.root_span_name = later.root_span_name
+        if later.start_time and (
+            not self.start_time or later.start_time < self.start_time
+        ):
+            self.start_time = later.start_time
+        if later.end_time and (self.end_time is None or later.end_time > self.end_time):
+            self.end_time = later.end_time
+        self.has_errors = self.has_errors or later.has_errors
+
+
+class TraceIndex(JsonlIndex):
+    """Trace file index with span rows and a summary per trace."""
+
+    kind = "trace"
+
+    def _reset(self) -> None:
+        super()._reset()
+        self.traces: dict[str, TraceSummary] = {}  # In first-seen order
+        self.span_name_counts: dict[str, int] = {}
+        self.status_counts: dict[str, int] = {}
+        self.first_start_time: str | None = None
+        self.last_start_time: str | None = None
+
+    def _new_chunk(self) -> dict[str, Any]:
+        chunk = super()._new_chunk()
+        chunk.update(
+            trace_ids=[], names=[], statuses=[], start_times=[], end_times=[], roots=[]
+        )
+        return chunk
+
+    def _add(self, chunk: dict[str, Any], record: dict[str, Any]) -> None:
+        end_time = record.get("end_time")
+        chunk["trace_ids"].append(str(record.get("trace_id", "unknown")))
+        chunk["names"].append(str(record.get("name", "unknown")))
+        chunk["statuses"].append(str(record.get("status", "UNSET")))
+        chunk["start_times"].append(str(record.get("start_time") or ""))
+        chunk["end_times"].append(str(end_time) if end_time else None)
+        chunk["roots"].append(0 if record.get("parent_span_id") else 1)
+
+    def _apply(self, chunk: dict[str, Any]) -> None:
+        row = len(self.offsets) - len(chunk["offsets"])
+        for trace_id, name, status, start_time, end_time, is_root in zip(
+            chunk["trace_ids"],
+            chunk["names"],
+            chunk["statuses"],
+            chunk["start_times"],
+            chunk["end_times"],
+            chunk["roots"],
+        ):
+            summary = self.traces.get(trace_id)
+            if summary is None:
+                summary = self.traces[trace_id] = TraceSummary(trace_id=trace_id)
+            summary.rows.append(row)
+            summary.add(name, status, start_time, end_time, bool(is_root))
+            row += 1
+
+            self.span_name_counts[name] = self.span_name_counts.get(name, 0) + 1
+            self.status_counts[status] = self.status_counts.get(status, 0) + 1
+            if start_time:
+                if self.first_start_time is None or start_time < self.first_start_time:
+                    self.first_start_time = start_time
+                if self.last_start_time is None or start_time > self.last_start_time:
+                    self.last_start_time = start_time
+
+
+def merge_summaries(indexes: list[TraceIndex]) -> dict[str, TraceSummary]:
+    """Summarize each trace across files, for indexes ordered oldest first.
+
+    A trace cut in two by a rotation is summarized once. Merged summaries
+    are copies that do not carry span rows.
+    """
+    merged: dict[str, TraceSummary] = {}
+    for index in indexes:
+        with index.locked():
+            for trace_id, summary in index.traces.items():
+                total = merged.get(trace_id)
+                if total is None:
+                    total = merged[trace_id] = TraceSummary(trace_id=trace_id)
+                total.merge(summary)
+    return merged
@@ -1,6 +1,13 @@
 """Run manager for workflow execution.
 
 Manages active workflow runs, SSE subscriptions, and user input handling.
+
+Each run's events live in a bounded EventStore: recent events stay in
+memory for subscribers, older ones spill to
+<project>/.cache/events/<run_id>.jsonl until the run is cleaned up.
+Subscribers read that log through an EventHub, each from its own
+cursor, so publishing an event does not copy it per subscriber and a
+slow SSE client cannot make memory grow.
 """
 
 import asyncio
@@ -18,8 +25,19 @@ from adkflow_runner import (
     EventType,
     UserInputRequest,
 )
+from adkflow_runner.runner.event_hub import (
+    DEFAULT_MAX_LAG,
+    EventHub,
+    SlowConsumerPolicy,
+    Subscription,
+)
+from adkflow_runner.runner.event_store import EventStore
 
 from backend.src.api.execution_models import RunRequest
+from backend.src.api.project_compiler import project_compiler
+
+# Spilled run events, relative to the project
+EVENT_SPILL_DIR = Path(".cache") / "events"
 
 
 @dataclass
@@ -47,11 +65,15 @@ class ActiveRun:
     config: RunConfig
     task: asyncio.Task | None = None
     result: RunResult | None = None
-    events: list[RunEvent] = field(default_factory=list)
-    subscribers: list[asyncio.Queue] = field(default_factory=list)
+    hub: EventHub = field(default_factory=EventHub)
     cancelled: bool = False
     pending_inputs: dict[str, PendingUserInput] = field(default_factory=dict)
 
+    @property
+    def events(self) -> EventStore:
+        """The run's event log."""
+        return self.hub.store
+
 
 class AsyncQueueInputProvider:
     """User input provider that works with the backend API.
@@ -102,11 +124,24 @@ class AsyncQueueInputProvider:
 
 
 class RunManager:
-    """Manages active workflow runs."""
+    """Manages active workflow runs.
+
+    Args:
+        slow_consumer_policy: What happens to a subscriber that falls more
+            than max_subscriber_lag events behind ("drop", "disconnect"
+            or "block")
+        max_subscriber_lag: Events a subscriber may fall behind
+    """
 
-    def __init__(self):
+    def __init__(
+        self,
+        slow_consumer_policy: SlowConsumerPolicy = "drop",
+        max_subscriber_lag: int = DEFAULT_MAX_LAG,
+    ):
         self.runs: dict[str, ActiveRun] = {}
-        self.runner = WorkflowRunner()
+        self.runner = WorkflowRunner(compiler=project_compiler)
+        self.slow_consumer_policy: SlowConsumerPolicy = slow_consumer_policy
+        self.max_subscriber_lag = max_subscriber_lag
 
     def generate_run_id(self) -> str:
         """Generate a unique run ID."""
@@ -121,15 +156,10 @@ class RunManager:
                 self.active_run = active_run
 
             async def on_event(self, event: RunEvent) -> None:
-                self.active_run.events.append(event)
                 if event.type.value == "run_error":
                     error_msg = event.data.get("error", "Unknown error")
                     print(f"\n[ERROR] {error_msg}\n")
-                for queue in self.active_run.subscribers:
-                    try:
-                        await queue.put(event)
-                    except Exception:
-                        pass
+                await self.active_run.hub.publish(event)
 
         config = RunConfig(
             project_path=Path(request.project_path).resolve(),
@@ -138,9 +168,20 @@ class RunManager:
             timeout_seconds=request.timeout_seconds,
             validate=request.validate_workflow,
             run_id=run_id,  # Pass run_id so logging uses the same ID
+            collect_events=False,  # Kept in ActiveRun.events instead
         )
 
-        active_run = ActiveRun(run_id=run_id, config=config)
+        active_run = ActiveRun(
+            run_id=run_id,
+            config=config,
+            hub=EventHub(
+                EventStore(
+                    spill_path=config.project_path / EVENT_SPILL_DIR / f"{run_id}.jsonl"
+                ),
+                policy=self.slow_consumer_policy,
+                max_lag=self.max_subscriber_lag,
+            ),
+        )
         config.callbacks = BroadcastCallbacks(active_run)  # type: ignore
         config.user_input_provider = AsyncQueueInputProvider(active_run)  # type: ignore
         self.runs[run_id] = active_run
@@ -170,47 +211,38 @@ class RunManager:
                 timestamp=time.time(),
                 data={"error": str(e)},
             )
-            active_run.events.append(error_event)
-            for queue in active_run.subscribers:
-                try:
-                    await queue.put(error_event)
-                except Exception:
-                    pass
+            await active_run.hub.publish(error_event)
             active_run.result = RunResult(
                 run_id=run_id,
                 status=RunStatus.FAILED,
                 error=str(e),
             )
         finally:
-            for queue in active_run.subscribers:
-                await queue.put(None)
+            # Release the spill file handle; replay reads it by path
+            active_run.events.close()
+            active_run.hub.close()
 
     def get_run(self, run_id: str) -> ActiveRun | None:
         """Get an active run by ID."""
         return self.runs.get(run_id)
 
-    async def subscribe(self, run_id: str) -> asyncio.Queue:
-        """Subscribe to events for a run."""
+    async def subscribe(self, run_id: str, start: int = 0) -> Subscription:
+        """Subscribe to events for a run, replaying from an offset.
+
+        Subscription.get() returns None once the run is finished and all
+        its events were delivered.
+        """
         active_run = self.runs.get(run_id)
         if not active_run:
             raise ValueError(f"Run not found: {run_id}")
 
-        queue: asyncio.Queue = asyncio.Queue()
-        active_run.subscribers.append(queue)
-
-        for event in active_run.events:
-            await queue.put(event)
-
-        if active_run.result is not None:
-            await queue.put(None)
-
-        return queue
+        return active_run.hub.subscribe(start)
 
-    def unsubscribe(self, run_id: str, queue: asyncio.Queue) -> None:
+    def unsubscribe(self, run_id: str, subscription: Subscription) -> None:
         """Unsubscribe from events."""
         active_run = self.runs.get(run_id)
-        if active_run and queue in active_run.subscribers:
-            active_run.subscribers.remove(queue)
+        if active_run:
+            active_run.hub.unsubscribe(subscription)
 
     async def cancel_run(self, run_id: str) -> bool:
         """Cancel a running workflow."""
@@ -232,13 +264,13 @@ class RunManager:
 
         for run_id, active_run in self.runs.items():
             if active_run.result:
-                if active_run.events:
-                    last_event_time = active_run.events[-1].timestamp
+                last_event_time = active_run.events.last_timestamp
+                if last_event_time is not None:
                     if now - last_event_time > max_age_seconds:
                         to_remove.append(run_id)
 
         for run_id in to_remove:
-            del self.runs[run_id]
+            self.runs.pop(run_id).events.close(delete=True)
 
 
 # Global run manager instance
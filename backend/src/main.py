@@ -7,6 +7,9 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from adkflow_runner.runner.tool_executor import tool_executors
+from adkflow_runner.runner.url_fetch import http_clients
+
 from backend.src.api.routes import router as api_router
 from backend.src.api.execution_routes import router as execution_router
 from backend.src.api.extension_routes import router as extension_router
@@ -101,8 +104,11 @@ async def lifespan(app: FastAPI):
 
     yield
 
-    # Shutdown: Cleanup can be added here if needed
+    # Shutdown: close pooled connections of URL context inputs and stop
+    # tool worker pools without waiting for running calls
     log_startup("Shutting down...")
+    await http_clients.aclose()
+    tool_executors.shutdown()
 
 
 # Initialize FastAPI app
@@ -83,6 +83,12 @@ class ProjectSettings(BaseModel):
         serialization_alias="defaultModel",
         description="Default model for new agents",
     )
+    custom_nodes: Optional[dict[str, Any]] = Field(
+        default=None,
+        alias="customNodes",
+        serialization_alias="customNodes",
+        description="Custom node execution limits (maxConcurrency, per-unit limits)",
+    )
 
 
 class ProjectManifest(BaseModel):
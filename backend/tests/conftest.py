@@ -52,11 +52,11 @@ async def dev_app():
     importlib.reload(backend.src.main)
     yield backend.src.main.app
 
-    # Cleanup: restore original state
+    # Cleanup: restore original state, including a dev mode main module
+    # imported for the first time above
     os.environ.pop("ADKFLOW_DEV_MODE", None)
-    for mod in modules_to_remove:
-        if mod in sys.modules:
-            del sys.modules[mod]
+    for mod in [k for k in sys.modules if k.startswith("backend.src.main")]:
+        del sys.modules[mod]
 
 
 @pytest.fixture
@@ -17,6 +17,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import httpx
 from httpx import AsyncClient
 
+from backend.src.api.routes import context_preview_service
 from backend.src.api.routes.context_preview_service import (
     _count_tokens,
     _format_frontmatter,
@@ -25,7 +26,6 @@ from backend.src.api.routes.context_preview_service import (
     _get_default_model,
     _get_file_metadata,
     _get_url_metadata,
-    _matches_exclude_pattern,
     _parse_env_file,
     _truncate_content,
     _unescape_string,
@@ -452,35 +452,6 @@ class TestHelperFunctions:
         assert metadata["status_code"] == "200"
         assert "retrieved_time" in metadata
 
-    def test_matches_exclude_pattern_exact_match(self, tmp_path: Path):
-        """Match exact directory/file name in path."""
-        file_path = tmp_path / "node_modules" / "test.txt"
-        file_path.parent.mkdir(parents=True)
-
-        result = _matches_exclude_pattern(file_path, tmp_path, ["node_modules"])
-
-        assert result is True
-
-    def test_matches_exclude_pattern_glob_match(self, tmp_path: Path):
-        """Match glob pattern in path parts."""
-        file_path = tmp_path / "src" / "test.pyc"
-        file_path.parent.mkdir(parents=True)
-
-        result = _matches_exclude_pattern(file_path, tmp_path, ["*.pyc"])
-
-        assert result is True
-
-    def test_matches_exclude_pattern_no_match(self, tmp_path: Path):
-        """No match when pattern doesn't apply."""
-        file_path = tmp_path / "src" / "test.txt"
-        file_path.parent.mkdir(parents=True)
-
-        result = _matches_exclude_pattern(
-            file_path, tmp_path, ["node_modules", "*.pyc"]
-        )
-
-        assert result is False
-
     def test_unescape_string(self):
         """Unescape common escape sequences."""
         input_str = "line1\\nline2\\ttab\\rcarriage\\\\backslash"
@@ -716,6 +687,25 @@ class TestPreviewDirectory:
         assert result.warnings is not None
         assert "showing first 5" in result.warnings[0]
 
+    async def testpreview_directory_count_limit(self, tmp_path: Path, monkeypatch):
+        """Stop counting files once the preview count limit is reached."""
+        monkeypatch.setattr(context_preview_service, "_PREVIEW_COUNT_LIMIT", 6)
+        for i in range(10):
+            (tmp_path / f"file{i}.txt").write_text(f"Content {i}")
+
+        result = await preview_directory(
+            ".",
+            "*.txt",
+            tmp_path,
+            include_metadata=False,
+            max_size=10000,
+            max_files=3,
+        )
+
+        assert result.totalFiles == 6
+        assert len(result.files) == 3
+        assert result.warnings == ["Found 6+ files, showing first 3"]
+
     async def testpreview_directory_max_file_size(self, tmp_path: Path):
         """Skip files exceeding max file size."""
         (tmp_path / "small.txt").write_text("Small")
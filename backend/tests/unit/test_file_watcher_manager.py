@@ -301,6 +301,37 @@ class TestFileWatcherManager:
         # Should not raise
         manager.notify_file_change(project_path, "prompts/test.md", "modified")
 
+    async def test_listener_receives_events_without_watcher(self, tmp_path: Path):
+        """Listeners are called even when no subscriber is watching."""
+        manager = FileWatcherManager(poll_interval=0.1)
+        project_path = str(tmp_path)
+        received: list[tuple[str, FileChangeEvent]] = []
+        manager.add_listener(lambda path, event: received.append((path, event)))
+
+        manager.notify_file_change(project_path, "prompts/test.md", "modified")
+
+        assert len(received) == 1
+        assert received[0][0] == project_path
+        assert received[0][1].file_path == "prompts/test.md"
+
+    async def test_failing_listener_does_not_block_subscribers(
+        self, tmp_path: Path
+    ):
+        """A listener that raises does not prevent queue delivery."""
+        manager = FileWatcherManager(poll_interval=0.1)
+        project_path = str(tmp_path)
+
+        def failing(path: str, event: FileChangeEvent) -> None:
+            raise RuntimeError("boom")
+
+        manager.add_listener(failing)
+        queue = await manager.subscribe(project_path)
+
+        manager.notify_file_change(project_path, "prompts/test.md", "created")
+
+        assert queue.get_nowait().change_type == "created"
+        await manager.unsubscribe(project_path, queue)
+
     async def test_poll_loop_continues_on_error(self, tmp_path: Path):
         """Poll loop continues even if check fails."""
         manager = FileWatcherManager(poll_interval=0.1)
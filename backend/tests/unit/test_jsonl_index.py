@@ -0,0 +1,91 @@
+"""Tests for the incremental JSONL file indexes."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from backend.src.api.routes.jsonl_index import (
+    INDEX_DIR_NAME,
+    clear_cache,
+    open_index,
+    open_indexes,
+)
+from backend.src.api.routes.log_index import LogIndex, LogQuery
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    """Start each test without in-memory indexes."""
+    clear_cache()
+    yield
+    clear_cache()
+
+
+def _write(path: Path, levels: list[str], mode: str = "w") -> None:
+    with open(path, mode) as f:
+        for i, level in enumerate(levels):
+            entry = {
+                "timestamp": f"2024-01-01T10:00:{i:02d}Z",
+                "level": level,
+                "category": "runner",
+                "message": f"{level} {i}",
+            }
+            f.write(json.dumps(entry) + "\n")
+
+
+class TestJsonlIndex:
+    """Tests for building, saving and reusing indexes."""
+
+    def test_index_is_restored_from_sidecar(self, tmp_path: Path):
+        log_file = tmp_path / "adkflow.jsonl"
+        _write(log_file, ["INFO", "ERROR", "INFO"])
+        open_index(LogIndex, log_file)
+
+        [sidecar] = (tmp_path / INDEX_DIR_NAME).iterdir()
+        clear_cache()
+        _write(log_file, ["DEBUG"], mode="a")
+        index = open_index(LogIndex, log_file)
+
+        assert len(index) == 4
+        assert index.level_counts() == {"INFO": 2, "ERROR": 1, "DEBUG": 1}
+        # The restored index was extended with one more chunk
+        assert len(sidecar.read_text().splitlines()) == 3
+
+    def test_rotated_file_keeps_its_index(self, tmp_path: Path):
+        log_file = tmp_path / "adkflow.jsonl"
+        _write(log_file, ["INFO", "ERROR"])
+        before = open_index(LogIndex, log_file)
+
+        log_file.rename(tmp_path / "adkflow.jsonl.1")
+        _write(log_file, ["WARNING"])
+        indexes = open_indexes(LogIndex, log_file)
+
+        assert indexes[0] is before
+        assert indexes[0].path.name == "adkflow.jsonl.1"
+        assert [len(index) for index in indexes] == [2, 1]
+        assert len(list((tmp_path / INDEX_DIR_NAME).iterdir())) == 2
+
+    def test_truncated_file_is_indexed_again(self, tmp_path: Path):
+        log_file = tmp_path / "adkflow.jsonl"
+        _write(log_file, ["INFO", "INFO", "INFO"])
+        open_index(LogIndex, log_file)
+
+        with open(log_file, "r+") as f:
+            first = f.readline()
+            f.truncate(len(first))
+        index = open_index(LogIndex, log_file)
+
+        assert len(index) == 1
+
+    def test_exact_count_without_reading_rows(self, tmp_path: Path):
+        log_file = tmp_path / "adkflow.jsonl"
+        _write(log_file, ["INFO", "ERROR", "INFO", "ERROR"])
+        index = open_index(LogIndex, log_file)
+
+        rows, count = index.candidates(LogQuery(levels=frozenset({"ERROR"})), True)
+        assert count == 2
+        assert list(rows) == [3, 1]
+
+        rows, count = index.candidates(LogQuery(search="error"), False)
+        assert count is None
@@ -1,6 +1,8 @@
 """Tests for log explorer API routes."""
 
 import json
+import threading
+from datetime import datetime, timezone
 from pathlib import Path
 
 import pytest
@@ -376,6 +378,257 @@ class TestListRuns:
         assert response.status_code == 404
 
 
+class TestPerRunLogFiles:
+    """Tests for runs logged to logs/runs/<run_id>.jsonl."""
+
+    @pytest.fixture
+    def run_log_file(self, logs_dir: Path) -> Path:
+        """Create a per-run log file without an index entry."""
+        runs_dir = logs_dir / "runs"
+        runs_dir.mkdir()
+        run_file = runs_dir / "run00001.jsonl"
+        with open(run_file, "w") as f:
+            for i in range(3):
+                entry = {
+                    "timestamp": f"2024-01-02T10:00:0{i}Z",
+                    "level": "INFO",
+                    "category": "runner.workflow",
+                    "message": f"Run step {i}",
+                    "run_id": "run00001",
+                }
+                f.write(json.dumps(entry) + "\n")
+        return run_file
+
+    @pytest.mark.asyncio
+    async def test_list_runs_includes_run_files(
+        self,
+        dev_client: AsyncClient,
+        tmp_path: Path,
+        sample_log_file: Path,
+        run_log_file: Path,
+    ):
+        """Runs with their own file are listed with the main file's runs."""
+        response = await dev_client.get(
+            "/api/debug/logs/runs", params={"project_path": str(tmp_path)}
+        )
+        assert response.status_code == 200
+
+        runs = response.json()["runs"]
+        assert [r["run_id"] for r in runs] == ["run00001", "def67890", "abc12345"]
+        assert runs[0]["entry_count"] == 3
+        assert runs[0]["last_timestamp"] == "2024-01-02T10:00:02Z"
+
+    @pytest.mark.asyncio
+    async def test_list_runs_without_main_file(
+        self, dev_client: AsyncClient, tmp_path: Path, run_log_file: Path
+    ):
+        """Only per-run files is not a missing file."""
+        response = await dev_client.get(
+            "/api/debug/logs/runs", params={"project_path": str(tmp_path)}
+        )
+        assert response.status_code == 200
+        assert len(response.json()["runs"]) == 1
+
+    @pytest.mark.asyncio
+    async def test_read_entries_reads_run_file(
+        self,
+        dev_client: AsyncClient,
+        tmp_path: Path,
+        sample_log_file: Path,
+        run_log_file: Path,
+    ):
+        """A run_id filter reads the run's own file."""
+        response = await dev_client.get(
+            "/api/debug/logs/entries",
+            params={"project_path": str(tmp_path), "run_id": "run00001"},
+        )
+        assert response.status_code == 200
+
+        data = response.json()
+        assert data["total_count"] == 3
+        assert data["entries"][0]["message"] == "Run step 0"
+
+
+class TestIndexedQueries:
+    """Tests for queries served from the log index, across rotated files."""
+
+    @pytest.fixture
+    def rotated_log_file(self, logs_dir: Path, sample_log_file: Path) -> Path:
+        """Add an older rotated backup to the sample log file."""
+        backup = logs_dir / "adkflow.jsonl.1"
+        with open(backup, "w") as f:
+            for i in range(2):
+                entry = {
+                    "timestamp": f"2023-12-31T10:00:0{i}Z",
+                    "level": "WARNING",
+                    "category": "api.request",
+                    "message": f"Old entry {i}",
+                    "run_id": "abc12345",
+                }
+                f.write(json.dumps(entry) + "\n")
+        return sample_log_file
+
+    @pytest.mark.asyncio
+    async def test_read_entries_includes_rotated_files(
+        self, dev_client: AsyncClient, tmp_path: Path, rotated_log_file: Path
+    ):
+        """Backups are read before the current file, oldest first."""
+        response = await dev_client.get(
+            "/api/debug/logs/entries", params={"project_path": str(tmp_path)}
+        )
+        data = response.json()
+        assert data["total_count"] == 6
+        assert data["entries"][0]["message"] == "Old entry 0"
+        assert data["entries"][0]["file_name"] == "adkflow.jsonl.1"
+        assert data["entries"][2]["file_name"] == "adkflow.jsonl"
+
+        response = await dev_client.get(
+            "/api/debug/logs/entries",
+            params={"project_path": str(tmp_path), "include_rotated": False},
+        )
+        assert response.json()["total_count"] == 4
+
+    @pytest.mark.asyncio
+    async def test_read_entries_newest_first(
+        self, dev_client: AsyncClient, tmp_path: Path, rotated_log_file: Path
+    ):
+        """order=desc pages from the end of the newest file."""
+        response = await dev_client.get(
+            "/api/debug/logs/entries",
+            params={
+                "project_path": str(tmp_path),
+                "order": "desc",
+                "offset": 3,
+                "limit": 2,
+            },
+        )
+        data = response.json()
+        assert [e["message"] for e in data["entries"]] == [
+            "Starting workflow",
+            "Old entry 1",
+        ]
+        assert data["total_count"] == 6
+        assert data["has_more"] is True
+
+    @pytest.mark.asyncio
+    async def test_combined_filters_and_search(
+        self, dev_client: AsyncClient, tmp_path: Path, rotated_log_file: Path
+    ):
+        """Indexed filters combine with each other and with the text search."""
+        response = await dev_client.get(
+            "/api/debug/logs/entries",
+            params={
+                "project_path": str(tmp_path),
+                "run_id": "abc12345",
+                "level": "info,warning",
+                "search": "entry 1",
+            },
+        )
+        data = response.json()
+        assert data["total_count"] == 1
+        assert data["entries"][0]["message"] == "Old entry 1"
+
+    @pytest.mark.asyncio
+    async def test_appended_entries_are_indexed(
+        self, dev_client: AsyncClient, tmp_path: Path, sample_log_file: Path
+    ):
+        """Lines appended after a query show up in the next one."""
+        params = {"project_path": str(tmp_path), "level": "ERROR"}
+        response = await dev_client.get("/api/debug/logs/entries", params=params)
+        assert response.json()["total_count"] == 1
+
+        with open(sample_log_file, "a") as f:
+            entry = {"timestamp": "2024-01-01T12:00:00Z", "level": "ERROR"}
+            f.write(json.dumps(entry) + "\n")
+            f.write('{"level": "ERROR", "message": "not yet complete')
+
+        response = await dev_client.get("/api/debug/logs/entries", params=params)
+        data = response.json()
+        assert data["total_count"] == 2
+        assert data["entries"][1]["line_number"] == 5
+
+    @pytest.mark.asyncio
+    async def test_stats_cover_rotated_files(
+        self, dev_client: AsyncClient, tmp_path: Path, rotated_log_file: Path
+    ):
+        """Stats add up the backups and the current file."""
+        response = await dev_client.get(
+            "/api/debug/logs/stats", params={"project_path": str(tmp_path)}
+        )
+        data = response.json()
+        assert data["total_lines"] == 6
+        assert data["level_counts"]["WARNING"] == 2
+        assert data["category_counts"]["api.request"] == 2
+        assert data["time_range"]["start"] == "2023-12-31T10:00:00Z"
+        assert data["time_range"]["end"] == "2024-01-01T11:00:00Z"
+
+    @pytest.mark.asyncio
+    async def test_runs_span_rotated_files(
+        self, dev_client: AsyncClient, tmp_path: Path, rotated_log_file: Path
+    ):
+        """A run continued across a rotation is listed once."""
+        response = await dev_client.get(
+            "/api/debug/logs/runs", params={"project_path": str(tmp_path)}
+        )
+        runs = {r["run_id"]: r for r in response.json()["runs"]}
+        assert runs["abc12345"]["entry_count"] == 5
+        assert runs["abc12345"]["first_timestamp"] == "2023-12-31T10:00:00Z"
+        assert runs["abc12345"]["last_timestamp"] == "2024-01-01T10:00:02Z"
+
+
+class TestConcurrentRefresh:
+    """Tests for reading indexes while another thread refreshes them."""
+
+    def test_queries_while_refreshing_on_another_thread(self, logs_dir: Path):
+        """Run listings and time-filtered queries see consistent columns."""
+        from backend.src.api.routes.jsonl_index import open_index
+        from backend.src.api.routes.log_explorer_routes import (
+            _index_runs,
+            _query_entries,
+        )
+        from backend.src.api.routes.log_index import LogIndex, LogQuery
+
+        log_file = logs_dir / "adkflow.jsonl"
+
+        def entry(i: int) -> str:
+            record = {
+                "timestamp": f"2024-01-01T10:00:{i % 60:02d}Z",
+                "level": "INFO",
+                "category": "runner",
+                "message": f"entry {i}",
+                "run_id": f"run-{i}",
+            }
+            return json.dumps(record) + "\n"
+
+        log_file.write_text(entry(0))
+        index = open_index(LogIndex, log_file)
+        assert index is not None
+        query = LogQuery(
+            levels=frozenset({"INFO"}),
+            start_time=datetime(2024, 1, 1, 10, 0, 30, tzinfo=timezone.utc),
+        )
+        done = threading.Event()
+
+        def writer() -> None:
+            for i in range(1, 100):
+                with open(log_file, "a") as f:
+                    f.writelines(entry(i * 200 + j) for j in range(200))
+                index.refresh()
+            done.set()
+
+        thread = threading.Thread(target=writer)
+        thread.start()
+        try:
+            while not done.is_set():
+                _index_runs(log_file, "adkflow.jsonl", include_rotated=False)
+                _query_entries([index], query, 0, 10, descending=True)
+        finally:
+            thread.join()
+
+        runs = _index_runs(log_file, "adkflow.jsonl", include_rotated=False)
+        assert len(runs) == 1 + 99 * 200
+
+
 class TestLogExplorerModels:
     """Tests for model parsing and data handling."""
 
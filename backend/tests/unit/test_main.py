@@ -5,7 +5,7 @@ Tests root, health, and dev info endpoints from backend/src/main.py.
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from httpx import AsyncClient
 
@@ -41,6 +41,28 @@ class TestHealthCheck:
         assert data["status"] == "healthy"
 
 
+class TestLifespan:
+    """Tests for application startup and shutdown."""
+
+    async def test_shutdown_releases_pools(self):
+        """Shutdown closes HTTP clients and tool worker pools."""
+        from backend.src import main
+
+        with (
+            patch.object(main, "init_shipped_extensions", None),
+            patch.object(main, "init_builtin_units", None),
+            patch.object(main, "init_global_extensions", None),
+            patch.object(main, "http_clients") as http_clients,
+            patch.object(main, "tool_executors") as tool_executors,
+        ):
+            http_clients.aclose = AsyncMock()
+            async with main.lifespan(main.app):
+                tool_executors.shutdown.assert_not_called()
+
+        http_clients.aclose.assert_awaited_once()
+        tool_executors.shutdown.assert_called_once_with()
+
+
 class TestDevInfo:
     """Tests for GET /api/dev/info endpoint."""
 
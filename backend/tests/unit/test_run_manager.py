@@ -9,6 +9,10 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from adkflow_runner import EventType, RunEvent
+from adkflow_runner.runner.event_hub import EventHub, Subscription
+from adkflow_runner.runner.event_store import EventStore
+
 from backend.src.api.run_manager import (
     ActiveRun,
     AsyncQueueInputProvider,
@@ -84,13 +88,13 @@ class TestActiveRun:
         assert active_run.config is config
         assert active_run.task is None
         assert active_run.result is None
-        assert active_run.events == []
-        assert active_run.subscribers == []
+        assert len(active_run.events) == 0
+        assert active_run.hub.subscriber_count == 0
         assert active_run.cancelled is False
         assert active_run.pending_inputs == {}
 
     def test_events_and_subscribers_are_mutable(self):
-        """Test that lists are mutable as expected."""
+        """Test that events and subscribers can be added."""
         config = MagicMock()
         active_run = ActiveRun(run_id="run-1", config=config)
 
@@ -100,9 +104,8 @@ class TestActiveRun:
         assert len(active_run.events) == 1
 
         # Add subscribers
-        queue: asyncio.Queue = asyncio.Queue()
-        active_run.subscribers.append(queue)
-        assert len(active_run.subscribers) == 1
+        active_run.hub.subscribe()
+        assert active_run.hub.subscriber_count == 1
 
 
 # =============================================================================
@@ -329,8 +332,8 @@ class TestRunManager:
         assert result is None
 
     @pytest.mark.asyncio
-    async def test_subscribe_returns_queue(self):
-        """Test subscribe returns a queue with events."""
+    async def test_subscribe_replays_events(self):
+        """Test subscribe returns a subscription that replays events."""
         manager = RunManager()
         config = MagicMock()
         active_run = ActiveRun(run_id="run-1", config=config)
@@ -338,20 +341,35 @@ class TestRunManager:
         # Add some existing events
         event1 = MagicMock()
         event2 = MagicMock()
-        active_run.events = [event1, event2]
+        active_run.events.append(event1)
+        active_run.events.append(event2)
         manager.runs["run-1"] = active_run
 
-        queue = await manager.subscribe("run-1")
+        subscription = await manager.subscribe("run-1")
 
-        assert isinstance(queue, asyncio.Queue)
-        assert queue in active_run.subscribers
+        assert isinstance(subscription, Subscription)
+        assert active_run.hub.subscriber_count == 1
 
         # Should receive existing events
-        received = await queue.get()
+        received = await subscription.get()
         assert received is event1
-        received = await queue.get()
+        received = await subscription.get()
         assert received is event2
 
+    @pytest.mark.asyncio
+    async def test_subscribe_from_offset(self):
+        """Test subscribe can start from a later offset."""
+        manager = RunManager()
+        active_run = ActiveRun(run_id="run-1", config=MagicMock())
+        events = [MagicMock() for _ in range(3)]
+        for event in events:
+            active_run.events.append(event)
+        manager.runs["run-1"] = active_run
+
+        subscription = await manager.subscribe("run-1", start=2)
+
+        assert await subscription.get() is events[2]
+
     @pytest.mark.asyncio
     async def test_subscribe_run_not_found(self):
         """Test subscribe raises error for nonexistent run."""
@@ -367,45 +385,45 @@ class TestRunManager:
         config = MagicMock()
         active_run = ActiveRun(run_id="run-1", config=config)
         active_run.result = MagicMock()  # Mark as completed
+        active_run.hub.close()
         manager.runs["run-1"] = active_run
 
-        queue = await manager.subscribe("run-1")
+        subscription = await manager.subscribe("run-1")
 
         # Should receive None sentinel
-        received = await queue.get()
+        received = await subscription.get()
         assert received is None
 
-    def test_unsubscribe_removes_queue(self):
-        """Test unsubscribe removes queue from subscribers."""
+    def test_unsubscribe_removes_subscription(self):
+        """Test unsubscribe removes the subscription."""
         manager = RunManager()
         config = MagicMock()
         active_run = ActiveRun(run_id="run-1", config=config)
-        queue: asyncio.Queue = asyncio.Queue()
-        active_run.subscribers.append(queue)
+        subscription = active_run.hub.subscribe()
         manager.runs["run-1"] = active_run
 
-        manager.unsubscribe("run-1", queue)
+        manager.unsubscribe("run-1", subscription)
 
-        assert queue not in active_run.subscribers
+        assert active_run.hub.subscriber_count == 0
 
-    def test_unsubscribe_nonexistent_queue(self):
-        """Test unsubscribe with queue not in subscribers."""
+    def test_unsubscribe_nonexistent_subscription(self):
+        """Test unsubscribe with a subscription of another run."""
         manager = RunManager()
         config = MagicMock()
         active_run = ActiveRun(run_id="run-1", config=config)
         manager.runs["run-1"] = active_run
 
-        queue: asyncio.Queue = asyncio.Queue()
+        other = ActiveRun(run_id="run-2", config=config).hub.subscribe()
         # Should not raise
-        manager.unsubscribe("run-1", queue)
+        manager.unsubscribe("run-1", other)
 
     def test_unsubscribe_nonexistent_run(self):
         """Test unsubscribe with nonexistent run."""
         manager = RunManager()
-        queue: asyncio.Queue = asyncio.Queue()
+        subscription = ActiveRun(run_id="run-1", config=MagicMock()).hub.subscribe()
 
         # Should not raise
-        manager.unsubscribe("nonexistent", queue)
+        manager.unsubscribe("nonexistent", subscription)
 
     @pytest.mark.asyncio
     async def test_cancel_run_success(self):
@@ -469,7 +487,7 @@ class TestRunManager:
         old_run.result = MagicMock()
         old_event = MagicMock()
         old_event.timestamp = time.time() - 7200  # 2 hours ago
-        old_run.events = [old_event]
+        old_run.events.append(old_event)
         manager.runs["old-run"] = old_run
 
         # Create a recent completed run
@@ -477,7 +495,7 @@ class TestRunManager:
         recent_run.result = MagicMock()
         recent_event = MagicMock()
         recent_event.timestamp = time.time() - 1800  # 30 minutes ago
-        recent_run.events = [recent_event]
+        recent_run.events.append(recent_event)
         manager.runs["recent-run"] = recent_run
 
         manager.cleanup_old_runs(max_age_seconds=3600)
@@ -494,7 +512,7 @@ class TestRunManager:
         running_run.result = None  # Still running
         old_event = MagicMock()
         old_event.timestamp = time.time() - 7200
-        running_run.events = [old_event]
+        running_run.events.append(old_event)
         manager.runs["running"] = running_run
 
         manager.cleanup_old_runs(max_age_seconds=3600)
@@ -509,7 +527,7 @@ class TestRunManager:
         config = MagicMock()
         run_no_events = ActiveRun(run_id="no-events", config=config)
         run_no_events.result = MagicMock()
-        run_no_events.events = []  # No events
+        # No events
         manager.runs["no-events"] = run_no_events
 
         # Should not raise
@@ -518,6 +536,29 @@ class TestRunManager:
         # Should still be there because no events to check timestamp
         assert "no-events" in manager.runs
 
+    def test_cleanup_old_runs_deletes_spilled_events(self, tmp_path):
+        """Test cleanup_old_runs deletes the run's spill file."""
+        manager = RunManager()
+
+        spill_path = tmp_path / "old-run.jsonl"
+        old_run = ActiveRun(
+            run_id="old-run",
+            config=MagicMock(),
+            hub=EventHub(EventStore(capacity=1, spill_path=spill_path)),
+        )
+        old_run.result = MagicMock()
+        for _ in range(3):
+            old_run.events.append(
+                RunEvent(type=EventType.AGENT_OUTPUT, timestamp=time.time() - 7200)
+            )
+        manager.runs["old-run"] = old_run
+        assert spill_path.exists()
+
+        manager.cleanup_old_runs(max_age_seconds=3600)
+
+        assert "old-run" not in manager.runs
+        assert not spill_path.exists()
+
 
 # =============================================================================
 # Tests for _execute method
@@ -637,11 +678,11 @@ class TestRunManagerExecute:
             run_id = await manager.start_run(request)
 
             # Subscribe to events
-            queue = await manager.subscribe(run_id)
+            subscription = await manager.subscribe(run_id)
 
             # Wait for execution to complete
             await asyncio.sleep(0.1)
 
             # Should receive None sentinel when complete
-            received = await asyncio.wait_for(queue.get(), timeout=1.0)
+            received = await asyncio.wait_for(subscription.get(), timeout=1.0)
             assert received is None
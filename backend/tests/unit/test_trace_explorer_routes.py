@@ -6,24 +6,26 @@ Tests OpenTelemetry trace file reading endpoints (development mode only).
 from __future__ import annotations
 
 import json
+import threading
 from pathlib import Path
 from typing import Any
 
 import pytest
 from httpx import AsyncClient
 
+from backend.src.api.routes.jsonl_index import open_index
 from backend.src.api.routes.trace_explorer_routes import (
-    _get_trace_file,
-    _parse_span,
-    _build_span_tree,
-    _read_all_spans,
-    _group_spans_by_trace,
-    TraceSpan,
+    TraceDetailResponse,
     TraceInfo,
     TraceListResponse,
-    TraceDetailResponse,
+    TraceSpan,
     TraceStats,
+    _build_span_tree,
+    _get_trace_file,
+    _read_trace_spans,
+    _trace_stats,
 )
+from backend.src.api.routes.trace_index import TraceIndex, merge_summaries
 
 
 def create_trace_file(
@@ -83,26 +85,6 @@ class TestGetTraceFile:
         assert path == tmp_path / "logs" / "custom.jsonl"
 
 
-class TestParseSpan:
-    """Tests for _parse_span helper function."""
-
-    def test_parse_valid_json(self):
-        """Parse valid JSON span."""
-        line = '{"trace_id": "abc", "span_id": "123", "name": "test"}'
-        result = _parse_span(line)
-        assert result == {"trace_id": "abc", "span_id": "123", "name": "test"}
-
-    def test_parse_invalid_json_returns_none(self):
-        """Return None for invalid JSON."""
-        result = _parse_span("not valid json")
-        assert result is None
-
-    def test_parse_empty_string_returns_none(self):
-        """Return None for empty string."""
-        result = _parse_span("")
-        assert result is None
-
-
 class TestBuildSpanTree:
     """Tests for _build_span_tree helper function."""
 
@@ -189,85 +171,79 @@ class TestBuildSpanTree:
         assert tree[1].span_id == "root2"
 
 
-class TestReadAllSpans:
-    """Tests for _read_all_spans helper function."""
-
-    def test_read_existing_file(self, tmp_path: Path):
-        """Read spans from existing file."""
-        spans = [make_span(span_id="s1"), make_span(span_id="s2")]
-        create_trace_file(tmp_path, spans)
+class TestTraceIndex:
+    """Tests for indexing spans by trace."""
 
-        result = _read_all_spans(tmp_path / "logs" / "traces.jsonl")
-
-        assert len(result) == 2
-        assert result[0]["span_id"] == "s1"
-        assert result[1]["span_id"] == "s2"
-
-    def test_read_nonexistent_file(self, tmp_path: Path):
-        """Return empty list for nonexistent file."""
-        result = _read_all_spans(tmp_path / "logs" / "missing.jsonl")
-        assert result == []
+    def test_reads_spans_of_one_trace(self, tmp_path: Path):
+        """A trace's rows read back only its spans, in file order."""
+        spans = [
+            make_span(trace_id="t1", span_id="s1"),
+            make_span(trace_id="t2", span_id="s2"),
+            make_span(trace_id="t1", span_id="s3"),
+        ]
+        index = open_index(TraceIndex, create_trace_file(tmp_path, spans))
 
-    def test_read_skips_empty_lines(self, tmp_path: Path):
-        """Skip empty lines in file."""
-        logs_dir = tmp_path / "logs"
-        logs_dir.mkdir()
-        trace_file = logs_dir / "traces.jsonl"
-        trace_file.write_text('{"span_id": "s1"}\n\n\n{"span_id": "s2"}\n')
+        assert list(index.traces) == ["t1", "t2"]
+        rows = index.traces["t1"].rows
+        assert [span["span_id"] for _, span in index.read_records(rows)] == [
+            "s1",
+            "s3",
+        ]
 
-        result = _read_all_spans(trace_file)
-        assert len(result) == 2
+    def test_missing_file(self, tmp_path: Path):
+        """A missing file has no index."""
+        assert open_index(TraceIndex, tmp_path / "logs" / "missing.jsonl") is None
 
-    def test_read_skips_invalid_json(self, tmp_path: Path):
-        """Skip invalid JSON lines."""
+    def test_skips_empty_and_invalid_lines(self, tmp_path: Path):
+        """Blank lines and invalid JSON are not spans."""
         logs_dir = tmp_path / "logs"
         logs_dir.mkdir()
         trace_file = logs_dir / "traces.jsonl"
-        trace_file.write_text('{"span_id": "s1"}\nnot valid json\n{"span_id": "s2"}\n')
-
-        result = _read_all_spans(trace_file)
-        assert len(result) == 2
-
-
-class TestGroupSpansByTrace:
-    """Tests for _group_spans_by_trace helper function."""
-
-    def test_group_single_trace(self):
-        """Group spans from single trace."""
-        spans = [
-            make_span(trace_id="t1", span_id="s1"),
-            make_span(trace_id="t1", span_id="s2"),
-        ]
-        result = _group_spans_by_trace(spans)
-
-        assert len(result) == 1
-        assert "t1" in result
-        assert len(result["t1"]) == 2
-
-    def test_group_multiple_traces(self):
-        """Group spans from multiple traces."""
-        spans = [
-            make_span(trace_id="t1", span_id="s1"),
-            make_span(trace_id="t2", span_id="s2"),
-            make_span(trace_id="t1", span_id="s3"),
-        ]
-        result = _group_spans_by_trace(spans)
+        trace_file.write_text(
+            '{"span_id": "s1"}\n\nnot valid json\n{"span_id": "s2"}\n'
+        )
 
-        assert len(result) == 2
-        assert len(result["t1"]) == 2
-        assert len(result["t2"]) == 1
+        index = open_index(TraceIndex, trace_file)
 
-    def test_group_empty_list(self):
-        """Handle empty span list."""
-        result = _group_spans_by_trace([])
-        assert result == {}
+        assert len(index) == 2
+        assert list(index.line_numbers) == [1, 4]
 
-    def test_group_missing_trace_id(self):
-        """Handle span with missing trace_id."""
-        spans = [{"span_id": "s1", "name": "test"}]
-        result = _group_spans_by_trace(spans)
+    def test_missing_trace_id(self, tmp_path: Path):
+        """Spans without a trace_id are grouped under "unknown"."""
+        index = open_index(
+            TraceIndex, create_trace_file(tmp_path, [{"span_id": "s1", "name": "x"}])
+        )
 
-        assert "unknown" in result
+        assert index.traces["unknown"].span_count == 1
+        assert index.traces["unknown"].root_span_name == "x"
+
+    def test_reads_while_refreshing_on_another_thread(self, tmp_path: Path):
+        """Readers see a consistent index while a worker thread extends it."""
+        trace_file = create_trace_file(tmp_path, [make_span(trace_id="t0")])
+        index = open_index(TraceIndex, trace_file)
+        assert index is not None
+        done = threading.Event()
+
+        def writer() -> None:
+            for i in range(1, 200):
+                with open(trace_file, "a") as f:
+                    for j in range(20):
+                        span = make_span(trace_id=f"t{i}-{j}", name=f"n{j}")
+                        f.write(json.dumps(span) + "\n")
+                index.refresh()
+            done.set()
+
+        thread = threading.Thread(target=writer)
+        thread.start()
+        try:
+            while not done.is_set():
+                merge_summaries([index])
+                _trace_stats(trace_file, include_rotated=False)
+                _read_trace_spans(trace_file, "t0", include_rotated=False)
+        finally:
+            thread.join()
+
+        assert len(merge_summaries([index])) == 1 + 199 * 20
 
 
 class TestTraceSpanModel:
@@ -605,6 +581,114 @@ class TestGetTraceStats:
         assert data["time_range"]["end"] == "2024-01-01T12:00:00Z"
 
 
+class TestIndexedTraces:
+    """Tests for traces served from the trace index, across rotated files."""
+
+    @pytest.fixture
+    def rotated_traces(self, tmp_path: Path) -> Path:
+        """A trace cut in two by a rotation, plus one trace in each file."""
+        create_trace_file(
+            tmp_path,
+            [
+                make_span(trace_id="old", span_id="o1", name="old_root"),
+                make_span(
+                    trace_id="split",
+                    span_id="p1",
+                    name="workflow",
+                    start_time="2024-01-01T11:00:00Z",
+                    end_time="2024-01-01T11:00:01Z",
+                ),
+            ],
+            file_name="traces.jsonl.1",
+        )
+        return create_trace_file(
+            tmp_path,
+            [
+                make_span(
+                    trace_id="split",
+                    span_id="p2",
+                    parent_span_id="p1",
+                    name="call_llm",
+                    start_time="2024-01-01T11:00:02Z",
+                    end_time="2024-01-01T11:00:05Z",
+                    status="ERROR",
+                ),
+                make_span(
+                    trace_id="new",
+                    span_id="n1",
+                    start_time="2024-01-01T12:00:00Z",
+                    end_time="2024-01-01T12:00:01Z",
+                ),
+            ],
+        )
+
+    @pytest.mark.asyncio
+    async def test_list_merges_trace_across_rotation(
+        self, dev_client: AsyncClient, tmp_path: Path, rotated_traces: Path
+    ):
+        """A trace spanning a backup and the current file is listed once."""
+        response = await dev_client.get(
+            "/api/debug/traces", params={"project_path": str(tmp_path)}
+        )
+        data = response.json()
+        assert [t["trace_id"] for t in data["traces"]] == ["new", "split", "old"]
+        split = data["traces"][1]
+        assert split["span_count"] == 2
+        assert split["root_span_name"] == "workflow"
+        assert split["duration_ms"] == 5000.0
+        assert split["has_errors"] is True
+
+        response = await dev_client.get(
+            "/api/debug/traces",
+            params={"project_path": str(tmp_path), "include_rotated": False},
+        )
+        assert response.json()["total_count"] == 2
+
+    @pytest.mark.asyncio
+    async def test_get_trace_reads_spans_from_each_file(
+        self, dev_client: AsyncClient, tmp_path: Path, rotated_traces: Path
+    ):
+        """A trace's spans are gathered from the backup and the current file."""
+        response = await dev_client.get(
+            "/api/debug/traces/split", params={"project_path": str(tmp_path)}
+        )
+        data = response.json()
+        assert [s["span_id"] for s in data["flat_spans"]] == ["p1", "p2"]
+        assert data["spans"][0]["children"][0]["name"] == "call_llm"
+
+    @pytest.mark.asyncio
+    async def test_stats_cover_rotated_files(
+        self, dev_client: AsyncClient, tmp_path: Path, rotated_traces: Path
+    ):
+        """Stats add up the backups and the current file."""
+        response = await dev_client.get(
+            "/api/debug/traces/stats", params={"project_path": str(tmp_path)}
+        )
+        data = response.json()
+        assert data["total_traces"] == 3
+        assert data["total_spans"] == 4
+        assert data["status_counts"] == {"OK": 3, "ERROR": 1}
+        assert data["time_range"]["end"] == "2024-01-01T12:00:00Z"
+
+    @pytest.mark.asyncio
+    async def test_appended_spans_update_summaries(
+        self, dev_client: AsyncClient, tmp_path: Path
+    ):
+        """Spans appended after a request show up in the next one."""
+        trace_file = create_trace_file(tmp_path, [make_span(trace_id="t1")])
+        params = {"project_path": str(tmp_path)}
+        response = await dev_client.get("/api/debug/traces", params=params)
+        assert response.json()["traces"][0]["span_count"] == 1
+
+        with open(trace_file, "a") as f:
+            f.write(json.dumps(make_span(trace_id="t1", status="ERROR")) + "\n")
+
+        response = await dev_client.get("/api/debug/traces", params=params)
+        trace = response.json()["traces"][0]
+        assert trace["span_count"] == 2
+        assert trace["has_errors"] is True
+
+
 class TestTraceListResponse:
     """Tests for TraceListResponse pydantic model."""
 
@@ -8,7 +8,9 @@ Pipeline:
 5. Validator: Validate workflow before execution
 """
 
+from adkflow_runner.compiler.cache import IRCache
 from adkflow_runner.compiler.compiler import Compiler
+from adkflow_runner.compiler.incremental import IncrementalCompiler
 from adkflow_runner.compiler.loader import ProjectLoader
 from adkflow_runner.compiler.parser import FlowParser
 from adkflow_runner.compiler.graph import GraphBuilder
@@ -17,6 +19,8 @@ from adkflow_runner.compiler.validator import WorkflowValidator
 
 __all__ = [
     "Compiler",
+    "IRCache",
+    "IncrementalCompiler",
     "ProjectLoader",
     "FlowParser",
     "GraphBuilder",
@@ -0,0 +1,218 @@
+"""Compiled IR cache.
+
+Caches WorkflowIR results keyed on a fingerprint of every file the
+loader consulted (manifest.json, referenced prompts/tools and fallback
+candidates) and on the extension registry generation. A cached entry is
+reused only while all of those files keep the same mtime and size and no
+extension was (re)loaded; any change invalidates the entry.
+
+Cached IR is never handed out directly. The runner mutates IR during a
+run (e.g. resolving context_vars), so every hit returns a deep copy.
+"""
+
+import copy
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+
+from adkflow_runner.ir import WorkflowIR
+from adkflow_runner.logging import get_logger
+
+_log = get_logger("compiler.cache")
+
+# (mtime_ns, size) for an existing file, None for a missing one
+FileStamp = tuple[int, int] | None
+
+
+def stat_file(path: Path) -> FileStamp:
+    """Get the stamp for a single file."""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def fingerprint_files(paths: list[Path]) -> dict[Path, FileStamp]:
+    """Build a fingerprint from a list of source files."""
+    return {path: stat_file(path) for path in paths}
+
+
+def fingerprint_is_stable(
+    before: dict[Path, FileStamp],
+    after: dict[Path, FileStamp],
+    load_started_ns: int,
+) -> bool:
+    """Check that no source file changed while the project was loading.
+
+    Files stamped before loading must carry the same stamp afterwards.
+    Files only discovered during loading must not have been modified
+    after loading started.
+
+    Args:
+        before: Stamps taken before loading
+        after: Stamps taken after loading
+        load_started_ns: time.time_ns() when loading started
+
+    Returns:
+        True if the loaded content matches the ``after`` stamps
+    """
+    for path, stamp in after.items():
+        if path in before:
+            if before[path] != stamp:
+                return False
+        elif stamp is not None and stamp[0] >= load_started_ns:
+            return False
+    return True
+
+
+@dataclass
+class _CacheEntry:
+    """A cached IR and the fingerprint it was compiled from."""
+
+    ir: WorkflowIR
+    fingerprint: dict[Path, FileStamp]
+    registry_generation: int = 0
+
+
+class IRCache:
+    """Thread-safe LRU cache of compiled WorkflowIR.
+
+    Usage:
+        cache = IRCache()
+        ir = cache.get(project_path, validate=True)
+        if ir is None:
+            before = fingerprint_files(cache.tracked_files(project_path))
+            ir = compile(...)
+            if fingerprint_is_stable(before, after, started_ns):
+                cache.put(project_path, ir, after, validate=True)
+    """
+
+    def __init__(self, max_entries: int = 32):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple[Path, bool], _CacheEntry] = OrderedDict()
+        # Source files last seen per project; kept across invalidation so
+        # the next compile can stamp them before loading
+        self._tracked: OrderedDict[Path, list[Path]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(
+        self,
+        project_path: Path | str,
+        validate: bool = True,
+        registry_generation: int = 0,
+    ) -> WorkflowIR | None:
+        """Get a copy of the cached IR if no source file has changed.
+
+        Args:
+            project_path: Path to the project directory
+            validate: Whether the IR was compiled with validation
+            registry_generation: Current extension registry generation
+
+        Returns:
+            A deep copy of the cached IR, or None on miss
+        """
+        key = (Path(project_path).resolve(), validate)
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        if entry.registry_generation != registry_generation:
+            _log.debug("IR cache invalidated by extension registry change")
+            self._drop(key, entry)
+            self.misses += 1
+            return None
+
+        for path, stamp in entry.fingerprint.items():
+            if stat_file(path) != stamp:
+                _log.debug("IR cache invalidated", path=str(path))
+                self._drop(key, entry)
+                self.misses += 1
+                return None
+
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+        self.hits += 1
+        return copy.deepcopy(entry.ir)
+
+    def _drop(self, key: tuple[Path, bool], entry: _CacheEntry) -> None:
+        """Remove a stale entry unless it was already replaced."""
+        with self._lock:
+            if self._entries.get(key) is entry:
+                del self._entries[key]
+
+    def tracked_files(self, project_path: Path | str) -> list[Path]:
+        """Get the source files of the last compile of a project.
+
+        Always includes manifest.json, so a project that was never
+        compiled still has its manifest stamped before loading.
+        """
+        resolved = Path(project_path).resolve()
+        with self._lock:
+            tracked = list(self._tracked.get(resolved, ()))
+        manifest = Path(project_path) / "manifest.json"
+        if manifest not in tracked:
+            tracked.append(manifest)
+        return tracked
+
+    def put(
+        self,
+        project_path: Path | str,
+        ir: WorkflowIR,
+        fingerprint: dict[Path, FileStamp],
+        validate: bool = True,
+        registry_generation: int = 0,
+    ) -> None:
+        """Store a compiled IR.
+
+        Args:
+            project_path: Path to the project directory
+            ir: Compiled IR (a private copy is stored)
+            fingerprint: Stamps of the source files, taken right after loading
+            validate: Whether the IR was compiled with validation
+            registry_generation: Extension registry generation the IR saw
+        """
+        resolved = Path(project_path).resolve()
+        key = (resolved, validate)
+        entry = _CacheEntry(
+            ir=copy.deepcopy(ir),
+            fingerprint=fingerprint,
+            registry_generation=registry_generation,
+        )
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        self.track_files(resolved, list(fingerprint))
+
+    def track_files(self, project_path: Path | str, paths: list[Path]) -> None:
+        """Remember the source files a project load consulted."""
+        resolved = Path(project_path).resolve()
+        with self._lock:
+            self._tracked[resolved] = paths
+            self._tracked.move_to_end(resolved)
+            while len(self._tracked) > self.max_entries:
+                self._tracked.popitem(last=False)
+
+    def invalidate(self, project_path: Path | str | None = None) -> None:
+        """Drop cached entries for a project, or all entries."""
+        with self._lock:
+            if project_path is None:
+                self._entries.clear()
+                self._tracked.clear()
+                return
+            resolved = Path(project_path).resolve()
+            for key in [k for k in self._entries if k[0] == resolved]:
+                del self._entries[key]
+            self._tracked.pop(resolved, None)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
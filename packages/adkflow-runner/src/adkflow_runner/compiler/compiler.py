@@ -3,8 +3,15 @@
 Provides a high-level API for compiling workflows from project paths to IR.
 """
 
+import asyncio
+import time
 from pathlib import Path
 
+from adkflow_runner.compiler.cache import (
+    IRCache,
+    fingerprint_files,
+    fingerprint_is_stable,
+)
 from adkflow_runner.compiler.graph import GraphBuilder, WorkflowGraph
 from adkflow_runner.compiler.loader import LoadedProject, ProjectLoader
 from adkflow_runner.compiler.node_transforms import transform_variable_nodes
@@ -33,11 +40,17 @@ class Compiler:
             ir = compiler.transform(graph, project)
     """
 
-    def __init__(self, config: ExecutionConfig | None = None):
+    def __init__(
+        self,
+        config: ExecutionConfig | None = None,
+        ir_cache: IRCache | None = None,
+    ):
         self.config = config or get_default_config()
+        self.ir_cache = ir_cache
         self.loader = ProjectLoader(
             load_prompts=self.config.load_prompt_content,
             load_tools=self.config.load_tool_code,
+            stream_threshold=self.config.manifest_stream_threshold,
         )
         self.parser = FlowParser()
         self.graph_builder = GraphBuilder(self.config)
@@ -56,17 +69,73 @@ class Compiler:
             validate: Whether to validate before compilation
 
         Returns:
-            WorkflowIR ready for execution
+            WorkflowIR ready for execution. When an IR cache is configured
+            and no source file changed, a copy of the cached IR is returned.
 
         Raises:
             CompilationError: If compilation fails
             ValidationError: If validation fails (when validate=True)
         """
+        if self.ir_cache is None:
+            return self.compile_project(self.load(project_path), validate=validate)
+
+        generation = _registry_generation()
+        cached = self.ir_cache.get(
+            project_path, validate=validate, registry_generation=generation
+        )
+        if cached is not None:
+            return cached
+
+        # Stamp known sources before reading them, so an edit made while
+        # loading is never cached under the newer stamps
+        before = fingerprint_files(self.ir_cache.tracked_files(project_path))
+        load_started_ns = time.time_ns()
+
         # Load
         project = self.load(project_path)
+        fingerprint = fingerprint_files(project.source_files)
+
+        ir = self.compile_project(project, validate=validate)
+
+        if (
+            fingerprint_is_stable(before, fingerprint, load_started_ns)
+            and _registry_generation() == generation
+        ):
+            self.ir_cache.put(
+                project_path,
+                ir,
+                fingerprint,
+                validate=validate,
+                registry_generation=generation,
+            )
+        else:
+            self.ir_cache.track_files(project_path, list(fingerprint))
+
+        return ir
+
+    def compile_project(
+        self,
+        project: LoadedProject,
+        validate: bool = True,
+        parsed: ParsedProject | None = None,
+    ) -> WorkflowIR:
+        """Compile an already loaded project to IR.
+
+        Args:
+            project: Loaded project
+            validate: Whether to validate before compilation
+            parsed: Parsed form of the project, if already available
+
+        Returns:
+            WorkflowIR ready for execution
 
+        Raises:
+            CompilationError: If compilation fails
+            ValidationError: If validation fails (when validate=True)
+        """
         # Parse
-        parsed = self.parse(project)
+        if parsed is None:
+            parsed = self.parse(project)
 
         # Build graph
         graph = self.build_graph(parsed)
@@ -93,6 +162,35 @@ class Compiler:
 
         return ir
 
+    async def compile_async(
+        self,
+        project_path: Path | str,
+        validate: bool = True,
+    ) -> WorkflowIR:
+        """Compile a project to IR without blocking the event loop.
+
+        File loading and compilation run on a worker thread.
+
+        Args:
+            project_path: Path to the project directory
+            validate: Whether to validate before compilation
+
+        Returns:
+            WorkflowIR ready for execution
+        """
+        return await asyncio.to_thread(self.compile, project_path, validate)
+
+    async def load_async(self, project_path: Path | str) -> LoadedProject:
+        """Load project files without blocking the event loop.
+
+        Args:
+            project_path: Path to the project directory
+
+        Returns:
+            LoadedProject with all files loaded
+        """
+        return await self.loader.load_async(Path(project_path))
+
     def load(self, project_path: Path | str) -> LoadedProject:
         """Load project files.
 
@@ -170,6 +268,15 @@ class Compiler:
         return self.transformer.transform(graph, project)
 
 
+def _registry_generation() -> int:
+    """Get the extension registry generation, or 0 without extensions."""
+    try:
+        from adkflow_runner.extensions import get_registry
+    except ImportError:
+        return 0
+    return get_registry().generation
+
+
 # Convenience function
 def compile_project(
     project_path: Path | str,
@@ -5,7 +5,7 @@ cross-tab connections via teleporters.
 """
 
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, Iterator
 
 from adkflow_runner.compiler.node_config import get_config_field
 from adkflow_runner.compiler.parser import ParsedEdge, ParsedNode, ParsedProject
@@ -161,46 +161,69 @@ class WorkflowGraph:
             CycleDetectedError: If a cycle is detected
         """
         visited: set[str] = set()
-        temp_visited: set[str] = set()
         result: list[str] = []
 
-        def visit(node_id: str, path: list[str]) -> None:
-            if node_id in temp_visited:
-                cycle_start = path.index(node_id)
-                cycle = path[cycle_start:] + [node_id]
-                # Convert IDs to names for better error messages
-                cycle_names = []
-                for nid in cycle:
-                    node = self.nodes.get(nid)
-                    cycle_names.append(node.name if node else nid)
-                node = self.nodes.get(node_id)
-                raise CycleDetectedError(
-                    cycle_nodes=cycle_names,
-                    location=ErrorLocation(
-                        node_id=node_id,
-                        node_name=node.name if node else None,
-                        tab_id=node.tab_id if node else None,
-                    ),
-                )
-            if node_id in visited:
-                return
-
-            temp_visited.add(node_id)
-            node = self.nodes.get(node_id)
-            if node:
-                for edge in node.outgoing:
-                    if edge.semantics == EdgeSemantics.SEQUENTIAL:
-                        visit(edge.target_id, path + [node_id])
+        # Current DFS path with each node's position for O(1) cycle slicing
+        path: list[str] = []
+        on_path: dict[str, int] = {}
+
+        for root_id in self.nodes:
+            if root_id in visited:
+                continue
+
+            # Each frame holds a node and an iterator over its successors
+            path.append(root_id)
+            on_path[root_id] = 0
+            stack = [(root_id, self._sequential_successors(root_id))]
+
+            while stack:
+                node_id, successors = stack[-1]
+                target_id = next(successors, None)
+
+                if target_id is None:
+                    stack.pop()
+                    path.pop()
+                    del on_path[node_id]
+                    visited.add(node_id)
+                    result.append(node_id)
+                elif target_id in on_path:
+                    cycle = path[on_path[target_id] :] + [target_id]
+                    raise self._cycle_error(cycle)
+                elif target_id not in visited:
+                    on_path[target_id] = len(path)
+                    path.append(target_id)
+                    stack.append((target_id, self._sequential_successors(target_id)))
 
-            temp_visited.remove(node_id)
-            visited.add(node_id)
-            result.append(node_id)
+        return list(reversed(result))
 
-        for node_id in self.nodes:
-            if node_id not in visited:
-                visit(node_id, [])
+    def _sequential_successors(self, node_id: str) -> Iterator[str]:
+        """Iterate over targets of a node's outgoing sequential edges."""
+        node = self.nodes.get(node_id)
+        if node is None:
+            return iter(())
+        return (
+            edge.target_id
+            for edge in node.outgoing
+            if edge.semantics == EdgeSemantics.SEQUENTIAL
+        )
 
-        return list(reversed(result))
+    def _cycle_error(self, cycle: list[str]) -> CycleDetectedError:
+        """Build a CycleDetectedError for a cycle path of node IDs."""
+        # Convert IDs to names for better error messages
+        cycle_names = []
+        for nid in cycle:
+            node = self.nodes.get(nid)
+            cycle_names.append(node.name if node else nid)
+        node_id = cycle[-1]
+        node = self.nodes.get(node_id)
+        return CycleDetectedError(
+            cycle_nodes=cycle_names,
+            location=ErrorLocation(
+                node_id=node_id,
+                node_name=node.name if node else None,
+                tab_id=node.tab_id if node else None,
+            ),
+        )
 
 
 class GraphBuilder:
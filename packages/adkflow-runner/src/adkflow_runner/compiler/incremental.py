@@ -0,0 +1,397 @@
+"""Incremental compilation driven by changed file paths.
+
+Keeps the LoadedProject, parsed tabs and IR of the last compile for each
+project. On recompile:
+- Nothing the project depends on changed: the previous IR is reused
+- A prompt, context or tool file changed: only that file is re-read
+- manifest.json changed: the manifest is re-read, referenced files whose
+  paths did not change are reused, and only tabs whose nodes or edges
+  changed are re-parsed
+
+Graph building, validation and IR transformation always run over the
+whole project; they are cheap next to file loading. A reload of the
+extension registry discards everything kept for every project, since
+FlowUnit attributes end up in the IR.
+
+State is kept for the most recently used projects only. Loading runs under
+a per-project lock, so compiling one project never waits on another
+project's file reads.
+"""
+
+import asyncio
+import copy
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable
+
+from adkflow_runner.compiler.cache import FileStamp, fingerprint_files, stat_file
+from adkflow_runner.compiler.compiler import Compiler, _registry_generation
+from adkflow_runner.compiler.graph import WorkflowGraph
+from adkflow_runner.compiler.loader import LoadedProject
+from adkflow_runner.compiler.parser import ParsedFlow, ParsedProject
+from adkflow_runner.compiler.validator import WorkflowValidator
+from adkflow_runner.errors import ValidationResult
+from adkflow_runner.ir import WorkflowIR
+from adkflow_runner.logging import get_logger
+
+_log = get_logger("compiler.incremental")
+
+# Global variable substitution rewrites node data in place, so tabs and
+# parsed flows are only reused when the project has no variable nodes
+_MUTATING_NODE_TYPES = {"variable"}
+
+
+@dataclass
+class _CompileState:
+    """Everything kept from the last compile of one project."""
+
+    project: LoadedProject
+    flows: dict[str, tuple[dict, ParsedFlow]]  # tab_id -> (flow_data, parsed)
+    fingerprint: dict[Path, FileStamp]
+    reusable: bool  # False when compiling mutated the loaded tabs
+    registry_generation: int  # Extension registry generation it was built with
+    ir: WorkflowIR | None = None  # None when the project was only validated
+    validate: bool = True  # Whether ir was compiled with validation
+
+
+class IncrementalCompiler:
+    """Recompiles projects reusing work from the previous compile.
+
+    Usage:
+        compiler = IncrementalCompiler()
+        ir = compiler.compile(project_path)
+        ...
+        ir = compiler.compile(project_path, changed_paths=["prompts/a.prompt.md"])
+
+    Without changed_paths, changes are detected by comparing the mtime and
+    size of every file the last compile consulted, plus any paths reported
+    through notify_changed() since then.
+    """
+
+    def __init__(self, compiler: Compiler | None = None, max_projects: int = 16):
+        self.compiler = compiler or Compiler()
+        self.max_projects = max_projects
+        self._states: OrderedDict[Path, _CompileState] = OrderedDict()
+        self._pending: dict[Path, set[Path]] = {}
+        self._project_locks: dict[Path, threading.Lock] = {}
+        # Guards _states, _pending and _project_locks
+        self._lock = threading.Lock()
+        # Serializes graph building, validation and transformation, which
+        # share the underlying Compiler's (stateful) validator
+        self._compile_lock = threading.Lock()
+
+    def compile(
+        self,
+        project_path: Path | str,
+        changed_paths: Iterable[Path | str] | None = None,
+        validate: bool = True,
+    ) -> WorkflowIR:
+        """Compile a project, reusing the previous compile where possible.
+
+        Args:
+            project_path: Path to the project directory
+            changed_paths: Files known to have changed, absolute or relative
+                to the project. None detects changes from file stamps and
+                notify_changed().
+            validate: Whether to validate before compilation
+
+        Returns:
+            A WorkflowIR owned by the caller
+
+        Raises:
+            CompilationError: If compilation fails
+            ValidationError: If validation fails (when validate=True)
+        """
+        root = Path(project_path).resolve()
+
+        with self._project_lock(root):
+            generation = _registry_generation()
+            state = self._get_state(root, generation)
+            if state is not None and state.ir is not None and (
+                state.validate != validate
+            ):
+                state = None
+
+            pending = self._take_pending(root)
+            try:
+                changed = self._detect_changes(root, state, changed_paths, pending)
+                if state is not None and state.ir is not None and not changed:
+                    return copy.deepcopy(state.ir)
+
+                project, parsed, fingerprint = self._load(root, state, changed)
+                return self._finish(
+                    root, project, parsed, fingerprint, validate, generation
+                )
+            except BaseException:
+                self._restore_pending(root, pending)
+                raise
+
+    async def compile_async(
+        self,
+        project_path: Path | str,
+        changed_paths: Iterable[Path | str] | None = None,
+        validate: bool = True,
+    ) -> WorkflowIR:
+        """Compile a project without blocking the event loop.
+
+        Args:
+            project_path: Path to the project directory
+            changed_paths: Files known to have changed (see compile)
+            validate: Whether to validate before compilation
+
+        Returns:
+            A WorkflowIR owned by the caller
+        """
+        return await asyncio.to_thread(
+            self.compile, project_path, changed_paths, validate
+        )
+
+    def validate(
+        self,
+        project_path: Path | str,
+        changed_paths: Iterable[Path | str] | None = None,
+    ) -> tuple[LoadedProject, WorkflowGraph, ValidationResult]:
+        """Validate a project's graph, reusing the previous load.
+
+        Unlike compile, validation problems are returned, not raised.
+
+        Args:
+            project_path: Path to the project directory
+            changed_paths: Files known to have changed (see compile)
+
+        Returns:
+            Tuple of (loaded project, workflow graph, validation result)
+
+        Raises:
+            CompilationError: If the project cannot be loaded or parsed
+        """
+        root = Path(project_path).resolve()
+
+        with self._project_lock(root):
+            generation = _registry_generation()
+            state = self._get_state(root, generation)
+            pending = self._take_pending(root)
+            try:
+                changed = self._detect_changes(root, state, changed_paths, pending)
+                project, parsed, fingerprint = self._load(root, state, changed)
+            except BaseException:
+                self._restore_pending(root, pending)
+                raise
+
+            if state is None or project is not state.project:
+                self._store(
+                    root,
+                    _CompileState(
+                        project=project,
+                        flows={
+                            tab.id: (tab.flow_data, parsed.flows[tab.id])
+                            for tab in project.tabs
+                        },
+                        fingerprint=fingerprint,
+                        reusable=self._is_reusable(parsed),
+                        registry_generation=generation,
+                    ),
+                )
+
+            graph = self.compiler.build_graph(parsed)
+            validator = WorkflowValidator(strict=self.compiler.config.strict_validation)
+            return project, graph, validator.validate_graph(graph, project)
+
+    def notify_changed(
+        self, project_path: Path | str, changed_paths: Iterable[Path | str]
+    ) -> None:
+        """Record files reported as changed by a file watcher.
+
+        They are treated as changed on the next compile or validate of the
+        project, even if their mtime and size look unchanged.
+        """
+        root = Path(project_path).resolve()
+        resolved = {(root / path).resolve() for path in changed_paths}
+        with self._lock:
+            if root in self._states:
+                self._pending.setdefault(root, set()).update(resolved)
+
+    def invalidate(self, project_path: Path | str | None = None) -> None:
+        """Forget the previous compile of a project, or of all projects."""
+        with self._lock:
+            if project_path is None:
+                self._states.clear()
+                self._pending.clear()
+            else:
+                root = Path(project_path).resolve()
+                self._states.pop(root, None)
+                self._pending.pop(root, None)
+
+    def _project_lock(self, root: Path) -> threading.Lock:
+        with self._lock:
+            lock = self._project_locks.get(root)
+            if lock is None:
+                lock = self._project_locks[root] = threading.Lock()
+            return lock
+
+    def _get_state(self, root: Path, generation: int) -> _CompileState | None:
+        """Get a project's state unless the extension registry changed since."""
+        with self._lock:
+            state = self._states.get(root)
+            if state is None:
+                return None
+            if state.registry_generation != generation:
+                _log.debug("Extension registry changed", path=str(root))
+                del self._states[root]
+                return None
+            self._states.move_to_end(root)
+            return state
+
+    def _take_pending(self, root: Path) -> set[Path]:
+        """Remove and return the paths notify_changed() recorded for a project."""
+        with self._lock:
+            return self._pending.pop(root, set())
+
+    def _restore_pending(self, root: Path, pending: set[Path]) -> None:
+        """Put back notified paths a failed compile did not consume."""
+        if not pending:
+            return
+        with self._lock:
+            if root in self._states:
+                self._pending.setdefault(root, set()).update(pending)
+
+    def _store(self, root: Path, state: _CompileState) -> None:
+        """Remember a project's state, evicting the least recently used."""
+        with self._lock:
+            self._states[root] = state
+            self._states.move_to_end(root)
+            while len(self._states) > self.max_projects:
+                evicted, _ = self._states.popitem(last=False)
+                self._pending.pop(evicted, None)
+                # Only drop the lock if no compile of that project holds it
+                lock = self._project_locks.get(evicted)
+                if lock is not None and not lock.locked():
+                    del self._project_locks[evicted]
+
+    def _detect_changes(
+        self,
+        root: Path,
+        state: _CompileState | None,
+        changed_paths: Iterable[Path | str] | None,
+        pending: set[Path],
+    ) -> set[Path]:
+        """Collect the tracked files that changed since the state was taken.
+
+        Paths notified by a file watcher (pending) count in both modes.
+        """
+        if state is None:
+            return set()
+
+        if changed_paths is None:
+            changed = {
+                path
+                for path, stamp in state.fingerprint.items()
+                if stat_file(path) != stamp
+            }
+        else:
+            changed = self._tracked_paths(root, state, changed_paths)
+        changed.update(path for path in pending if path in state.fingerprint)
+        return changed
+
+    def _tracked_paths(
+        self,
+        root: Path,
+        state: _CompileState,
+        changed_paths: Iterable[Path | str],
+    ) -> set[Path]:
+        """Resolve changed paths and keep those the project depends on."""
+        changed: set[Path] = set()
+        for path in changed_paths:
+            resolved = (root / path).resolve()
+            if resolved in state.fingerprint:
+                changed.add(resolved)
+        return changed
+
+    def _load(
+        self,
+        root: Path,
+        state: _CompileState | None,
+        changed: set[Path],
+    ) -> tuple[LoadedProject, ParsedProject, dict[Path, FileStamp]]:
+        """Load and parse a project, reusing as much of state as possible."""
+        if state is None or not state.reusable:
+            if state is not None:
+                _log.debug("Previous compile not reusable", path=str(root))
+            project = self.compiler.load(root)
+            fingerprint = fingerprint_files(project.source_files)
+            return project, self.compiler.parse(project), fingerprint
+
+        if not changed:
+            flows = {tab_id: parsed for tab_id, (_, parsed) in state.flows.items()}
+            parsed = ParsedProject(project=state.project, flows=flows)
+            return state.project, parsed, state.fingerprint
+
+        project = self.compiler.loader.reload(state.project, changed)
+        fingerprint = fingerprint_files(project.source_files)
+
+        flows: dict[str, ParsedFlow] = {}
+        reparsed = 0
+        for tab in project.tabs:
+            previous = state.flows.get(tab.id)
+            if previous is not None and (
+                previous[0] is tab.flow_data or previous[0] == tab.flow_data
+            ):
+                flows[tab.id] = previous[1]
+            else:
+                flows[tab.id] = self.compiler.parser.parse_tab(tab)
+                reparsed += 1
+
+        _log.debug(
+            "Incremental load",
+            path=str(root),
+            changed=len(changed),
+            reparsed_tabs=reparsed,
+        )
+        return project, ParsedProject(project=project, flows=flows), fingerprint
+
+    @staticmethod
+    def _is_reusable(parsed: ParsedProject) -> bool:
+        return not any(
+            node.type in _MUTATING_NODE_TYPES
+            for flow in parsed.flows.values()
+            for node in flow.nodes
+        )
+
+    def _finish(
+        self,
+        root: Path,
+        project: LoadedProject,
+        parsed: ParsedProject,
+        fingerprint: dict[Path, FileStamp],
+        validate: bool,
+        generation: int,
+    ) -> WorkflowIR:
+        """Compile the parsed project and remember the result."""
+        # Drop any stale state first so a failed compile is not reused
+        with self._lock:
+            self._states.pop(root, None)
+
+        reusable = self._is_reusable(parsed)
+        with self._compile_lock:
+            ir = self.compiler.compile_project(
+                project, validate=validate, parsed=parsed
+            )
+
+        self._store(
+            root,
+            _CompileState(
+                project=project,
+                flows={
+                    tab.id: (tab.flow_data, parsed.flows[tab.id])
+                    for tab in project.tabs
+                },
+                fingerprint=fingerprint,
+                reusable=reusable,
+                registry_generation=generation,
+                ir=copy.deepcopy(ir),
+                validate=validate,
+            ),
+        )
+        return ir
@@ -0,0 +1,172 @@
+"""Incremental JSON loading for large manifests.
+
+json.load reads the whole file into one string before parsing, so a
+multi-megabyte manifest briefly costs its text size on top of the parsed
+objects. load_json_stream reads the file in chunks instead:
+- Top-level object members are decoded one at a time
+- Top-level arrays (e.g. "nodes", "edges") are decoded element by element
+- Only the unparsed remainder of the current chunk is kept in memory
+
+The result is the same dict json.load would return, and malformed input
+raises json.JSONDecodeError with line numbers relative to the whole file.
+"""
+
+import json
+from typing import Any, NoReturn, TextIO
+
+_WHITESPACE = " \t\n\r"
+
+# Characters that can end a number or literal
+_DELIMITERS = frozenset(",]}" + _WHITESPACE)
+
+
+class _ChunkReader:
+    """Sliding text buffer over a file, consumed from the front."""
+
+    def __init__(self, fp: TextIO, chunk_size: int):
+        self.fp = fp
+        # json.load shares key strings across one document, but that memo
+        # is reset on every raw_decode call; keep one for the whole file
+        self.keys: dict[str, str] = {}
+        self.decoder = json.JSONDecoder(object_pairs_hook=self._make_object)
+        self.chunk_size = chunk_size
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+        self.line_offset = 0  # Newlines in text already dropped from buf
+
+    def fill(self, size: int | None = None) -> bool:
+        """Drop consumed text and append the next chunk."""
+        if self.eof:
+            return False
+        chunk = self.fp.read(size or self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.line_offset += self.buf.count("\n", 0, self.pos)
+        self.buf = self.buf[self.pos :] + chunk
+        self.pos = 0
+        return True
+
+    def _make_object(self, pairs: list[tuple[str, Any]]) -> dict[str, Any]:
+        keys = self.keys
+        return {keys.setdefault(key, key): value for key, value in pairs}
+
+    def peek(self) -> str:
+        """Return the next non-whitespace character without consuming it."""
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self.fill():
+                return ""
+
+    def expect(self, char: str) -> None:
+        """Consume an expected structural character."""
+        if self.peek() != char:
+            self.error(f"Expecting '{char}'")
+        self.pos += 1
+
+    def decode(self) -> Any:
+        """Decode one complete JSON value at the current position."""
+        self.peek()
+        size = self.chunk_size
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError as e:
+                if self.eof:
+                    self.error(e.msg, e.pos)
+                # Value spans past the buffer; read more, growing the read
+                # size so one huge value is not re-parsed once per chunk
+                self.fill(size)
+                size *= 2
+                continue
+            if (
+                not self.eof
+                and not isinstance(value, (dict, list, str))
+                and (end == len(self.buf) or self.buf[end] not in _DELIMITERS)
+            ):
+                # A number or literal cut by the chunk boundary ("3." of
+                # "3.25") decodes as a shorter prefix; read on until a
+                # delimiter follows it
+                if self.fill(size):
+                    size *= 2
+                    continue
+            self.pos = end
+            return value
+
+    def error(self, msg: str, pos: int | None = None) -> NoReturn:
+        """Raise JSONDecodeError with a line number in the whole file."""
+        error = json.JSONDecodeError(msg, self.buf, self.pos if pos is None else pos)
+        error.lineno += self.line_offset
+        raise error
+
+
+def load_json_stream(fp: TextIO, chunk_size: int = 64 * 1024) -> Any:
+    """Load a JSON document from a text file in chunks.
+
+    Args:
+        fp: Text file opened for reading
+        chunk_size: Number of characters to read at a time
+
+    Returns:
+        The decoded document
+
+    Raises:
+        json.JSONDecodeError: If the document is malformed
+    """
+    reader = _ChunkReader(fp, chunk_size)
+
+    if reader.peek() != "{":
+        # Only objects are streamed; anything else decodes in one piece
+        return reader.decode()
+
+    reader.expect("{")
+    result: dict[str, Any] = {}
+
+    if reader.peek() == "}":
+        reader.pos += 1
+    else:
+        while True:
+            if reader.peek() != '"':
+                reader.error("Expecting property name enclosed in double quotes")
+            key = reader.decode()
+            reader.expect(":")
+            if reader.peek() == "[":
+                result[key] = _decode_array(reader)
+            else:
+                result[key] = reader.decode()
+
+            char = reader.peek()
+            reader.pos += 1
+            if char == "}":
+                break
+            if char != ",":
+                reader.pos -= 1
+                reader.error("Expecting ',' delimiter")
+
+    if reader.peek():
+        reader.error("Extra data")
+    return result
+
+
+def _decode_array(reader: _ChunkReader) -> list[Any]:
+    """Decode a top-level array one element at a time."""
+    reader.expect("[")
+    items: list[Any] = []
+
+    if reader.peek() == "]":
+        reader.pos += 1
+        return items
+
+    while True:
+        items.append(reader.decode())
+        char = reader.peek()
+        reader.pos += 1
+        if char == "]":
+            return items
+        if char != ",":
+            reader.pos -= 1
+            reader.error("Expecting ',' delimiter")
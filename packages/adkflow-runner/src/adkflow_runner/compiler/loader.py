@@ -9,11 +9,14 @@ In v3.0 format, all nodes and edges are stored in manifest.json.
 Each node has data.tabId to indicate which tab it belongs to.
 """
 
+import asyncio
 import json
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Iterator, Literal
 
+from adkflow_runner.compiler.json_stream import load_json_stream
 from adkflow_runner.compiler.node_config import get_node_config
 from adkflow_runner.errors import (
     CompilationError,
@@ -25,6 +28,13 @@ from adkflow_runner.logging import get_logger
 
 _log = get_logger("compiler.loader")
 
+# Default stream_threshold. Streaming parses more slowly than json.load,
+# so only manifests this large, where peak memory matters, use it
+STREAM_THRESHOLD_BYTES = 4 * 1024 * 1024
+
+# Referenced prompt/tool files are read on a pool of this many threads
+DEFAULT_MAX_WORKERS = 8
+
 
 @dataclass
 class LoadedPrompt:
@@ -66,6 +76,13 @@ class LoadedProject:
     tabs: list[LoadedTab]
     prompts: dict[str, LoadedPrompt] = field(default_factory=dict)
     tools: dict[str, LoadedTool] = field(default_factory=dict)
+    # Every path consulted while loading (manifest, referenced files and
+    # fallback candidates), used to fingerprint the project for caching
+    source_files: list[Path] = field(default_factory=list)
+    settings: dict[str, Any] = field(default_factory=dict)
+    # Paths probed for each (kind, file_path) reference, so a reload can
+    # tell which references a set of changed paths touches
+    ref_candidates: dict[tuple[str, str], list[Path]] = field(default_factory=dict)
 
     def get_tab(self, tab_id: str) -> LoadedTab | None:
         """Get a tab by ID."""
@@ -83,12 +100,49 @@ class LoadedProject:
         return self.tools.get(file_path)
 
 
+@dataclass
+class _FileRef:
+    """A prompt, context or tool file referenced by a node."""
+
+    kind: Literal["prompt", "context", "tool"]
+    file_path: str  # As written in the node config
+    name: str
+    tab_id: str
+
+
+@dataclass
+class _ResolvedFile:
+    """Result of resolving and reading a _FileRef."""
+
+    candidates: list[Path]  # Every path probed, for cache fingerprints
+    absolute_path: Path
+    content: str
+
+
 class ProjectLoader:
     """Loads project files for compilation."""
 
-    def __init__(self, load_prompts: bool = True, load_tools: bool = True):
+    def __init__(
+        self,
+        load_prompts: bool = True,
+        load_tools: bool = True,
+        stream_threshold: int | None = STREAM_THRESHOLD_BYTES,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ):
+        """Initialize the loader.
+
+        Args:
+            load_prompts: Load prompt files referenced by nodes
+            load_tools: Load tool files referenced by nodes
+            stream_threshold: Manifests at least this many bytes are parsed
+                incrementally to lower peak memory, at some cost in speed.
+                None disables streaming.
+            max_workers: Maximum number of referenced files read concurrently
+        """
         self.load_prompts = load_prompts
         self.load_tools = load_tools
+        self.stream_threshold = stream_threshold
+        self.max_workers = max_workers
 
     def load(self, project_path: Path | str) -> LoadedProject:
         """Load a complete project.
@@ -126,6 +180,8 @@ class ProjectLoader:
             name=manifest.get("name", "Untitled"),
             version=manifest.get("version", "3.0"),
             tabs=tabs,
+            source_files=[project_path / "manifest.json"],
+            settings=manifest.get("settings") or {},
         )
 
         # Scan for referenced prompts and tools in the flow data
@@ -142,6 +198,71 @@ class ProjectLoader:
 
         return project
 
+    def reload(
+        self, previous: LoadedProject, changed_paths: Iterable[Path]
+    ) -> LoadedProject:
+        """Reload a project, re-reading only what the changed paths touch.
+
+        The manifest is re-read only when manifest.json changed. Referenced
+        files are re-read only when one of the paths probed while resolving
+        them changed; other references reuse the previous content.
+
+        Args:
+            previous: Project returned by an earlier load or reload
+            changed_paths: Absolute, resolved paths of changed files
+
+        Returns:
+            A new LoadedProject; the previous one is not modified
+
+        Raises:
+            CompilationError: If project structure is invalid
+        """
+        changed = set(changed_paths)
+        project_path = previous.path
+        manifest_path = project_path / "manifest.json"
+
+        if manifest_path in changed:
+            manifest = self._load_manifest(project_path)
+            tabs = self._load_tabs(manifest)
+            name = manifest.get("name", "Untitled")
+            version = manifest.get("version", "3.0")
+            settings = manifest.get("settings") or {}
+        else:
+            tabs = previous.tabs
+            name, version, settings = previous.name, previous.version, previous.settings
+
+        project = LoadedProject(
+            path=project_path,
+            name=name,
+            version=version,
+            tabs=tabs,
+            source_files=[manifest_path],
+            settings=settings,
+        )
+
+        if self.load_prompts or self.load_tools:
+            self._load_referenced_files(project, previous, changed)
+
+        _log.debug(
+            "Project reloaded",
+            name=project.name,
+            changed=len(changed),
+            manifest_changed=manifest_path in changed,
+        )
+
+        return project
+
+    async def load_async(self, project_path: Path | str) -> LoadedProject:
+        """Load a project without blocking the event loop.
+
+        Args:
+            project_path: Path to the project directory
+
+        Returns:
+            LoadedProject with all files loaded
+        """
+        return await asyncio.to_thread(self.load, project_path)
+
     def _load_manifest(self, project_path: Path) -> dict[str, Any]:
         """Load manifest.json."""
         manifest_path = project_path / "manifest.json"
@@ -152,8 +273,15 @@ class ProjectLoader:
                 location=ErrorLocation(file_path=str(manifest_path)),
             )
 
+        stream = (
+            self.stream_threshold is not None
+            and manifest_path.stat().st_size >= self.stream_threshold
+        )
+
         try:
             with open(manifest_path, encoding="utf-8") as f:
+                if stream:
+                    return load_json_stream(f)
                 return json.load(f)
         except json.JSONDecodeError as e:
             raise CompilationError(
@@ -173,27 +301,32 @@ class ProjectLoader:
         if not tab_metadata:
             raise CompilationError("No tabs defined in manifest.json")
 
-        # Get all nodes and edges from manifest
-        all_nodes = manifest.get("nodes", [])
-        all_edges = manifest.get("edges", [])
+        # Bucket nodes and edges by tab in a single pass over each list
+        tab_nodes_by_id: dict[str, list[dict[str, Any]]] = {}
+        node_tabs: dict[str, str] = {}
+        for node in manifest.get("nodes", []):
+            node_tab_id = node.get("data", {}).get("tabId")
+            tab_nodes_by_id.setdefault(node_tab_id, []).append(node)
+            node_id = node.get("id")
+            if node_id is not None:
+                node_tabs[node_id] = node_tab_id
+
+        # An edge belongs to a tab when both of its ends are in that tab
+        tab_edges_by_id: dict[str, list[dict[str, Any]]] = {}
+        for edge in manifest.get("edges", []):
+            source_tab = node_tabs.get(edge.get("source"))
+            if source_tab is not None and node_tabs.get(edge.get("target")) == (
+                source_tab
+            ):
+                tab_edges_by_id.setdefault(source_tab, []).append(edge)
 
         for tab_info in sorted(tab_metadata, key=lambda t: t.get("order", 0)):
             tab_id = tab_info.get("id")
             if not tab_id:
                 continue
 
-            # Filter nodes by tabId
-            tab_nodes = [
-                n for n in all_nodes if n.get("data", {}).get("tabId") == tab_id
-            ]
-
-            # Filter edges - both source and target must be in this tab
-            node_ids = {n["id"] for n in tab_nodes}
-            tab_edges = [
-                e
-                for e in all_edges
-                if e.get("source") in node_ids and e.get("target") in node_ids
-            ]
+            tab_nodes = tab_nodes_by_id.get(tab_id, [])
+            tab_edges = tab_edges_by_id.get(tab_id, [])
 
             # Get viewport from tab metadata
             viewport = tab_info.get("viewport", {"x": 0, "y": 0, "zoom": 1})
@@ -215,123 +348,174 @@ class ProjectLoader:
 
         return tabs
 
-    def _load_referenced_files(self, project: LoadedProject) -> None:
-        """Scan flow data and load referenced prompts/tools."""
-        for tab in project.tabs:
-            nodes = tab.flow_data.get("nodes", [])
-            for node in nodes:
-                node_type = node.get("type")
-                data = node.get("data", {})
-
-                if node_type == "prompt" and self.load_prompts:
-                    self._load_prompt_from_node(project, data, tab.id)
-                elif node_type == "context" and self.load_prompts:
-                    self._load_prompt_from_node(project, data, tab.id, is_context=True)
-                elif node_type in ("tool", "agentTool") and self.load_tools:
-                    self._load_tool_from_node(project, data, tab.id)
-
-    def _load_prompt_from_node(
+    def _load_referenced_files(
         self,
         project: LoadedProject,
-        data: dict[str, Any],
-        tab_id: str,
-        is_context: bool = False,
+        previous: LoadedProject | None = None,
+        changed: set[Path] | None = None,
     ) -> None:
-        """Load a prompt file referenced by a node."""
-        config = get_node_config(data)
-        file_path = config.get("file_path")
+        """Scan flow data and load referenced prompts/tools.
 
-        if not file_path or file_path in project.prompts:
+        References are collected first, then resolved and read concurrently
+        on a bounded thread pool. Results are applied in node order, so the
+        first failing node is the one reported. When a previous project is
+        given, references untouched by the changed paths reuse its content.
+        """
+        refs = self._collect_file_refs(project)
+        if not refs:
             return
 
-        # file_path may already include the directory (e.g., "prompts/file.prompt.md")
-        # or just the filename. Handle both cases.
-        absolute_path = (project.path / file_path).resolve()
+        resolved: list[_ResolvedFile | None] = [
+            self._reuse_file_ref(previous, ref, changed or set())
+            if previous is not None
+            else None
+            for ref in refs
+        ]
+        to_read = [ref for ref, result in zip(refs, resolved) if result is None]
 
-        # If not found, try with default directory prefix
-        if not absolute_path.exists():
-            if is_context:
-                absolute_path = (project.path / "static" / file_path).resolve()
-            else:
-                absolute_path = (project.path / "prompts" / file_path).resolve()
+        def read(ref: _FileRef) -> _ResolvedFile:
+            return self._read_file_ref(project.path, ref)
 
-        # Security check: ensure path is within project
-        try:
-            absolute_path.relative_to(project.path)
-        except ValueError:
-            raise PromptLoadError(
-                f"Prompt path escapes project directory: {file_path}",
-                location=ErrorLocation(tab_id=tab_id, file_path=file_path),
-            )
+        workers = min(self.max_workers, len(to_read))
+        if workers <= 1:
+            self._apply_file_refs(project, refs, resolved, map(read, to_read))
+            return
 
-        if not absolute_path.exists():
-            raise PromptLoadError(
-                f"Prompt file not found: {file_path}",
-                location=ErrorLocation(tab_id=tab_id, file_path=str(absolute_path)),
-            )
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="project-loader"
+        ) as executor:
+            self._apply_file_refs(project, refs, resolved, executor.map(read, to_read))
+
+    def _reuse_file_ref(
+        self, previous: LoadedProject, ref: _FileRef, changed: set[Path]
+    ) -> _ResolvedFile | None:
+        """Get a reference's previous result if none of its paths changed."""
+        candidates = previous.ref_candidates.get((ref.kind, ref.file_path))
+        if candidates is None or not changed.isdisjoint(candidates):
+            return None
+
+        if ref.kind == "tool":
+            tool = previous.tools.get(ref.file_path)
+            if tool is None:
+                return None
+            return _ResolvedFile(candidates, tool.absolute_path, tool.code)
+
+        prompt = previous.prompts.get(ref.file_path)
+        if prompt is None:
+            return None
+        return _ResolvedFile(candidates, prompt.absolute_path, prompt.content)
+
+    def _collect_file_refs(self, project: LoadedProject) -> list[_FileRef]:
+        """Collect referenced files in node order, first reference wins."""
+        refs: list[_FileRef] = []
+        seen_prompts: set[str] = set()
+        seen_tools: set[str] = set()
 
-        try:
-            content = absolute_path.read_text(encoding="utf-8")
-        except Exception as e:
-            raise PromptLoadError(
-                f"Failed to read prompt file: {e}",
-                location=ErrorLocation(tab_id=tab_id, file_path=str(absolute_path)),
-            ) from e
-
-        project.prompts[file_path] = LoadedPrompt(
-            name=config.get("name", file_path),
-            file_path=file_path,
-            absolute_path=absolute_path,
-            content=content,
-        )
+        for tab in project.tabs:
+            nodes = tab.flow_data.get("nodes", [])
+            for node in nodes:
+                node_type = node.get("type")
+                data = node.get("data", {})
 
-    def _load_tool_from_node(
+                if node_type in ("prompt", "context") and self.load_prompts:
+                    kind = "prompt" if node_type == "prompt" else "context"
+                    seen = seen_prompts
+                elif node_type in ("tool", "agentTool") and self.load_tools:
+                    kind = "tool"
+                    seen = seen_tools
+                else:
+                    continue
+
+                config = get_node_config(data)
+                file_path = config.get("file_path")
+                if not file_path or file_path in seen:
+                    continue
+                seen.add(file_path)
+
+                if kind == "tool":
+                    name = config.get("name", Path(file_path).stem)
+                else:
+                    name = config.get("name", file_path)
+                refs.append(_FileRef(kind, file_path, name, tab.id))
+
+        return refs
+
+    def _apply_file_refs(
         self,
         project: LoadedProject,
-        data: dict[str, Any],
-        tab_id: str,
+        refs: list[_FileRef],
+        resolved: list[_ResolvedFile | None],
+        fresh: Iterator[_ResolvedFile],
     ) -> None:
-        """Load a tool file referenced by a node."""
-        config = get_node_config(data)
-        file_path = config.get("file_path")
+        """Store loaded files on the project in reference order.
 
-        if not file_path or file_path in project.tools:
-            return
+        Entries of resolved that are None are taken from fresh, in order.
+        """
+        for ref, result in zip(refs, resolved):
+            if result is None:
+                result = next(fresh)
+            project.source_files.extend(result.candidates)
+            project.ref_candidates[(ref.kind, ref.file_path)] = result.candidates
+            if ref.kind == "tool":
+                project.tools[ref.file_path] = LoadedTool(
+                    name=ref.name,
+                    file_path=ref.file_path,
+                    absolute_path=result.absolute_path,
+                    code=result.content,
+                )
+            else:
+                project.prompts[ref.file_path] = LoadedPrompt(
+                    name=ref.name,
+                    file_path=ref.file_path,
+                    absolute_path=result.absolute_path,
+                    content=result.content,
+                )
+
+    def _read_file_ref(self, project_path: Path, ref: _FileRef) -> _ResolvedFile:
+        """Resolve and read one referenced file.
+
+        Runs on loader worker threads, so it only touches its arguments.
+        """
+        if ref.kind == "tool":
+            error_type: type[CompilationError] = ToolLoadError
+            label = "Tool"
+            fallback_dir = "tools"
+        else:
+            error_type = PromptLoadError
+            label = "Prompt"
+            fallback_dir = "static" if ref.kind == "context" else "prompts"
 
-        # file_path may already include the directory (e.g., "tools/file.py")
+        # file_path may already include the directory (e.g., "prompts/file.prompt.md")
         # or just the filename. Handle both cases.
-        absolute_path = (project.path / file_path).resolve()
+        absolute_path = (project_path / ref.file_path).resolve()
+        candidates = [absolute_path]
 
-        # If not found, try with tools/ prefix
+        # If not found, try with default directory prefix
         if not absolute_path.exists():
-            absolute_path = (project.path / "tools" / file_path).resolve()
+            absolute_path = (project_path / fallback_dir / ref.file_path).resolve()
+            candidates.append(absolute_path)
 
-        # Security check
+        # Security check: ensure path is within project
         try:
-            absolute_path.relative_to(project.path)
+            absolute_path.relative_to(project_path)
         except ValueError:
-            raise ToolLoadError(
-                f"Tool path escapes project directory: {file_path}",
-                location=ErrorLocation(tab_id=tab_id, file_path=file_path),
+            raise error_type(
+                f"{label} path escapes project directory: {ref.file_path}",
+                location=ErrorLocation(tab_id=ref.tab_id, file_path=ref.file_path),
             )
 
         if not absolute_path.exists():
-            raise ToolLoadError(
-                f"Tool file not found: {file_path}",
-                location=ErrorLocation(tab_id=tab_id, file_path=str(absolute_path)),
+            raise error_type(
+                f"{label} file not found: {ref.file_path}",
+                location=ErrorLocation(tab_id=ref.tab_id, file_path=str(absolute_path)),
             )
 
         try:
-            code = absolute_path.read_text(encoding="utf-8")
+            content = absolute_path.read_text(encoding="utf-8")
         except Exception as e:
-            raise ToolLoadError(
-                f"Failed to read tool file: {e}",
-                location=ErrorLocation(tab_id=tab_id, file_path=str(absolute_path)),
+            raise error_type(
+                f"Failed to read {label.lower()} file: {e}",
+                location=ErrorLocation(tab_id=ref.tab_id, file_path=str(absolute_path)),
             ) from e
 
-        project.tools[file_path] = LoadedTool(
-            name=config.get("name", Path(file_path).stem),
-            file_path=file_path,
-            absolute_path=absolute_path,
-            code=code,
-        )
+        return _ResolvedFile(candidates, absolute_path, content)
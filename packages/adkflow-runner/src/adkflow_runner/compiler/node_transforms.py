@@ -13,6 +13,8 @@ from adkflow_runner.ir import (
     ConnectionSource,
     ContextAggregatorIR,
     CustomNodeIR,
+    ExecutionLimitsIR,
+    UnitLimitsIR,
     UserInputIR,
     VariableIR,
 )
@@ -161,12 +163,18 @@ def transform_custom_nodes(graph: WorkflowGraph) -> list[CustomNodeIR]:
             output_node = False
             always_execute = False
             lazy_inputs: list[str] = []
+            max_concurrency: int | None = None
+            rate_limit: float | None = None
+            rate_limit_burst = 1
 
             if registry:
                 flow_unit_cls = registry.get_unit(unit_id)
                 if flow_unit_cls:
                     output_node = getattr(flow_unit_cls, "OUTPUT_NODE", False)
                     always_execute = getattr(flow_unit_cls, "ALWAYS_EXECUTE", False)
+                    max_concurrency = getattr(flow_unit_cls, "MAX_CONCURRENCY", None)
+                    rate_limit = getattr(flow_unit_cls, "RATE_LIMIT", None)
+                    rate_limit_burst = getattr(flow_unit_cls, "RATE_LIMIT_BURST", 1)
 
                     # Find lazy input ports from UI schema
                     try:
@@ -189,6 +197,9 @@ def transform_custom_nodes(graph: WorkflowGraph) -> list[CustomNodeIR]:
                     output_node=output_node,
                     always_execute=always_execute,
                     lazy_inputs=lazy_inputs,
+                    max_concurrency=max_concurrency,
+                    rate_limit=rate_limit,
+                    rate_limit_burst=rate_limit_burst,
                 )
             )
 
@@ -298,3 +309,32 @@ def transform_variable_nodes(
             global_variables.update(variables)
 
     return variable_nodes, global_variables
+
+
+def transform_execution_limits(settings: dict[str, Any]) -> ExecutionLimitsIR:
+    """Transform project settings to custom node execution limits.
+
+    Reads manifest settings of the form:
+        "customNodes": {
+            "maxConcurrency": 16,
+            "units": {
+                "advanced.api_client": {
+                    "maxConcurrency": 4, "rateLimit": 5, "rateLimitBurst": 5
+                }
+            }
+        }
+    """
+    custom_nodes = settings.get("customNodes") or {}
+    units = {
+        unit_id: UnitLimitsIR(
+            max_concurrency=limits.get("maxConcurrency"),
+            rate_limit=limits.get("rateLimit"),
+            rate_limit_burst=limits.get("rateLimitBurst"),
+        )
+        for unit_id, limits in (custom_nodes.get("units") or {}).items()
+        if isinstance(limits, dict)
+    }
+    return ExecutionLimitsIR(
+        max_concurrency=custom_nodes.get("maxConcurrency"),
+        units=units,
+    )
@@ -3,7 +3,7 @@
 Extracts and resolves data from connected nodes in the workflow graph.
 """
 
-from typing import Literal
+from typing import Any, Literal
 
 from adkflow_runner.compiler.graph import GraphNode, WorkflowGraph
 from adkflow_runner.compiler.loader import LoadedProject
@@ -90,6 +90,18 @@ def resolve_include_contents(
     return "default"
 
 
+# Tool node config keys that control how the runner executes sync tools
+_TOOL_EXECUTION_KEYS = ("execution_mode", "max_workers", "timeout")
+
+
+def _tool_execution_config(config: dict[str, Any]) -> dict[str, Any] | None:
+    """Pick the execution settings from a tool node's config, if any."""
+    execution = {
+        key: config[key] for key in _TOOL_EXECUTION_KEYS if config.get(key) is not None
+    }
+    return execution or None
+
+
 def resolve_tools(
     node: GraphNode,
     graph: WorkflowGraph,
@@ -117,6 +129,7 @@ def resolve_tools(
                                 file_path=file_path,
                                 code=loaded.code,
                                 error_behavior=error_behavior,
+                                config=_tool_execution_config(config),
                             )
                         )
                 else:
@@ -128,6 +141,7 @@ def resolve_tools(
                                 name=config.get("name", f"tool_{source_node.id[:8]}"),
                                 code=code,
                                 error_behavior=error_behavior,
+                                config=_tool_execution_config(config),
                             )
                         )
             elif source_node.type == "shellTool":
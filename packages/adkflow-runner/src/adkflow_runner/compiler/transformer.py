@@ -11,6 +11,7 @@ from adkflow_runner.compiler.node_config import get_node_config
 from adkflow_runner.compiler.node_transforms import (
     transform_context_aggregators,
     transform_custom_nodes,
+    transform_execution_limits,
     transform_user_inputs,
     transform_variable_nodes,
 )
@@ -172,6 +173,7 @@ class IRTransformer:
                 "project_name": project.name,
                 "version": project.version,
             },
+            execution_limits=transform_execution_limits(project.settings),
         )
 
     def _transform_agent(
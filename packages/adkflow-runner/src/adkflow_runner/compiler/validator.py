@@ -149,8 +149,59 @@ class WorkflowValidator:
                     )
                 )
 
+        # Check custom node concurrency and rate limits
+        self._check_execution_limits(ir, result)
+
         return result
 
+    def _check_execution_limits(
+        self, ir: WorkflowIR, result: ValidationResult
+    ) -> None:
+        """Check that concurrency and rate limits are positive numbers."""
+
+        def check(
+            value: object,
+            name: str,
+            integer: bool,
+            where: str,
+            location: ErrorLocation | None = None,
+        ) -> None:
+            if value is None:
+                return
+            valid_type = (int,) if integer else (int, float)
+            if (
+                isinstance(value, bool)
+                or not isinstance(value, valid_type)
+                or value <= 0
+            ):
+                kind = "positive integer" if integer else "positive number"
+                result.add_error(
+                    ValidationError(
+                        f"{where}: '{name}' must be a {kind} "
+                        f"(omit it for no limit), got {value!r}",
+                        location=location,
+                    )
+                )
+
+        limits = ir.execution_limits
+        check(limits.max_concurrency, "maxConcurrency", True, "settings.customNodes")
+        for unit_id, unit in limits.units.items():
+            where = f"settings.customNodes.units['{unit_id}']"
+            check(unit.max_concurrency, "maxConcurrency", True, where)
+            check(unit.rate_limit, "rateLimit", False, where)
+            check(unit.rate_limit_burst, "rateLimitBurst", True, where)
+
+        checked_units: set[str] = set()
+        for node in ir.custom_nodes:
+            if node.unit_id in checked_units:
+                continue
+            checked_units.add(node.unit_id)
+            where = f"FlowUnit '{node.unit_id}'"
+            location = ErrorLocation(node_id=node.source_node_id)
+            check(node.max_concurrency, "MAX_CONCURRENCY", True, where, location)
+            check(node.rate_limit, "RATE_LIMIT", False, where, location)
+            check(node.rate_limit_burst, "RATE_LIMIT_BURST", True, where, location)
+
     def _check_cycles(self, graph: WorkflowGraph, result: ValidationResult) -> None:
         """Check for cycles in sequential flow."""
         try:
@@ -244,6 +244,11 @@ DEFAULT_EDGE_RULES: list[EdgeRule] = [
 ]
 
 
+# Max memoized handle combinations per config; handle names come from
+# manifests, so the long-lived default config must not grow without bound
+SEMANTICS_CACHE_SIZE = 4096
+
+
 @dataclass
 class ExecutionConfig:
     """Configuration for workflow execution."""
@@ -263,6 +268,20 @@ class ExecutionConfig:
     strict_validation: bool = True  # Fail on warnings
     load_tool_code: bool = True  # Load tool code at compile time
     load_prompt_content: bool = True  # Load prompt content at compile time
+    # Manifests at least this many bytes are stream-parsed to lower peak
+    # memory (slower than json.load); None disables streaming
+    manifest_stream_threshold: int | None = 4 * 1024 * 1024
+
+    # Compiled edge rule index, rebuilt when edge_rules changes
+    _rule_index: dict[tuple[str, str], list[EdgeRule]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _semantics_cache: dict[tuple[str, str, str | None, str | None], EdgeSemantics] = (
+        field(default_factory=dict, init=False, repr=False, compare=False)
+    )
+    _indexed_rules: tuple[int, int] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def get_edge_semantics(
         self,
@@ -271,17 +290,47 @@ class ExecutionConfig:
         source_handle: str | None = None,
         target_handle: str | None = None,
     ) -> EdgeSemantics:
-        """Get the semantics for an edge based on rules."""
-        # Sort by priority (descending)
-        sorted_rules = sorted(self.edge_rules, key=lambda r: -r.priority)
-
-        for rule in sorted_rules:
-            if self._rule_matches(
-                rule, source_type, target_type, source_handle, target_handle
-            ):
-                return rule.semantics
-
-        return EdgeSemantics.UNKNOWN
+        """Get the semantics for an edge based on rules.
+
+        Rules are compiled into an index keyed on (source_type, target_type)
+        and results are memoized per handle combination (up to
+        SEMANTICS_CACHE_SIZE of them), so classifying an edge is O(1) after
+        the first edge of its kind.
+        """
+        if self._indexed_rules != (id(self.edge_rules), len(self.edge_rules)):
+            self.compile_rules()
+
+        key = (source_type, target_type, source_handle, target_handle)
+        semantics = self._semantics_cache.get(key)
+        if semantics is None:
+            semantics = EdgeSemantics.UNKNOWN
+            # Bucket is ordered by priority, highest first
+            for rule in self._rule_index.get((source_type, target_type), ()):
+                if self._rule_matches(
+                    rule, source_type, target_type, source_handle, target_handle
+                ):
+                    semantics = rule.semantics
+                    break
+            if len(self._semantics_cache) >= SEMANTICS_CACHE_SIZE:
+                # Evict the oldest entry (dicts keep insertion order)
+                del self._semantics_cache[next(iter(self._semantics_cache))]
+            self._semantics_cache[key] = semantics
+        return semantics
+
+    def compile_rules(self) -> None:
+        """Rebuild the rule index from edge_rules.
+
+        Called automatically by add_rule and remove_rules_for, and when the
+        edge_rules list is replaced or grows. Call it after editing rules
+        in place.
+        """
+        index: dict[tuple[str, str], list[EdgeRule]] = {}
+        # Stable sort keeps declaration order among equal priorities
+        for rule in sorted(self.edge_rules, key=lambda r: -r.priority):
+            index.setdefault((rule.source_type, rule.target_type), []).append(rule)
+        self._rule_index = index
+        self._semantics_cache = {}
+        self._indexed_rules = (id(self.edge_rules), len(self.edge_rules))
 
     def _rule_matches(
         self,
@@ -305,6 +354,7 @@ class ExecutionConfig:
     def add_rule(self, rule: EdgeRule) -> None:
         """Add a custom edge rule."""
         self.edge_rules.append(rule)
+        self.compile_rules()
 
     def remove_rules_for(self, source_type: str, target_type: str) -> None:
         """Remove all rules for a specific source/target combination."""
@@ -313,6 +363,7 @@ class ExecutionConfig:
             for r in self.edge_rules
             if not (r.source_type == source_type and r.target_type == target_type)
         ]
+        self.compile_rules()
 
 
 # Global default configuration
@@ -86,6 +86,18 @@ class ExecutionError(ExecutionLayerError):
         super().__init__(message, location, details)
 
 
+class ToolTimeoutError(ExecutionError):
+    """A tool call did not finish within its timeout."""
+
+    pass
+
+
+class SlowConsumerError(ExecutionError):
+    """An event subscriber fell too far behind and was disconnected."""
+
+    pass
+
+
 class ToolLoadError(CompilationError):
     """Error loading a tool from file."""
 
@@ -208,6 +208,11 @@ class FlowUnit(ABC):
     OUTPUT_NODE: bool = False  # True = sink node (writes file, sends API, etc.)
     ALWAYS_EXECUTE: bool = False  # True = skip cache, always run
 
+    # Execution limits (project settings can override these per UNIT_ID)
+    MAX_CONCURRENCY: int | None = None  # Max instances running at once
+    RATE_LIMIT: float | None = None  # Max executions per second
+    RATE_LIMIT_BURST: int = 1  # Executions allowed back-to-back
+
     @classmethod
     @abstractmethod
     def setup_interface(cls) -> UISchema:
@@ -285,8 +290,10 @@ class FlowUnit(ABC):
         """Control when the node should re-execute.
 
         Override to implement custom change detection. The return value is
-        compared to the previous run's return value. If different, the node
-        re-executes even if inputs/config hash matches.
+        part of the result cache key together with the node's inputs and
+        config, so a cached result is reused only for a matching value
+        (from any earlier run sharing the cache). A new value re-executes
+        the node even if inputs/config are unchanged.
 
         Special values:
             - Return float('nan') to always execute (NaN != NaN)
@@ -297,7 +304,7 @@ class FlowUnit(ABC):
             inputs: Input values from connected ports
 
         Returns:
-            Any value for comparison with previous run
+            Any value to include in the result cache key
         """
         return None
 
@@ -45,6 +45,10 @@ class ExtensionRegistry:
         self._file_mtimes: dict[str, float] = {}
         self._lock = threading.RLock()
 
+        # Bumped whenever the registered units change, so compiled IR that
+        # baked in FlowUnit class attributes can be invalidated
+        self._generation = 0
+
         # Legacy single-path support (for backwards compatibility)
         self._extensions_path: Path | None = None
 
@@ -157,18 +161,21 @@ class ExtensionRegistry:
         Returns:
             Number of units registered from this package
         """
-        return load_extension_package(
-            package_dir=package_dir,
-            scope=scope,
-            registrar=self,
-            hooks_registry=self._hooks_registry,
-            file_mtimes=self._file_mtimes,
-            source_files=self._source_files,
-            scopes=self._scopes,
-            units=self._units,
-            schemas=self._schemas,
-            lock=self._lock,
-        )
+        try:
+            return load_extension_package(
+                package_dir=package_dir,
+                scope=scope,
+                registrar=self,
+                hooks_registry=self._hooks_registry,
+                file_mtimes=self._file_mtimes,
+                source_files=self._source_files,
+                scopes=self._scopes,
+                units=self._units,
+                schemas=self._schemas,
+                lock=self._lock,
+            )
+        finally:
+            self._bump_generation()
 
     def _load_module(
         self, file_path: Path, scope: ExtensionScope = ExtensionScope.PROJECT
@@ -182,17 +189,20 @@ class ExtensionRegistry:
         Returns:
             Number of units registered from this file
         """
-        return load_module_legacy(
-            file_path=file_path,
-            scope=scope,
-            registrar=self,
-            file_mtimes=self._file_mtimes,
-            source_files=self._source_files,
-            scopes=self._scopes,
-            units=self._units,
-            schemas=self._schemas,
-            lock=self._lock,
-        )
+        try:
+            return load_module_legacy(
+                file_path=file_path,
+                scope=scope,
+                registrar=self,
+                file_mtimes=self._file_mtimes,
+                source_files=self._source_files,
+                scopes=self._scopes,
+                units=self._units,
+                schemas=self._schemas,
+                lock=self._lock,
+            )
+        finally:
+            self._bump_generation()
 
     def register_unit(
         self, unit_cls: type[FlowUnit], file_path: Path, scope: ExtensionScope
@@ -232,6 +242,7 @@ class ExtensionRegistry:
         self._units[unit_id] = unit_cls
         self._source_files[unit_id] = file_path
         self._scopes[unit_id] = scope
+        self._bump_generation()
 
         # Generate JSON schema for frontend
         try:
@@ -335,6 +346,16 @@ class ExtensionRegistry:
         """Stop project file watcher."""
         self._file_watcher.stop_watching_project()
 
+    def _bump_generation(self) -> None:
+        """Record that the set of registered units changed."""
+        with self._lock:
+            self._generation += 1
+
+    @property
+    def generation(self) -> int:
+        """Counter that changes whenever registered units change."""
+        return self._generation
+
     def get_unit(self, unit_id: str) -> type[FlowUnit] | None:
         """Get FlowUnit class by ID."""
         with self._lock:
@@ -388,6 +409,7 @@ class ExtensionRegistry:
             Number of units loaded
         """
         with self._lock:
+            self._bump_generation()
             self._units.clear()
             self._schemas.clear()
             self._source_files.clear()
@@ -430,6 +452,7 @@ class ExtensionRegistry:
             return 0
 
         with self._lock:
+            self._bump_generation()
             # Remove global units
             global_units = [
                 uid
@@ -463,6 +486,7 @@ class ExtensionRegistry:
             return 0
 
         with self._lock:
+            self._bump_generation()
             # Remove project units
             project_units = [
                 uid
@@ -493,6 +517,7 @@ class ExtensionRegistry:
         before loading a new project's extensions.
         """
         with self._lock:
+            self._bump_generation()
             # Stop project watcher
             self.stop_watching_project()
 
@@ -534,6 +559,7 @@ class ExtensionRegistry:
         """
         count = 0
         with self._lock:
+            self._bump_generation()
             for unit_cls in unit_classes:
                 if not (
                     hasattr(unit_cls, "UNIT_ID")
@@ -582,6 +608,7 @@ class ExtensionRegistry:
         """
         count = 0
         with self._lock:
+            self._bump_generation()
             for unit_cls in unit_classes:
                 if not hasattr(unit_cls, "UNIT_ID"):
                     print(
@@ -342,6 +342,29 @@ class CustomNodeIR:
     output_node: bool = False  # Sink node - triggers execution trace
     always_execute: bool = False  # Skip cache, always run
     lazy_inputs: list[str] = field(default_factory=list)  # Port IDs marked lazy
+    max_concurrency: int | None = None  # Max concurrent runs of this unit
+    rate_limit: float | None = None  # Max runs per second of this unit
+    rate_limit_burst: int = 1  # Token bucket size for rate_limit
+
+
+@dataclass
+class UnitLimitsIR:
+    """Concurrency and rate limits for one FlowUnit type."""
+
+    max_concurrency: int | None = None
+    rate_limit: float | None = None  # Runs per second
+    rate_limit_burst: int | None = None
+
+
+@dataclass
+class ExecutionLimitsIR:
+    """Custom node execution limits from project settings.
+
+    Per-unit values override the FlowUnit class attributes.
+    """
+
+    max_concurrency: int | None = None  # Global limit across all custom nodes
+    units: dict[str, UnitLimitsIR] = field(default_factory=dict)  # By UNIT_ID
 
 
 @dataclass
@@ -409,6 +432,7 @@ class WorkflowIR:
         default_factory=dict
     )  # Legacy, kept for compatibility
     metadata: dict[str, Any] = field(default_factory=dict)
+    execution_limits: ExecutionLimitsIR = field(default_factory=ExecutionLimitsIR)
 
     # Flow control nodes (for topology visualization)
     has_start_node: bool = False
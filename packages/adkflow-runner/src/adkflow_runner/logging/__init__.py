@@ -82,9 +82,18 @@ from adkflow_runner.logging.handlers import (
     Handler,
     LogRecord,
     NullHandler,
+    QueueHandler,
+    QueueStats,
     RotatingFileHandler,
 )
 from adkflow_runner.logging.logger import Logger, get_logger, reset_loggers
+from adkflow_runner.logging.run_logs import (
+    RunLogHandler,
+    RunSummary,
+    read_run_index,
+    retire_runs,
+    run_log_path,
+)
 
 __all__ = [
     # Core
@@ -117,7 +126,15 @@ __all__ = [
     "Handler",
     "ConsoleHandler",
     "RotatingFileHandler",
+    "QueueHandler",
+    "QueueStats",
     "NullHandler",
+    # Per-run log files
+    "RunLogHandler",
+    "RunSummary",
+    "read_run_index",
+    "retire_runs",
+    "run_log_path",
     # Testing
     "reset_loggers",
 ]
@@ -1,4 +1,10 @@
-"""Category registry and hierarchy management for logging."""
+"""Category registry and hierarchy management for logging.
+
+Every change to levels or enabled flags bumps the registry's generation
+counter. Loggers cache their resolved threshold together with the
+generation it was computed at, and only resolve again after a change,
+so checking whether a message is enabled takes no lock.
+"""
 
 from __future__ import annotations
 
@@ -13,6 +19,9 @@ from adkflow_runner.logging.constants import (
     LogLevel,
 )
 
+# Threshold of disabled categories; higher than any level, including OFF
+DISABLED_THRESHOLD = int(LogLevel.OFF) + 1
+
 
 @dataclass
 class CategoryNode:
@@ -42,6 +51,9 @@ class CategoryRegistry:
         # Use RLock to allow reentrant locking (needed when is_enabled calls get_effective_level)
         self._lock = threading.RLock()
         self._default_level = LogLevel.INFO
+        # Bumped on every change that can affect resolution; read without
+        # the lock by loggers checking whether their cached level is stale
+        self.generation = 0
 
     def register(
         self,
@@ -73,12 +85,14 @@ class CategoryRegistry:
                     )
                     current_dict[part] = node
                     self._all_paths.add(current_path)
+                    self.generation += 1
                 else:
                     node = current_dict[part]
                     # Update level if this is the target path
                     if i == len(parts) - 1 and level is not None:
                         node.level = level
                         node.enabled = enabled
+                        self.generation += 1
 
                 parent = node
                 current_dict = node.children
@@ -129,6 +143,7 @@ class CategoryRegistry:
                     node.level = level
                 else:
                     self.register(category_pattern, level=level)
+            self.generation += 1
 
     def clear_level(self, category_pattern: str) -> None:
         """Clear the explicit level for a category (revert to inheritance).
@@ -146,6 +161,7 @@ class CategoryRegistry:
                 node = self._get_unlocked(category_pattern)
                 if node:
                     node.level = None
+            self.generation += 1
 
     def set_enabled(self, category_pattern: str, enabled: bool) -> None:
         """Enable/disable a category pattern."""
@@ -160,22 +176,44 @@ class CategoryRegistry:
                 node = self._get_unlocked(category_pattern)
                 if node:
                     node.enabled = enabled
+            self.generation += 1
 
     def get_effective_level(self, category_path: str) -> LogLevel:
         """Get the effective level for a category (inherits from parent if not set)."""
+        with self._lock:
+            return self._effective_level(self._get_unlocked(category_path))
+
+    def _effective_level(self, node: CategoryNode | None) -> LogLevel:
+        # Walk up the tree to find an explicit level
+        current = node
+        while current is not None:
+            if current.level is not None:
+                return current.level
+            current = current.parent
+        return self._default_level
+
+    def resolve(self, category_path: str) -> tuple[int, int]:
+        """Resolve the minimum level a message needs to be logged.
+
+        Unknown categories are registered.
+
+        Returns:
+            (generation, threshold): the registry generation the result
+            is valid for, and the effective level, or a value above every
+            level if the category or a parent is disabled
+        """
         with self._lock:
             node = self._get_unlocked(category_path)
             if not node:
-                return self._default_level
+                node = self.register(category_path)
 
-            # Walk up the tree to find an explicit level
             current: CategoryNode | None = node
             while current is not None:
-                if current.level is not None:
-                    return current.level
+                if not current.enabled:
+                    return self.generation, DISABLED_THRESHOLD
                 current = current.parent
 
-            return self._default_level
+            return self.generation, int(self._effective_level(node))
 
     def is_enabled(self, category_path: str, level: LogLevel) -> bool:
         """Check if logging is enabled for this category at this level.
@@ -184,23 +222,7 @@ class CategoryRegistry:
         1. The category (or parent) is not explicitly disabled
         2. The message level >= effective category level
         """
-        with self._lock:
-            node = self._get_unlocked(category_path)
-
-            # Auto-register unknown categories
-            if not node:
-                node = self.register(category_path)
-
-            # Check if disabled
-            current: CategoryNode | None = node
-            while current is not None:
-                if not current.enabled:
-                    return False
-                current = current.parent
-
-            # Check level
-            effective_level = self.get_effective_level(category_path)
-            return level >= effective_level
+        return level >= self.resolve(category_path)[1]
 
     def list_all(self) -> list[str]:
         """Return all registered category paths sorted."""
@@ -243,7 +265,9 @@ class CategoryRegistry:
 
     def set_default_level(self, level: LogLevel) -> None:
         """Set the default level for categories without explicit level."""
-        self._default_level = level
+        with self._lock:
+            self._default_level = level
+            self.generation += 1
 
     def get_category_info(self, category_path: str) -> dict:
         """Get detailed info about a category."""
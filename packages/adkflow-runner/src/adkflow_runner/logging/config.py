@@ -7,15 +7,19 @@ import os
 import threading
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import Any, get_args
 
 from adkflow_runner.logging.constants import (
     DEFAULT_BACKUP_COUNT,
+    DEFAULT_FLUSH_INTERVAL,
     DEFAULT_FULL_PAYLOAD_LEVEL,
     DEFAULT_LOG_DIR,
+    DEFAULT_QUEUE_SIZE,
+    DEFAULT_RETAIN_RUNS,
     DEFAULT_SUMMARY_THRESHOLD,
     LogLevel,
 )
+from adkflow_runner.logging.handlers import Durability, OverflowPolicy
 
 
 @dataclass
@@ -30,6 +34,13 @@ class FileConfig:
     rotation: str = "10MB"  # Size-based rotation
     retain: int = DEFAULT_BACKUP_COUNT  # Number of rotated files to keep
     clear_before_run: bool = False  # Clear log file before each workflow run
+    async_writes: bool = True  # Write from a background thread (QueueHandler)
+    flush_interval: float = DEFAULT_FLUSH_INTERVAL  # Seconds between batch writes
+    durability: Durability = "flush"  # Applied per batch
+    queue_size: int = DEFAULT_QUEUE_SIZE  # Queued records before overflow
+    overflow: OverflowPolicy = "drop"  # When the queue is full
+    per_run: bool = False  # Write run records to runs/<run_id>.jsonl
+    retain_runs: int = DEFAULT_RETAIN_RUNS  # Run files kept when per_run is set
 
     @property
     def max_bytes(self) -> int:
@@ -161,6 +172,13 @@ class LogConfig:
                 rotation=fc.get("rotation", "10MB"),
                 retain=fc.get("retain", DEFAULT_BACKUP_COUNT),
                 clear_before_run=fc.get("clear_before_run", False),
+                async_writes=fc.get("async_writes", True),
+                flush_interval=fc.get("flush_interval", DEFAULT_FLUSH_INTERVAL),
+                durability=_parse_durability(fc.get("durability", "flush")),
+                queue_size=fc.get("queue_size", DEFAULT_QUEUE_SIZE),
+                overflow=_parse_overflow(fc.get("overflow", "drop")),
+                per_run=fc.get("per_run", False),
+                retain_runs=fc.get("retain_runs", DEFAULT_RETAIN_RUNS),
             )
 
         # Parse console config
@@ -240,6 +258,13 @@ class LogConfig:
                 "rotation": self.file.rotation,
                 "retain": self.file.retain,
                 "clear_before_run": self.file.clear_before_run,
+                "async_writes": self.file.async_writes,
+                "flush_interval": self.file.flush_interval,
+                "durability": self.file.durability,
+                "queue_size": self.file.queue_size,
+                "overflow": self.file.overflow,
+                "per_run": self.file.per_run,
+                "retain_runs": self.file.retain_runs,
             },
             "console": {
                 "enabled": self.console.enabled,
@@ -262,6 +287,24 @@ def _parse_level(level_str: str) -> LogLevel:
         return LogLevel.INFO
 
 
+def _parse_durability(value: Any) -> Durability:
+    """Parse a file durability setting, defaulting to "flush"."""
+    value = str(value).lower().strip()
+    for durability in get_args(Durability):
+        if value == durability:
+            return durability
+    return "flush"
+
+
+def _parse_overflow(value: Any) -> OverflowPolicy:
+    """Parse a queue overflow policy, defaulting to "drop"."""
+    value = str(value).lower().strip()
+    for overflow in get_args(OverflowPolicy):
+        if value == overflow:
+            return overflow
+    return "drop"
+
+
 # Global config singleton
 _config: LogConfig | None = None
 _config_lock = threading.Lock()
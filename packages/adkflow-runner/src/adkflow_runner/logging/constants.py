@@ -43,6 +43,17 @@ DEFAULT_MAX_BYTES = 10 * 1024 * 1024  # 10MB
 DEFAULT_BACKUP_COUNT = 5
 DEFAULT_LOG_DIR = "logs"
 
+# Per-run log files (FileConfig.per_run)
+RUNS_DIR_NAME = "runs"  # logs/runs/<run_id>.jsonl
+RUN_INDEX_FILE_NAME = "runs.index"  # Append-only run index in RUNS_DIR_NAME
+DEFAULT_RETAIN_RUNS = 100  # Run files kept; older ones are deleted
+DEFAULT_MAX_OPEN_RUNS = 8  # Run files kept open for writing
+
+# Background file writes (QueueHandler)
+DEFAULT_QUEUE_SIZE = 10_000  # Records waiting to be written before overflow
+DEFAULT_BATCH_SIZE = 256  # Records written per batch
+DEFAULT_FLUSH_INTERVAL = 0.1  # Seconds a record may wait before it is written
+
 # Console formatting
 LEVEL_COLORS: dict[str, str] = {
     "DEBUG": "dim",
@@ -1,19 +1,40 @@
-"""Log handlers for console and file output."""
+"""Log handlers for console and file output.
+
+File output can be moved off the calling thread by wrapping a handler in
+a QueueHandler:
+- emit() only appends the record to a bounded queue, so logging from the
+  asyncio loop never waits on disk I/O
+- A background thread formats and writes queued records in batches, at
+  least every flush_interval seconds (immediately for ERROR and above)
+- When the queue is full, records are dropped and counted ("drop") or
+  the caller waits for the writer to catch up ("block")
+
+How hard each batch is pushed to disk is the file handler's durability:
+"none" leaves it in the file buffer, "flush" hands it to the OS and
+"fsync" waits for the disk.
+"""
 
 from __future__ import annotations
 
+import atexit
+import os
 import sys
 import threading
+import time
 from abc import ABC, abstractmethod
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, TextIO
+from typing import TYPE_CHECKING, Any, Literal, Sequence, TextIO
 
 from adkflow_runner.logging.constants import (
     DEFAULT_BACKUP_COUNT,
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_FLUSH_INTERVAL,
     DEFAULT_LOG_FILE_NAME,
     DEFAULT_MAX_BYTES,
+    DEFAULT_QUEUE_SIZE,
     LogLevel,
 )
 from adkflow_runner.logging.formatters import (
@@ -25,6 +46,9 @@ from adkflow_runner.logging.formatters import (
 if TYPE_CHECKING:
     from rich.console import Console
 
+Durability = Literal["none", "flush", "fsync"]
+OverflowPolicy = Literal["drop", "block"]
+
 
 @dataclass
 class LogRecord:
@@ -52,6 +76,23 @@ class Handler(ABC):
         """Close the handler and release resources."""
         ...
 
+    def emit_batch(self, records: Sequence[LogRecord]) -> None:
+        """Emit several records; handlers that can write them at once override this."""
+        for record in records:
+            self.emit(record)
+
+    def flush(self) -> None:
+        """Write out anything the handler has buffered."""
+        pass
+
+    def clear(self) -> None:
+        """Discard the output written so far (FileConfig.clear_before_run)."""
+        pass
+
+    def close_run(self, run_id: str) -> None:
+        """Finish a run's output; handlers that keep per-run state override this."""
+        pass
+
 
 class ConsoleHandler(Handler):
     """Console output handler with optional colored output via Rich."""
@@ -115,12 +156,14 @@ class RotatingFileHandler(Handler):
         backup_count: int = DEFAULT_BACKUP_COUNT,
         formatter: LogFormatter | None = None,
         clear_on_init: bool = False,
+        durability: Durability = "flush",
     ) -> None:
         self.log_dir = Path(log_dir)
         self.filename = filename
         self.max_bytes = max_bytes
         self.backup_count = backup_count
         self.formatter = formatter or JSONFormatter()
+        self.durability = durability
         self._lock = threading.Lock()
 
         self._file: TextIO | None = None
@@ -174,20 +217,40 @@ class RotatingFileHandler(Handler):
 
     def emit(self, record: LogRecord) -> None:
         """Emit a log record to file."""
-        if self._file is None:
-            return
+        self.emit_batch((record,))
 
-        formatted = self.formatter.format(record)
-        line = formatted + "\n"
-        line_bytes = len(line.encode("utf-8"))
+    def emit_batch(self, records: Sequence[LogRecord]) -> None:
+        """Write records to file, then push them to disk once per durability."""
+        lines = [self.formatter.format(record) + "\n" for record in records]
 
         with self._lock:
-            if self._current_size + line_bytes > self.max_bytes:
-                self._rotate()
+            if self._file is None:
+                return
+            for line in lines:
+                line_bytes = len(line.encode("utf-8"))
+                if self._current_size + line_bytes > self.max_bytes:
+                    self._rotate()
+                self._file.write(line)
+                self._current_size += line_bytes
+            if self.durability != "none":
+                self._file.flush()
+            if self.durability == "fsync":
+                os.fsync(self._file.fileno())
+
+    def flush(self) -> None:
+        """Flush buffered lines to the OS."""
+        with self._lock:
+            if self._file:
+                self._file.flush()
 
-            self._file.write(line)
-            self._file.flush()
-            self._current_size += line_bytes
+    def clear(self) -> None:
+        """Delete the log file and its backups, and start a new file."""
+        with self._lock:
+            if self._file is None:
+                return
+            self._file.close()
+            self._clear_file()
+            self._open_file()
 
     def close(self) -> None:
         """Close the handler."""
@@ -197,6 +260,168 @@ class RotatingFileHandler(Handler):
                 self._file = None
 
 
+@dataclass
+class QueueStats:
+    """Counters of a QueueHandler."""
+
+    queued: int  # Records waiting for the writer thread
+    max_queued: int  # Deepest the queue has been
+    written: int  # Records handed to the target handler
+    dropped: int  # Records discarded because the queue was full or closed
+    errors: int  # Batches the target handler failed to write
+
+
+class QueueHandler(Handler):
+    """Handler that queues records for a background thread to write in batches.
+
+    Usage:
+        handler = QueueHandler(RotatingFileHandler(log_dir))
+        handler.emit(record)  # Returns without touching the file
+        handler.flush()  # Wait until everything queued is written
+        handler.close()
+    """
+
+    def __init__(
+        self,
+        target: Handler,
+        max_queue: int = DEFAULT_QUEUE_SIZE,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        overflow: OverflowPolicy = "drop",
+    ) -> None:
+        self.target = target
+        self.max_queue = max(1, max_queue)
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.overflow = overflow
+
+        self._records: deque[LogRecord] = deque()
+        self._cond = threading.Condition()
+        self._closed = False
+        self._urgent = False  # Write without waiting for flush_interval
+        self._in_flight = 0  # Records taken by the writer, not yet written
+        self._max_queued = 0
+        self._written = 0
+        self._dropped = 0
+        self._errors = 0
+
+        self._thread = threading.Thread(
+            target=self._run, name="adkflow-log-writer", daemon=True
+        )
+        self._thread.start()
+        # The writer is a daemon thread; drain the queue before exit
+        atexit.register(self.close)
+
+    def emit(self, record: LogRecord) -> None:
+        """Queue a record for the writer thread."""
+        with self._cond:
+            if len(self._records) >= self.max_queue and self.overflow == "block":
+                self._cond.wait_for(
+                    lambda: self._closed or len(self._records) < self.max_queue
+                )
+            if self._closed or len(self._records) >= self.max_queue:
+                self._dropped += 1
+                return
+            self._records.append(record)
+            queued = len(self._records)
+            if queued > self._max_queued:
+                self._max_queued = queued
+            if record.level >= LogLevel.ERROR:
+                self._urgent = True
+                self._cond.notify_all()
+            elif queued == 1 or queued == self.batch_size:
+                self._cond.notify_all()
+
+    def flush(self) -> None:
+        """Wait until every queued record is written."""
+        with self._cond:
+            if self._closed and not self._thread.is_alive():
+                return
+            self._urgent = True
+            self._cond.notify_all()
+            self._cond.wait_for(lambda: not self._records and not self._in_flight)
+        self.target.flush()
+
+    def clear(self) -> None:
+        """Discard queued records and clear the target.
+
+        Records emitted after clear() returns are kept.
+        """
+        with self._cond:
+            self._records.clear()
+            self._cond.wait_for(lambda: not self._in_flight)
+            # Still holding the lock: the writer cannot start a batch
+            self.target.clear()
+            self._cond.notify_all()
+
+    def close_run(self, run_id: str) -> None:
+        """Write the queued records, then finish the run on the target."""
+        self.flush()
+        self.target.close_run(run_id)
+
+    def close(self) -> None:
+        """Write the remaining records, stop the writer and close the target."""
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify_all()
+        atexit.unregister(self.close)
+        self._thread.join()
+        self.target.close()
+
+    def stats(self) -> QueueStats:
+        """Get the handler's counters."""
+        with self._cond:
+            return QueueStats(
+                queued=len(self._records),
+                max_queued=self._max_queued,
+                written=self._written,
+                dropped=self._dropped,
+                errors=self._errors,
+            )
+
+    def _ready(self) -> bool:
+        return self._closed or self._urgent or len(self._records) >= self.batch_size
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._records or self._closed)
+                # Let a batch build up unless it is full or wanted now
+                deadline = time.monotonic() + self.flush_interval
+                while not self._ready():
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+                if not self._records:
+                    if self._closed:
+                        return
+                    continue
+                count = min(len(self._records), self.batch_size)
+                batch = [self._records.popleft() for _ in range(count)]
+                if not self._records:
+                    self._urgent = False
+                self._in_flight = count
+                # Wake producers blocked on a full queue
+                self._cond.notify_all()
+
+            try:
+                self.target.emit_batch(batch)
+                written, failed = count, 0
+            except Exception:
+                # Swallow handler errors to avoid log loops
+                written, failed = 0, 1
+
+            with self._cond:
+                self._in_flight = 0
+                self._written += written
+                self._errors += failed
+                # Wake flush() callers
+                self._cond.notify_all()
+
+
 class NullHandler(Handler):
     """Handler that discards all records (for testing or disabling logging)."""
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import dataclasses
 import threading
 from datetime import datetime
 from pathlib import Path
@@ -9,18 +10,25 @@ from typing import Any, Callable
 
 from adkflow_runner.logging.categories import CategoryRegistry, get_registry
 from adkflow_runner.logging.config import LogConfig, get_config
-from adkflow_runner.logging.constants import LogLevel
+from adkflow_runner.logging.constants import RUNS_DIR_NAME, LogLevel
 from adkflow_runner.logging.run_context import get_run_id
 from adkflow_runner.logging.handlers import (
     ConsoleHandler,
     Handler,
     LogRecord,
+    QueueHandler,
     RotatingFileHandler,
 )
+from adkflow_runner.logging.run_logs import RunLogHandler
 
 # Lazy message callable type
 LazyMessage = Callable[[], str]
 
+# Plain ints for the fast checks in debug/info/warning
+_DEBUG = int(LogLevel.DEBUG)
+_INFO = int(LogLevel.INFO)
+_WARNING = int(LogLevel.WARNING)
+
 
 class Logger:
     """Hierarchical logger with structured output.
@@ -31,6 +39,7 @@ class Logger:
     - Structured context (key=value pairs)
     - Multiple handlers (console, file, JSON)
     - Thread-safe operation
+    - File writes batched on a background thread (FileConfig.async_writes)
 
     Usage:
         from adkflow_runner.logging import get_logger
@@ -43,10 +52,15 @@ class Logger:
         log.debug(lambda: f"Full IR: {expensive_serialize(ir)}")
     """
 
+    # Replaced, never mutated, so _emit can iterate it without the lock
     _handlers: list[Handler] = []
     _lock = threading.Lock()
     _initialized = False
     _project_path: Path | None = None
+    # What initialize() built its handlers from, and the list it built, so
+    # unchanged settings reuse them (add_handler() replaces the list)
+    _setup: tuple[Any, ...] | None = None
+    _setup_handlers: list[Handler] | None = None
 
     def __init__(
         self,
@@ -63,6 +77,10 @@ class Logger:
         # Register this category
         self._registry.register(category)
 
+        # Cached CategoryRegistry.resolve() result; -1 forces resolution
+        self._generation = -1
+        self._threshold = 0
+
     @classmethod
     def initialize(
         cls,
@@ -72,20 +90,41 @@ class Logger:
         """Initialize handlers based on configuration.
 
         Call this at the start of workflow execution to set up
-        project-specific logging.
+        project-specific logging. Called again with the same project and
+        console/file settings, it keeps the current handlers and only
+        clears the log file if clear_before_run is set.
         """
         with cls._lock:
+            config = config or get_config()
+            project_path = project_path or config.project_path
+            setup = (
+                project_path,
+                dataclasses.replace(config.console),
+                dataclasses.replace(config.file, clear_before_run=False),
+            )
+            if (
+                cls._initialized
+                and setup == cls._setup
+                and cls._handlers is cls._setup_handlers
+            ):
+                # Same outputs as the last run: keep the handlers (and the
+                # file writer thread) instead of draining and restarting them
+                if config.file.clear_before_run:
+                    for handler in cls._handlers:
+                        handler.clear()
+                return
+
             # Close existing handlers
-            for handler in cls._handlers:
+            old_handlers, cls._handlers = cls._handlers, []
+            for handler in old_handlers:
                 handler.close()
-            cls._handlers.clear()
 
-            config = config or get_config()
-            cls._project_path = project_path or config.project_path
+            cls._project_path = project_path
+            handlers: list[Handler] = []
 
             # Console handler
             if config.console.enabled:
-                cls._handlers.append(
+                handlers.append(
                     ConsoleHandler(
                         colored=config.console.colored,
                     )
@@ -95,32 +134,64 @@ class Logger:
             # Always outputs JSON format to adkflow.jsonl
             if config.file.enabled and cls._project_path:
                 log_dir = cls._project_path / config.file.path
-                cls._handlers.append(
-                    RotatingFileHandler(
-                        log_dir=log_dir,
-                        max_bytes=config.file.max_bytes,
-                        backup_count=config.file.retain,
-                        clear_on_init=config.file.clear_before_run,
-                    )
+                file_handler: Handler = RotatingFileHandler(
+                    log_dir=log_dir,
+                    max_bytes=config.file.max_bytes,
+                    backup_count=config.file.retain,
+                    clear_on_init=config.file.clear_before_run,
+                    durability=config.file.durability,
                 )
+                if config.file.per_run:
+                    # Run records go to runs/<run_id>.jsonl instead
+                    file_handler = RunLogHandler(
+                        log_dir / RUNS_DIR_NAME,
+                        fallback=file_handler,
+                        durability=config.file.durability,
+                        retain_runs=config.file.retain_runs,
+                    )
+                if config.file.async_writes:
+                    file_handler = QueueHandler(
+                        file_handler,
+                        max_queue=config.file.queue_size,
+                        flush_interval=config.file.flush_interval,
+                        overflow=config.file.overflow,
+                    )
+                handlers.append(file_handler)
 
+            cls._handlers = handlers
             cls._initialized = True
+            cls._setup = setup
+            cls._setup_handlers = handlers
 
     @classmethod
     def add_handler(cls, handler: Handler) -> None:
         """Add a custom handler."""
         with cls._lock:
-            cls._handlers.append(handler)
+            cls._handlers = [*cls._handlers, handler]
+
+    @classmethod
+    def flush(cls) -> None:
+        """Wait until every handler has written what it has buffered."""
+        for handler in cls._handlers:
+            handler.flush()
+
+    @classmethod
+    def close_run(cls, run_id: str) -> None:
+        """Write out a finished run's records and close its run log file."""
+        for handler in cls._handlers:
+            handler.close_run(run_id)
 
     @classmethod
     def reset(cls) -> None:
         """Reset all handlers (for testing/reconfiguration)."""
         with cls._lock:
-            for handler in cls._handlers:
+            old_handlers, cls._handlers = cls._handlers, []
+            for handler in old_handlers:
                 handler.close()
-            cls._handlers.clear()
             cls._initialized = False
             cls._project_path = None
+            cls._setup = None
+            cls._setup_handlers = None
 
     def with_context(self, **context: Any) -> Logger:
         """Create a child logger with additional context."""
@@ -133,9 +204,14 @@ class Logger:
         )
         return logger
 
-    def _is_enabled(self, level: LogLevel) -> bool:
-        """Check if logging is enabled for this level."""
-        return self._registry.is_enabled(self.category, level)
+    def is_enabled_for(self, level: LogLevel) -> bool:
+        """Check if a message at this level would be logged.
+
+        Use it to skip building expensive context for disabled levels.
+        """
+        if self._generation != self._registry.generation:
+            self._generation, self._threshold = self._registry.resolve(self.category)
+        return level >= self._threshold
 
     def _emit(
         self,
@@ -146,7 +222,11 @@ class Logger:
         **context: Any,
     ) -> None:
         """Emit a log record to all handlers."""
-        if not self._is_enabled(level):
+        # Inlined is_enabled_for: disabled calls cost a generation check
+        # and one compare
+        if self._generation != self._registry.generation:
+            self._generation, self._threshold = self._registry.resolve(self.category)
+        if level < self._threshold:
             return
 
         # Lazy-initialize handlers if needed
@@ -186,13 +266,12 @@ class Logger:
             exception=exception,
         )
 
-        with Logger._lock:
-            for handler in Logger._handlers:
-                try:
-                    handler.emit(record)
-                except Exception:
-                    # Swallow handler errors to avoid log loops
-                    pass
+        for handler in Logger._handlers:
+            try:
+                handler.emit(record)
+            except Exception:
+                # Swallow handler errors to avoid log loops
+                pass
 
     def log(
         self,
@@ -205,16 +284,25 @@ class Logger:
             level = LogLevel[level.upper()]
         self._emit(level, message, **context)
 
+    # debug/info/warning return before calling _emit when the cached
+    # threshold is current and above their level
+
     def debug(self, message: str | LazyMessage, **context: Any) -> None:
         """Log at DEBUG level."""
+        if self._threshold > _DEBUG and self._generation == self._registry.generation:
+            return
         self._emit(LogLevel.DEBUG, message, **context)
 
     def info(self, message: str | LazyMessage, **context: Any) -> None:
         """Log at INFO level."""
+        if self._threshold > _INFO and self._generation == self._registry.generation:
+            return
         self._emit(LogLevel.INFO, message, **context)
 
     def warning(self, message: str | LazyMessage, **context: Any) -> None:
         """Log at WARNING level."""
+        if self._threshold > _WARNING and self._generation == self._registry.generation:
+            return
         self._emit(LogLevel.WARNING, message, **context)
 
     def error(
@@ -0,0 +1,369 @@
+"""Per-run log files with an append-only run index.
+
+With FileConfig.per_run set, records logged inside a run context go to
+logs/runs/<run_id>.jsonl instead of the shared adkflow.jsonl:
+- Reading one run only touches that run's file
+- Old runs are retired by deleting their files (retain_runs) rather than
+  by rotating the shared file
+
+logs/runs/runs.index holds one JSON line per written segment of a run
+file: run_id, byte range, first/last timestamp and level counts. A
+segment is appended when its file is closed (run file evicted, handler
+closed), so read_run_index() scans only the bytes written since the
+last indexed segment of each file.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import tempfile
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import IO, Any, Collection, Sequence
+
+from adkflow_runner.logging.constants import (
+    DEFAULT_MAX_OPEN_RUNS,
+    RUN_INDEX_FILE_NAME,
+)
+from adkflow_runner.logging.formatters import JSONFormatter, LogFormatter
+from adkflow_runner.logging.handlers import Durability, Handler, LogRecord
+
+_UNSAFE_CHARS = re.compile(r"[^A-Za-z0-9_.-]")
+
+
+def run_log_path(runs_dir: Path, run_id: str) -> Path:
+    """Get the log file of a run."""
+    return Path(runs_dir) / f"{_UNSAFE_CHARS.sub('_', run_id)}.jsonl"
+
+
+@dataclass
+class RunSummary:
+    """What the run index knows about one run's log file."""
+
+    run_id: str
+    path: Path
+    first_timestamp: str | None = None
+    last_timestamp: str | None = None
+    entry_count: int = 0
+    level_counts: dict[str, int] = field(default_factory=dict)
+    indexed_bytes: int = 0  # Bytes of the file the summary covers
+
+    def add(self, timestamp: str | None, level: str) -> None:
+        """Count one record."""
+        self._extend(timestamp)
+        self.entry_count += 1
+        self.level_counts[level] = self.level_counts.get(level, 0) + 1
+
+    def merge(self, segment: dict[str, Any]) -> None:
+        """Count an index segment's records."""
+        self._extend(segment["first_timestamp"])
+        self._extend(segment["last_timestamp"])
+        self.entry_count += segment["entry_count"]
+        for level, count in segment["level_counts"].items():
+            self.level_counts[level] = self.level_counts.get(level, 0) + count
+        self.indexed_bytes = segment["end_offset"]
+
+    def _extend(self, timestamp: str | None) -> None:
+        if not timestamp:
+            return
+        if self.first_timestamp is None or timestamp < self.first_timestamp:
+            self.first_timestamp = timestamp
+        if self.last_timestamp is None or timestamp > self.last_timestamp:
+            self.last_timestamp = timestamp
+
+
+@dataclass
+class _OpenRun:
+    """A run file being written and the segment written to it so far."""
+
+    file: IO[str]
+    summary: RunSummary
+    start_offset: int  # File size when opened
+    offset: int
+
+
+class RunLogHandler(Handler):
+    """File handler that writes each run's records to its own file.
+
+    Records without a run_id go to the fallback handler.
+
+    Usage:
+        handler = RunLogHandler(log_dir / "runs", fallback=RotatingFileHandler(log_dir))
+        with run_context("abc123"):
+            log.info("Step done")  # -> runs/abc123.jsonl
+    """
+
+    def __init__(
+        self,
+        runs_dir: Path,
+        fallback: Handler | None = None,
+        formatter: LogFormatter | None = None,
+        durability: Durability = "flush",
+        max_open: int = DEFAULT_MAX_OPEN_RUNS,
+        retain_runs: int | None = None,
+    ) -> None:
+        self.runs_dir = Path(runs_dir)
+        self.fallback = fallback
+        self.formatter = formatter or JSONFormatter()
+        self.durability = durability
+        self.max_open = max(1, max_open)
+        self.retain_runs = retain_runs
+        self._lock = threading.Lock()
+        self._open: OrderedDict[str, _OpenRun] = OrderedDict()
+        self._closed = False
+
+        self.runs_dir.mkdir(parents=True, exist_ok=True)
+        if retain_runs is not None:
+            retire_runs(self.runs_dir, keep=retain_runs)
+
+    def emit(self, record: LogRecord) -> None:
+        """Emit a log record to its run's file."""
+        self.emit_batch((record,))
+
+    def emit_batch(self, records: Sequence[LogRecord]) -> None:
+        """Write records to their run files, one write per run."""
+        by_run: dict[str, list[LogRecord]] = {}
+        outside_runs: list[LogRecord] = []
+        for record in records:
+            run_id = record.context.get("run_id") if record.context else None
+            if run_id:
+                by_run.setdefault(str(run_id), []).append(record)
+            else:
+                outside_runs.append(record)
+
+        if outside_runs and self.fallback is not None:
+            self.fallback.emit_batch(outside_runs)
+
+        with self._lock:
+            if self._closed:
+                return
+            for run_id, run_records in by_run.items():
+                run = self._get_run(run_id)
+                lines = []
+                for record in run_records:
+                    line = self.formatter.format(record) + "\n"
+                    run.offset += len(line.encode("utf-8"))
+                    run.summary.add(record.timestamp.isoformat(), record.level.name)
+                    lines.append(line)
+                run.file.write("".join(lines))
+                if self.durability != "none":
+                    run.file.flush()
+                if self.durability == "fsync":
+                    os.fsync(run.file.fileno())
+
+    def close_run(self, run_id: str) -> None:
+        """Close a run's file, add its segment to the index and retire old runs."""
+        with self._lock:
+            run = self._open.pop(run_id, None)
+            if run is None:
+                return
+            self._close_run(run)
+            # Counting files is cheap; retiring reads the whole index
+            if self.retain_runs is not None and (
+                sum(1 for _ in self.runs_dir.glob("*.jsonl")) > self.retain_runs
+            ):
+                retire_runs(self.runs_dir, keep=self.retain_runs, active=self._open)
+
+    def flush(self) -> None:
+        """Flush open run files and the fallback handler."""
+        with self._lock:
+            for run in self._open.values():
+                run.file.flush()
+        if self.fallback is not None:
+            self.fallback.flush()
+
+    def clear(self) -> None:
+        """Clear the fallback handler; run files are retired by retain_runs."""
+        if self.fallback is not None:
+            self.fallback.clear()
+
+    def close(self) -> None:
+        """Close every run file, indexing them, and the fallback handler."""
+        with self._lock:
+            self._closed = True
+            while self._open:
+                _, run = self._open.popitem(last=False)
+                self._close_run(run)
+        if self.fallback is not None:
+            self.fallback.close()
+
+    def _get_run(self, run_id: str) -> _OpenRun:
+        run = self._open.get(run_id)
+        if run is not None:
+            self._open.move_to_end(run_id)
+            return run
+
+        while len(self._open) >= self.max_open:
+            _, oldest = self._open.popitem(last=False)
+            self._close_run(oldest)
+
+        path = run_log_path(self.runs_dir, run_id)
+        file = open(path, "a", encoding="utf-8")
+        offset = file.tell()
+        run = _OpenRun(
+            file=file,
+            summary=RunSummary(run_id=run_id, path=path),
+            start_offset=offset,
+            offset=offset,
+        )
+        self._open[run_id] = run
+        return run
+
+    def _close_run(self, run: _OpenRun) -> None:
+        run.file.close()
+        if run.offset == run.start_offset:
+            return
+        summary = run.summary
+        segment = {
+            "run_id": summary.run_id,
+            "file": summary.path.name,
+            "start_offset": run.start_offset,
+            "end_offset": run.offset,
+            "first_timestamp": summary.first_timestamp,
+            "last_timestamp": summary.last_timestamp,
+            "entry_count": summary.entry_count,
+            "level_counts": summary.level_counts,
+        }
+        try:
+            with open(self.runs_dir / RUN_INDEX_FILE_NAME, "a", encoding="utf-8") as f:
+                f.write(json.dumps(segment) + "\n")
+        except OSError:
+            # read_run_index() scans bytes no segment covers
+            pass
+
+
+def read_run_index(runs_dir: Path) -> list[RunSummary]:
+    """Summarize every run log file, newest run first.
+
+    Index segments are merged per file; bytes no segment covers (a run
+    still being written, a segment lost in a crash) are scanned.
+    """
+    runs_dir = Path(runs_dir)
+    if not runs_dir.is_dir():
+        return []
+
+    segments: dict[str, list[dict[str, Any]]] = {}
+    for segment in _read_segments(runs_dir / RUN_INDEX_FILE_NAME):
+        if isinstance(segment, dict) and isinstance(segment.get("file"), str):
+            segments.setdefault(segment["file"], []).append(segment)
+
+    runs: list[RunSummary] = []
+    for path in runs_dir.glob("*.jsonl"):
+        try:
+            size = path.stat().st_size
+        except OSError:
+            continue
+        file_segments = segments.get(path.name, [])
+        run_id = file_segments[0].get("run_id") if file_segments else None
+        summary = RunSummary(run_id=run_id or path.stem, path=path)
+        try:
+            for segment in sorted(file_segments, key=lambda s: s["start_offset"]):
+                if segment["end_offset"] > size:
+                    raise ValueError("file is shorter than its index")
+                if segment["start_offset"] < summary.indexed_bytes:
+                    raise ValueError("overlapping segments")
+                _scan(summary, segment["start_offset"])
+                summary.merge(segment)
+        except (KeyError, TypeError, ValueError, AttributeError):
+            # The file was replaced or the index is damaged: scan it all
+            summary = RunSummary(run_id=run_id or path.stem, path=path)
+        _scan(summary, size)
+        if summary.entry_count:
+            runs.append(summary)
+
+    runs.sort(key=lambda r: r.first_timestamp or "", reverse=True)
+    return runs
+
+
+def retire_runs(
+    runs_dir: Path, keep: int, active: Collection[str] = ()
+) -> list[str]:
+    """Delete all but the newest keep run log files and compact the index.
+
+    Args:
+        runs_dir: Directory of run log files
+        keep: Number of newest runs to keep
+        active: run_ids still being written; never deleted, and left out
+            of the compacted index until their file is closed
+
+    Returns:
+        The run_ids that were deleted
+    """
+    runs = read_run_index(runs_dir)
+    retired = [s for s in runs[max(0, keep) :] if s.run_id not in active]
+    for summary in retired:
+        summary.path.unlink(missing_ok=True)
+
+    # Rewrite the index as one segment per remaining run
+    kept = [s for s in runs[: max(0, keep)] if s.run_id not in active]
+    index_path = Path(runs_dir) / RUN_INDEX_FILE_NAME
+    if not retired and not index_path.exists():
+        return []
+    try:
+        fd, tmp_name = tempfile.mkstemp(dir=runs_dir, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                for summary in kept:
+                    f.write(json.dumps(_segment(summary)) + "\n")
+            os.replace(tmp_name, index_path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+    except OSError:
+        # The index is rebuilt from the run files by the next read
+        pass
+    return [summary.run_id for summary in retired]
+
+
+def _segment(summary: RunSummary) -> dict[str, Any]:
+    return {
+        "run_id": summary.run_id,
+        "file": summary.path.name,
+        "start_offset": 0,
+        "end_offset": summary.indexed_bytes,
+        "first_timestamp": summary.first_timestamp,
+        "last_timestamp": summary.last_timestamp,
+        "entry_count": summary.entry_count,
+        "level_counts": summary.level_counts,
+    }
+
+
+def _read_segments(index_path: Path) -> list[dict[str, Any]]:
+    try:
+        with open(index_path, encoding="utf-8") as f:
+            lines = f.readlines()
+    except OSError:
+        return []
+    segments = []
+    for line in lines:
+        try:
+            segments.append(json.loads(line))
+        except json.JSONDecodeError:
+            continue
+    return segments
+
+
+def _scan(summary: RunSummary, end: int) -> None:
+    """Count the records between the covered bytes of a run file and end."""
+    if end <= summary.indexed_bytes:
+        return
+    try:
+        with open(summary.path, "rb") as f:
+            f.seek(summary.indexed_bytes)
+            data = f.read(end - summary.indexed_bytes)
+    except OSError:
+        return
+    # Only complete lines; a partial last line is counted by the next read
+    complete = data.rfind(b"\n") + 1
+    for line in data[:complete].splitlines():
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        if isinstance(record, dict):
+            summary.add(record.get("timestamp"), record.get("level", "INFO"))
+    summary.indexed_bytes += complete
@@ -3,8 +3,12 @@
 Components:
 - WorkflowRunner: Main execution engine
 - AgentFactory: Creates ADK agents from IR
+- AgentTreePool: Reuses built agent trees across runs
 - ToolLoader: Loads tools dynamically from Python files
+- ToolModuleCache: Shares loaded tool modules across runs
 - CustomNodeExecutor: Executes custom FlowUnit nodes
+- EventStore: Bounded per-run event buffer that spills to disk
+- EventHub: Broadcasts run events to subscribers with per-subscriber cursors
 """
 
 from adkflow_runner.runner.types import (
@@ -23,7 +27,11 @@ from adkflow_runner.runner.workflow_runner import (
     run_workflow,
 )
 from adkflow_runner.runner.agent_factory import AgentFactory
+from adkflow_runner.runner.agent_pool import AgentTreePool
 from adkflow_runner.runner.custom_executor import CustomNodeExecutor
+from adkflow_runner.runner.event_hub import EventHub
+from adkflow_runner.runner.event_store import EventStore
+from adkflow_runner.runner.tool_cache import ToolModuleCache
 from adkflow_runner.runner.tool_loader import ToolLoader
 
 __all__ = [
@@ -42,6 +50,10 @@ __all__ = [
     "NoOpCallbacks",
     # Supporting classes
     "AgentFactory",
+    "AgentTreePool",
     "CustomNodeExecutor",
+    "EventHub",
+    "EventStore",
     "ToolLoader",
+    "ToolModuleCache",
 ]
@@ -60,7 +60,11 @@ class AgentFactory:
         self._agent_cache: dict[str, BaseAgent] = {}
         self._finish_reason_handlers: dict[str, FinishReasonHandler] = {}
         self._response_handlers: dict[str, ResponseHandler] = {}
+        # Handlers holding emit/hooks, rebound when a built tree is reused
+        self._emit_handlers: list[EmitHandler | UserCallbackHandler] = []
+        self._hooks_handlers: list[ExtensionHooksHandler] = []
         self._global_variables: dict[str, str] = {}  # From unconnected Variable nodes
+        self.root_agent: BaseAgent | None = None
 
     def create_from_workflow(
         self,
@@ -84,7 +88,44 @@ class AgentFactory:
         self.tool_loader = ToolLoader(self.project_path)
         self._global_variables = ir.global_variables  # Store for validation
 
-        return self.create(ir.root_agent)
+        self.root_agent = self.create(ir.root_agent)
+        return self.root_agent
+
+    def bind_run(
+        self,
+        emit: EmitFn | None = None,
+        hooks: HooksIntegration | None = None,
+    ) -> BaseAgent:
+        """Point an already built agent tree at a new run.
+
+        Rebinds emit and hooks on every callback handler the factory
+        created and clears per-run finish reasons and responses, so the
+        tree can be reused without rebuilding agents or reloading tools.
+
+        Args:
+            emit: Emit function of the new run (None to detach)
+            hooks: Hooks integration of the new run (None to detach)
+
+        Returns:
+            Root agent built by create_from_workflow
+
+        Raises:
+            ExecutionError: If no tree has been built yet
+        """
+        if self.root_agent is None:
+            raise ExecutionError("Agent tree has not been built")
+
+        self.emit = emit
+        self.hooks = hooks
+        for handler in self._emit_handlers:
+            handler.emit = emit
+        for handler in self._hooks_handlers:
+            handler.hooks = hooks
+        for finish_reason_handler in self._finish_reason_handlers.values():
+            finish_reason_handler.reset()
+        for response_handler in self._response_handlers.values():
+            response_handler.reset()
+        return self.root_agent
 
     def create(self, agent_ir: AgentIR) -> BaseAgent:
         """Create an ADK agent from IR.
@@ -368,7 +409,9 @@ class AgentFactory:
         self._finish_reason_handlers[agent_ir.id] = finish_reason_handler
 
         # Priority 400: RunEvent emission for UI
-        registry.register(EmitHandler(self.emit))
+        emit_handler = EmitHandler(self.emit)
+        registry.register(emit_handler)
+        self._emit_handlers.append(emit_handler)
 
         # Priority 450: Response capture for output handles
         response_handler = ResponseHandler()
@@ -376,7 +419,9 @@ class AgentFactory:
         self._response_handlers[agent_ir.id] = response_handler
 
         # Priority 500: Extension hooks bridge
-        registry.register(ExtensionHooksHandler(self.hooks))
+        hooks_handler = ExtensionHooksHandler(self.hooks)
+        registry.register(hooks_handler)
+        self._hooks_handlers.append(hooks_handler)
 
         # Priority 600: User-defined callbacks (optional)
         # Supports both file paths and inline code from connected CallbackNodes
@@ -386,13 +431,13 @@ class AgentFactory:
             loader = UserCallbackLoader(loader_path)
             loaded, callback_metadata = loader.load(agent_ir.callbacks)
             if loaded:
-                registry.register(
-                    UserCallbackHandler(
-                        callbacks=loaded,
-                        callback_metadata=callback_metadata,
-                        emit=self.emit,
-                    )
+                user_handler = UserCallbackHandler(
+                    callbacks=loaded,
+                    callback_metadata=callback_metadata,
+                    emit=self.emit,
                 )
+                registry.register(user_handler)
+                self._emit_handlers.append(user_handler)
 
         return registry.to_adk_callbacks()
 
@@ -691,3 +736,8 @@ class AgentFactory:
     def clear_cache(self) -> None:
         """Clear the agent cache."""
         self._agent_cache.clear()
+        self._finish_reason_handlers.clear()
+        self._response_handlers.clear()
+        self._emit_handlers.clear()
+        self._hooks_handlers.clear()
+        self.root_agent = None
@@ -0,0 +1,162 @@
+"""Warm pool of built ADK agent trees.
+
+Building an agent tree creates every ADK agent, loads tools and builds
+callback registries. For a workflow that runs repeatedly with the same
+IR that work is identical each time, so finished runs hand their tree
+back to the pool and the next run rebinds it instead of rebuilding:
+- Trees are keyed on a fingerprint of the agent IR (fingerprint_agent_tree)
+- A tree is leased to one run at a time; concurrent runs of the same
+  workflow each get their own tree
+- Per-run state (emit, hooks, finish reasons, responses) is rebound
+  through AgentFactory.bind_run
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+from adkflow_runner.compiler.cache import stat_file
+from adkflow_runner.ir import AgentIR, CallbackConfig, WorkflowIR
+from adkflow_runner.logging import get_logger
+from adkflow_runner.runner.agent_factory import AgentFactory
+
+_log = get_logger("runner.agent.pool")
+
+_CALLBACK_FIELDS = [f.name for f in dataclasses.fields(CallbackConfig)]
+
+
+def _walk_agents(ir: WorkflowIR) -> list[AgentIR]:
+    """List every agent reachable from the root or registered in the IR."""
+    agents: dict[str, AgentIR] = {}
+    stack = [ir.root_agent, *ir.all_agents.values()]
+    while stack:
+        agent = stack.pop()
+        if agent.id in agents:
+            continue
+        agents[agent.id] = agent
+        stack.extend(agent.subagents)
+    return [agents[agent_id] for agent_id in sorted(agents)]
+
+
+def _source_files(agent: AgentIR, project_path: Path | None) -> list[Path]:
+    """Files read while building an agent that the IR only names by path."""
+    base = project_path or Path.cwd()
+    paths: list[Path] = []
+    for name in _CALLBACK_FIELDS:
+        source = getattr(agent.callbacks, name)
+        if source and source.file_path and not source.code:
+            paths.append(base / source.file_path)
+    for tool in agent.tools:
+        if tool.file_path:
+            paths.append(base / tool.file_path)
+            paths.append(base / "tools" / tool.file_path)
+    return paths
+
+
+def fingerprint_agent_tree(ir: WorkflowIR) -> str:
+    """Fingerprint everything that shapes the agent tree built from an IR.
+
+    Context variable values are left out: they are resolved per run and
+    reach agents through session state, so only their names matter for
+    building. Callback and tool files referenced by path are included by
+    mtime and size.
+
+    Args:
+        ir: Workflow IR, after per-run context variable resolution
+
+    Returns:
+        Hex digest identifying the tree
+    """
+    project_path = Path(ir.project_path) if ir.project_path else None
+    hasher = hashlib.sha256()
+    hasher.update(f"{ir.project_path}\0{ir.root_agent.id}\0".encode())
+    hasher.update(repr(sorted(ir.global_variables)).encode())
+
+    for agent in _walk_agents(ir):
+        # The dataclass repr covers every field; subagents are hashed by id
+        # since each is visited on its own
+        shape = dataclasses.replace(agent, subagents=[], context_vars={})
+        hasher.update(repr(shape).encode())
+        hasher.update(repr([sub.id for sub in agent.subagents]).encode())
+        hasher.update(repr(sorted(agent.context_vars)).encode())
+        for path in _source_files(agent, project_path):
+            hasher.update(f"{path}={stat_file(path)}".encode())
+
+    return hasher.hexdigest()
+
+
+class AgentTreePool:
+    """Thread-safe pool of idle AgentFactory instances with built trees.
+
+    Usage:
+        pool = AgentTreePool()
+        key = fingerprint_agent_tree(ir)
+        factory = pool.acquire(key)
+        if factory is None:
+            factory = AgentFactory(project_path)
+            root = factory.create_from_workflow(ir, emit=emit, hooks=hooks)
+        else:
+            root = factory.bind_run(emit=emit, hooks=hooks)
+        ...
+        pool.release(key, factory)  # Only after a successful run
+    """
+
+    def __init__(self, max_keys: int = 16, max_idle_per_key: int = 2):
+        self.max_keys = max_keys
+        self.max_idle_per_key = max_idle_per_key
+        self._idle: OrderedDict[str, list[AgentFactory]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def acquire(self, key: str) -> AgentFactory | None:
+        """Take an idle tree for a fingerprint.
+
+        Args:
+            key: Fingerprint from fingerprint_agent_tree
+
+        Returns:
+            A factory whose tree is ready for bind_run, or None on miss
+        """
+        with self._lock:
+            idle = self._idle.get(key)
+            if not idle:
+                self.misses += 1
+                return None
+            factory = idle.pop()
+            self._idle.move_to_end(key)
+            self.hits += 1
+            return factory
+
+    def release(self, key: str, factory: AgentFactory) -> None:
+        """Return a tree after its run finished.
+
+        The tree is detached from the finished run first so the pool does
+        not keep its emit function or hooks alive.
+
+        Args:
+            key: Fingerprint the tree was built or acquired for
+            factory: Factory holding the tree
+        """
+        factory.bind_run(emit=None, hooks=None)
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            self._idle.move_to_end(key)
+            if len(idle) < self.max_idle_per_key:
+                idle.append(factory)
+            while len(self._idle) > self.max_keys:
+                evicted, _ = self._idle.popitem(last=False)
+                _log.debug("Agent tree evicted", key=evicted[:12])
+
+    def clear(self) -> None:
+        """Drop every idle tree."""
+        with self._lock:
+            self._idle.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(len(idle) for idle in self._idle.values())
@@ -98,6 +98,10 @@ class FinishReasonHandler(BaseHandler):
         """
         return self._last_finish_reason
 
+    def reset(self) -> None:
+        """Forget the last finish reason before the agent runs again."""
+        self._last_finish_reason = None
+
     def after_model(
         self,
         callback_context: Any,
@@ -7,7 +7,7 @@ from __future__ import annotations
 
 from typing import Any
 
-from adkflow_runner.logging import get_logger
+from adkflow_runner.logging import LogLevel, get_logger
 from adkflow_runner.runner.callbacks.handlers.base import BaseHandler
 from adkflow_runner.runner.callbacks.types import HandlerResult
 
@@ -43,6 +43,10 @@ class LoggingHandler(BaseHandler):
         Returns:
             None
         """
+        # Runs on every LLM call; skip building previews nobody logs
+        if not _api_request_log.is_enabled_for(LogLevel.INFO):
+            return None
+
         # Extract content from request
         contents = getattr(llm_request, "contents", []) or []
         message_count = len(contents)
@@ -90,6 +94,9 @@ class LoggingHandler(BaseHandler):
         Returns:
             None
         """
+        if not _api_response_log.is_enabled_for(LogLevel.INFO):
+            return None
+
         content = getattr(llm_response, "content", None)
         text = ""
         if content and hasattr(content, "parts") and content.parts:
@@ -154,6 +161,9 @@ class LoggingHandler(BaseHandler):
         Returns:
             None
         """
+        if not _tool_log.is_enabled_for(LogLevel.INFO):
+            return None
+
         tool_name = getattr(tool, "name", str(tool))
 
         # Format args preview (truncate if too long)
@@ -192,6 +202,9 @@ class LoggingHandler(BaseHandler):
         Returns:
             None
         """
+        if not _tool_log.is_enabled_for(LogLevel.INFO):
+            return None
+
         tool_name = getattr(tool, "name", str(tool))
 
         # Format result preview (truncate if too long)
@@ -52,6 +52,10 @@ class ResponseHandler(BaseHandler):
         """
         return self._last_response
 
+    def reset(self) -> None:
+        """Forget the last response before the agent runs again."""
+        self._last_response = None
+
     def after_model(
         self,
         callback_context: Any,
@@ -0,0 +1,220 @@
+"""Concurrency and rate limits for custom node execution.
+
+Limits come from two places:
+- FlowUnit class attributes (MAX_CONCURRENCY, RATE_LIMIT, RATE_LIMIT_BURST),
+  carried on CustomNodeIR
+- Project settings (manifest "settings.customNodes"), carried on
+  WorkflowIR.execution_limits, which override the class attributes
+
+Waiters are served in FIFO order, so nodes queue fairly instead of
+racing for slots. get_shared_limiter() hands out one limiter per project
+and event loop, so the limits bound every phase and every concurrent run
+of a project rather than a single graph execution.
+"""
+
+import asyncio
+import threading
+import time
+import weakref
+from contextlib import AsyncExitStack, asynccontextmanager
+from dataclasses import astuple, dataclass
+from typing import AsyncIterator, Callable
+
+from adkflow_runner.ir import WorkflowIR
+
+
+@dataclass
+class UnitLimits:
+    """Resolved limits for one FlowUnit type."""
+
+    max_concurrency: int | None = None
+    rate_limit: float | None = None  # Executions per second
+    rate_limit_burst: int = 1
+
+
+def resolve_unit_limits(ir: WorkflowIR) -> dict[str, UnitLimits]:
+    """Merge FlowUnit defaults with project setting overrides per UNIT_ID."""
+    unit_limits: dict[str, UnitLimits] = {}
+    for node in ir.custom_nodes:
+        if node.unit_id not in unit_limits:
+            unit_limits[node.unit_id] = UnitLimits(
+                max_concurrency=node.max_concurrency,
+                rate_limit=node.rate_limit,
+                rate_limit_burst=node.rate_limit_burst,
+            )
+
+    for unit_id, override in ir.execution_limits.units.items():
+        limits = unit_limits.setdefault(unit_id, UnitLimits())
+        if override.max_concurrency is not None:
+            limits.max_concurrency = override.max_concurrency
+        if override.rate_limit is not None:
+            limits.rate_limit = override.rate_limit
+        if override.rate_limit_burst is not None:
+            limits.rate_limit_burst = override.rate_limit_burst
+
+    return unit_limits
+
+
+class TokenBucket:
+    """Async token bucket rate limiter with FIFO waiters."""
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if rate <= 0:
+            raise ValueError(f"Rate must be positive, got {rate}")
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._clock = clock
+        self._tokens = float(self.burst)
+        self._updated = clock()
+        # asyncio.Lock wakes waiters in FIFO order
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(
+            float(self.burst), self._tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it."""
+        async with self._lock:
+            self._refill()
+            while self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= 1
+
+
+class ConcurrencyLimiter:
+    """Global and per-UNIT_ID limits for custom node execution.
+
+    Usage:
+        limiter = ConcurrencyLimiter(max_concurrency=8)
+        async with limiter.slot("advanced.api_client"):
+            await run_node()
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int | None = None,
+        unit_limits: dict[str, UnitLimits] | None = None,
+    ):
+        self.max_concurrency = max_concurrency
+        self.unit_limits = unit_limits or {}
+        self._global = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+        self._unit_semaphores: dict[str, asyncio.Semaphore] = {}
+        self._unit_buckets: dict[str, TokenBucket] = {}
+        self._active = 0
+        self._waiting = 0
+
+    @classmethod
+    def from_ir(cls, ir: WorkflowIR) -> "ConcurrencyLimiter":
+        """Build a limiter from FlowUnit defaults and project settings."""
+        return cls(
+            max_concurrency=ir.execution_limits.max_concurrency,
+            unit_limits=resolve_unit_limits(ir),
+        )
+
+    @property
+    def signature(self) -> tuple:
+        """Hashable summary of the configured limits."""
+        return (
+            self.max_concurrency,
+            tuple(
+                sorted((uid, astuple(lim)) for uid, lim in self.unit_limits.items())
+            ),
+        )
+
+    @property
+    def active(self) -> int:
+        """Number of executions currently holding a slot."""
+        return self._active
+
+    @property
+    def waiting(self) -> int:
+        """Number of executions queued for a slot."""
+        return self._waiting
+
+    def _unit_semaphore(self, unit_id: str) -> asyncio.Semaphore | None:
+        limits = self.unit_limits.get(unit_id)
+        if limits is None or not limits.max_concurrency:
+            return None
+        semaphore = self._unit_semaphores.get(unit_id)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(limits.max_concurrency)
+            self._unit_semaphores[unit_id] = semaphore
+        return semaphore
+
+    def _unit_bucket(self, unit_id: str) -> TokenBucket | None:
+        limits = self.unit_limits.get(unit_id)
+        if limits is None or not limits.rate_limit:
+            return None
+        bucket = self._unit_buckets.get(unit_id)
+        if bucket is None:
+            bucket = TokenBucket(limits.rate_limit, limits.rate_limit_burst)
+            self._unit_buckets[unit_id] = bucket
+        return bucket
+
+    @asynccontextmanager
+    async def slot(self, unit_id: str) -> AsyncIterator[None]:
+        """Hold an execution slot for a unit.
+
+        The unit's own semaphore and rate token are taken before the global
+        semaphore, so a throttled unit never ties up global capacity.
+        """
+        async with AsyncExitStack() as stack:
+            self._waiting += 1
+            try:
+                unit_semaphore = self._unit_semaphore(unit_id)
+                if unit_semaphore is not None:
+                    await stack.enter_async_context(unit_semaphore)
+
+                bucket = self._unit_bucket(unit_id)
+                if bucket is not None:
+                    await bucket.acquire()
+
+                if self._global is not None:
+                    await stack.enter_async_context(self._global)
+            finally:
+                self._waiting -= 1
+
+            self._active += 1
+            try:
+                yield
+            finally:
+                self._active -= 1
+
+
+# Limiters shared per event loop, keyed by project path and limits.
+# asyncio primitives are bound to the loop that first uses them.
+_shared_limiters: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, dict[tuple, ConcurrencyLimiter]
+] = weakref.WeakKeyDictionary()
+_shared_lock = threading.Lock()
+
+
+def get_shared_limiter(ir: WorkflowIR) -> ConcurrencyLimiter:
+    """Get the limiter shared by all executions of a project on this loop.
+
+    Every graph execution of the project (each run and each phase within
+    a run) draws slots from the same limiter. A limiter is replaced when
+    the project's limits change.
+    """
+    limiter = ConcurrencyLimiter.from_ir(ir)
+    key = (ir.project_path, limiter.signature)
+    loop = asyncio.get_running_loop()
+    with _shared_lock:
+        limiters = _shared_limiters.setdefault(loop, {})
+        shared = limiters.get(key)
+        if shared is None:
+            # Drop limiters for outdated limits of the same project
+            for stale in [k for k in limiters if k[0] == ir.project_path]:
+                del limiters[stale]
+            limiters[key] = shared = limiter
+        return shared
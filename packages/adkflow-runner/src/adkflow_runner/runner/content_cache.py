@@ -0,0 +1,197 @@
+"""Process-wide cache of context aggregator inputs.
+
+Context files rarely change between runs, so reading and decoding them
+again every run is wasted work:
+- Decoded text is keyed on (path, mtime, size, encoding); editing a file
+  changes its key, so stale text is never returned
+- Aggregated outputs are cached per aggregator config together with the
+  versions of every file and directory they were built from, and are
+  reused only while all of those are unchanged
+
+Both kinds of entries share one LRU bounded by estimated bytes. The
+runner and the backend's context preview service use the same instance.
+"""
+
+import os
+import sys
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Hashable
+
+from adkflow_runner.logging import get_logger
+
+_log = get_logger("runner.content_cache")
+
+# (path, st_mtime_ns, st_size) of a file or directory; (path, -1, -1) if
+# it does not exist
+FileVersion = tuple[str, int, int]
+
+
+@dataclass(frozen=True)
+class CachedText:
+    """Decoded file content."""
+
+    content: str
+    encoding: str  # Encoding that decoded the file
+    size: int  # Bytes on disk
+    mtime: float
+
+
+@dataclass
+class _CachedOutput:
+    """An aggregated output and the file versions it was built from."""
+
+    output: dict[str, Any]
+    versions: tuple[FileVersion, ...]
+
+
+def file_version(path: str | Path) -> FileVersion:
+    """Get the current version of a file or directory."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return (str(path), -1, -1)
+    return (str(path), st.st_mtime_ns, st.st_size)
+
+
+class ContentCache:
+    """Thread-safe, byte-bounded LRU of decoded files and aggregated outputs.
+
+    Usage:
+        text = content_cache.read_text(path)
+        output = content_cache.get_output(key)
+        content_cache.set_output(key, output, versions)
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[Hashable, Any] = OrderedDict()
+        self._sizes: dict[Hashable, int] = {}
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def read_text(
+        self,
+        path: Path,
+        encoding: str = "utf-8",
+        fallback: str | None = "latin-1",
+    ) -> CachedText:
+        """Read and decode a file, reusing the cached text if unchanged.
+
+        Args:
+            path: File to read
+            encoding: Encoding to try first
+            fallback: Encoding used if the first one fails, or None
+
+        Returns:
+            The decoded text
+
+        Raises:
+            OSError: If the file cannot be read
+            UnicodeDecodeError: If no encoding can decode the file
+        """
+        with open(path, "rb") as f:
+            # Key on the opened file, so a concurrent edit cannot pair new
+            # content with an old key
+            st = os.fstat(f.fileno())
+            key = ("text", str(path), st.st_mtime_ns, st.st_size, encoding)
+            cached = self._get(key)
+            # Text decoded with a fallback is only valid for the same fallback
+            if cached is not None and cached.encoding in (encoding, fallback):
+                return cached
+            data = f.read()
+
+        try:
+            content, used = data.decode(encoding), encoding
+        except UnicodeDecodeError:
+            if fallback is None:
+                raise
+            content, used = data.decode(fallback), fallback
+        # Universal newlines, as Path.read_text would give
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
+
+        text = CachedText(
+            content=content, encoding=used, size=st.st_size, mtime=st.st_mtime
+        )
+        self._put(key, text, sys.getsizeof(content))
+        return text
+
+    def get_output(self, key: str) -> dict[str, Any] | None:
+        """Get a cached aggregated output if its sources are unchanged."""
+        entry = self._get(("output", key))
+        if entry is None:
+            return None
+        if any(file_version(v[0]) != v for v in entry.versions):
+            with self._lock:
+                # Counted as a hit by _get, but the entry is stale
+                self.hits -= 1
+                self.misses += 1
+            self._discard(("output", key))
+            return None
+        return entry.output
+
+    def set_output(
+        self,
+        key: str,
+        output: dict[str, Any],
+        versions: list[FileVersion],
+    ) -> None:
+        """Cache an aggregated output built from the given file versions."""
+        size = sys.getsizeof(output) + sum(
+            sys.getsizeof(v) for v in output.get("output", {}).values()
+        )
+        self._put(("output", key), _CachedOutput(output, tuple(versions)), size)
+
+    def clear(self) -> None:
+        """Forget all cached entries."""
+        with self._lock:
+            self._entries.clear()
+            self._sizes.clear()
+            self._bytes = 0
+
+    @property
+    def memory_bytes(self) -> int:
+        """Estimated size of the cached entries in bytes."""
+        return self._bytes
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def _get(self, key: Hashable) -> Any | None:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def _put(self, key: Hashable, value: Any, size: int) -> None:
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._bytes -= self._sizes[key]
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            self._sizes[key] = size
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                evicted, _ = self._entries.popitem(last=False)
+                self._bytes -= self._sizes.pop(evicted)
+
+    def _discard(self, key: Hashable) -> None:
+        with self._lock:
+            if key in self._entries:
+                del self._entries[key]
+                self._bytes -= self._sizes.pop(key)
+
+
+# Shared by the runner's context aggregators and the backend preview
+content_cache = ContentCache()
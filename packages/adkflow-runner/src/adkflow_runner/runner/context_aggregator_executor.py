@@ -3,21 +3,75 @@
 Executes context aggregator nodes as built-in nodes, collecting content from
 files, directories, URLs, and connected nodes into named variables for
 Agent template substitution.
+
+Inputs of an aggregator are fetched concurrently (at most
+MAX_CONCURRENT_INPUTS at a time) and assembled in their configured order.
+File and directory reads run on a small bounded thread pool shared by all
+aggregators, so disk I/O never blocks the event loop.
+
+Decoded files and whole aggregator outputs are memoized in the shared
+content cache. An output is reused while every file and directory it was
+built from is unchanged; outputs with URL inputs, or with node inputs
+whose metadata carries a retrieval time, are always rebuilt.
 """
 
-import glob as glob_module
+import asyncio
+import contextvars
+import functools
+import hashlib
+import json
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime
 from email.utils import parsedate_to_datetime
 from pathlib import Path
-from typing import Any, Literal
+from typing import Any, Callable, Literal, TypeVar
 
 import httpx
 
 from adkflow_runner.ir import ContextAggregatorIR
 from adkflow_runner.logging import get_logger
+from adkflow_runner.runner.content_cache import (
+    FileVersion,
+    content_cache,
+    file_version,
+)
+from adkflow_runner.runner.directory_scan import DirectoryScan, scan_directory
+from adkflow_runner.runner.url_fetch import fetch_url
 
 _log = get_logger("runner.context_aggregator")
 
+# HTTP response cache of URL inputs, relative to the project
+URL_CACHE_DIR = Path(".cache") / "urls"
+
+# Inputs of one aggregator fetched at the same time
+MAX_CONCURRENT_INPUTS = 8
+
+# Disk reads of all aggregators share this pool
+_io_executor = ThreadPoolExecutor(
+    max_workers=MAX_CONCURRENT_INPUTS, thread_name_prefix="adkflow-context"
+)
+
+_T = TypeVar("_T")
+
+# (content, metadata) of one source
+_Item = tuple[str, dict[str, str] | None]
+
+
+@dataclass
+class _SourceVersions:
+    """Versions of the files and directories an output was built from."""
+
+    versions: list[FileVersion] = field(default_factory=list)
+    cacheable: bool = True  # False if the output cannot be validated
+
+
+async def _run_io(func: Callable[..., _T], *args: Any, **kwargs: Any) -> _T:
+    """Run blocking file I/O on the shared context reader pool."""
+    loop = asyncio.get_running_loop()
+    call = functools.partial(contextvars.copy_context().run, func, *args, **kwargs)
+    return await loop.run_in_executor(_io_executor, call)
+
 
 async def execute_context_aggregator(
     ir: ContextAggregatorIR,
@@ -46,6 +100,17 @@ async def execute_context_aggregator(
     # Unescape separator (handle \\n -> \n)
     separator = separator.replace("\\n", "\n").replace("\\t", "\t")
 
+    # Reuse the previous output while none of its sources changed
+    sources = _SourceVersions(
+        cacheable=_is_output_cacheable(dynamic_inputs, include_metadata)
+    )
+    cache_key = _output_cache_key(ir, project_path, node_inputs)
+    if sources.cacheable:
+        cached = content_cache.get_output(cache_key)
+        if cached is not None:
+            _log.debug("Context aggregator output cached", node_id=ir.id)
+            return {"output": dict(cached["output"])}
+
     project_path_obj = Path(project_path)
     variables: dict[str, str] = {}
     # For concatenate mode: list of (content, metadata) tuples
@@ -59,75 +124,25 @@ async def execute_context_aggregator(
         aggregation_mode=aggregation_mode,
     )
 
-    for di in dynamic_inputs:
-        input_type = di.get("inputType")
-        var_name = di.get("variableName", di.get("id"))
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_INPUTS)
 
-        if input_type == "file":
-            content, metadata = await _read_file(
-                di.get("filePath", ""),
-                project_path_obj,
-                include_metadata,
+    async def fetch(di: dict[str, Any]) -> dict[str, _Item]:
+        async with semaphore:
+            return await _fetch_input(
+                di, project_path_obj, node_inputs, include_metadata, sources
             )
-            if aggregation_mode == "pass":
-                if metadata:
-                    content = _format_frontmatter(metadata) + content
-                variables[var_name] = content
-            else:
-                all_items.append((content, metadata))
-
-        elif input_type == "directory":
-            contents = await _read_directory(
-                di.get("directoryPath", ""),
-                di.get("globPattern", "*"),
-                di.get("directoryAggregation", "concatenate"),
-                di.get("namingPattern", "file_name"),
-                di.get("customPattern", "{base}_{file_name}"),
-                di.get("directorySeparator", "\n\n---")
-                .replace("\\n", "\n")
-                .replace("\\t", "\t"),
-                var_name,
-                project_path_obj,
-                include_metadata,
-                recursive=di.get("recursive", False),
-                exclude_patterns=di.get("excludePatterns"),
-                max_files=di.get("maxFiles", 100),
-                max_file_size=di.get("maxFileSize", 1048576),
-            )
-            if aggregation_mode == "pass":
-                for v_name, (content, metadata) in contents.items():
-                    if metadata:
-                        content = _format_frontmatter(metadata) + content
-                    variables[v_name] = content
-            else:
-                all_items.extend(contents.values())
 
-        elif input_type == "url":
-            content, metadata = await _fetch_url(di.get("url", ""), include_metadata)
-            if aggregation_mode == "pass":
+    # Fetch every input concurrently; results keep the configured order
+    results = await asyncio.gather(*(fetch(di) for di in dynamic_inputs))
+
+    for items in results:
+        if aggregation_mode == "pass":
+            for v_name, (content, metadata) in items.items():
                 if metadata:
                     content = _format_frontmatter(metadata) + content
-                variables[var_name] = content
-            else:
-                all_items.append((content, metadata))
-
-        elif input_type == "node":
-            # Get from inputs (connected node output)
-            input_id = di.get("id")
-            content = node_inputs.get(input_id, "")
-            if isinstance(content, str):
-                metadata = None
-                if include_metadata:
-                    # Get source info from inputs if available
-                    source_name = di.get("label", var_name)
-                    metadata = _get_node_metadata(source_name, input_id)
-
-                if aggregation_mode == "pass":
-                    if metadata:
-                        content = _format_frontmatter(metadata) + content
-                    variables[var_name] = content
-                else:
-                    all_items.append((content, metadata))
+                variables[v_name] = content
+        else:
+            all_items.extend(items.values())
 
     if aggregation_mode == "concatenate":
         # Check if any items have metadata
@@ -155,23 +170,158 @@ async def execute_context_aggregator(
         variables=list(variables.keys()),
     )
 
+    if sources.cacheable:
+        content_cache.set_output(
+            cache_key, {"output": dict(variables)}, sources.versions
+        )
     return {"output": variables}
 
 
+def _is_output_cacheable(
+    dynamic_inputs: list[dict[str, Any]], include_metadata: bool
+) -> bool:
+    """Check whether an aggregator's output depends only on files."""
+    for di in dynamic_inputs:
+        input_type = di.get("inputType")
+        if input_type == "url":
+            return False
+        if input_type == "node" and include_metadata:
+            return False  # Metadata records the retrieval time
+    return True
+
+
+def _output_cache_key(
+    ir: ContextAggregatorIR, project_path: str, node_inputs: dict[str, Any]
+) -> str:
+    """Hash everything besides file contents that an output depends on."""
+    data = json.dumps(
+        [project_path, ir.id, ir.config, node_inputs], sort_keys=True, default=str
+    )
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+
+async def _fetch_input(
+    di: dict[str, Any],
+    project_path: Path,
+    node_inputs: dict[str, Any],
+    include_metadata: bool,
+    sources: _SourceVersions | None = None,
+) -> dict[str, _Item]:
+    """Fetch one dynamic input.
+
+    Args:
+        di: Dynamic input config
+        project_path: Path to the project root
+        node_inputs: Values from connected nodes
+        include_metadata: Whether to collect metadata
+        sources: Collects versions of the files and directories read
+
+    Returns:
+        Dict mapping variable names to (content, metadata) tuples; several
+        entries for a directory in pass mode, none for unusable inputs
+    """
+    input_type = di.get("inputType")
+    var_name = str(di.get("variableName") or di.get("id") or "")
+    if not var_name:
+        return {}
+
+    if input_type == "file":
+        return {
+            var_name: await _read_file(
+                di.get("filePath", ""), project_path, include_metadata, sources
+            )
+        }
+
+    if input_type == "directory":
+        return await _read_directory(
+            di.get("directoryPath", ""),
+            di.get("globPattern", "*"),
+            di.get("directoryAggregation", "concatenate"),
+            di.get("namingPattern", "file_name"),
+            di.get("customPattern", "{base}_{file_name}"),
+            di.get("directorySeparator", "\n\n---")
+            .replace("\\n", "\n")
+            .replace("\\t", "\t"),
+            var_name,
+            project_path,
+            include_metadata,
+            recursive=di.get("recursive", False),
+            exclude_patterns=di.get("excludePatterns"),
+            max_files=di.get("maxFiles", 100),
+            max_file_size=di.get("maxFileSize", 1048576),
+            sources=sources,
+        )
+
+    if input_type == "url":
+        return {
+            var_name: await _fetch_url(
+                di.get("url", ""),
+                include_metadata,
+                cache_dir=project_path / URL_CACHE_DIR,
+            )
+        }
+
+    if input_type == "node":
+        # Get from inputs (connected node output)
+        input_id = str(di.get("id") or "")
+        content = node_inputs.get(input_id, "")
+        if not isinstance(content, str):
+            return {}
+        metadata = None
+        if include_metadata:
+            # Get source info from inputs if available
+            source_name = di.get("label", var_name)
+            metadata = _get_node_metadata(source_name, input_id)
+        return {var_name: (content, metadata)}
+
+    return {}
+
+
 # -----------------------------------------------------------------------------
 # File reading
 # -----------------------------------------------------------------------------
 
 
 async def _read_file(
-    file_path: str, project_path: Path, include_metadata: bool = False
+    file_path: str,
+    project_path: Path,
+    include_metadata: bool = False,
+    sources: _SourceVersions | None = None,
+) -> tuple[str, dict[str, str] | None]:
+    """Read content from a file without blocking the event loop.
+
+    Args:
+        file_path: Path to the file (relative to project or absolute)
+        project_path: Path to the project root
+        include_metadata: Whether to collect file metadata
+        sources: Collects versions of the paths looked at
+
+    Returns:
+        Tuple of (content, metadata dict or None)
+    """
+    if not file_path:
+        return "", None
+    return await _run_io(
+        _read_file_sync, file_path, project_path, include_metadata, sources
+    )
+
+
+def _read_file_sync(
+    file_path: str,
+    project_path: Path,
+    include_metadata: bool = False,
+    sources: _SourceVersions | None = None,
 ) -> tuple[str, dict[str, str] | None]:
     """Read content from a file.
 
+    Decoding tries UTF-8 and falls back to latin-1; decoded text comes
+    from the content cache while the file is unchanged.
+
     Args:
         file_path: Path to the file (relative to project or absolute)
         project_path: Path to the project root
         include_metadata: Whether to collect file metadata
+        sources: Collects versions of the paths looked at
 
     Returns:
         Tuple of (content, metadata dict or None)
@@ -184,29 +334,25 @@ async def _read_file(
 
     # Try both relative to project and absolute paths
     full_path = project_path / file_path
+    if sources is not None:
+        sources.versions.append(file_version(full_path))
     if not full_path.exists():
         # Try absolute path
         full_path = Path(file_path)
+        if sources is not None:
+            sources.versions.append(file_version(full_path))
         if not full_path.exists():
             return f"[File not found: {file_path}]", None
 
     try:
-        content = full_path.read_text(encoding="utf-8")
+        content = content_cache.read_text(full_path).content
         metadata = None
         if include_metadata:
             metadata = _get_file_metadata(full_path, relative_path)
         return content, metadata
-    except UnicodeDecodeError:
-        # Try latin-1 as fallback
-        try:
-            content = full_path.read_text(encoding="latin-1")
-            metadata = None
-            if include_metadata:
-                metadata = _get_file_metadata(full_path, relative_path)
-            return content, metadata
-        except Exception as e:
-            return f"[Error reading {file_path}: {e}]", None
     except Exception as e:
+        if sources is not None:
+            sources.cacheable = False
         return f"[Error reading {file_path}: {e}]", None
 
 
@@ -215,81 +361,30 @@ async def _read_file(
 # -----------------------------------------------------------------------------
 
 
-def _matches_exclude_pattern(
-    file_path: Path, base_dir: Path, patterns: list[str]
-) -> bool:
-    """Check if a file path matches any exclusion pattern.
+def _limit_warning(
+    scan: DirectoryScan, max_files: int, max_file_size: int
+) -> str | None:
+    """Describe files left out of a directory scan by its limits.
 
     Args:
-        file_path: Absolute path to the file
-        base_dir: Base directory for relative path computation
-        patterns: List of patterns to check (e.g., ".git", "node_modules")
-
-    Returns:
-        True if the file should be excluded
-    """
-    try:
-        rel_path = file_path.relative_to(base_dir)
-    except ValueError:
-        return False
-
-    rel_parts = rel_path.parts
-    for pattern in patterns:
-        # Check if pattern matches any component of the path
-        if pattern in rel_parts:
-            return True
-        # Also support glob-like patterns (e.g., "*.pyc")
-        if any(Path(part).match(pattern) for part in rel_parts):
-            return True
-    return False
-
-
-def _check_limits(
-    files: list[Path], max_files: int, max_file_size: int
-) -> tuple[list[Path], str | None]:
-    """Check and enforce file/size limits.
-
-    Args:
-        files: List of file paths to check
+        scan: Result of scan_directory
         max_files: Maximum number of files allowed
         max_file_size: Maximum size per file in bytes
 
     Returns:
-        Tuple of (filtered_files, warning_message or None)
+        Warning message, or None if nothing was left out
     """
-    warning = None
-    skipped_large = 0
-
-    # Filter out files that exceed the per-file size limit
-    size_filtered_files = []
-    for f in files:
-        try:
-            file_size = f.stat().st_size
-            if file_size > max_file_size:
-                skipped_large += 1
-            else:
-                size_filtered_files.append(f)
-        except OSError:
-            continue
-
-    if skipped_large > 0:
-        warning = (
-            f"[Warning: Skipped {skipped_large} file(s) "
+    warnings = []
+    if scan.skipped_large > 0:
+        warnings.append(
+            f"[Warning: Skipped {scan.skipped_large} file(s) "
             f"exceeding {max_file_size // 1024}KB]"
         )
-
-    # Apply file count limit
-    if len(size_filtered_files) > max_files:
-        count_warning = (
-            f"[Warning: Found {len(size_filtered_files)} files, limited to {max_files}]"
+    if scan.matched > max_files:
+        warnings.append(
+            f"[Warning: Found more than {max_files} files, limited to {max_files}]"
         )
-        if warning:
-            warning = f"{warning} {count_warning}"
-        else:
-            warning = count_warning
-        size_filtered_files = size_filtered_files[:max_files]
-
-    return size_filtered_files, warning
+    return " ".join(warnings) or None
 
 
 def _sanitize_relative_path(rel_path: str) -> str:
@@ -348,6 +443,48 @@ async def _read_directory(
     exclude_patterns: list[str] | None = None,
     max_files: int = 100,
     max_file_size: int = 1048576,
+    sources: _SourceVersions | None = None,
+) -> dict[str, tuple[str, dict[str, str] | None]]:
+    """Read files from a directory without blocking the event loop.
+
+    See _read_directory_sync for the arguments.
+    """
+    if not directory_path:
+        return {}
+    return await _run_io(
+        _read_directory_sync,
+        directory_path,
+        glob_pattern,
+        aggregation,
+        naming_pattern,
+        custom_pattern,
+        separator,
+        base_var_name,
+        project_path,
+        include_metadata,
+        recursive=recursive,
+        exclude_patterns=exclude_patterns,
+        max_files=max_files,
+        max_file_size=max_file_size,
+        sources=sources,
+    )
+
+
+def _read_directory_sync(
+    directory_path: str,
+    glob_pattern: str,
+    aggregation: str,
+    naming_pattern: str,
+    custom_pattern: str,
+    separator: str,
+    base_var_name: str,
+    project_path: Path,
+    include_metadata: bool = False,
+    recursive: bool = False,
+    exclude_patterns: list[str] | None = None,
+    max_files: int = 100,
+    max_file_size: int = 1048576,
+    sources: _SourceVersions | None = None,
 ) -> dict[str, tuple[str, dict[str, str] | None]]:
     """Read files from a directory with glob pattern.
 
@@ -365,6 +502,7 @@ async def _read_directory(
         exclude_patterns: Patterns to exclude (e.g., ".git", "node_modules")
         max_files: Maximum number of files to include
         max_file_size: Maximum size per file in bytes
+        sources: Collects versions of the directories and files scanned
 
     Returns:
         Dict mapping variable names to (content, metadata) tuples
@@ -374,35 +512,34 @@ async def _read_directory(
 
     # Try both relative to project and absolute paths
     full_dir = project_path / directory_path
+    if sources is not None:
+        sources.versions.append(file_version(full_dir))
     if not full_dir.exists():
         full_dir = Path(directory_path)
+        if sources is not None:
+            sources.versions.append(file_version(full_dir))
         if not full_dir.exists():
             return {base_var_name: (f"[Directory not found: {directory_path}]", None)}
 
-    # Handle recursive mode - prepend **/ if not already recursive
-    effective_pattern = glob_pattern
-    if recursive and not glob_pattern.startswith("**/"):
-        effective_pattern = f"**/{glob_pattern}"
-
-    pattern = str(full_dir / effective_pattern)
-    files = sorted(glob_module.glob(pattern, recursive=True))
-
-    # Filter out directories, keep only files
-    files = [Path(f) for f in files if Path(f).is_file()]
-
-    # Apply exclusion patterns
-    if exclude_patterns:
-        files = [
-            f
-            for f in files
-            if not _matches_exclude_pattern(f, full_dir, exclude_patterns)
-        ]
-
-    if not files:
+    # Streams the directory and stops once max_files files are found
+    scan = scan_directory(
+        full_dir,
+        glob_pattern,
+        recursive=recursive,
+        exclude_patterns=exclude_patterns,
+        max_files=max_files,
+        max_file_size=max_file_size,
+    )
+    if sources is not None:
+        if scan.versions is None:
+            sources.cacheable = False
+        else:
+            sources.versions.extend(scan.versions)
+    if not scan.matched and not scan.skipped_large:
         return {base_var_name: (f"[No files matched: {glob_pattern}]", None)}
 
-    # Apply limits
-    files, limit_warning = _check_limits(files, max_files, max_file_size)
+    files = [f.path for f in scan.files]
+    limit_warning = _limit_warning(scan, max_files, max_file_size)
 
     total_files = len(files)
 
@@ -424,7 +561,7 @@ async def _read_directory(
             sanitized_rel_path = _sanitize_relative_path(str(rel_to_dir))
 
             try:
-                content = file_path.read_text(encoding="utf-8")
+                content = content_cache.read_text(file_path).content
                 metadata = None
                 if include_metadata:
                     metadata = _get_file_metadata(file_path, relative_path)
@@ -432,21 +569,9 @@ async def _read_directory(
                     metadata["total_files"] = str(total_files)
                     metadata["relative_path"] = sanitized_rel_path
                 contents_with_meta.append((content, metadata))
-            except UnicodeDecodeError:
-                # Try latin-1 as fallback
-                try:
-                    content = file_path.read_text(encoding="latin-1")
-                    metadata = None
-                    if include_metadata:
-                        metadata = _get_file_metadata(file_path, relative_path)
-                        metadata["file_index"] = str(i)
-                        metadata["total_files"] = str(total_files)
-                        metadata["relative_path"] = sanitized_rel_path
-                    contents_with_meta.append((content, metadata))
-                except Exception:
-                    pass
             except Exception:
-                pass
+                if sources is not None:
+                    sources.cacheable = False
 
         # For concatenate with metadata, build the output with formatted separators
         if include_metadata and any(m for _, m in contents_with_meta):
@@ -484,29 +609,18 @@ async def _read_directory(
             sanitized_rel_path = _sanitize_relative_path(str(rel_to_dir))
 
             try:
-                content = file_path.read_text(encoding="utf-8")
+                content = content_cache.read_text(file_path).content
                 metadata = None
                 if include_metadata:
                     metadata = _get_file_metadata(file_path, relative_path)
                     metadata["file_index"] = str(i)
                     metadata["total_files"] = str(total_files)
                     metadata["relative_path"] = sanitized_rel_path
-            except UnicodeDecodeError:
-                # Try latin-1 as fallback
-                try:
-                    content = file_path.read_text(encoding="latin-1")
-                    metadata = None
-                    if include_metadata:
-                        metadata = _get_file_metadata(file_path, relative_path)
-                        metadata["file_index"] = str(i)
-                        metadata["total_files"] = str(total_files)
-                        metadata["relative_path"] = sanitized_rel_path
-                except Exception as e:
-                    content = f"[Error: {e}]"
-                    metadata = None
             except Exception as e:
                 content = f"[Error: {e}]"
                 metadata = None
+                if sources is not None:
+                    sources.cacheable = False
 
             # Generate variable name based on pattern
             if naming_pattern == "file_name":
@@ -533,13 +647,14 @@ async def _read_directory(
 
 
 async def _fetch_url(
-    url: str, include_metadata: bool = False
+    url: str, include_metadata: bool = False, cache_dir: Path | None = None
 ) -> tuple[str, dict[str, str] | None]:
     """Fetch content from a URL.
 
     Args:
         url: URL to fetch
         include_metadata: Whether to collect metadata
+        cache_dir: Directory of the HTTP response cache, None to disable
 
     Returns:
         Tuple of (content, metadata dict or None)
@@ -548,16 +663,15 @@ async def _fetch_url(
         return "", None
 
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, timeout=30.0, follow_redirects=True)
-            response.raise_for_status()
-            content = response.text
+        response = await fetch_url(url, cache_dir=cache_dir, timeout=30.0)
+        response.raise_for_status()
+        content = response.text
 
-            metadata = None
-            if include_metadata:
-                metadata = _get_url_metadata(url, response)
+        metadata = None
+        if include_metadata:
+            metadata = _get_url_metadata(url, response)
 
-            return content, metadata
+        return content, metadata
     except httpx.TimeoutException:
         return f"[Timeout fetching {url}]", None
     except httpx.HTTPStatusError as e:
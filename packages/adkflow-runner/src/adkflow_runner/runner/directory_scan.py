@@ -0,0 +1,266 @@
+"""Streaming directory scan for context aggregation.
+
+Finds the files of a directory input without materializing the whole
+tree the way sorted(glob(...)) does:
+- Walks with os.scandir, so file type and stat come from DirEntry caches
+- Prunes excluded directories and directories the pattern cannot match
+  below before descending into them
+- Yields files in the same order as sorted(glob(...)), so results are
+  deterministic
+- Stops as soon as max_files files are found (plus one, to know that
+  the list was cut)
+- Records the version of every directory listed and file examined, so
+  results derived from a scan can be validated later without scanning
+
+Pattern matching follows glob with recursive=True: "**" matches any
+number of directories, and wildcards do not match names starting with
+"." unless the pattern component does.
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import glob as glob_module
+import os
+import re
+from dataclasses import dataclass, field
+from pathlib import Path, PurePath
+from typing import Callable, Iterator
+
+
+@dataclass
+class ScannedFile:
+    """A file found by scan_directory."""
+
+    path: Path
+    size: int  # Bytes
+    mtime: float
+
+
+@dataclass
+class DirectoryScan:
+    """Result of scan_directory."""
+
+    files: list[ScannedFile] = field(default_factory=list)  # At most max_files
+    matched: int = 0  # Files within the size limit seen by the scan
+    skipped_large: int = 0  # Files over max_file_size seen by the scan
+    complete: bool = True  # False if the scan stopped at count_limit
+    # (path, st_mtime_ns, st_size) of every directory listed and file
+    # examined; None if the pattern was resolved by glob
+    versions: list[tuple[str, int, int]] | None = field(default_factory=list)
+
+
+def scan_directory(
+    directory: Path,
+    pattern: str,
+    recursive: bool = False,
+    exclude_patterns: list[str] | None = None,
+    max_files: int = 100,
+    max_file_size: int = 1048576,
+    count_limit: int | None = None,
+) -> DirectoryScan:
+    """Find files in a directory matching a glob pattern.
+
+    Args:
+        directory: Directory to scan
+        pattern: Glob pattern relative to the directory
+        recursive: Whether to match the pattern in subdirectories too
+        exclude_patterns: Names or glob patterns; a file is skipped if any
+            part of its path below the directory matches one
+        max_files: Maximum number of files to return
+        max_file_size: Files larger than this many bytes are skipped
+        count_limit: Stop once this many files within the size limit have
+            been seen; defaults to max_files + 1, which is enough to tell
+            whether files were left out
+
+    Returns:
+        DirectoryScan with the first max_files matching files in order
+    """
+    if recursive and not pattern.startswith("**/"):
+        pattern = f"**/{pattern}"
+    if count_limit is None:
+        count_limit = max_files + 1
+
+    scan = DirectoryScan()
+    excludes = exclude_patterns or []
+    for path, stat in _iter_candidates(directory, pattern, excludes, scan):
+        try:
+            st = stat()
+        except OSError:
+            continue
+        if scan.versions is not None:
+            scan.versions.append((path, st.st_mtime_ns, st.st_size))
+        if st.st_size > max_file_size:
+            scan.skipped_large += 1
+            continue
+
+        scan.matched += 1
+        if len(scan.files) < max_files:
+            scan.files.append(
+                ScannedFile(path=Path(path), size=st.st_size, mtime=st.st_mtime)
+            )
+        if scan.matched >= count_limit:
+            scan.complete = False
+            break
+    return scan
+
+
+_Candidate = tuple[str, Callable[[], os.stat_result]]
+
+# Pattern parts as compiled name matchers; None stands for "**"
+_Parts = list[Callable[[str], object] | None]
+
+# Pattern positions still to be matched below a directory
+_States = frozenset[int]
+
+_FLAGS = re.IGNORECASE if os.path.normcase("A") == "a" else 0
+
+
+def _compile(part: str) -> Callable[[str], object]:
+    return re.compile(fnmatch.translate(part), _FLAGS).match
+
+
+def _iter_candidates(
+    directory: Path, pattern: str, excludes: list[str], scan: DirectoryScan
+) -> Iterator[_Candidate]:
+    """Yield (path, stat) of matching files in sorted path order."""
+    raw = [p for p in pattern.replace(os.sep, "/").split("/") if p not in ("", ".")]
+    if os.path.isabs(pattern) or ".." in raw:
+        # Patterns leaving the directory are left to glob
+        scan.versions = None
+        yield from _iter_glob(directory, pattern, excludes)
+        return
+
+    try:
+        st = os.stat(directory)
+    except OSError:
+        return
+    versions = scan.versions if scan.versions is not None else []
+    versions.append((str(directory), st.st_mtime_ns, st.st_size))
+
+    parts: _Parts = [None if p == "**" else _compile(p) for p in raw]
+    # Like glob, wildcards skip hidden names unless the pattern asks for them
+    hidden_ok = [p.startswith(".") for p in raw]
+    walker = _Walker(parts, hidden_ok, excludes, versions)
+    yield from walker.walk(str(directory), walker.closure({0}))
+
+
+class _Walker:
+    """Depth-first scan that tracks which pattern parts are left to match."""
+
+    def __init__(
+        self,
+        parts: _Parts,
+        hidden_ok: list[bool],
+        excludes: list[str],
+        versions: list[tuple[str, int, int]],
+    ):
+        self.parts = parts
+        self.hidden_ok = hidden_ok
+        self.versions = versions
+        # A name is excluded if it equals a pattern or matches it as a glob;
+        # patterns with "/" never match a single name
+        self.exclude_names = set(excludes)
+        self.exclude_matchers = [_compile(p) for p in excludes if "/" not in p]
+        self.visited: set[tuple[int, int]] = set()
+
+    def closure(self, states: set[int]) -> _States:
+        """Add the positions after each "**", which may match no directory."""
+        pending = list(states)
+        while pending:
+            i = pending.pop()
+            if i < len(self.parts) and self.parts[i] is None and i + 1 not in states:
+                states.add(i + 1)
+                pending.append(i + 1)
+        return frozenset(states)
+
+    def _match(self, i: int, name: str) -> bool:
+        if name.startswith(".") and not self.hidden_ok[i]:
+            return False
+        matcher = self.parts[i]
+        return matcher is None or bool(matcher(name))
+
+    def _file_matches(self, states: _States, name: str) -> bool:
+        last = len(self.parts) - 1
+        return last in states and self._match(last, name)
+
+    def _enter(self, states: _States, name: str) -> _States:
+        """Positions left to match below a directory called name."""
+        last = len(self.parts) - 1
+        entered = set()
+        for i in states:
+            if i > last or not self._match(i, name):
+                continue
+            if self.parts[i] is None:
+                entered.add(i)  # "**" may match more directories
+            elif i < last:
+                entered.add(i + 1)
+        return self.closure(entered)
+
+    def _excluded(self, name: str) -> bool:
+        return name in self.exclude_names or any(m(name) for m in self.exclude_matchers)
+
+    def walk(self, directory: str, states: _States) -> Iterator[_Candidate]:
+        try:
+            with os.scandir(directory) as it:
+                entries = [(entry, _is_dir(entry)) for entry in it]
+        except OSError:
+            return
+
+        # A directory's files sort right after the directory name followed
+        # by "/", which reproduces sorted() over full paths
+        entries.sort(key=lambda item: item[0].name + "/" if item[1] else item[0].name)
+
+        check_excludes = bool(self.exclude_names)
+        for entry, is_dir in entries:
+            name = entry.name
+            if check_excludes and self._excluded(name):
+                continue
+            if is_dir:
+                below = self._enter(states, name)
+                if not below:
+                    continue
+                try:
+                    st = entry.stat()
+                except OSError:
+                    continue
+                # Guards against symlink cycles
+                key = (st.st_dev, st.st_ino)
+                if key in self.visited:
+                    continue
+                self.visited.add(key)
+                self.versions.append((entry.path, st.st_mtime_ns, st.st_size))
+                yield from self.walk(entry.path, below)
+            elif self._file_matches(states, name) and _is_file(entry):
+                yield entry.path, entry.stat
+
+
+def _iter_glob(
+    directory: Path, pattern: str, excludes: list[str]
+) -> Iterator[_Candidate]:
+    for path in sorted(glob_module.glob(str(directory / pattern), recursive=True)):
+        if not os.path.isfile(path):
+            continue
+        try:
+            rel_parts = Path(path).relative_to(directory).parts
+        except ValueError:
+            rel_parts = ()
+        if excludes and any(
+            part == p or PurePath(part).match(p) for part in rel_parts for p in excludes
+        ):
+            continue
+        yield path, lambda path=path: os.stat(path)
+
+
+def _is_dir(entry: os.DirEntry[str]) -> bool:
+    try:
+        return entry.is_dir()
+    except OSError:
+        return False
+
+
+def _is_file(entry: os.DirEntry[str]) -> bool:
+    try:
+        return entry.is_file()
+    except OSError:
+        return False
@@ -0,0 +1,292 @@
+"""Broadcast of run events to any number of subscribers.
+
+Subscribers share one append-only log (an EventStore) instead of each
+getting a copy of every event:
+- Publishing appends to the log once and wakes waiting subscribers, so
+  its cost does not grow with the number of subscribers
+- Each subscriber reads from its own cursor into the log; subscribing
+  late replays history by starting the cursor at an earlier offset
+- A subscriber may fall at most max_lag events behind. Past that, its
+  slow-consumer policy applies: "drop" skips ahead to the newest
+  max_lag events, "disconnect" ends the subscription with
+  SlowConsumerError, "block" makes publish wait until it catches up
+
+Lag and drop counts are tracked per subscriber and reported by stats().
+"""
+
+import asyncio
+from dataclasses import dataclass
+from typing import Generator, Literal, cast, get_args
+
+from adkflow_runner.errors import SlowConsumerError
+from adkflow_runner.logging import get_logger
+from adkflow_runner.runner.event_store import EventStore
+from adkflow_runner.runner.types import RunEvent
+
+_log = get_logger("runner.event_hub")
+
+SlowConsumerPolicy = Literal["drop", "disconnect", "block"]
+
+# Events a subscriber may fall behind before its policy applies
+DEFAULT_MAX_LAG = 10_000
+
+
+def _check_policy(policy: str) -> SlowConsumerPolicy:
+    """Reject unknown slow-consumer policies."""
+    if policy not in get_args(SlowConsumerPolicy):
+        raise ValueError(f"Unknown slow-consumer policy: {policy!r}")
+    return cast(SlowConsumerPolicy, policy)
+
+
+@dataclass
+class SubscriberStats:
+    """Delivery metrics of one subscription."""
+
+    subscriber_id: int
+    policy: SlowConsumerPolicy
+    cursor: int  # Offset of the next event to deliver
+    lag: int  # Published events not yet delivered
+    max_lag_seen: int
+    dropped: int  # Events skipped by the drop policy or lost from the log
+    disconnected: bool
+
+
+class Subscription:
+    """A subscriber's cursor into an EventHub.
+
+    Usage:
+        subscription = hub.subscribe()
+        while (event := await subscription.get()) is not None:
+            ...
+        hub.unsubscribe(subscription)
+    """
+
+    def __init__(
+        self,
+        hub: "EventHub",
+        subscriber_id: int,
+        cursor: int,
+        policy: SlowConsumerPolicy,
+        max_lag: int,
+    ):
+        self.hub = hub
+        self.subscriber_id = subscriber_id
+        self.cursor = cursor
+        self.policy: SlowConsumerPolicy = policy
+        self.max_lag = max(1, max_lag)
+        self.max_lag_seen = 0
+        self.dropped = 0
+        self.disconnected = False
+        self._events: Generator[RunEvent, None, None] | None = None
+
+    async def get(self) -> RunEvent | None:
+        """Wait for the next event.
+
+        Returns:
+            The next event, or None once the hub is closed and every
+            event has been delivered
+
+        Raises:
+            SlowConsumerError: If the "disconnect" policy ended this
+                subscription
+        """
+        while True:
+            event = self._next()
+            if event is not None:
+                return event
+            if self.hub.closed:
+                return None
+            await self.hub._published()
+
+    @property
+    def lag(self) -> int:
+        """Published events not yet delivered to this subscriber."""
+        return max(0, len(self.hub.store) - self.cursor)
+
+    def stats(self) -> SubscriberStats:
+        """Get this subscription's delivery metrics."""
+        return SubscriberStats(
+            subscriber_id=self.subscriber_id,
+            policy=self.policy,
+            cursor=self.cursor,
+            lag=self.lag,
+            max_lag_seen=self.max_lag_seen,
+            dropped=self.dropped,
+            disconnected=self.disconnected,
+        )
+
+    def close(self) -> None:
+        """Release the replay iterator."""
+        self._seek(self.cursor)
+
+    def _next(self) -> RunEvent | None:
+        if self.disconnected:
+            raise SlowConsumerError(
+                f"Subscriber fell more than {self.max_lag} events behind"
+            )
+        store = self.hub.store
+        lag = len(store) - self.cursor
+        self.max_lag_seen = max(self.max_lag_seen, lag)
+        if lag > self.max_lag:
+            if self.policy == "disconnect":
+                self.disconnected = True
+                self.hub.unsubscribe(self)
+                _log.warning(
+                    "Disconnected slow event subscriber",
+                    subscriber_id=self.subscriber_id,
+                    lag=lag,
+                )
+                raise SlowConsumerError(
+                    f"Subscriber fell more than {self.max_lag} events behind"
+                )
+            if self.policy == "drop":
+                skipped = lag - self.max_lag
+                self.dropped += skipped
+                self._seek(self.cursor + skipped)
+                _log.debug(
+                    "Dropped events for slow subscriber",
+                    subscriber_id=self.subscriber_id,
+                    dropped=skipped,
+                )
+
+        # Events evicted from a store without a spill file are gone
+        first = store.first_offset
+        if self.cursor < first:
+            self.dropped += first - self.cursor
+            self._seek(first)
+
+        if self.cursor >= len(store):
+            return None
+        if self._events is None:
+            self._events = store.replay(self.cursor)
+        event = next(self._events, None)
+        if event is None:
+            self._events = None
+            return None
+        self.cursor += 1
+        if self.policy == "block":
+            self.hub._advanced()
+        return event
+
+    def _seek(self, cursor: int) -> None:
+        if self._events is not None:
+            self._events.close()
+            self._events = None
+        self.cursor = cursor
+
+
+class EventHub:
+    """Shared event log with per-subscriber cursors.
+
+    Usage:
+        hub = EventHub(EventStore(spill_path=path))
+        await hub.publish(event)
+        hub.close()
+    """
+
+    def __init__(
+        self,
+        store: EventStore | None = None,
+        policy: SlowConsumerPolicy = "drop",
+        max_lag: int = DEFAULT_MAX_LAG,
+    ):
+        self.store = store if store is not None else EventStore()
+        self.policy: SlowConsumerPolicy = _check_policy(policy)
+        self.max_lag = max_lag
+        self.closed = False
+        self._subscriptions: dict[int, Subscription] = {}
+        self._blocking: dict[int, Subscription] = {}  # Policy "block" only
+        self._next_id = 0
+        self._publish_waiter: asyncio.Future[None] | None = None
+        self._advance_waiter: asyncio.Future[None] | None = None
+
+    async def publish(self, event: RunEvent) -> int:
+        """Append an event to the log and wake subscribers.
+
+        Returns:
+            The event's offset
+        """
+        while self._blocked():
+            await self._wait(advance=True)
+        offset = self.store.append(event)
+        self._wake_subscribers()
+        return offset
+
+    def close(self) -> None:
+        """Mark the end of the stream; subscribers finish after draining."""
+        self.closed = True
+        self._wake_subscribers()
+
+    def subscribe(
+        self,
+        start: int = 0,
+        policy: SlowConsumerPolicy | None = None,
+        max_lag: int | None = None,
+    ) -> Subscription:
+        """Subscribe from an offset (0 replays the whole run).
+
+        Args:
+            start: Offset of the first event to deliver
+            policy: Slow-consumer policy; defaults to the hub's
+            max_lag: Maximum lag; defaults to the hub's
+        """
+        subscription = Subscription(
+            self,
+            self._next_id,
+            cursor=max(0, start),
+            policy=_check_policy(policy) if policy else self.policy,
+            max_lag=max_lag if max_lag is not None else self.max_lag,
+        )
+        self._subscriptions[self._next_id] = subscription
+        if subscription.policy == "block":
+            self._blocking[self._next_id] = subscription
+        self._next_id += 1
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """Remove a subscription."""
+        self._blocking.pop(subscription.subscriber_id, None)
+        if self._subscriptions.pop(subscription.subscriber_id, None) is not None:
+            subscription.close()
+            # A blocking subscriber may be what publish is waiting on
+            self._advanced()
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscriptions)
+
+    def stats(self) -> list[SubscriberStats]:
+        """Get delivery metrics of every subscription."""
+        return [s.stats() for s in self._subscriptions.values()]
+
+    def _blocked(self) -> bool:
+        if not self._blocking:
+            return False
+        head = len(self.store)
+        return any(head - s.cursor >= s.max_lag for s in self._blocking.values())
+
+    async def _published(self) -> None:
+        await self._wait(advance=False)
+
+    async def _wait(self, advance: bool) -> None:
+        # One future per wait kind, shared by all waiters and replaced
+        # after it fires; shield keeps a cancelled waiter from cancelling
+        # it for the others
+        waiter = self._advance_waiter if advance else self._publish_waiter
+        if waiter is None or waiter.done():
+            waiter = asyncio.get_running_loop().create_future()
+            if advance:
+                self._advance_waiter = waiter
+            else:
+                self._publish_waiter = waiter
+        await asyncio.shield(waiter)
+
+    def _wake_subscribers(self) -> None:
+        waiter, self._publish_waiter = self._publish_waiter, None
+        if waiter is not None and not waiter.done():
+            waiter.set_result(None)
+
+    def _advanced(self) -> None:
+        waiter, self._advance_waiter = self._advance_waiter, None
+        if waiter is not None and not waiter.done():
+            waiter.set_result(None)
@@ -0,0 +1,169 @@
+"""Bounded event store for workflow runs.
+
+Long runs with streaming output emit many events, and keeping all of
+them in a list holds the whole run in memory:
+- The most recent events stay in an in-memory ring buffer of fixed
+  capacity, which is all that live subscribers normally read
+- Events that fall out of the ring are appended to a per-run JSONL file
+  (when a spill path is given), so the full run can still be replayed
+- Every event gets an offset (its position in the run), and replay can
+  start from any offset
+
+Without a spill path, events evicted from the ring are dropped and
+replay starts at the oldest event still in memory.
+
+The byte position of every SPILL_INDEX_INTERVAL-th spilled event is
+kept, so replay from a late offset seeks near it instead of re-reading
+the spill file from the start.
+"""
+
+import json
+from collections import deque
+from pathlib import Path
+from typing import IO, Generator, Iterator
+
+from adkflow_runner.logging import get_logger
+from adkflow_runner.runner.types import RunEvent
+
+_log = get_logger("runner.event_store")
+
+# Events kept in memory per run
+DEFAULT_CAPACITY = 1000
+
+# Spilled events between recorded byte positions in the spill file
+SPILL_INDEX_INTERVAL = 256
+
+
+class EventStore:
+    """Ring buffer of run events that spills older events to disk.
+
+    Usage:
+        store = EventStore(spill_path=Path("run.jsonl"))
+        offset = store.append(event)
+        for event in store.replay(offset):
+            ...
+        store.close(delete=True)
+    """
+
+    def __init__(
+        self,
+        capacity: int = DEFAULT_CAPACITY,
+        spill_path: Path | None = None,
+    ):
+        self.capacity = max(1, capacity)
+        self.spill_path = spill_path
+        self._buffer: deque[RunEvent] = deque()
+        self._count = 0  # Events appended so far
+        self._spilled = 0  # Events in the spill file (offsets 0.._spilled-1)
+        self._spill_bytes = 0  # Size of the spill file
+        # Byte position of event i * SPILL_INDEX_INTERVAL in the spill file
+        self._spill_index: list[int] = []
+        self._file: IO[bytes] | None = None
+        self._spill_failed = False
+        self.last_timestamp: float | None = None
+
+    def append(self, event: RunEvent) -> int:
+        """Add an event and return its offset."""
+        offset = self._count
+        self._buffer.append(event)
+        self._count += 1
+        self.last_timestamp = event.timestamp
+        while len(self._buffer) > self.capacity:
+            self._spill(self._buffer.popleft())
+        return offset
+
+    def replay(self, start: int = 0) -> Generator[RunEvent, None, None]:
+        """Yield stored events from an offset onwards, in order.
+
+        Events appended while iterating are included. Offsets that were
+        dropped (no spill file) are skipped.
+        """
+        offset = max(0, start)
+        while True:
+            if offset < self._spilled:
+                # Also reached when events were evicted while iterating
+                before = offset
+                for event in self._read_spilled(offset, self._spilled):
+                    yield event
+                    offset += 1
+                if offset == before:
+                    offset = self._spilled  # Spill file is gone or truncated
+                continue
+            first = self._count - len(self._buffer)
+            offset = max(offset, first)
+            if offset >= self._count:
+                return
+            yield self._buffer[offset - first]
+            offset += 1
+
+    @property
+    def first_offset(self) -> int:
+        """Offset of the oldest event that can still be replayed."""
+        if self._spilled:
+            return 0
+        return self._count - len(self._buffer)
+
+    @property
+    def spilled(self) -> int:
+        """Number of events written to the spill file."""
+        return self._spilled
+
+    def close(self, delete: bool = False) -> None:
+        """Close the spill file, optionally deleting it.
+
+        A closed store can still be replayed and appended to.
+        """
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        if delete and self.spill_path is not None:
+            self.spill_path.unlink(missing_ok=True)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[RunEvent]:
+        return self.replay()
+
+    def _spill(self, event: RunEvent) -> None:
+        # After a failure nothing more is written, so the file only ever
+        # holds a gap-free prefix of the run
+        if self.spill_path is None or self._spill_failed:
+            return
+        try:
+            if self._file is None:
+                self.spill_path.parent.mkdir(parents=True, exist_ok=True)
+                # Append after close(), start a fresh file otherwise
+                mode = "ab" if self._spilled else "wb"
+                self._file = open(self.spill_path, mode)
+            line = (json.dumps(event.to_dict(), default=str) + "\n").encode("utf-8")
+            self._file.write(line)
+        except (OSError, TypeError, ValueError) as e:
+            self._spill_failed = True
+            _log.warning(
+                "Failed to spill run events", path=str(self.spill_path), error=str(e)
+            )
+            return
+        if self._spilled % SPILL_INDEX_INTERVAL == 0:
+            self._spill_index.append(self._spill_bytes)
+        self._spill_bytes += len(line)
+        self._spilled += 1
+
+    def _read_spilled(self, start: int, end: int) -> Iterator[RunEvent]:
+        if self._file is not None:
+            self._file.flush()
+        assert self.spill_path is not None
+        try:
+            f = open(self.spill_path, "rb")
+        except OSError:
+            return
+        with f:
+            block = start // SPILL_INDEX_INTERVAL
+            f.seek(self._spill_index[block])
+            offset = block * SPILL_INDEX_INTERVAL
+            for line in f:
+                if offset >= end:
+                    return
+                if offset >= start:
+                    yield RunEvent.from_dict(json.loads(line))
+                offset += 1
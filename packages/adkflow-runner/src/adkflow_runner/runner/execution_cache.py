@@ -0,0 +1,406 @@
+"""Two-tier result cache for custom node execution.
+
+Results are keyed by a SHA-256 of node ID, FlowUnit ID and code version,
+inputs, config and the IS_CHANGED value, which makes the cache
+content-addressed:
+- Memory tier: LRU bounded by entry count and estimated byte size
+- Disk tier: one file per key under cache_dir, written atomically so
+  several processes can share the same directory. Bounded by entry count
+  and total bytes; the least recently used files are pruned first
+
+Serialization for the disk tier is pluggable. Values the serializer
+cannot handle, or could not return unchanged, are kept in memory only.
+"""
+
+import hashlib
+import inspect
+import json
+import os
+import pickle
+import sys
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Protocol
+
+from adkflow_runner.logging import get_logger
+
+_log = get_logger("runner.cache")
+
+
+class CacheSerializer(Protocol):
+    """Serializer used by the disk tier."""
+
+    extension: str
+
+    def dumps(self, value: Any) -> bytes: ...
+
+    def loads(self, data: bytes) -> Any: ...
+
+
+class JsonSerializer:
+    """JSON serializer (default). Non-JSON values stay memory-only.
+
+    Values JSON would change (tuples, non-str dict keys, NaN, subclasses of
+    the JSON types) are refused, so a disk hit returns exactly what a
+    memory hit would.
+    """
+
+    extension = "json"
+
+    def dumps(self, value: Any) -> bytes:
+        if not _json_exact(value):
+            raise TypeError("Value does not round-trip through JSON")
+        return json.dumps(value).encode("utf-8")
+
+    def loads(self, data: bytes) -> Any:
+        return json.loads(data)
+
+
+def _json_exact(value: Any) -> bool:
+    """Check that JSON would decode value back to an equal value of the same types."""
+    kind = type(value)
+    if value is None or kind in (str, int, bool):
+        return True
+    if kind is float:
+        return value == value and value not in (float("inf"), float("-inf"))
+    if kind is list:
+        return all(_json_exact(item) for item in value)
+    if kind is dict:
+        return all(
+            type(key) is str and _json_exact(item) for key, item in value.items()
+        )
+    return False
+
+
+def unit_code_version(flow_unit_cls: type) -> str:
+    """Stamp of a FlowUnit's code: its VERSION and source file mtime and size.
+
+    Part of the cache key, so outputs cached before the unit's code changed
+    (or was reloaded from an edited file) are not served afterwards.
+    """
+    version = str(getattr(flow_unit_cls, "VERSION", ""))
+    try:
+        source = inspect.getsourcefile(flow_unit_cls)
+    except TypeError:
+        source = None
+    if source is None:
+        return version
+    try:
+        st = os.stat(source)
+    except OSError:
+        return version
+    return f"{version}:{st.st_mtime_ns}:{st.st_size}"
+
+
+class PickleSerializer:
+    """Pickle serializer for arbitrary Python outputs.
+
+    Only use with a cache directory that is not writable by untrusted users.
+    """
+
+    extension = "pkl"
+
+    def dumps(self, value: Any) -> bytes:
+        return pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def loads(self, data: bytes) -> Any:
+        return pickle.loads(data)
+
+
+class ExecutionCache:
+    """Cache for node execution results with IS_CHANGED support."""
+
+    def __init__(
+        self,
+        cache_dir: Path | None = None,
+        max_entries: int = 1024,
+        max_bytes: int = 64 * 1024 * 1024,
+        serializer: CacheSerializer | None = None,
+        max_disk_entries: int = 16384,
+        max_disk_bytes: int = 512 * 1024 * 1024,
+    ):
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.max_disk_entries = max_disk_entries
+        self.max_disk_bytes = max_disk_bytes
+        self.serializer: CacheSerializer = serializer or JsonSerializer()
+        self._memory_cache: OrderedDict[str, Any] = OrderedDict()
+        self._sizes: dict[str, int] = {}
+        self._memory_bytes = 0
+        self._is_changed_values: dict[str, Any] = {}
+        # Disk usage estimate, seeded by a scan on first write. Other
+        # processes sharing cache_dir are picked up on the next prune.
+        self._disk_entries: int | None = None
+        self._disk_bytes = 0
+        self._lock = threading.Lock()
+
+    def compute_key(
+        self,
+        node_id: str,
+        inputs: dict[str, Any],
+        config: dict[str, Any],
+        is_changed_value: Any,
+        unit_id: str = "",
+        code_version: str = "",
+    ) -> str:
+        """Compute cache key from inputs, config, and is_changed value.
+
+        Args:
+            node_id: Node ID
+            inputs: Node inputs
+            config: Node config
+            is_changed_value: Value returned by the FlowUnit's is_changed()
+            unit_id: The FlowUnit's UNIT_ID
+            code_version: Stamp of the FlowUnit's code (unit_code_version)
+
+        Returns:
+            Hex SHA-256 cache key
+        """
+        # Include is_changed_value in the hash
+        data = {
+            "node_id": node_id,
+            "unit_id": unit_id,
+            "code_version": code_version,
+            "inputs": self._make_hashable(inputs),
+            "config": self._make_hashable(config),
+            "is_changed": str(is_changed_value),
+        }
+        return hashlib.sha256(json.dumps(data, sort_keys=True).encode()).hexdigest()
+
+    def _make_hashable(self, obj: Any) -> Any:
+        """Convert object to hashable representation."""
+        if isinstance(obj, dict):
+            return tuple(sorted((k, self._make_hashable(v)) for k, v in obj.items()))
+        if isinstance(obj, list):
+            return tuple(self._make_hashable(v) for v in obj)
+        if isinstance(obj, set):
+            return tuple(sorted(self._make_hashable(v) for v in obj))
+        return str(obj)
+
+    def get(self, key: str) -> Any | None:
+        """Get cached result, checking memory first and then disk."""
+        with self._lock:
+            if key in self._memory_cache:
+                self._memory_cache.move_to_end(key)
+                return self._memory_cache[key]
+
+        data = self._read_disk(key)
+        if data is None:
+            return None
+        try:
+            value = self.serializer.loads(data)
+        except Exception as e:
+            _log.warning("Discarding unreadable cache entry", key=key, error=str(e))
+            return None
+
+        self._store_memory(key, value, len(data))
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        """Cache a result in memory and, when possible, on disk."""
+        data: bytes | None = None
+        try:
+            data = self.serializer.dumps(value)
+        except Exception:
+            # Not serializable - keep it in memory only
+            pass
+
+        size = len(data) if data is not None else sys.getsizeof(value)
+        self._store_memory(key, value, size)
+
+        if data is not None:
+            self._write_disk(key, data)
+
+    def clear(self) -> None:
+        """Clear both tiers."""
+        with self._lock:
+            self._memory_cache.clear()
+            self._sizes.clear()
+            self._memory_bytes = 0
+        if self.cache_dir and self.cache_dir.exists():
+            for path in self.cache_dir.glob(f"*/*.{self.serializer.extension}"):
+                path.unlink(missing_ok=True)
+        with self._lock:
+            self._disk_entries = None
+            self._disk_bytes = 0
+
+    def should_execute(
+        self,
+        node_id: str,
+        is_changed_value: Any,
+        always_execute: bool,
+    ) -> bool:
+        """Determine if node should execute based on IS_CHANGED.
+
+        .. deprecated::
+            GraphExecutor decides hits from the content-addressed key
+            returned by compute_key(). This method is maintained for
+            backwards compatibility but will be removed in a future version.
+        """
+        if always_execute:
+            return True
+
+        # NaN never equals anything, including itself
+        if is_changed_value != is_changed_value:  # NaN check
+            return True
+
+        # Compare with previous value
+        prev_value = self._is_changed_values.get(node_id)
+        if prev_value is None:
+            return True  # First run
+
+        return is_changed_value != prev_value
+
+    def update_is_changed(self, node_id: str, value: Any) -> None:
+        """Update stored IS_CHANGED value for next comparison.
+
+        .. deprecated::
+            Only feeds should_execute(). Maintained for backwards
+            compatibility but will be removed in a future version.
+        """
+        self._is_changed_values[node_id] = value
+
+    @property
+    def memory_bytes(self) -> int:
+        """Estimated size of the memory tier in bytes."""
+        return self._memory_bytes
+
+    def _store_memory(self, key: str, value: Any, size: int) -> None:
+        """Insert into the memory tier and evict down to the limits."""
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._memory_cache:
+                self._memory_bytes -= self._sizes[key]
+            self._memory_cache[key] = value
+            self._memory_cache.move_to_end(key)
+            self._sizes[key] = size
+            self._memory_bytes += size
+            while (
+                len(self._memory_cache) > self.max_entries
+                or self._memory_bytes > self.max_bytes
+            ):
+                evicted, _ = self._memory_cache.popitem(last=False)
+                self._memory_bytes -= self._sizes.pop(evicted)
+
+    def _disk_path(self, key: str) -> Path | None:
+        """Get the content-addressed path for a key."""
+        if self.cache_dir is None:
+            return None
+        return self.cache_dir / key[:2] / f"{key}.{self.serializer.extension}"
+
+    def _read_disk(self, key: str) -> bytes | None:
+        """Read raw bytes for a key from the disk tier."""
+        path = self._disk_path(key)
+        if path is None:
+            return None
+        try:
+            data = path.read_bytes()
+        except OSError:
+            return None
+        # Refresh mtime so pruning treats the entry as recently used
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return data
+
+    def _write_disk(self, key: str, data: bytes) -> None:
+        """Atomically write raw bytes for a key to the disk tier."""
+        path = self._disk_path(key)
+        if path is None:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write to a temp file in the same directory and rename, so
+            # concurrent readers only ever see complete entries
+            fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+            try:
+                old_size = path.stat().st_size
+            except OSError:
+                old_size = None
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(data)
+                os.replace(tmp_name, path)
+            except BaseException:
+                Path(tmp_name).unlink(missing_ok=True)
+                raise
+        except OSError as e:
+            _log.warning("Failed to write cache entry", key=key, error=str(e))
+            return
+
+        with self._lock:
+            if self._disk_entries is None:
+                needs_prune = True
+            else:
+                if old_size is None:
+                    self._disk_entries += 1
+                else:
+                    self._disk_bytes -= old_size
+                self._disk_bytes += len(data)
+                needs_prune = (
+                    self._disk_entries > self.max_disk_entries
+                    or self._disk_bytes > self.max_disk_bytes
+                )
+        if needs_prune:
+            self._prune_disk()
+
+    def _prune_disk(self) -> None:
+        """Rescan the disk tier and delete the least recently used files.
+
+        Prunes down to 90% of the limits so a full cache is not rescanned
+        on every write.
+        """
+        if self.cache_dir is None:
+            return
+        files: list[tuple[float, int, Path]] = []
+        for path in self.cache_dir.glob(f"*/*.{self.serializer.extension}"):
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            files.append((st.st_mtime, st.st_size, path))
+
+        total_bytes = sum(size for _, size, _ in files)
+        count = len(files)
+        if count > self.max_disk_entries or total_bytes > self.max_disk_bytes:
+            target_entries = int(self.max_disk_entries * 0.9)
+            target_bytes = int(self.max_disk_bytes * 0.9)
+            files.sort(key=lambda f: f[0])
+            for _, size, path in files:
+                if count <= target_entries and total_bytes <= target_bytes:
+                    break
+                try:
+                    path.unlink()
+                except OSError:
+                    continue
+                count -= 1
+                total_bytes -= size
+
+        with self._lock:
+            self._disk_entries = count
+            self._disk_bytes = total_bytes
+
+
+# Process-wide caches, one per cache directory
+_shared_caches: dict[Path, ExecutionCache] = {}
+_shared_lock = threading.Lock()
+
+
+def get_shared_cache(cache_dir: Path) -> ExecutionCache:
+    """Get the process-wide ExecutionCache for a cache directory.
+
+    Sharing the instance lets the memory tier survive across runs, since
+    each run builds a fresh GraphExecutor.
+    """
+    resolved = cache_dir.resolve()
+    with _shared_lock:
+        cache = _shared_caches.get(resolved)
+        if cache is None:
+            cache = ExecutionCache(resolved)
+            _shared_caches[resolved] = cache
+        return cache
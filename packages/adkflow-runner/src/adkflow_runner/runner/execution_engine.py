@@ -20,6 +20,8 @@ from adkflow_runner.runner.types import (
 )
 from adkflow_runner.runner.graph_builder import GraphBuilder
 from adkflow_runner.runner.graph_executor import GraphExecutor
+from adkflow_runner.runner.execution_cache import get_shared_cache
+from adkflow_runner.runner.concurrency import get_shared_limiter
 from adkflow_runner.hooks import HooksIntegration
 
 _log = get_logger("runner.execution_engine")
@@ -321,6 +323,9 @@ async def execute_custom_nodes_graph(
         cache_dir=actual_cache_dir,
         enable_cache=enable_cache,
         hooks=hooks,
+        cache=get_shared_cache(actual_cache_dir) if enable_cache else None,
+        scheduling="eager" if config.custom_node_scheduling == "eager" else "layered",
+        limiter=get_shared_limiter(ir),
     )
 
     # Generate session_id
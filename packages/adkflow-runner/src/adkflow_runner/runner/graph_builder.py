@@ -8,7 +8,9 @@ by the workflow runner. Custom nodes that depend on agent outputs receive
 those outputs as pre-populated external results.
 """
 
-from adkflow_runner.ir import WorkflowIR
+from collections import deque
+
+from adkflow_runner.ir import CustomNodeIR, WorkflowIR
 from adkflow_runner.runner.graph_executor import (
     ExecutionEdge,
     ExecutionGraph,
@@ -41,9 +43,11 @@ class GraphBuilder:
         agent_ids = set(ir.all_agents.keys())
 
         # Add custom nodes (filtered if custom_node_ids provided)
+        included: dict[str, CustomNodeIR] = {}
         for custom_ir in ir.custom_nodes:
             if custom_node_ids is not None and custom_ir.id not in custom_node_ids:
                 continue
+            included[custom_ir.id] = custom_ir
             nodes[custom_ir.id] = ExecutionNode(
                 id=custom_ir.id,
                 node_type="custom",
@@ -85,7 +89,7 @@ class GraphBuilder:
                     # Skip edges to custom nodes not in this graph
                     if target_id not in nodes:
                         continue
-                    target_port = self._find_target_port(target_id, ir)
+                    target_port = self._default_input_port(included[target_id].unit_id)
                     edges.append(
                         ExecutionEdge(
                             source_id=custom_ir.id,
@@ -107,14 +111,11 @@ class GraphBuilder:
                 return "output"
         return "output"
 
-    def _find_target_port(self, target_id: str, ir: WorkflowIR) -> str:
-        """Find the input port ID for a target node."""
-        for custom_ir in ir.custom_nodes:
-            if custom_ir.id == target_id:
-                schema = self._get_custom_node_schema(custom_ir.unit_id)
-                if schema and schema.get("inputs"):
-                    return schema["inputs"][0].get("id", "input")
-                return "input"
+    def _default_input_port(self, unit_id: str) -> str:
+        """Get the first input port ID declared by a unit's schema."""
+        schema = self._get_custom_node_schema(unit_id)
+        if schema and schema.get("inputs"):
+            return schema["inputs"][0].get("id", "input")
         return "input"
 
     def _get_custom_node_schema(self, unit_id: str) -> dict | None:
@@ -144,29 +145,23 @@ def partition_custom_nodes(
     """
     agent_ids = set(ir.all_agents.keys())
 
-    # Find nodes that directly depend on agents
-    direct_agent_dependents: set[str] = set()
+    # Index downstream custom nodes once so propagation is O(V+E)
+    dependents: dict[str, list[str]] = {}
     for custom_ir in ir.custom_nodes:
         for sources in custom_ir.input_connections.values():
             for source in sources:
-                if source.node_id in agent_ids:
-                    direct_agent_dependents.add(custom_ir.id)
-                    break
-
-    # Now find transitive dependencies (nodes that depend on agent-dependent nodes)
-    post_agent_nodes: set[str] = set(direct_agent_dependents)
-    changed = True
-    while changed:
-        changed = False
-        for custom_ir in ir.custom_nodes:
-            if custom_ir.id in post_agent_nodes:
-                continue
-            for sources in custom_ir.input_connections.values():
-                for source in sources:
-                    if source.node_id in post_agent_nodes:
-                        post_agent_nodes.add(custom_ir.id)
-                        changed = True
-                        break
+                dependents.setdefault(source.node_id, []).append(custom_ir.id)
+
+    # Seed with nodes that directly depend on agents, then walk downstream
+    # to collect transitive dependents
+    post_agent_nodes: set[str] = set()
+    queue: deque[str] = deque(agent_ids)
+    while queue:
+        node_id = queue.popleft()
+        for dependent_id in dependents.get(node_id, ()):
+            if dependent_id not in post_agent_nodes and dependent_id not in agent_ids:
+                post_agent_nodes.add(dependent_id)
+                queue.append(dependent_id)
 
     # Pre-agent nodes are all custom nodes not in post_agent_nodes
     all_custom_ids = {cn.id for cn in ir.custom_nodes}
@@ -6,19 +6,27 @@ This module implements a ComfyUI-style execution model where:
 - Execution traces backwards from sinks to find required nodes
 - Independent nodes in the same layer execute in parallel
 - Caching with IS_CHANGED support for smart re-execution
+
+Two scheduling modes are available:
+- "layered": run Kahn layers one at a time with a barrier per layer
+- "eager": dispatch each node as soon as its last predecessor finishes
 """
 
 import asyncio
-import hashlib
-import json
 import time
+from collections import deque
+from contextlib import AbstractAsyncContextManager, nullcontext
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Callable, Literal
+from typing import Any, Callable, Coroutine, Literal
 
 from adkflow_runner.extensions import EmitFn, ExecutionContext, get_registry
 from adkflow_runner.ir import AgentIR, CustomNodeIR
 from adkflow_runner.hooks import HookAction, HooksIntegration
+from adkflow_runner.runner.concurrency import ConcurrencyLimiter
+from adkflow_runner.runner.execution_cache import ExecutionCache, unit_code_version
+
+SchedulingMode = Literal["layered", "eager"]
 
 
 @dataclass
@@ -42,79 +50,33 @@ class ExecutionEdge:
 
 @dataclass
 class ExecutionGraph:
-    """Unified execution graph containing agents and custom nodes."""
+    """Unified execution graph containing agents and custom nodes.
+
+    Adjacency indexes are built from the edges on construction so planning
+    never rescans the edge list. Call reindex() after mutating edges.
+    """
 
     nodes: dict[str, ExecutionNode] = field(default_factory=dict)
     edges: list[ExecutionEdge] = field(default_factory=list)
-
-
-class ExecutionCache:
-    """Cache for node execution results with IS_CHANGED support."""
-
-    def __init__(self, cache_dir: Path | None = None):
-        self.cache_dir = cache_dir
-        self._memory_cache: dict[str, Any] = {}
-        self._is_changed_values: dict[str, Any] = {}
-
-    def compute_key(
-        self,
-        node_id: str,
-        inputs: dict[str, Any],
-        config: dict[str, Any],
-        is_changed_value: Any,
-    ) -> str:
-        """Compute cache key from inputs, config, and is_changed value."""
-        # Include is_changed_value in the hash
-        data = {
-            "node_id": node_id,
-            "inputs": self._make_hashable(inputs),
-            "config": self._make_hashable(config),
-            "is_changed": str(is_changed_value),
-        }
-        return hashlib.sha256(json.dumps(data, sort_keys=True).encode()).hexdigest()
-
-    def _make_hashable(self, obj: Any) -> Any:
-        """Convert object to hashable representation."""
-        if isinstance(obj, dict):
-            return tuple(sorted((k, self._make_hashable(v)) for k, v in obj.items()))
-        if isinstance(obj, list):
-            return tuple(self._make_hashable(v) for v in obj)
-        if isinstance(obj, set):
-            return tuple(sorted(self._make_hashable(v) for v in obj))
-        return str(obj)
-
-    def get(self, key: str) -> Any | None:
-        """Get cached result."""
-        return self._memory_cache.get(key)
-
-    def set(self, key: str, value: Any) -> None:
-        """Cache a result."""
-        self._memory_cache[key] = value
-
-    def should_execute(
-        self,
-        node_id: str,
-        is_changed_value: Any,
-        always_execute: bool,
-    ) -> bool:
-        """Determine if node should execute based on IS_CHANGED."""
-        if always_execute:
-            return True
-
-        # NaN never equals anything, including itself
-        if is_changed_value != is_changed_value:  # NaN check
-            return True
-
-        # Compare with previous value
-        prev_value = self._is_changed_values.get(node_id)
-        if prev_value is None:
-            return True  # First run
-
-        return is_changed_value != prev_value
-
-    def update_is_changed(self, node_id: str, value: Any) -> None:
-        """Update stored IS_CHANGED value for next comparison."""
-        self._is_changed_values[node_id] = value
+    # Node ID -> target IDs of its outgoing edges (one entry per edge)
+    successors: dict[str, list[str]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    # Node ID -> source IDs of its incoming edges (one entry per edge)
+    predecessors: dict[str, list[str]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        self.reindex()
+
+    def reindex(self) -> None:
+        """Rebuild the adjacency indexes from the edge list."""
+        self.successors = {node_id: [] for node_id in self.nodes}
+        self.predecessors = {node_id: [] for node_id in self.nodes}
+        for edge in self.edges:
+            self.successors.setdefault(edge.source_id, []).append(edge.target_id)
+            self.predecessors.setdefault(edge.target_id, []).append(edge.source_id)
 
 
 class GraphExecutor:
@@ -124,7 +86,7 @@ class GraphExecutor:
     1. Find OUTPUT_NODE sinks
     2. Trace dependencies backwards
     3. Topological sort into parallel layers
-    4. Execute layer by layer with caching
+    4. Execute layer by layer (or eagerly per node) with caching
     """
 
     def __init__(
@@ -133,12 +95,17 @@ class GraphExecutor:
         cache_dir: Path | None = None,
         enable_cache: bool = True,
         hooks: HooksIntegration | None = None,
+        cache: ExecutionCache | None = None,
+        scheduling: SchedulingMode = "layered",
+        limiter: ConcurrencyLimiter | None = None,
     ):
         self.emit = emit
-        self.cache = ExecutionCache(cache_dir)
+        self.cache = cache or ExecutionCache(cache_dir)
         self.enable_cache = enable_cache
         self.registry = get_registry()
         self.hooks = hooks
+        self.scheduling = scheduling
+        self.limiter = limiter
 
     async def execute(
         self,
@@ -187,10 +154,16 @@ class GraphExecutor:
             if hook_result.action == HookAction.SKIP:
                 return {}  # Skip execution entirely
 
-        # 4. Execute layer by layer
+        # 4. Execute
         # Initialize results with external results (e.g., agent outputs)
         results: dict[str, dict[str, Any]] = dict(external_results or {})
 
+        if self.scheduling == "eager":
+            await self._execute_eager(
+                graph, layers, results, session_state, project_path, session_id, run_id
+            )
+            return results
+
         for layer_idx, layer in enumerate(layers):
             # Invoke before_layer_execute hook
             if self.hooks:
@@ -209,19 +182,15 @@ class GraphExecutor:
             # Execute all nodes in layer concurrently
             layer_tasks = []
             for node_id in layer:
-                node = graph.nodes[node_id]
-                inputs = self._resolve_inputs(node, graph, results)
-
-                if node.node_type == "custom":
-                    task = self._execute_custom_node(
-                        node, inputs, session_state, project_path, session_id, run_id
-                    )
-                else:
-                    # Agent execution - delegate to existing agent runner
-                    task = self._execute_agent(
-                        node, inputs, session_state, project_path, session_id, run_id
-                    )
-
+                task = self._run_node(
+                    graph.nodes[node_id],
+                    graph,
+                    results,
+                    session_state,
+                    project_path,
+                    session_id,
+                    run_id,
+                )
                 layer_tasks.append((node_id, task))
 
             # Await all tasks in parallel
@@ -242,21 +211,184 @@ class GraphExecutor:
                 results[node_id] = result  # type: ignore[assignment]
                 layer_results_dict[node_id] = result  # type: ignore[assignment]
 
-            # Invoke after_layer_execute hook
+            await self._finish_layer(layer_idx, len(layer), layer_results_dict, results)
+
+        return results
+
+    async def _execute_eager(
+        self,
+        graph: ExecutionGraph,
+        layers: list[list[str]],
+        results: dict[str, dict[str, Any]],
+        session_state: dict[str, Any],
+        project_path: Path,
+        session_id: str,
+        run_id: str,
+    ) -> None:
+        """Dispatch each node as soon as all of its predecessors finish.
+
+        The planned layers are kept as a compatibility shim for layer hooks:
+        before_layer_execute runs once, when the first node of a layer is
+        ready, and after_layer_execute once every node of that layer is done.
+        Nodes dropped by before_layer_execute (or a skipped layer) produce no
+        results but still release their successors.
+
+        Because successors start as soon as their own predecessors finish,
+        they may consume a node's outputs before its layer completes. A
+        REPLACE from after_layer_execute therefore only rewrites the returned
+        results; it cannot change inputs successors already consumed.
+        """
+        layer_of = {
+            node_id: idx for idx, layer in enumerate(layers) for node_id in layer
+        }
+
+        # Predecessor counts restricted to planned nodes
+        pending_preds = {
+            node_id: sum(
+                1 for p in graph.predecessors.get(node_id, ()) if p in layer_of
+            )
+            for node_id in layer_of
+        }
+
+        layer_remaining = [len(layer) for layer in layers]
+        layer_results: list[dict[str, dict[str, Any]]] = [{} for _ in layers]
+        layer_gates: dict[int, asyncio.Future[set[str]]] = {}
+
+        async def open_layer(layer_idx: int) -> set[str]:
+            layer = layers[layer_idx]
             if self.hooks:
-                hook_result, layer_results_dict = await self.hooks.after_layer_execute(
-                    layer_idx, layer_results_dict
+                hook_result, layer = await self.hooks.before_layer_execute(
+                    layer_idx, layer
                 )
-                if hook_result.action == HookAction.REPLACE:
-                    # Update results with modified layer results
-                    for node_id, node_result in layer_results_dict.items():
-                        results[node_id] = node_result
+                if hook_result.action == HookAction.ABORT:
+                    raise RuntimeError(
+                        hook_result.error or "Aborted by before_layer_execute hook"
+                    )
+                if hook_result.action == HookAction.SKIP:
+                    return set()
+            await self._emit_event("layer_start", {"layer": layer_idx, "nodes": layer})
+            return set(layer)
+
+        async def run(node_id: str) -> dict[str, Any] | None:
+            layer_idx = layer_of[node_id]
+            gate = layer_gates.get(layer_idx)
+            if gate is None:
+                gate = asyncio.ensure_future(open_layer(layer_idx))
+                layer_gates[layer_idx] = gate
+            if node_id not in await asyncio.shield(gate):
+                return None
+            return await self._run_node(
+                graph.nodes[node_id],
+                graph,
+                results,
+                session_state,
+                project_path,
+                session_id,
+                run_id,
+            )
 
-            await self._emit_event(
-                "layer_end", {"layer": layer_idx, "node_count": len(layer)}
+        ready = deque(
+            node_id
+            for layer in layers
+            for node_id in layer
+            if not pending_preds[node_id]
+        )
+        running: dict[asyncio.Future, str] = {}
+
+        try:
+            while ready or running:
+                while ready:
+                    node_id = ready.popleft()
+                    running[asyncio.ensure_future(run(node_id))] = node_id
+
+                done, _ = await asyncio.wait(
+                    running, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    node_id = running.pop(task)
+                    layer_idx = layer_of[node_id]
+                    error = task.exception()
+                    if error is not None:
+                        await self._emit_event(
+                            "node_error", {"node_id": node_id, "error": str(error)}
+                        )
+                        raise error
+
+                    result = task.result()
+                    if result is not None:
+                        results[node_id] = result
+                        layer_results[layer_idx][node_id] = result
+
+                    layer_remaining[layer_idx] -= 1
+                    if (
+                        not layer_remaining[layer_idx]
+                        and layer_gates[layer_idx].result()
+                    ):
+                        await self._finish_layer(
+                            layer_idx,
+                            len(layers[layer_idx]),
+                            layer_results[layer_idx],
+                            results,
+                        )
+
+                    for successor in graph.successors.get(node_id, ()):
+                        if successor not in layer_of:
+                            continue
+                        pending_preds[successor] -= 1
+                        if not pending_preds[successor]:
+                            ready.append(successor)
+        finally:
+            for task in running:
+                task.cancel()
+            for gate in layer_gates.values():
+                gate.cancel()
+            # Wait for cancelled nodes to unwind so none outlive the call
+            await asyncio.gather(
+                *running, *layer_gates.values(), return_exceptions=True
             )
 
-        return results
+    async def _finish_layer(
+        self,
+        layer_idx: int,
+        node_count: int,
+        layer_results: dict[str, dict[str, Any]],
+        results: dict[str, dict[str, Any]],
+    ) -> None:
+        """Invoke after_layer_execute and emit the layer_end event."""
+        if self.hooks:
+            hook_result, layer_results = await self.hooks.after_layer_execute(
+                layer_idx, layer_results
+            )
+            if hook_result.action == HookAction.REPLACE:
+                # Update results with modified layer results
+                for node_id, node_result in layer_results.items():
+                    results[node_id] = node_result
+
+        await self._emit_event(
+            "layer_end", {"layer": layer_idx, "node_count": node_count}
+        )
+
+    def _run_node(
+        self,
+        node: ExecutionNode,
+        graph: ExecutionGraph,
+        results: dict[str, dict[str, Any]],
+        session_state: dict[str, Any],
+        project_path: Path,
+        session_id: str,
+        run_id: str,
+    ) -> Coroutine[Any, Any, dict[str, Any]]:
+        """Resolve inputs for a node and create its execution coroutine."""
+        inputs = self._resolve_inputs(node, graph, results)
+
+        if node.node_type == "custom":
+            return self._execute_custom_node(
+                node, inputs, session_state, project_path, session_id, run_id
+            )
+        # Agent execution - delegate to existing agent runner
+        return self._execute_agent(
+            node, inputs, session_state, project_path, session_id, run_id
+        )
 
     def _find_output_nodes(self, graph: ExecutionGraph) -> set[str]:
         """Find all output/sink nodes in the graph.
@@ -267,9 +399,6 @@ class GraphExecutor:
         """
         output_nodes = set()
 
-        # Find nodes with outgoing edges
-        nodes_with_outputs = {edge.source_id for edge in graph.edges}
-
         for node_id, node in graph.nodes.items():
             if node.node_type == "custom":
                 ir = node.ir
@@ -277,7 +406,7 @@ class GraphExecutor:
                     output_nodes.add(node_id)
             else:
                 # Agents: consider terminal agents as outputs
-                if node_id not in nodes_with_outputs:
+                if not graph.successors.get(node_id):
                     output_nodes.add(node_id)
 
         return output_nodes
@@ -287,17 +416,11 @@ class GraphExecutor:
     ) -> set[str]:
         """Trace backwards from output nodes to find all required nodes."""
         required = set(output_nodes)
-        queue = list(output_nodes)
-
-        # Build reverse edge map
-        incoming: dict[str, list[str]] = {n: [] for n in graph.nodes}
-        for edge in graph.edges:
-            if edge.target_id in incoming:
-                incoming[edge.target_id].append(edge.source_id)
+        queue = deque(output_nodes)
 
         while queue:
-            node_id = queue.pop(0)
-            for source_id in incoming.get(node_id, []):
+            node_id = queue.popleft()
+            for source_id in graph.predecessors.get(node_id, ()):
                 if source_id not in required and source_id in graph.nodes:
                     required.add(source_id)
                     queue.append(source_id)
@@ -311,39 +434,41 @@ class GraphExecutor:
 
         Uses Kahn's algorithm, grouping nodes with same depth into layers.
         Nodes in the same layer have no dependencies on each other and
-        can execute in parallel.
+        can execute in parallel. Runs in O(V+E) over the required subgraph.
         """
         if not nodes:
             return []
 
         # Compute in-degrees for required nodes only
-        in_degree = {n: 0 for n in nodes}
-
-        for edge in graph.edges:
-            if edge.target_id in nodes and edge.source_id in nodes:
-                in_degree[edge.target_id] += 1
+        in_degree = {
+            n: sum(1 for source in graph.predecessors.get(n, ()) if source in nodes)
+            for n in nodes
+        }
 
         layers = []
-        remaining = set(nodes)
-
-        while remaining:
-            # Nodes with no remaining dependencies form a layer
-            layer = [n for n in remaining if in_degree[n] == 0]
-
-            if not layer:
-                # This shouldn't happen in a valid DAG
-                raise ValueError(
-                    f"Cycle detected in execution graph. Remaining nodes: {remaining}"
-                )
+        layer = [n for n in nodes if in_degree[n] == 0]
+        placed = 0
 
+        while layer:
             layers.append(layer)
+            placed += len(layer)
 
-            # Remove layer nodes and update in-degrees
+            # Release successors whose last dependency is in this layer
+            next_layer = []
             for node in layer:
-                remaining.remove(node)
-                for edge in graph.edges:
-                    if edge.source_id == node and edge.target_id in remaining:
-                        in_degree[edge.target_id] -= 1
+                for target in graph.successors.get(node, ()):
+                    if target in in_degree:
+                        in_degree[target] -= 1
+                        if in_degree[target] == 0:
+                            next_layer.append(target)
+            layer = next_layer
+
+        if placed < len(nodes):
+            # This shouldn't happen in a valid DAG
+            remaining = {n for n in nodes if in_degree[n] > 0}
+            raise ValueError(
+                f"Cycle detected in execution graph. Remaining nodes: {remaining}"
+            )
 
         return layers
 
@@ -424,13 +549,23 @@ class GraphExecutor:
         # Check IS_CHANGED (use potentially modified config)
         is_changed_value = flow_unit_cls.is_changed(config, inputs)
 
-        # Check cache (unless ALWAYS_EXECUTE)
+        # Check cache (unless ALWAYS_EXECUTE). The unit's code version keeps
+        # outputs of older code from being served after an edit or reload.
+        code_version = unit_code_version(flow_unit_cls)
         if self.enable_cache and not ir.always_execute:
-            cache_key = self.cache.compute_key(ir.id, inputs, config, is_changed_value)
+            cache_key = self.cache.compute_key(
+                ir.id,
+                inputs,
+                config,
+                is_changed_value,
+                unit_id=ir.unit_id,
+                code_version=code_version,
+            )
 
-            if not self.cache.should_execute(
-                ir.id, is_changed_value, ir.always_execute
-            ):
+            # The IS_CHANGED value is part of the content-addressed key, so a
+            # hit means nothing changed. NaN never equals itself and forces
+            # execution.
+            if is_changed_value == is_changed_value:
                 cached = self.cache.get(cache_key)
                 if cached is not None:
                     await self._emit_event(
@@ -449,91 +584,96 @@ class GraphExecutor:
             # TODO: Full lazy evaluation would re-trigger upstream nodes
             _ = flow_unit_cls.check_lazy_status(config, available)
 
-        # Execute
-        await self._emit_event(
-            "custom_node_start", {"node_id": ir.id, "node_name": ir.name}
-        )
-
-        start_time = time.time()
-
-        try:
-            instance = flow_unit_cls()
-            context = ExecutionContext(
-                session_id=session_id,
-                run_id=run_id,
-                node_id=ir.id,
-                node_name=ir.name,
-                state=session_state,
-                emit=self._create_node_emit(ir.id, ir.name),
-                project_path=project_path,
+        # Execute, queueing for a slot when concurrency/rate limits apply
+        async with self._slot(ir.unit_id):
+            await self._emit_event(
+                "custom_node_start", {"node_id": ir.id, "node_name": ir.name}
             )
 
-            await instance.on_before_execute(context)
-            outputs = await instance.run_process(inputs, config, context)
-            await instance.on_after_execute(context, outputs)
-
-            duration = time.time() - start_time
+            start_time = time.time()
 
-            # Invoke after_node_execute hook
-            if self.hooks:
-                hook_result, outputs = await self.hooks.after_node_execute(
+            try:
+                instance = flow_unit_cls()
+                context = ExecutionContext(
+                    session_id=session_id,
+                    run_id=run_id,
                     node_id=ir.id,
                     node_name=ir.name,
-                    unit_id=ir.unit_id,
-                    outputs=outputs,
+                    state=session_state,
+                    emit=self._create_node_emit(ir.id, ir.name),
+                    project_path=project_path,
                 )
-                if hook_result.action == HookAction.ABORT:
-                    raise RuntimeError(
-                        hook_result.error
-                        or f"Aborted by after_node_execute hook for {ir.name}"
-                    )
 
-            await self._emit_event(
-                "custom_node_end",
-                {
-                    "node_id": ir.id,
-                    "node_name": ir.name,
-                    "duration": duration,
-                    "output_keys": list(outputs.keys()),
-                },
-            )
+                await instance.on_before_execute(context)
+                outputs = await instance.run_process(inputs, config, context)
+                await instance.on_after_execute(context, outputs)
 
-            # Cache result
-            if self.enable_cache and not ir.always_execute:
-                cache_key = self.cache.compute_key(
-                    ir.id, inputs, config, is_changed_value
-                )
-                self.cache.set(cache_key, outputs)
-                self.cache.update_is_changed(ir.id, is_changed_value)
+                duration = time.time() - start_time
 
-            return outputs
-
-        except Exception as e:
-            # Invoke on_node_error hook
-            if self.hooks:
-                hook_result, fallback_output = await self.hooks.on_node_error(
-                    node_id=ir.id,
-                    node_name=ir.name,
-                    unit_id=ir.unit_id,
-                    error=e,
+                # Invoke after_node_execute hook
+                if self.hooks:
+                    hook_result, outputs = await self.hooks.after_node_execute(
+                        node_id=ir.id,
+                        node_name=ir.name,
+                        unit_id=ir.unit_id,
+                        outputs=outputs,
+                    )
+                    if hook_result.action == HookAction.ABORT:
+                        raise RuntimeError(
+                            hook_result.error
+                            or f"Aborted by after_node_execute hook for {ir.name}"
+                        )
+
+                await self._emit_event(
+                    "custom_node_end",
+                    {
+                        "node_id": ir.id,
+                        "node_name": ir.name,
+                        "duration": duration,
+                        "output_keys": list(outputs.keys()),
+                    },
                 )
-                if hook_result.action == HookAction.SKIP:
-                    # Skip error, return empty outputs
-                    return {}
-                if (
-                    hook_result.action == HookAction.REPLACE
-                    and fallback_output is not None
-                ):
-                    # Use fallback output provided by hook
-                    if isinstance(fallback_output, dict):
-                        return fallback_output
-                    return {"output": fallback_output}
 
-            await self._emit_event(
-                "custom_node_error",
-                {"node_id": ir.id, "node_name": ir.name, "error": str(e)},
-            )
-            raise
+                # Cache result
+                if self.enable_cache and not ir.always_execute:
+                    cache_key = self.cache.compute_key(
+                        ir.id,
+                        inputs,
+                        config,
+                        is_changed_value,
+                        unit_id=ir.unit_id,
+                        code_version=code_version,
+                    )
+                    self.cache.set(cache_key, outputs)
+
+                return outputs
+
+            except Exception as e:
+                # Invoke on_node_error hook
+                if self.hooks:
+                    hook_result, fallback_output = await self.hooks.on_node_error(
+                        node_id=ir.id,
+                        node_name=ir.name,
+                        unit_id=ir.unit_id,
+                        error=e,
+                    )
+                    if hook_result.action == HookAction.SKIP:
+                        # Skip error, return empty outputs
+                        return {}
+                    if (
+                        hook_result.action == HookAction.REPLACE
+                        and fallback_output is not None
+                    ):
+                        # Use fallback output provided by hook
+                        if isinstance(fallback_output, dict):
+                            return fallback_output
+                        return {"output": fallback_output}
+
+                await self._emit_event(
+                    "custom_node_error",
+                    {"node_id": ir.id, "node_name": ir.name, "error": str(e)},
+                )
+                raise
 
     async def _execute_agent(
         self,
@@ -554,6 +694,12 @@ class GraphExecutor:
             f"Agent '{node.id}' should be executed via workflow_runner._execute()"
         )
 
+    def _slot(self, unit_id: str) -> AbstractAsyncContextManager[Any]:
+        """Get the execution slot for a unit (no-op without a limiter)."""
+        if self.limiter is None:
+            return nullcontext()
+        return self.limiter.slot(unit_id)
+
     def _create_node_emit(self, node_id: str, node_name: str) -> EmitFn:
         """Create an emit function scoped to a specific node."""
 
@@ -1,9 +1,18 @@
 """Streaming execution utilities for workflow runner.
 
 Provides async generator support for streaming workflow execution events.
+
+Events flow from the run to the consumer through an EventChannel, a
+single-consumer async iterator that is closed when the run finishes:
+- Delivering an event appends it to a deque and wakes the consumer if it
+  is waiting; no task is created per event
+- The consumer can take events one at a time or, for high-rate token
+  streaming, as batches of everything that arrived since its last read
 """
 
 import asyncio
+import dataclasses
+from collections import deque
 from typing import AsyncIterator, TYPE_CHECKING
 
 from adkflow_runner.runner.types import (
@@ -16,15 +25,78 @@ if TYPE_CHECKING:
     from adkflow_runner.runner.workflow_runner import WorkflowRunner
 
 
-class QueueCallbacks:
-    """Callbacks that push events to an asyncio queue."""
+class EventChannel:
+    """Single-consumer async channel of run events.
+
+    Usage:
+        channel = EventChannel()
+        channel.send(event)
+        channel.close()
+        async for event in channel:
+            ...
+    """
 
-    def __init__(self, queue: asyncio.Queue[RunEvent | None]) -> None:
-        self._queue = queue
+    def __init__(self) -> None:
+        self._events: deque[RunEvent] = deque()
+        self._waiter: asyncio.Future[None] | None = None
+        self.closed = False
+
+    def send(self, event: RunEvent) -> None:
+        """Deliver an event; ignored once the channel is closed."""
+        if self.closed:
+            return
+        self._events.append(event)
+        self._wake()
+
+    def close(self) -> None:
+        """End the stream; buffered events are still delivered."""
+        self.closed = True
+        self._wake()
+
+    async def get_batch(self, max_events: int | None = None) -> list[RunEvent]:
+        """Wait for events and take all buffered ones (at most max_events).
+
+        Returns:
+            The events, oldest first; an empty list once the channel is
+            closed and drained
+        """
+        await self._wait()
+        count = len(self._events)
+        if max_events is not None:
+            count = min(count, max_events)
+        return [self._events.popleft() for _ in range(count)]
+
+    def __aiter__(self) -> "EventChannel":
+        return self
+
+    async def __anext__(self) -> RunEvent:
+        await self._wait()
+        if self._events:
+            return self._events.popleft()
+        raise StopAsyncIteration
+
+    async def _wait(self) -> None:
+        while not self._events and not self.closed:
+            self._waiter = asyncio.get_running_loop().create_future()
+            try:
+                await self._waiter
+            finally:
+                self._waiter = None
+
+    def _wake(self) -> None:
+        if self._waiter is not None and not self._waiter.done():
+            self._waiter.set_result(None)
+
+
+class ChannelCallbacks:
+    """Callbacks that send events to an EventChannel."""
+
+    def __init__(self, channel: EventChannel) -> None:
+        self._channel = channel
 
     async def on_event(self, event: RunEvent) -> None:
-        """Push event to the queue."""
-        await self._queue.put(event)
+        """Send event to the channel."""
+        self._channel.send(event)
 
 
 async def run_workflow_generator(
@@ -40,48 +112,50 @@ async def run_workflow_generator(
     Yields:
         RunEvent objects as execution progresses, RunResult at end
     """
-    event_queue: asyncio.Queue[RunEvent | None] = asyncio.Queue()
-
-    config_with_callbacks = RunConfig(
-        project_path=config.project_path,
-        tab_id=config.tab_id,
-        input_data=config.input_data,
-        callbacks=QueueCallbacks(event_queue),
-        timeout_seconds=config.timeout_seconds,
-        validate=config.validate,
-        user_input_provider=config.user_input_provider,
-        max_llm_calls=config.max_llm_calls,
-        context_window_compression=config.context_window_compression,
-        streaming_mode=config.streaming_mode,
-    )
+    channel = EventChannel()
+    run_task = _start_run(runner, config, channel)
+    try:
+        async for event in channel:
+            yield event
+        yield await run_task
+    finally:
+        if not run_task.done():
+            run_task.cancel()
 
-    # Start run in background
-    run_task = asyncio.create_task(runner.run(config_with_callbacks))
 
+async def run_workflow_batches(
+    runner: "WorkflowRunner",
+    config: RunConfig,
+    max_batch_size: int | None = None,
+) -> AsyncIterator[list[RunEvent] | RunResult]:
+    """Run a workflow and yield the events that arrived since the last yield.
+
+    Args:
+        runner: The workflow runner instance
+        config: Run configuration
+        max_batch_size: Largest batch to yield; None for no limit
+
+    Yields:
+        Non-empty lists of RunEvent objects, RunResult at end
+    """
+    channel = EventChannel()
+    run_task = _start_run(runner, config, channel)
     try:
-        while True:
-            # Wait for event or task completion
-            done, _ = await asyncio.wait(
-                [
-                    asyncio.create_task(event_queue.get()),
-                    run_task,
-                ],
-                return_when=asyncio.FIRST_COMPLETED,
-            )
-
-            for task in done:
-                if task == run_task:
-                    # Drain remaining events
-                    while not event_queue.empty():
-                        event = await event_queue.get()
-                        if event:
-                            yield event
-                    return
-                else:
-                    event = task.result()
-                    if event:
-                        yield event
-
-    except asyncio.CancelledError:
-        run_task.cancel()
-        raise
+        while batch := await channel.get_batch(max_batch_size):
+            yield batch
+        yield await run_task
+    finally:
+        if not run_task.done():
+            run_task.cancel()
+
+
+def _start_run(
+    runner: "WorkflowRunner", config: RunConfig, channel: EventChannel
+) -> "asyncio.Task[RunResult]":
+    """Start a run in the background that sends its events to channel."""
+    config_with_callbacks = dataclasses.replace(
+        config, callbacks=ChannelCallbacks(channel)
+    )
+    run_task = asyncio.create_task(runner.run(config_with_callbacks))
+    run_task.add_done_callback(lambda _: channel.close())
+    return run_task
@@ -0,0 +1,150 @@
+"""Process-wide cache of loaded tool modules.
+
+Executing a tool module repeats every import it makes, so modules are
+shared across ToolLoader instances (and therefore across runs):
+- Tool files are keyed on their resolved path and reloaded when their
+  mtime or size changes
+- Inline tools are keyed on a hash of their code
+- Concurrent loads of the same key execute the module once
+
+Each load is timed; load_timings() lists the most recent load per module.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Hashable
+
+from adkflow_runner.logging import get_logger
+
+_log = get_logger("runner.tool")
+
+
+@dataclass
+class ToolModuleTiming:
+    """How long the last load of a tool module took."""
+
+    key: str
+    module_name: str
+    duration_ms: float
+    loaded_at: float  # time.time() when the load finished
+
+
+@dataclass
+class _CachedModule:
+    """A loaded module and the source version it was loaded from."""
+
+    module: Any
+    version: Hashable
+
+
+class ToolModuleCache:
+    """Thread-safe LRU cache of executed tool modules.
+
+    Usage:
+        module = cache.get_or_load(
+            f"file:{path}", stat_file(path), lambda: load_module(path)
+        )
+    """
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, _CachedModule] = OrderedDict()
+        self._key_locks: dict[str, threading.Lock] = {}
+        self._timings: dict[str, ToolModuleTiming] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_load(
+        self,
+        key: str,
+        version: Hashable,
+        load: Callable[[], Any],
+    ) -> Any:
+        """Get a cached module, loading it if missing or outdated.
+
+        Args:
+            key: Cache key, e.g. "file:<resolved path>" or "code:<sha256>"
+            version: Source version; a different version forces a reload
+            load: Loads and returns the module; exceptions propagate and
+                nothing is cached
+
+        Returns:
+            The loaded module
+        """
+        entry = self._lookup(key, version)
+        if entry is not None:
+            return entry.module
+
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            # Another thread may have finished the same load meanwhile
+            entry = self._lookup(key, version, count=False)
+            if entry is not None:
+                return entry.module
+
+            start = time.perf_counter()
+            module = load()
+            duration_ms = (time.perf_counter() - start) * 1000
+
+            timing = ToolModuleTiming(
+                key=key,
+                module_name=getattr(module, "__name__", ""),
+                duration_ms=round(duration_ms, 3),
+                loaded_at=time.time(),
+            )
+            with self._lock:
+                self._entries[key] = _CachedModule(module=module, version=version)
+                self._entries.move_to_end(key)
+                self._timings[key] = timing
+                while len(self._entries) > self.max_entries:
+                    evicted, _ = self._entries.popitem(last=False)
+                    self._timings.pop(evicted, None)
+                    self._key_locks.pop(evicted, None)
+
+        _log.debug(
+            "Tool module loaded",
+            key=key,
+            module=timing.module_name,
+            duration_ms=timing.duration_ms,
+        )
+        return module
+
+    def _lookup(
+        self, key: str, version: Hashable, count: bool = True
+    ) -> _CachedModule | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.version == version:
+                self._entries.move_to_end(key)
+                if count:
+                    self.hits += 1
+                return entry
+            if count:
+                self.misses += 1
+            return None
+
+    def load_timings(self) -> list[ToolModuleTiming]:
+        """Get the last load timing of every cached module, slowest first."""
+        with self._lock:
+            timings = list(self._timings.values())
+        return sorted(timings, key=lambda t: t.duration_ms, reverse=True)
+
+    def clear(self) -> None:
+        """Forget all cached modules."""
+        with self._lock:
+            self._entries.clear()
+            self._timings.clear()
+            self._key_locks.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+# Shared by every ToolLoader that is not given its own cache
+tool_module_cache = ToolModuleCache()
@@ -0,0 +1,326 @@
+"""Bounded executors for synchronous tools.
+
+Sync tool functions would block the event loop, so they run on worker
+pools. Instead of the loop's shared default executor (also used for file
+I/O and compilation), tools get their own bounded pools:
+- One thread pool per project, shared by its tools
+- A dedicated pool for a tool that sets max_workers in ToolIR.config
+- A process pool for CPU-bound tools with execution_mode "process"
+
+Every call can carry a timeout, and each pool tracks in-flight calls
+and queue depth so saturation is visible. A call that times out while
+already running keeps its worker, so it stays in flight (and is counted
+as abandoned) until the worker actually returns.
+
+Tool config keys (ToolIR.config):
+- execution_mode: "thread" (default) or "process"
+- max_workers: size of a dedicated pool for this tool
+- timeout: per-call timeout in seconds
+"""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import contextvars
+import dataclasses
+import functools
+import multiprocessing
+import os
+import threading
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Literal
+
+from adkflow_runner.errors import ToolTimeoutError
+from adkflow_runner.ir import ToolIR
+from adkflow_runner.logging import get_logger
+
+_log = get_logger("runner.tool")
+
+ExecutionMode = Literal["thread", "process"]
+
+# Default size of the per-project thread pool shared by its sync tools
+DEFAULT_THREAD_WORKERS = 8
+
+# (project, tool name for dedicated pools, mode, max_workers)
+_ExecutorKey = tuple[str, str | None, ExecutionMode, int | None]
+
+
+@dataclass(frozen=True)
+class ToolExecutionSettings:
+    """Execution settings read from ToolIR.config."""
+
+    mode: ExecutionMode = "thread"
+    max_workers: int | None = None  # None shares the project pool
+    timeout: float | None = None  # Seconds per call, None waits forever
+
+    @classmethod
+    def from_config(cls, config: dict[str, Any] | None) -> ToolExecutionSettings:
+        """Parse settings, ignoring missing or invalid values."""
+        config = config or {}
+        mode: ExecutionMode = (
+            "process" if config.get("execution_mode") == "process" else "thread"
+        )
+        max_workers = _positive(config.get("max_workers"), int)
+        timeout = _positive(config.get("timeout"), float)
+        return cls(mode=mode, max_workers=max_workers, timeout=timeout)
+
+
+def _positive(value: Any, kind: type[int] | type[float]) -> Any:
+    try:
+        parsed = kind(value)
+    except (TypeError, ValueError):
+        return None
+    return parsed if parsed > 0 else None
+
+
+@dataclass
+class ToolExecutorStats:
+    """Counters for one tool executor."""
+
+    max_workers: int
+    in_flight: int = 0  # Submitted and not finished
+    abandoned: int = 0  # Timed out or cancelled, still running on a worker
+    queue_depth: int = 0  # Waiting for a free worker
+    max_queue_depth: int = 0
+    completed: int = 0
+    failed: int = 0
+    timed_out: int = 0
+    cancelled: int = 0  # Caller was cancelled while waiting
+
+
+class ToolExecutor:
+    """Runs sync tool calls on a bounded pool with timeouts and metrics."""
+
+    def __init__(
+        self,
+        name: str,
+        mode: ExecutionMode = "thread",
+        max_workers: int = DEFAULT_THREAD_WORKERS,
+    ):
+        self.name = name
+        self.mode = mode
+        self.max_workers = max_workers
+        self._executor: Executor
+        if mode == "process":
+            # spawn avoids forking a process that is running threads
+            self._executor = ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        else:
+            self._executor = ThreadPoolExecutor(
+                max_workers=max_workers,
+                thread_name_prefix=f"adkflow-tool-{name}",
+            )
+        self._stats = ToolExecutorStats(max_workers=max_workers)
+        self._lock = threading.Lock()
+
+    async def run(
+        self,
+        func: Callable[..., Any],
+        *args: Any,
+        timeout: float | None = None,
+        **kwargs: Any,
+    ) -> Any:
+        """Run a sync callable on the pool.
+
+        Thread mode runs the call in a copy of the caller's context, like
+        asyncio.to_thread, so run-scoped logging context is kept.
+
+        Args:
+            func: Callable to run; must be picklable in process mode
+            *args: Positional arguments
+            timeout: Seconds to wait before giving up
+            **kwargs: Keyword arguments
+
+        Returns:
+            The callable's result
+
+        Raises:
+            ToolTimeoutError: If the call does not finish within timeout
+        """
+        if self.mode == "thread":
+            call = functools.partial(
+                contextvars.copy_context().run, func, *args, **kwargs
+            )
+        else:
+            call = functools.partial(func, *args, **kwargs)
+
+        self._update(in_flight=1)
+        future = self._executor.submit(call)
+        try:
+            result = await asyncio.wait_for(asyncio.wrap_future(future), timeout)
+        except asyncio.TimeoutError:
+            self._release(future, timed_out=1)
+            _log.warning(
+                "Tool call timed out",
+                executor=self.name,
+                timeout=timeout,
+            )
+            raise ToolTimeoutError(
+                f"Tool call on '{self.name}' timed out after {timeout}s"
+            ) from None
+        except asyncio.CancelledError:
+            self._release(future, cancelled=1)
+            raise
+        except BaseException:
+            self._release(future, failed=1)
+            raise
+        self._update(in_flight=-1, completed=1)
+        return result
+
+    def _release(
+        self,
+        future: Future,
+        timed_out: int = 0,
+        failed: int = 0,
+        cancelled: int = 0,
+    ) -> None:
+        """Stop waiting on a call that did not complete normally.
+
+        A call still queued is dropped. A running thread cannot be
+        interrupted and keeps its worker until it returns, so it stays in
+        flight until its future is done.
+        """
+        if future.cancel() or future.done():
+            self._update(
+                in_flight=-1, timed_out=timed_out, failed=failed, cancelled=cancelled
+            )
+            return
+        self._update(
+            abandoned=1, timed_out=timed_out, failed=failed, cancelled=cancelled
+        )
+        future.add_done_callback(lambda _: self._update(in_flight=-1, abandoned=-1))
+
+    def _update(
+        self,
+        in_flight: int = 0,
+        abandoned: int = 0,
+        completed: int = 0,
+        failed: int = 0,
+        timed_out: int = 0,
+        cancelled: int = 0,
+    ) -> None:
+        with self._lock:
+            stats = self._stats
+            stats.in_flight += in_flight
+            stats.abandoned += abandoned
+            stats.completed += completed
+            stats.failed += failed
+            stats.timed_out += timed_out
+            stats.cancelled += cancelled
+            stats.queue_depth = max(0, stats.in_flight - self.max_workers)
+            stats.max_queue_depth = max(stats.max_queue_depth, stats.queue_depth)
+
+    def stats(self) -> ToolExecutorStats:
+        """Get a snapshot of the executor's counters."""
+        with self._lock:
+            return dataclasses.replace(self._stats)
+
+    def shutdown(self, wait: bool = False) -> None:
+        """Stop accepting calls and release idle workers."""
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+
+class ToolExecutorRegistry:
+    """Process-wide set of tool executors, created on first use.
+
+    Executors are keyed on (project, tool, mode, max_workers): tools
+    without max_workers share their project's pool for the mode, tools
+    with it get a dedicated pool of that size.
+    """
+
+    def __init__(self, thread_workers: int = DEFAULT_THREAD_WORKERS):
+        self.thread_workers = thread_workers
+        self._executors: dict[_ExecutorKey, ToolExecutor] = {}
+        self._lock = threading.Lock()
+
+    def for_tool(
+        self,
+        project_path: Path | None,
+        tool_name: str,
+        settings: ToolExecutionSettings,
+    ) -> ToolExecutor:
+        """Get the executor a tool's sync calls should run on."""
+        project = str(project_path) if project_path else ""
+        dedicated = settings.max_workers is not None
+        key = (
+            project,
+            tool_name if dedicated else None,
+            settings.mode,
+            settings.max_workers,
+        )
+
+        with self._lock:
+            executor = self._executors.get(key)
+            if executor is None:
+                if settings.max_workers is not None:
+                    max_workers = settings.max_workers
+                elif settings.mode == "process":
+                    max_workers = os.cpu_count() or 1
+                else:
+                    max_workers = self.thread_workers
+                name = tool_name if dedicated else (Path(project).name or "default")
+                executor = ToolExecutor(name, settings.mode, max_workers)
+                self._executors[key] = executor
+                _log.debug(
+                    "Tool executor created",
+                    executor=name,
+                    mode=settings.mode,
+                    max_workers=max_workers,
+                )
+            return executor
+
+    def stats(self) -> dict[str, ToolExecutorStats]:
+        """Get counters of every executor, keyed "project:tool:mode"."""
+        with self._lock:
+            executors = dict(self._executors)
+        return {
+            f"{project}:{tool or '*'}:{mode}": executor.stats()
+            for (project, tool, mode, _), executor in executors.items()
+        }
+
+    def shutdown(self, wait: bool = False) -> None:
+        """Shut down and forget every executor."""
+        with self._lock:
+            executors = list(self._executors.values())
+            self._executors.clear()
+        for executor in executors:
+            executor.shutdown(wait=wait)
+
+
+def call_tool_in_process(
+    project_path: Path | None,
+    tool_ir: ToolIR,
+    *args: Any,
+    **kwargs: Any,
+) -> Any:
+    """Load and call a tool inside a process pool worker.
+
+    Functions from dynamically loaded tool modules cannot be pickled by
+    reference, so the worker loads the tool itself from its IR. Loaded
+    modules stay cached in the worker between calls.
+    """
+    from adkflow_runner.runner.tool_loader import ToolLoader
+
+    func = ToolLoader(project_path).load_function(tool_ir)
+    result = func(*args, **kwargs)
+    if asyncio.iscoroutine(result):
+        result = asyncio.run(result)
+    return result
+
+
+# Shared by every ToolLoader that is not given its own registry
+tool_executors = ToolExecutorRegistry()
+
+# Release pooled workers (process pools hold child processes) when the
+# interpreter exits without an explicit shutdown, e.g. from the CLI
+atexit.register(tool_executors.shutdown)
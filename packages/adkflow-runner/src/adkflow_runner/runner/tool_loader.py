@@ -5,17 +5,26 @@ for use with ADK agents.
 """
 
 import ast
-import asyncio
 import functools
+import hashlib
 import importlib.util
 import inspect
+import linecache
 import sys
-import tempfile
+import types
 from pathlib import Path
 from typing import Any, Callable
 
+from adkflow_runner.compiler.cache import stat_file
 from adkflow_runner.errors import ErrorLocation, ToolLoadError
 from adkflow_runner.ir import ToolIR
+from adkflow_runner.runner.tool_cache import ToolModuleCache, tool_module_cache
+from adkflow_runner.runner.tool_executor import (
+    ToolExecutionSettings,
+    ToolExecutorRegistry,
+    call_tool_in_process,
+    tool_executors,
+)
 
 
 # Built-in tool names that map to ADK built-in tools
@@ -29,9 +38,18 @@ BUILTIN_TOOLS = {
 class ToolLoader:
     """Loads Python tools from IR definitions."""
 
-    def __init__(self, project_path: Path | None = None):
+    def __init__(
+        self,
+        project_path: Path | None = None,
+        module_cache: ToolModuleCache | None = None,
+        executors: ToolExecutorRegistry | None = None,
+    ):
         self.project_path = project_path
-        self._loaded_modules: dict[str, Any] = {}
+        # Shared across loaders so tool modules are executed once per process
+        self.module_cache = (
+            module_cache if module_cache is not None else tool_module_cache
+        )
+        self.executors = executors if executors is not None else tool_executors
 
     def load(self, tool_ir: ToolIR) -> Callable | str:
         """Load a tool from IR.
@@ -49,19 +67,10 @@ class ToolLoader:
         if tool_ir.name in BUILTIN_TOOLS:
             return tool_ir.name
 
-        # Load the function
-        func: Callable | None = None
-        if tool_ir.file_path:
-            func = self._load_from_file(tool_ir)
-        elif tool_ir.code:
-            func = self._load_from_code(tool_ir)
-        else:
-            raise ToolLoadError(
-                f"Tool '{tool_ir.name}' has neither file_path nor code",
-            )
+        func = self.load_function(tool_ir)
 
-        # Wrap sync functions to run in thread pool (prevents event loop blocking)
-        func = self._wrap_for_async(func)
+        # Wrap sync functions to run on a tool executor (prevents event loop blocking)
+        func = self._wrap_for_async(func, tool_ir)
 
         # Wrap with error handling if pass_to_model
         if tool_ir.error_behavior == "pass_to_model":
@@ -69,6 +78,20 @@ class ToolLoader:
 
         return func
 
+    def load_function(self, tool_ir: ToolIR) -> Callable:
+        """Load the unwrapped tool function from a file or inline code.
+
+        Raises:
+            ToolLoadError: If tool cannot be loaded
+        """
+        if tool_ir.file_path:
+            return self._load_from_file(tool_ir)
+        if tool_ir.code:
+            return self._load_from_code(tool_ir)
+        raise ToolLoadError(
+            f"Tool '{tool_ir.name}' has neither file_path nor code",
+        )
+
     def load_all(self, tools: list[ToolIR]) -> list[Callable | str]:
         """Load all tools from IR list.
 
@@ -101,13 +124,12 @@ class ToolLoader:
                 location=ErrorLocation(file_path=str(file_path)),
             )
 
-        # Check if already loaded
-        cache_key = str(file_path.resolve())
-        if cache_key in self._loaded_modules:
-            module = self._loaded_modules[cache_key]
-        else:
-            module = self._load_module(file_path, tool_ir.name)
-            self._loaded_modules[cache_key] = module
+        # Reuse the module until the file changes
+        module = self.module_cache.get_or_load(
+            f"file:{file_path}",
+            stat_file(file_path),
+            lambda: self._load_module(file_path, tool_ir.name),
+        )
 
         # Find the tool function
         func = self._find_tool_function(module, tool_ir.name, file_path)
@@ -118,27 +140,47 @@ class ToolLoader:
         if not tool_ir.code:
             raise ToolLoadError(f"Tool '{tool_ir.name}' has no code")
 
-        # Validate the code is safe (basic check)
-        self._validate_code(tool_ir.code, tool_ir.name)
-
-        # Create a temporary module
-        module_name = f"adkflow_tool_{tool_ir.name}"
-
-        # Write to temp file and load
-        with tempfile.NamedTemporaryFile(
-            mode="w",
-            suffix=".py",
-            delete=False,
-        ) as f:
-            f.write(tool_ir.code)
-            temp_path = Path(f.name)
+        code = tool_ir.code
+        digest = hashlib.sha256(code.encode("utf-8")).hexdigest()
+        module = self.module_cache.get_or_load(
+            f"code:{digest}",
+            None,
+            lambda: self._load_code_module(code, tool_ir.name),
+        )
+        return self._find_tool_function(
+            module, tool_ir.name, Path(module.__file__ or tool_ir.name)
+        )
 
+    def _load_code_module(self, code: str, tool_name: str) -> Any:
+        """Execute inline tool code as a module without touching disk."""
+        # Validate the code is safe (basic check)
+        self._validate_code(code, tool_name)
+
+        # A pseudo filename keeps tracebacks and inspect.getsource working
+        module_name = f"adkflow_tool_{tool_name}"
+        filename = f"<{module_name}>"
+        code_obj = compile(code, filename, "exec")
+
+        linecache.cache[filename] = (
+            len(code),
+            None,
+            code.splitlines(keepends=True),
+            filename,
+        )
+        module = types.ModuleType(module_name)
+        module.__file__ = filename
+        sys.modules[module_name] = module
         try:
-            module = self._load_module(temp_path, module_name)
-            func = self._find_tool_function(module, tool_ir.name, temp_path)
-            return func
-        finally:
-            temp_path.unlink(missing_ok=True)
+            exec(code_obj, module.__dict__)
+        except Exception as e:
+            # Leave no half-initialized module behind
+            sys.modules.pop(module_name, None)
+            linecache.cache.pop(filename, None)
+            raise ToolLoadError(
+                f"Failed to load tool module: {e}",
+                location=ErrorLocation(file_path=filename),
+            ) from e
+        return module
 
     def _load_module(self, file_path: Path, module_name: str) -> Any:
         """Load a Python module from file."""
@@ -226,19 +268,36 @@ class ToolLoader:
                 # In production, you might want to be stricter
                 pass
 
-    def _wrap_for_async(self, func: Callable) -> Callable:
-        """Wrap sync functions to run in thread pool.
+    def _wrap_for_async(
+        self, func: Callable, tool_ir: ToolIR | None = None
+    ) -> Callable:
+        """Wrap sync functions to run on a bounded tool executor.
 
         This prevents synchronous tool functions from blocking the event loop,
         allowing SSE events to be sent in real-time while tools execute.
+        Execution mode, pool size and timeout come from ToolIR.config.
         Async functions are returned unchanged.
         """
         if inspect.iscoroutinefunction(func):
             return func  # Already async, no wrapping needed
 
+        settings = ToolExecutionSettings.from_config(
+            tool_ir.config if tool_ir else None
+        )
+        executor = self.executors.for_tool(
+            self.project_path, tool_ir.name if tool_ir else func.__name__, settings
+        )
+        timeout = settings.timeout
+
+        if settings.mode == "process" and tool_ir is not None:
+            # The worker process loads the tool itself from its IR
+            target = functools.partial(call_tool_in_process, self.project_path, tool_ir)
+        else:
+            target = func
+
         @functools.wraps(func)
         async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
-            return await asyncio.to_thread(func, *args, **kwargs)
+            return await executor.run(target, *args, timeout=timeout, **kwargs)
 
         return async_wrapper
 
@@ -68,6 +68,17 @@ class RunEvent:
             "data": self.data,
         }
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "RunEvent":
+        """Create from a dictionary produced by to_dict."""
+        return cls(
+            type=EventType(data["type"]),
+            timestamp=data["timestamp"],
+            agent_id=data.get("agent_id"),
+            agent_name=data.get("agent_name"),
+            data=data.get("data") or {},
+        )
+
 
 @dataclass
 class RunResult:
@@ -179,3 +190,12 @@ class RunConfig:
     max_llm_calls: int = 500  # Total LLM calls per run. 0 = unlimited
     context_window_compression: bool = False  # Enable context window compression
     streaming_mode: str = "none"  # "none" | "sse" | "bidi"
+
+    # Custom node scheduling: "layered" (barrier per layer) or "eager"
+    # (dispatch each node as soon as its predecessors finish; an
+    # after_layer_execute REPLACE cannot rewrite outputs already consumed)
+    custom_node_scheduling: str = "layered"
+
+    # Whether RunResult.events holds every event of the run; callers that
+    # keep their own event store can turn this off to save memory
+    collect_events: bool = True
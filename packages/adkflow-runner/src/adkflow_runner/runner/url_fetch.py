@@ -0,0 +1,284 @@
+"""Pooled, cached HTTP fetching for URL context inputs.
+
+URL inputs are usually documentation pages fetched again on every run:
+- One keep-alive AsyncClient per event loop is shared by all fetches
+  (HTTP/2 when the optional h2 package is installed)
+- Responses are cached on disk and honor Cache-Control, Expires, ETag
+  and Last-Modified: fresh entries are served without a request, stale
+  ones are revalidated with If-None-Match / If-Modified-Since, so an
+  unchanged page costs a 304 at most
+
+Cache entries are one file per URL under cache_dir, written atomically
+so several processes can share the directory.
+"""
+
+import asyncio
+import calendar
+import hashlib
+import importlib.util
+import json
+import os
+import tempfile
+import time
+import weakref
+from email.utils import parsedate_tz
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+from adkflow_runner.logging import get_logger
+
+_log = get_logger("runner.url_fetch")
+
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Bodies larger than this are fetched but not cached
+MAX_CACHED_BODY_BYTES = 10 * 1024 * 1024
+
+# Headers that describe the wire encoding; cached bodies are stored decoded
+_WIRE_HEADERS = {"content-encoding", "content-length", "transfer-encoding"}
+
+# Headers a 304 may update on the cached entry
+_REVALIDATION_HEADERS = {
+    "cache-control",
+    "date",
+    "etag",
+    "expires",
+    "last-modified",
+}
+
+
+class HttpClientPool:
+    """Shared keep-alive AsyncClients, one per event loop.
+
+    An AsyncClient's connections belong to the loop that opened them, so
+    each running loop gets its own client. Clients live until aclose() is
+    called from their loop or the loop is garbage collected.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = 20,
+        max_keepalive_connections: int = 10,
+        keepalive_expiry: float = 30.0,
+    ):
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self._clients: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, httpx.AsyncClient
+        ] = weakref.WeakKeyDictionary()
+
+    def client(self) -> httpx.AsyncClient:
+        """Get the client for the running event loop, creating it if needed."""
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                limits=self.limits,
+                http2=HTTP2_AVAILABLE,
+                follow_redirects=True,
+            )
+            self._clients[loop] = client
+        return client
+
+    async def aclose(self) -> None:
+        """Close the running loop's client and its pooled connections."""
+        client = self._clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+
+
+class UrlResponseCache:
+    """On-disk HTTP response cache with conditional revalidation."""
+
+    def __init__(self, cache_dir: Path):
+        self.cache_dir = cache_dir
+
+    def load(self, url: str) -> tuple[dict[str, Any], bytes] | None:
+        """Load the cached (meta, body) for a URL, if any."""
+        try:
+            data = self._path(url).read_bytes()
+            header, _, body = data.partition(b"\n")
+            meta = json.loads(header)
+        except (OSError, ValueError):
+            return None
+        if meta.get("url") != url:
+            return None
+        return meta, body
+
+    def store(self, url: str, response: httpx.Response) -> None:
+        """Cache a 200 response if its headers allow it."""
+        if response.status_code != 200 or not _is_cacheable(response.headers):
+            return
+        body = response.content
+        if len(body) > MAX_CACHED_BODY_BYTES:
+            return
+        headers = [
+            (k, v) for k, v in response.headers.items() if k not in _WIRE_HEADERS
+        ]
+        self._write(url, {"url": url, "stored_at": time.time()}, headers, body)
+
+    def refresh(
+        self, url: str, meta: dict[str, Any], body: bytes, response: httpx.Response
+    ) -> dict[str, Any]:
+        """Apply a 304's headers to a cached entry and reset its age."""
+        updated = {
+            k: v for k, v in response.headers.items() if k in _REVALIDATION_HEADERS
+        }
+        headers = [(k, v) for k, v in meta["headers"] if k not in updated]
+        headers.extend(updated.items())
+        meta = {"url": url, "stored_at": time.time()}
+        self._write(url, meta, headers, body)
+        return {**meta, "headers": headers}
+
+    def _path(self, url: str) -> Path:
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return self.cache_dir / key[:2] / f"{key}.http"
+
+    def _write(
+        self,
+        url: str,
+        meta: dict[str, Any],
+        headers: list[tuple[str, str]],
+        body: bytes,
+    ) -> None:
+        path = self._path(url)
+        header = json.dumps({**meta, "headers": headers}).encode("utf-8")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write to a temp file in the same directory and rename, so
+            # concurrent readers only ever see complete entries
+            fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(header + b"\n" + body)
+                os.replace(tmp_name, path)
+            except BaseException:
+                Path(tmp_name).unlink(missing_ok=True)
+                raise
+        except OSError as e:
+            _log.warning("Failed to write URL cache entry", url=url, error=str(e))
+
+
+async def fetch_url(
+    url: str,
+    cache_dir: Path | None = None,
+    timeout: float = 30.0,
+    pool: HttpClientPool | None = None,
+) -> httpx.Response:
+    """GET a URL through the shared client and the response cache.
+
+    Args:
+        url: URL to fetch
+        cache_dir: Directory of the response cache; None disables caching
+        timeout: Request timeout in seconds
+        pool: Client pool to use; defaults to the shared http_clients
+
+    Returns:
+        The response; a cache hit is returned as a 200 response built from
+        the cached headers and body
+
+    Raises:
+        httpx.HTTPError: On network errors, as with httpx
+    """
+    client = (pool if pool is not None else http_clients).client()
+    cache = UrlResponseCache(cache_dir) if cache_dir is not None else None
+    cached = await asyncio.to_thread(cache.load, url) if cache else None
+
+    request_headers: dict[str, str] = {}
+    if cached is not None:
+        meta, body = cached
+        stored = httpx.Headers(meta["headers"])
+        if _is_fresh(stored, meta["stored_at"]):
+            _log.debug("URL cache hit", url=url)
+            return _cached_response(url, stored, body)
+        if "etag" in stored:
+            request_headers["If-None-Match"] = stored["etag"]
+        if "last-modified" in stored:
+            request_headers["If-Modified-Since"] = stored["last-modified"]
+
+    response = await client.get(url, headers=request_headers, timeout=timeout)
+
+    if cache is None:
+        return response
+    if cached is not None and response.status_code == 304:
+        meta, body = cached
+        meta = await asyncio.to_thread(cache.refresh, url, meta, body, response)
+        _log.debug("URL cache revalidated", url=url)
+        return _cached_response(url, httpx.Headers(meta["headers"]), body)
+    await asyncio.to_thread(cache.store, url, response)
+    return response
+
+
+def _cached_response(url: str, headers: httpx.Headers, body: bytes) -> httpx.Response:
+    return httpx.Response(
+        200,
+        headers=headers,
+        content=body,
+        request=httpx.Request("GET", url),
+    )
+
+
+def _cache_control(headers: httpx.Headers) -> dict[str, str]:
+    """Parse Cache-Control into lower-case directives."""
+    directives: dict[str, str] = {}
+    for part in headers.get("cache-control", "").split(","):
+        name, _, value = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = value.strip().strip('"')
+    return directives
+
+
+def _is_cacheable(headers: httpx.Headers) -> bool:
+    """Check whether a response may be stored and later reused."""
+    cc = _cache_control(headers)
+    if "no-store" in cc:
+        return False
+    return (
+        "etag" in headers
+        or "last-modified" in headers
+        or _freshness_lifetime(headers, time.time()) > 0
+    )
+
+
+def _freshness_lifetime(headers: httpx.Headers, response_time: float) -> float:
+    """Seconds a response stays fresh, from max-age or Expires."""
+    cc = _cache_control(headers)
+    if "no-cache" in cc:
+        return 0.0
+    if "max-age" in cc:
+        try:
+            return float(cc["max-age"])
+        except ValueError:
+            return 0.0
+    expires = _parse_http_date(headers.get("expires"))
+    if expires is None:
+        return 0.0
+    date = _parse_http_date(headers.get("date"))
+    return expires - (date if date is not None else response_time)
+
+
+def _is_fresh(headers: httpx.Headers, stored_at: float) -> bool:
+    try:
+        initial_age = float(headers.get("age", 0))
+    except ValueError:
+        initial_age = 0.0
+    age = initial_age + max(0.0, time.time() - stored_at)
+    return age < _freshness_lifetime(headers, stored_at)
+
+
+def _parse_http_date(value: str | None) -> float | None:
+    if not value:
+        return None
+    parsed = parsedate_tz(value)
+    if parsed is None:
+        return None
+    return calendar.timegm(parsed[:6]) - (parsed[9] or 0)
+
+
+# Shared by every URL fetch that is not given its own pool
+http_clients = HttpClientPool()
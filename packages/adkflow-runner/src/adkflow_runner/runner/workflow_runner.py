@@ -4,6 +4,7 @@ Executes compiled workflows using ADK agents with callback support.
 """
 
 import asyncio
+import dataclasses
 import os
 import time
 import traceback
@@ -17,9 +18,9 @@ from google.adk.runners import Runner
 from google.adk.sessions import InMemorySessionService
 from google.genai import types
 
-from adkflow_runner.compiler import Compiler
+from adkflow_runner.compiler import Compiler, IncrementalCompiler, IRCache
 from adkflow_runner.errors import ExecutionError
-from adkflow_runner.ir import WorkflowIR
+from adkflow_runner.ir import ContextAggregatorIR, WorkflowIR
 from adkflow_runner.logging import (
     Logger,
     configure_logging,
@@ -29,6 +30,7 @@ from adkflow_runner.logging import (
 )
 from adkflow_runner.telemetry import setup_tracing
 from adkflow_runner.runner.agent_factory import AgentFactory
+from adkflow_runner.runner.agent_pool import AgentTreePool, fingerprint_agent_tree
 from adkflow_runner.runner.types import (
     RunStatus,
     EventType,
@@ -54,7 +56,10 @@ from adkflow_runner.runner.execution_engine import (
 from adkflow_runner.runner.graph_builder import partition_custom_nodes
 from adkflow_runner.runner.session_utils import collect_context_vars_for_session
 from adkflow_runner.runner.adk_config import build_adk_run_config
-from adkflow_runner.runner.streaming import run_workflow_generator
+from adkflow_runner.runner.streaming import (
+    run_workflow_batches,
+    run_workflow_generator,
+)
 from adkflow_runner.hooks import (
     HookAction,
     HookAbortError,
@@ -77,8 +82,25 @@ class WorkflowRunner:
         ))
     """
 
-    def __init__(self, enable_cache: bool = True, cache_dir: Path | None = None):
-        self.compiler = Compiler()
+    def __init__(
+        self,
+        enable_cache: bool = True,
+        cache_dir: Path | None = None,
+        compiler: Compiler | IncrementalCompiler | None = None,
+    ):
+        """Initialize the runner.
+
+        Args:
+            enable_cache: Reuse compiled IR, built agents and node results
+            cache_dir: Directory for the custom node result cache
+            compiler: Compiler to use, e.g. an IncrementalCompiler shared
+                with other callers. Defaults to a Compiler with an IR cache
+                when enable_cache is set.
+        """
+        self.compiler = compiler or Compiler(
+            ir_cache=IRCache() if enable_cache else None
+        )
+        self.agent_pool = AgentTreePool() if enable_cache else None
         self._active_runs: dict[str, asyncio.Task] = {}
         self._enable_cache = enable_cache
         self._cache_dir = cache_dir
@@ -108,13 +130,18 @@ class WorkflowRunner:
         run_id = config.run_id or str(uuid.uuid4())[:8]
 
         # Set run context so all logs automatically include run_id
-        with run_context(run_id):
-            return await self._run_with_context(config, run_id)
+        try:
+            with run_context(run_id):
+                return await self._run_with_context(config, run_id)
+        finally:
+            # Close the run's log file (per_run logging) and retire old runs
+            await asyncio.to_thread(Logger.close_run, run_id)
 
     async def _run_with_context(self, config: RunConfig, run_id: str) -> RunResult:
         """Execute the workflow run within a run context."""
         start_time = time.time()
         events: list[RunEvent] = []
+        collect_events = config.collect_events
         callbacks = config.callbacks or NoOpCallbacks()
 
         # Create run-scoped logger with context (run_id is auto-injected)
@@ -123,7 +150,8 @@ class WorkflowRunner:
         )
 
         async def emit(event: RunEvent) -> None:
-            events.append(event)
+            if collect_events:
+                events.append(event)
             await callbacks.on_event(event)
 
         # Create hooks integration for this run
@@ -168,16 +196,7 @@ class WorkflowRunner:
                     metadata={"skipped_by_hook": True},
                 )
             # Use potentially modified input data
-            config = RunConfig(
-                project_path=config.project_path,
-                tab_id=config.tab_id,
-                input_data=input_data,
-                callbacks=config.callbacks,
-                timeout_seconds=config.timeout_seconds,
-                validate=config.validate,
-                user_input_provider=config.user_input_provider,
-                run_id=config.run_id,
-            )
+            config = dataclasses.replace(config, input_data=input_data)
 
             # Emit run start
             await emit(
@@ -194,7 +213,7 @@ class WorkflowRunner:
 
             # Compile workflow with timing
             with log_timing(run_log, "compile") as ctx:
-                ir = self.compiler.compile(
+                ir = await self.compiler.compile_async(
                     config.project_path,
                     validate=config.validate,
                 )
@@ -378,29 +397,26 @@ class WorkflowRunner:
                 custom_node_ids=pre_agent_nodes,
             )
 
-        # Execute context aggregators (built-in nodes)
+        # Execute context aggregators (built-in nodes). They only read
+        # custom node outputs, never each other, so they run concurrently.
         context_aggregator_outputs: dict[str, dict[str, Any]] = {}
         if ir.context_aggregators:
-            for aggregator_ir in ir.context_aggregators:
-                # Resolve inputs from connected nodes (custom node outputs)
-                node_inputs: dict[str, Any] = {}
-                for port_id, source_ids in aggregator_ir.input_connections.items():
-                    for source_id in source_ids:
-                        if source_id in custom_node_outputs:
-                            source_output = custom_node_outputs[source_id]
-                            if source_output:
-                                # Get first output value
-                                node_inputs[port_id] = next(
-                                    iter(source_output.values())
-                                )
-                            break
-
-                output = await execute_context_aggregator(
-                    aggregator_ir,
-                    str(config.project_path),
-                    node_inputs,
+            outputs = await asyncio.gather(
+                *(
+                    execute_context_aggregator(
+                        aggregator_ir,
+                        str(config.project_path),
+                        self._aggregator_node_inputs(
+                            aggregator_ir, custom_node_outputs
+                        ),
+                    )
+                    for aggregator_ir in ir.context_aggregators
                 )
-                context_aggregator_outputs[aggregator_ir.id] = output
+            )
+            context_aggregator_outputs = {
+                aggregator_ir.id: output
+                for aggregator_ir, output in zip(ir.context_aggregators, outputs)
+            }
 
         # Resolve context variables for agents from context aggregator and custom node outputs
         if context_aggregator_outputs or custom_node_outputs:
@@ -408,8 +424,18 @@ class WorkflowRunner:
                 ir, context_aggregator_outputs, custom_node_outputs
             )
 
-        factory = AgentFactory(config.project_path)
-        root_agent = factory.create_from_workflow(ir, emit=emit, hooks=hooks)
+        # Reuse a warm agent tree built for identical agent IR if one is idle
+        pool_key: str | None = None
+        factory: AgentFactory | None = None
+        if self.agent_pool is not None:
+            pool_key = fingerprint_agent_tree(ir)
+            factory = self.agent_pool.acquire(pool_key)
+        if factory is not None:
+            root_agent = factory.bind_run(emit=emit, hooks=hooks)
+            _log.debug("Reusing warm agent tree", agents=len(ir.all_agents))
+        else:
+            factory = AgentFactory(config.project_path)
+            root_agent = factory.create_from_workflow(ir, emit=emit, hooks=hooks)
 
         # Extract Monitor connections for real-time updates during ADK streaming
         agent_monitors = extract_agent_monitor_connections(ir)
@@ -591,8 +617,29 @@ class WorkflowRunner:
 
         await write_output_files(ir, output, config.project_path, emit)
 
+        # Trees from failed runs are dropped rather than returned
+        if self.agent_pool is not None and pool_key is not None:
+            self.agent_pool.release(pool_key, factory)
+
         return output
 
+    def _aggregator_node_inputs(
+        self,
+        aggregator_ir: ContextAggregatorIR,
+        custom_node_outputs: dict[str, dict[str, Any]],
+    ) -> dict[str, Any]:
+        """Resolve a context aggregator's inputs from connected custom nodes."""
+        node_inputs: dict[str, Any] = {}
+        for port_id, source_ids in aggregator_ir.input_connections.items():
+            for source_id in source_ids:
+                if source_id in custom_node_outputs:
+                    source_output = custom_node_outputs[source_id]
+                    if source_output:
+                        # Get first output value
+                        node_inputs[port_id] = next(iter(source_output.values()))
+                    break
+        return node_inputs
+
     def _resolve_agent_context_vars(
         self,
         ir: WorkflowIR,
@@ -678,6 +725,26 @@ class WorkflowRunner:
         async for item in run_workflow_generator(self, config):
             yield item
 
+    async def run_async_batches(
+        self,
+        config: RunConfig,
+        max_batch_size: int | None = None,
+    ) -> AsyncIterator[list[RunEvent] | RunResult]:
+        """Run a workflow and yield events in batches.
+
+        Each batch holds the events emitted since the previous one, which
+        suits high-rate token streaming.
+
+        Args:
+            config: Run configuration
+            max_batch_size: Largest batch to yield; None for no limit
+
+        Yields:
+            Lists of RunEvent objects as execution progresses, RunResult at end
+        """
+        async for item in run_workflow_batches(self, config, max_batch_size):
+            yield item
+
 
 # Convenience function
 async def run_workflow(
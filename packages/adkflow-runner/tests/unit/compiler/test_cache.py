@@ -0,0 +1,228 @@
+"""Tests for the compiled IR cache."""
+
+import json
+import os
+
+import pytest
+
+from adkflow_runner.compiler.cache import IRCache, fingerprint_files, stat_file
+from adkflow_runner.compiler.compiler import Compiler
+
+
+@pytest.fixture
+def prompt_project(tmp_path):
+    """Create a project with an agent fed by a prompt file."""
+    manifest = {
+        "name": "cache-project",
+        "version": "3.0",
+        "tabs": [{"id": "main", "name": "Main", "order": 0}],
+        "nodes": [
+            {
+                "id": "start_1",
+                "type": "start",
+                "position": {"x": 0, "y": 0},
+                "data": {"tabId": "main"},
+            },
+            {
+                "id": "prompt_1",
+                "type": "prompt",
+                "position": {"x": 0, "y": 100},
+                "data": {
+                    "tabId": "main",
+                    "config": {"name": "Prompt", "file_path": "main.prompt.md"},
+                },
+            },
+            {
+                "id": "agent_1",
+                "type": "agent",
+                "position": {"x": 200, "y": 0},
+                "data": {
+                    "tabId": "main",
+                    "config": {"name": "CacheAgent", "description": "Test"},
+                },
+            },
+        ],
+        "edges": [
+            {"id": "e1", "source": "start_1", "target": "agent_1"},
+            {"id": "e2", "source": "prompt_1", "target": "agent_1"},
+        ],
+        "settings": {},
+    }
+    (tmp_path / "manifest.json").write_text(json.dumps(manifest))
+    (tmp_path / "prompts").mkdir()
+    (tmp_path / "prompts" / "main.prompt.md").write_text("Be helpful.")
+    return tmp_path
+
+
+def _touch(path, content):
+    """Rewrite a file and push its mtime forward so the change is visible."""
+    st = path.stat()
+    path.write_text(content)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+class TestFingerprint:
+    """Tests for file stamping helpers."""
+
+    def test_stat_missing_file(self, tmp_path):
+        assert stat_file(tmp_path / "missing.txt") is None
+
+    def test_stat_existing_file(self, tmp_path):
+        path = tmp_path / "a.txt"
+        path.write_text("abc")
+        stamp = stat_file(path)
+        assert stamp is not None
+        assert stamp[1] == 3
+
+    def test_fingerprint_files(self, tmp_path):
+        path = tmp_path / "a.txt"
+        path.write_text("abc")
+        fp = fingerprint_files([path, tmp_path / "b.txt"])
+        assert fp[path] == stat_file(path)
+        assert fp[tmp_path / "b.txt"] is None
+
+
+class TestLoaderSourceFiles:
+    """Tests for source file tracking in the loader."""
+
+    def test_records_manifest_and_prompt_candidates(self, prompt_project):
+        project = Compiler().load(prompt_project)
+        paths = set(project.source_files)
+        assert prompt_project / "manifest.json" in paths
+        # Direct candidate is probed first, then the prompts/ fallback
+        assert (prompt_project / "main.prompt.md").resolve() in paths
+        assert (prompt_project / "prompts" / "main.prompt.md").resolve() in paths
+
+
+class TestIRCache:
+    """Tests for IRCache behavior through the Compiler."""
+
+    def test_hit_returns_equal_copy(self, prompt_project):
+        cache = IRCache()
+        compiler = Compiler(ir_cache=cache)
+
+        first = compiler.compile(prompt_project)
+        second = compiler.compile(prompt_project)
+
+        assert cache.hits == 1
+        assert second is not first
+        assert second.root_agent.name == first.root_agent.name
+
+    def test_hit_is_isolated_from_mutation(self, prompt_project):
+        compiler = Compiler(ir_cache=IRCache())
+
+        first = compiler.compile(prompt_project)
+        first.root_agent.context_vars["leak"] = "value"
+
+        second = compiler.compile(prompt_project)
+        assert "leak" not in second.root_agent.context_vars
+
+    def test_prompt_change_invalidates(self, prompt_project):
+        cache = IRCache()
+        compiler = Compiler(ir_cache=cache)
+        compiler.compile(prompt_project)
+
+        _touch(prompt_project / "prompts" / "main.prompt.md", "Be terse.")
+        ir = compiler.compile(prompt_project)
+
+        assert cache.hits == 0
+        assert ir.root_agent.instruction is not None
+        assert "Be terse." in ir.root_agent.instruction
+
+    def test_manifest_change_invalidates(self, prompt_project):
+        cache = IRCache()
+        compiler = Compiler(ir_cache=cache)
+        compiler.compile(prompt_project)
+
+        manifest_path = prompt_project / "manifest.json"
+        manifest = json.loads(manifest_path.read_text())
+        manifest["nodes"][2]["data"]["config"]["name"] = "RenamedAgent"
+        _touch(manifest_path, json.dumps(manifest))
+
+        ir = compiler.compile(prompt_project)
+        assert cache.hits == 0
+        assert ir.root_agent.name == "RenamedAgent"
+
+    def test_shadowing_file_invalidates(self, prompt_project):
+        cache = IRCache()
+        compiler = Compiler(ir_cache=cache)
+        compiler.compile(prompt_project)
+
+        # A file at the direct path now takes precedence over prompts/
+        (prompt_project / "main.prompt.md").write_text("Shadowed.")
+        ir = compiler.compile(prompt_project)
+
+        assert cache.hits == 0
+        assert ir.root_agent.instruction is not None
+        assert "Shadowed." in ir.root_agent.instruction
+
+    def test_validate_flag_is_part_of_key(self, prompt_project):
+        cache = IRCache()
+        compiler = Compiler(ir_cache=cache)
+        compiler.compile(prompt_project, validate=True)
+        compiler.compile(prompt_project, validate=False)
+
+        assert cache.hits == 0
+        assert len(cache) == 2
+
+    def test_lru_eviction(self, tmp_path, prompt_project):
+        cache = IRCache(max_entries=1)
+        ir = Compiler().compile(prompt_project)
+
+        cache.put(prompt_project, ir, {})
+        cache.put(tmp_path / "other", ir, {})
+
+        assert len(cache) == 1
+        assert cache.get(prompt_project) is None
+
+    def test_invalidate_project(self, prompt_project):
+        cache = IRCache()
+        compiler = Compiler(ir_cache=cache)
+        compiler.compile(prompt_project)
+
+        cache.invalidate(prompt_project)
+        assert len(cache) == 0
+
+    def test_no_cache_by_default(self, prompt_project):
+        compiler = Compiler()
+        assert compiler.ir_cache is None
+        first = compiler.compile(prompt_project)
+        second = compiler.compile(prompt_project)
+        assert first is not second
+
+    def test_edit_during_load_is_not_cached(self, prompt_project, monkeypatch):
+        cache = IRCache()
+        compiler = Compiler(ir_cache=cache)
+        compiler.compile(prompt_project)
+        cache.invalidate(prompt_project)
+        cache.track_files(prompt_project, [prompt_project / "manifest.json"])
+
+        load = compiler.load
+
+        def load_then_edit(project_path):
+            project = load(project_path)
+            _touch(prompt_project / "prompts" / "main.prompt.md", "Edited.")
+            return project
+
+        monkeypatch.setattr(compiler, "load", load_then_edit)
+        compiler.compile(prompt_project)
+        assert len(cache) == 0
+
+        monkeypatch.setattr(compiler, "load", load)
+        ir = compiler.compile(prompt_project)
+        assert ir.root_agent.instruction is not None
+        assert "Edited." in ir.root_agent.instruction
+
+    def test_registry_change_invalidates(self, prompt_project):
+        from adkflow_runner.extensions import get_registry
+
+        cache = IRCache()
+        compiler = Compiler(ir_cache=cache)
+        compiler.compile(prompt_project)
+
+        get_registry()._bump_generation()
+        compiler.compile(prompt_project)
+
+        assert cache.hits == 0
+        compiler.compile(prompt_project)
+        assert cache.hits == 1
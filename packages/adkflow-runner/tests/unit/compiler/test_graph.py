@@ -266,6 +266,72 @@ class TestWorkflowGraph:
         with pytest.raises(CycleDetectedError):
             graph.topological_sort()
 
+    def test_graph_topological_sort_reports_cycle_path(
+        self, make_graph_node, make_graph_edge
+    ):
+        """Cycle error lists the full cycle, not the path leading into it."""
+        entry = make_graph_node("entry", "agent", "Entry")
+        a = make_graph_node("a", "agent", "A")
+        b = make_graph_node("b", "agent", "B")
+        c = make_graph_node("c", "agent", "C")
+
+        # entry -> a -> b -> c -> a
+        make_graph_edge(entry, a, EdgeSemantics.SEQUENTIAL)
+        make_graph_edge(a, b, EdgeSemantics.SEQUENTIAL)
+        make_graph_edge(b, c, EdgeSemantics.SEQUENTIAL)
+        make_graph_edge(c, a, EdgeSemantics.SEQUENTIAL)
+
+        graph = WorkflowGraph(
+            nodes={"entry": entry, "a": a, "b": b, "c": c},
+            edges=[],
+            teleporter_pairs=[],
+            entry_nodes=[entry],
+        )
+
+        with pytest.raises(CycleDetectedError) as exc_info:
+            graph.topological_sort()
+
+        assert exc_info.value.cycle_nodes == ["A", "B", "C", "A"]
+        assert exc_info.value.location.node_id == "a"
+
+    def test_graph_topological_sort_long_chain(self, make_graph_node, make_graph_edge):
+        """Long sequential chains do not hit the recursion limit."""
+        size = 20_000
+        nodes = {f"n{i}": make_graph_node(f"n{i}", "agent") for i in range(size)}
+        for i in range(size - 1):
+            make_graph_edge(
+                nodes[f"n{i}"], nodes[f"n{i + 1}"], EdgeSemantics.SEQUENTIAL
+            )
+
+        # Insert in reverse so the sort cannot just follow dict order
+        graph = WorkflowGraph(
+            nodes=dict(reversed(nodes.items())),
+            edges=[],
+            teleporter_pairs=[],
+            entry_nodes=[nodes["n0"]],
+        )
+
+        assert graph.topological_sort() == [f"n{i}" for i in range(size)]
+
+    def test_graph_topological_sort_ignores_data_edges(
+        self, make_graph_node, make_graph_edge
+    ):
+        """Only sequential edges constrain the order."""
+        a = make_graph_node("a", "agent", "A")
+        p = make_graph_node("p", "prompt", "P")
+
+        make_graph_edge(a, p, EdgeSemantics.SEQUENTIAL)
+        make_graph_edge(p, a, EdgeSemantics.INSTRUCTION)
+
+        graph = WorkflowGraph(
+            nodes={"a": a, "p": p},
+            edges=[],
+            teleporter_pairs=[],
+            entry_nodes=[a],
+        )
+
+        assert graph.topological_sort() == ["a", "p"]
+
 
 class TestTeleporterPair:
     """Tests for TeleporterPair dataclass."""
@@ -0,0 +1,383 @@
+"""Tests for incremental recompilation."""
+
+import json
+import os
+import shutil
+
+import pytest
+
+from adkflow_runner.compiler.incremental import IncrementalCompiler
+
+
+def _node(node_id, node_type, tab_id, config=None, y=0):
+    data = {"tabId": tab_id}
+    if config is not None:
+        data["config"] = config
+    return {
+        "id": node_id,
+        "type": node_type,
+        "position": {"x": 0, "y": y},
+        "data": data,
+    }
+
+
+@pytest.fixture
+def two_tab_project(tmp_path):
+    """Create a project with one prompt-fed agent on each of two tabs."""
+    manifest = {
+        "name": "incremental-project",
+        "version": "3.0",
+        "tabs": [
+            {"id": "main", "name": "Main", "order": 0},
+            {"id": "side", "name": "Side", "order": 1},
+        ],
+        "nodes": [
+            _node("start_1", "start", "main"),
+            _node(
+                "prompt_1",
+                "prompt",
+                "main",
+                {"name": "Main", "file_path": "main.prompt.md"},
+            ),
+            _node(
+                "agent_1", "agent", "main", {"name": "MainAgent", "description": "Main"}
+            ),
+            _node(
+                "prompt_2",
+                "prompt",
+                "side",
+                {"name": "Side", "file_path": "side.prompt.md"},
+            ),
+            _node(
+                "agent_2", "agent", "side", {"name": "SideAgent", "description": "Side"}
+            ),
+        ],
+        "edges": [
+            {"id": "e1", "source": "start_1", "target": "agent_1"},
+            {"id": "e2", "source": "prompt_1", "target": "agent_1"},
+            {"id": "e3", "source": "prompt_2", "target": "agent_2"},
+        ],
+        "settings": {},
+    }
+    (tmp_path / "manifest.json").write_text(json.dumps(manifest))
+    (tmp_path / "prompts").mkdir()
+    (tmp_path / "prompts" / "main.prompt.md").write_text("Be helpful.")
+    (tmp_path / "prompts" / "side.prompt.md").write_text("Be brief.")
+    return tmp_path
+
+
+def _touch(path, content):
+    """Rewrite a file and push its mtime forward so the change is visible."""
+    st = path.stat() if path.exists() else None
+    path.write_text(content)
+    if st is not None:
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+def _rename_agent(project_path, node_id, name):
+    manifest_path = project_path / "manifest.json"
+    manifest = json.loads(manifest_path.read_text())
+    for node in manifest["nodes"]:
+        if node["id"] == node_id:
+            node["data"]["config"]["name"] = name
+    _touch(manifest_path, json.dumps(manifest))
+
+
+@pytest.fixture
+def spied():
+    """IncrementalCompiler that records file reads and tab parses."""
+    compiler = IncrementalCompiler()
+    reads: list[str] = []
+    parses: list[str] = []
+
+    loader = compiler.compiler.loader
+    read_file_ref = loader._read_file_ref
+
+    def record_read(project_path, ref):
+        reads.append(ref.file_path)
+        return read_file_ref(project_path, ref)
+
+    parser = compiler.compiler.parser
+    parse_tab = parser.parse_tab
+
+    def record_parse(tab):
+        parses.append(tab.id)
+        return parse_tab(tab)
+
+    loader._read_file_ref = record_read
+    parser.parse_tab = record_parse
+    return compiler, reads, parses
+
+
+def _instructions(ir):
+    return {agent.name: agent.instruction for agent in ir.all_agents.values()}
+
+
+class TestIncrementalCompiler:
+    """Tests for IncrementalCompiler.compile."""
+
+    def test_first_compile_is_full(self, two_tab_project, spied):
+        compiler, reads, parses = spied
+        ir = compiler.compile(two_tab_project)
+
+        assert sorted(reads) == ["main.prompt.md", "side.prompt.md"]
+        assert sorted(parses) == ["main", "side"]
+        assert "Be helpful." in _instructions(ir)["MainAgent"]
+
+    def test_unchanged_project_reuses_ir(self, two_tab_project, spied):
+        compiler, reads, parses = spied
+        first = compiler.compile(two_tab_project)
+        reads.clear()
+        parses.clear()
+
+        second = compiler.compile(two_tab_project)
+
+        assert reads == [] and parses == []
+        assert second is not first
+        assert _instructions(second) == _instructions(first)
+
+    def test_result_is_isolated_from_mutation(self, two_tab_project):
+        compiler = IncrementalCompiler()
+        first = compiler.compile(two_tab_project)
+        first.root_agent.context_vars["leak"] = "value"
+
+        second = compiler.compile(two_tab_project)
+        assert "leak" not in second.root_agent.context_vars
+
+    def test_prompt_change_rereads_only_that_file(self, two_tab_project, spied):
+        compiler, reads, parses = spied
+        compiler.compile(two_tab_project)
+        reads.clear()
+        parses.clear()
+
+        _touch(two_tab_project / "prompts" / "side.prompt.md", "Be terse.")
+        ir = compiler.compile(two_tab_project)
+
+        assert reads == ["side.prompt.md"]
+        assert parses == []
+        assert "Be terse." in _instructions(ir)["SideAgent"]
+        assert "Be helpful." in _instructions(ir)["MainAgent"]
+
+    def test_manifest_change_reparses_only_changed_tab(self, two_tab_project, spied):
+        compiler, reads, parses = spied
+        compiler.compile(two_tab_project)
+        reads.clear()
+        parses.clear()
+
+        _rename_agent(two_tab_project, "agent_2", "RenamedAgent")
+        ir = compiler.compile(two_tab_project)
+
+        assert reads == []
+        assert parses == ["side"]
+        assert set(_instructions(ir)) == {"MainAgent", "RenamedAgent"}
+
+    def test_explicit_changed_paths(self, two_tab_project, spied):
+        compiler, reads, _ = spied
+        compiler.compile(two_tab_project)
+        reads.clear()
+
+        (two_tab_project / "prompts" / "main.prompt.md").write_text("Be bold.")
+        ir = compiler.compile(two_tab_project, changed_paths=["prompts/main.prompt.md"])
+
+        assert reads == ["main.prompt.md"]
+        assert "Be bold." in _instructions(ir)["MainAgent"]
+
+    def test_untracked_changed_path_reuses_ir(self, two_tab_project, spied):
+        compiler, reads, parses = spied
+        compiler.compile(two_tab_project)
+        reads.clear()
+        parses.clear()
+
+        (two_tab_project / "notes.txt").write_text("unrelated")
+        compiler.compile(two_tab_project, changed_paths=["notes.txt"])
+
+        assert reads == [] and parses == []
+
+    def test_shadowing_file_is_picked_up(self, two_tab_project):
+        compiler = IncrementalCompiler()
+        compiler.compile(two_tab_project)
+
+        # A file at the direct path now takes precedence over prompts/
+        (two_tab_project / "main.prompt.md").write_text("Shadowed.")
+        ir = compiler.compile(two_tab_project)
+
+        assert "Shadowed." in _instructions(ir)["MainAgent"]
+
+    def test_variable_nodes_force_full_compile(self, two_tab_project, spied):
+        manifest_path = two_tab_project / "manifest.json"
+        manifest = json.loads(manifest_path.read_text())
+        manifest["nodes"].append(
+            _node(
+                "var_1",
+                "variable",
+                "main",
+                {"name": "Vars", "isGlobal": True, "variables": []},
+            )
+        )
+        manifest_path.write_text(json.dumps(manifest))
+
+        compiler, reads, parses = spied
+        compiler.compile(two_tab_project)
+        reads.clear()
+        parses.clear()
+
+        _touch(two_tab_project / "prompts" / "side.prompt.md", "Be terse.")
+        compiler.compile(two_tab_project)
+
+        assert sorted(reads) == ["main.prompt.md", "side.prompt.md"]
+        assert sorted(parses) == ["main", "side"]
+
+    def test_validate_flag_change_is_full_compile(self, two_tab_project, spied):
+        compiler, _, parses = spied
+        compiler.compile(two_tab_project, validate=True)
+        parses.clear()
+
+        compiler.compile(two_tab_project, validate=False)
+        assert sorted(parses) == ["main", "side"]
+
+    def test_invalidate(self, two_tab_project, spied):
+        compiler, _, parses = spied
+        compiler.compile(two_tab_project)
+        parses.clear()
+
+        compiler.invalidate(two_tab_project)
+        compiler.compile(two_tab_project)
+        assert sorted(parses) == ["main", "side"]
+
+    def test_deleted_prompt_raises_and_retries(self, two_tab_project):
+        from adkflow_runner.errors import PromptLoadError
+
+        compiler = IncrementalCompiler()
+        compiler.compile(two_tab_project)
+
+        prompt = two_tab_project / "prompts" / "side.prompt.md"
+        prompt.unlink()
+        with pytest.raises(PromptLoadError):
+            compiler.compile(two_tab_project)
+
+        prompt.write_text("Back again.")
+        ir = compiler.compile(two_tab_project)
+        assert "Back again." in _instructions(ir)["SideAgent"]
+
+    def test_notified_change_with_same_stamp(self, two_tab_project, spied):
+        compiler, reads, _ = spied
+        compiler.compile(two_tab_project)
+        reads.clear()
+
+        # Same size, mtime restored: invisible to stamp comparison
+        prompt = two_tab_project / "prompts" / "main.prompt.md"
+        st = prompt.stat()
+        prompt.write_text("Be careful.")
+        os.utime(prompt, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+        compiler.notify_changed(two_tab_project, ["prompts/main.prompt.md"])
+        ir = compiler.compile(two_tab_project)
+
+        assert reads == ["main.prompt.md"]
+        assert "Be careful." in _instructions(ir)["MainAgent"]
+
+    def test_notified_change_kept_with_explicit_paths(self, two_tab_project, spied):
+        compiler, reads, _ = spied
+        compiler.compile(two_tab_project)
+        reads.clear()
+
+        prompt = two_tab_project / "prompts" / "main.prompt.md"
+        st = prompt.stat()
+        prompt.write_text("Be careful.")
+        os.utime(prompt, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+        compiler.notify_changed(two_tab_project, ["prompts/main.prompt.md"])
+        ir = compiler.compile(two_tab_project, changed_paths=["notes.txt"])
+
+        assert reads == ["main.prompt.md"]
+        assert "Be careful." in _instructions(ir)["MainAgent"]
+
+    def test_notified_change_survives_failed_load(
+        self, two_tab_project, monkeypatch
+    ):
+        compiler = IncrementalCompiler()
+        compiler.compile(two_tab_project)
+
+        prompt = two_tab_project / "prompts" / "main.prompt.md"
+        st = prompt.stat()
+        prompt.write_text("Be careful.")
+        os.utime(prompt, ns=(st.st_atime_ns, st.st_mtime_ns))
+        compiler.notify_changed(two_tab_project, ["prompts/main.prompt.md"])
+
+        def fail_reload(previous, changed_paths):
+            raise OSError("disk went away")
+
+        loader = compiler.compiler.loader
+        monkeypatch.setattr(loader, "reload", fail_reload)
+        with pytest.raises(OSError):
+            compiler.compile(two_tab_project)
+        monkeypatch.undo()
+
+        ir = compiler.compile(two_tab_project)
+        assert "Be careful." in _instructions(ir)["MainAgent"]
+
+    def test_registry_reload_is_full_compile(
+        self, two_tab_project, spied, monkeypatch
+    ):
+        import adkflow_runner.compiler.incremental as incremental
+
+        compiler, reads, parses = spied
+        monkeypatch.setattr(incremental, "_registry_generation", lambda: 1)
+        first = compiler.compile(two_tab_project)
+        reads.clear()
+        parses.clear()
+
+        monkeypatch.setattr(incremental, "_registry_generation", lambda: 2)
+        ir = compiler.compile(two_tab_project)
+
+        assert ir is not first
+        assert sorted(reads) == ["main.prompt.md", "side.prompt.md"]
+        assert sorted(parses) == ["main", "side"]
+
+    def test_state_is_bounded(self, tmp_path, two_tab_project):
+        compiler = IncrementalCompiler(max_projects=1)
+        compiler.compile(two_tab_project)
+
+        other = tmp_path.parent / f"{tmp_path.name}-other"
+        shutil.copytree(two_tab_project, other)
+        compiler.compile(other)
+
+        assert list(compiler._states) == [other.resolve()]
+
+    def test_projects_do_not_share_a_lock(self, tmp_path, two_tab_project):
+        compiler = IncrementalCompiler()
+        with compiler._project_lock((tmp_path / "busy").resolve()):
+            ir = compiler.compile(two_tab_project)
+        assert ir.root_agent is not None
+
+
+class TestIncrementalValidate:
+    """Tests for IncrementalCompiler.validate."""
+
+    def test_validate_reuses_load(self, two_tab_project, spied):
+        compiler, reads, parses = spied
+        project, graph, result = compiler.validate(two_tab_project)
+        assert result.valid
+        assert len(project.tabs) == 2
+        assert len(graph.get_agent_nodes()) == 2
+
+        reads.clear()
+        parses.clear()
+        compiler.validate(two_tab_project)
+        compiler.compile(two_tab_project)
+
+        assert reads == [] and parses == []
+
+    def test_validate_picks_up_changes(self, two_tab_project, spied):
+        compiler, _, parses = spied
+        compiler.compile(two_tab_project)
+        parses.clear()
+
+        _rename_agent(two_tab_project, "agent_2", "RenamedAgent")
+        _, graph, _ = compiler.validate(two_tab_project)
+
+        assert parses == ["side"]
+        assert {n.name for n in graph.get_agent_nodes()} == {
+            "MainAgent",
+            "RenamedAgent",
+        }
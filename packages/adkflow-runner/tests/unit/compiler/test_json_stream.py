@@ -0,0 +1,85 @@
+"""Tests for incremental JSON loading."""
+
+import io
+import json
+
+import pytest
+
+from adkflow_runner.compiler.json_stream import load_json_stream
+
+DOCUMENTS = [
+    {},
+    {"a": []},
+    {"name": "x", "version": "3.0", "flag": True, "none": None},
+    {"numbers": [1, 22, 333, -4.5e10, 123456789012345678901234567890]},
+    {"nested": {"list": [{"k": "v" * 100}] * 20}, "tail": 12345},
+    {"unicode": "café ☃", "escaped": 'quote " and \\ backslash'},
+    [1, 2, 3],
+    "plain",
+]
+
+SCALARS = {
+    "float": 3.25,
+    "exponent": -1.5e-07,
+    "int": 1234567,
+    "true": True,
+    "false": False,
+    "null": None,
+    "list": [1, 2.0, 3e5, True, None],
+}
+
+
+class _SplitReader(io.StringIO):
+    """Text file whose first read stops at a given offset."""
+
+    def __init__(self, text: str, split: int):
+        super().__init__(text)
+        self.split = split
+
+    def read(self, size: int | None = -1) -> str:
+        if self.split:
+            size, self.split = self.split, 0
+        return super().read(size)
+
+
+class TestLoadJsonStream:
+    """Tests for load_json_stream."""
+
+    @pytest.mark.parametrize("document", DOCUMENTS)
+    @pytest.mark.parametrize("chunk_size", [1, 3, 7, 64 * 1024])
+    @pytest.mark.parametrize("indent", [None, 2])
+    def test_matches_json_load(self, document, chunk_size, indent):
+        text = json.dumps(document, indent=indent, ensure_ascii=False)
+        assert load_json_stream(io.StringIO(text), chunk_size) == document
+
+    @pytest.mark.parametrize("indent", [None, 2])
+    def test_chunk_boundary_at_every_offset(self, indent):
+        text = json.dumps(SCALARS, indent=indent)
+        for split in range(1, len(text)):
+            reader = _SplitReader(text, split)
+            assert load_json_stream(reader, chunk_size=64 * 1024) == SCALARS, split
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "",
+            "{",
+            '{"a": 1,}',
+            '{"a": 1 "b": 2}',
+            '{"a": [1, 2}',
+            '{"a": 1} extra',
+            "{a: 1}",
+        ],
+    )
+    def test_malformed_input(self, text):
+        with pytest.raises(json.JSONDecodeError):
+            load_json_stream(io.StringIO(text), chunk_size=4)
+
+    def test_error_line_is_relative_to_file(self):
+        lines = ["{", '  "nodes": ['] + ['    {"id": 1},'] * 50 + ["    oops", "  ]}"]
+        text = "\n".join(lines)
+
+        with pytest.raises(json.JSONDecodeError) as exc_info:
+            load_json_stream(io.StringIO(text), chunk_size=16)
+
+        assert exc_info.value.lineno == 53
@@ -15,12 +15,15 @@ from pathlib import Path
 
 import pytest
 
+from adkflow_runner.compiler.compiler import Compiler
 from adkflow_runner.compiler.loader import (
+    STREAM_THRESHOLD_BYTES,
     LoadedPrompt,
     LoadedTab,
     LoadedTool,
     ProjectLoader,
 )
+from adkflow_runner.config import ExecutionConfig
 from adkflow_runner.errors import CompilationError, PromptLoadError, ToolLoadError
 
 
@@ -172,6 +175,91 @@ class TestProjectLoader:
         assert tab2 is not None
         assert len(tab2.flow_data["edges"]) == 0
 
+    def test_load_project_nodes_without_tab_are_dropped(self, tmp_path: Path):
+        """Nodes with no or unknown tabId are not assigned to any tab."""
+        manifest = {
+            "name": "test",
+            "version": "3.0",
+            "tabs": [{"id": "tab1", "name": "Tab1"}],
+            "nodes": [
+                {"id": "n1", "type": "agent", "data": {"tabId": "tab1"}},
+                {"id": "n2", "type": "agent", "data": {}},
+                {"id": "n3", "type": "agent", "data": {"tabId": "gone"}},
+            ],
+            "edges": [
+                {"id": "e1", "source": "n2", "target": "n1"},
+                {"id": "e2", "source": "n2", "target": "missing"},
+            ],
+        }
+        (tmp_path / "manifest.json").write_text(json.dumps(manifest))
+
+        project = ProjectLoader().load(tmp_path)
+
+        tab1 = project.get_tab("tab1")
+        assert tab1 is not None
+        assert [n["id"] for n in tab1.flow_data["nodes"]] == ["n1"]
+        assert tab1.flow_data["edges"] == []
+
+    def test_load_project_node_without_id_is_kept(self, tmp_path: Path):
+        """A node with no id stays in its tab and does not break edge bucketing."""
+        manifest = {
+            "name": "test",
+            "version": "3.0",
+            "tabs": [{"id": "tab1", "name": "Tab1"}],
+            "nodes": [
+                {"type": "agent", "data": {"tabId": "tab1"}},
+                {"id": "n1", "type": "agent", "data": {"tabId": "tab1"}},
+            ],
+            "edges": [{"id": "e1", "source": "n1", "target": "n1"}],
+        }
+        (tmp_path / "manifest.json").write_text(json.dumps(manifest))
+
+        project = ProjectLoader().load(tmp_path)
+
+        tab1 = project.get_tab("tab1")
+        assert tab1 is not None
+        assert len(tab1.flow_data["nodes"]) == 2
+        assert [e["id"] for e in tab1.flow_data["edges"]] == ["e1"]
+
+    def test_compiler_passes_stream_threshold(self):
+        """ExecutionConfig.manifest_stream_threshold reaches the loader."""
+        assert Compiler().loader.stream_threshold == STREAM_THRESHOLD_BYTES
+        config = ExecutionConfig(manifest_stream_threshold=None)
+        assert Compiler(config).loader.stream_threshold is None
+
+    def test_streamed_manifest_matches_regular_load(self, tmp_path: Path):
+        """Streaming parse produces the same tabs as json.load."""
+        manifest = {
+            "name": "test",
+            "version": "3.0",
+            "tabs": [{"id": "tab1", "name": "Tab1"}, {"id": "tab2", "name": "T2"}],
+            "nodes": [
+                {"id": f"n{i}", "type": "agent", "data": {"tabId": f"tab{i % 2 + 1}"}}
+                for i in range(50)
+            ],
+            "edges": [
+                {"id": f"e{i}", "source": f"n{i}", "target": f"n{i + 2}"}
+                for i in range(48)
+            ],
+            "settings": {"customNodes": {"maxConcurrency": 4}},
+        }
+        (tmp_path / "manifest.json").write_text(json.dumps(manifest, indent=2))
+
+        regular = ProjectLoader(stream_threshold=None).load(tmp_path)
+        streamed = ProjectLoader(stream_threshold=0).load(tmp_path)
+
+        assert streamed.tabs == regular.tabs
+        assert streamed.settings == regular.settings
+
+    def test_streamed_manifest_invalid_json(self, tmp_path: Path):
+        """Streaming parse reports invalid JSON as a CompilationError."""
+        (tmp_path / "manifest.json").write_text('{"name": "x",\n "tabs": [}')
+
+        loader = ProjectLoader(stream_threshold=0)
+        with pytest.raises(CompilationError, match="Invalid JSON") as exc_info:
+            loader.load(tmp_path)
+        assert exc_info.value.location.line == 2
+
 
 class TestProjectLoaderPrompts:
     """Tests for prompt file loading."""
@@ -319,6 +407,99 @@ class TestProjectLoaderTools:
             loader.load(tmp_path)
 
 
+class TestProjectLoaderParallel:
+    """Tests for concurrent loading of referenced files."""
+
+    @staticmethod
+    def _write_project(tmp_path: Path, count: int, missing: set[int] = set()):
+        nodes = []
+        (tmp_path / "prompts").mkdir()
+        (tmp_path / "static").mkdir()
+        (tmp_path / "tools").mkdir()
+        for i in range(count):
+            kind = ("prompt", "context", "tool")[i % 3]
+            directory, suffix = {
+                "prompt": ("prompts", ".prompt.md"),
+                "context": ("static", ".txt"),
+                "tool": ("tools", ".py"),
+            }[kind]
+            file_name = f"file{i}{suffix}"
+            if i not in missing:
+                (tmp_path / directory / file_name).write_text(f"content {i}")
+            nodes.append(
+                {
+                    "id": f"n{i}",
+                    "type": kind,
+                    "data": {"tabId": "tab1", "config": {"file_path": file_name}},
+                }
+            )
+        manifest = {
+            "name": "test",
+            "version": "3.0",
+            "tabs": [{"id": "tab1", "name": "Main"}],
+            "nodes": nodes,
+            "edges": [],
+        }
+        (tmp_path / "manifest.json").write_text(json.dumps(manifest))
+
+    def test_parallel_load_matches_sequential(self, tmp_path: Path):
+        """Thread pool loading produces the same project as one worker."""
+        self._write_project(tmp_path, 60)
+
+        sequential = ProjectLoader(max_workers=1).load(tmp_path)
+        parallel = ProjectLoader(max_workers=8).load(tmp_path)
+
+        assert parallel.prompts == sequential.prompts
+        assert parallel.tools == sequential.tools
+        assert parallel.source_files == sequential.source_files
+        assert len(parallel.prompts) == 40
+        assert parallel.get_tool("file2.py").code == "content 2"
+
+    def test_first_failing_node_is_reported(self, tmp_path: Path):
+        """Errors are raised in node order, not completion order."""
+        self._write_project(tmp_path, 30, missing={4, 20})
+
+        with pytest.raises(PromptLoadError, match="file4.txt"):
+            ProjectLoader(max_workers=8).load(tmp_path)
+
+    def test_duplicate_references_loaded_once(self, tmp_path: Path):
+        """A file referenced by several nodes keeps the first node's name."""
+        (tmp_path / "prompts").mkdir()
+        (tmp_path / "prompts" / "shared.prompt.md").write_text("shared")
+        manifest = {
+            "name": "test",
+            "version": "3.0",
+            "tabs": [{"id": "tab1", "name": "Main"}],
+            "nodes": [
+                {
+                    "id": f"p{i}",
+                    "type": "prompt",
+                    "data": {
+                        "tabId": "tab1",
+                        "config": {"name": f"P{i}", "file_path": "shared.prompt.md"},
+                    },
+                }
+                for i in range(3)
+            ],
+            "edges": [],
+        }
+        (tmp_path / "manifest.json").write_text(json.dumps(manifest))
+
+        project = ProjectLoader().load(tmp_path)
+
+        assert len(project.prompts) == 1
+        assert project.prompts["shared.prompt.md"].name == "P0"
+
+    async def test_load_async(self, tmp_path: Path):
+        """load_async returns the same project as load."""
+        self._write_project(tmp_path, 6)
+
+        loader = ProjectLoader()
+        project = await loader.load_async(tmp_path)
+
+        assert project.prompts == loader.load(tmp_path).prompts
+
+
 class TestLoadedProject:
     """Tests for LoadedProject helper methods."""
 
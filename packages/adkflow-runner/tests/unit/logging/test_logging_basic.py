@@ -6,11 +6,14 @@ Tests LogLevel, LogRecord, Logger, and integration.
 from __future__ import annotations
 
 from datetime import datetime
+from unittest.mock import patch
 
 import pytest
 
 from adkflow_runner.logging import (
+    CategoryRegistry,
     LogConfig,
+    Logger,
     LogLevel,
     LogRecord,
     configure_logging,
@@ -173,3 +176,45 @@ class TestLoggerIntegration:
         log.debug(lambda: expensive_fn())
         # With ERROR level, debug should not be called
         # Note: actual behavior depends on implementation
+
+
+class TestCachedLevels:
+    """Tests for the logger's cached level resolution."""
+
+    def _logger(self, category):
+        registry = CategoryRegistry()
+        return Logger(category, registry=registry), registry
+
+    def test_changes_invalidate_cache(self):
+        log, registry = self._logger("cache.child")
+        assert log.is_enabled_for(LogLevel.INFO)
+        assert not log.is_enabled_for(LogLevel.DEBUG)
+
+        registry.set_level("cache", LogLevel.DEBUG)
+        assert log.is_enabled_for(LogLevel.DEBUG)
+
+        registry.set_enabled("cache", False)
+        assert not log.is_enabled_for(LogLevel.CRITICAL)
+
+        registry.set_enabled("cache", True)
+        registry.clear_level("cache")
+        assert not log.is_enabled_for(LogLevel.DEBUG)
+
+        registry.set_default_level(LogLevel.WARNING)
+        assert not log.is_enabled_for(LogLevel.INFO)
+
+    def test_disabled_calls_do_not_resolve(self):
+        log, registry = self._logger("cache.hot")
+        log.debug("warm up")
+
+        with patch.object(registry, "resolve", side_effect=AssertionError):
+            for _ in range(100):
+                log.debug("discarded")
+
+    def test_resolve_reports_generation(self):
+        _, registry = self._logger("cache.gen")
+        generation, threshold = registry.resolve("cache.gen")
+        assert threshold == LogLevel.INFO
+
+        registry.set_level("cache.gen", LogLevel.ERROR)
+        assert registry.resolve("cache.gen") == (generation + 1, LogLevel.ERROR)
@@ -167,6 +167,27 @@ class TestLogConfigFromManifest:
         assert config.file.retain == 10
         assert config.file.clear_before_run is True
 
+    def test_load_from_manifest_durability_and_overflow(self, tmp_path):
+        """Durability and overflow are parsed, unknown values fall back."""
+        manifest_file = tmp_path / "manifest.json"
+        manifest_file.write_text(
+            __import__("json").dumps(
+                {"logging": {"file": {"durability": "FSYNC", "overflow": "block"}}}
+            )
+        )
+        config = LogConfig.load(project_path=tmp_path)
+        assert config.file.durability == "fsync"
+        assert config.file.overflow == "block"
+
+        manifest_file.write_text(
+            __import__("json").dumps(
+                {"logging": {"file": {"durability": "disk", "overflow": 3}}}
+            )
+        )
+        config = LogConfig.load(project_path=tmp_path)
+        assert config.file.durability == "flush"
+        assert config.file.overflow == "drop"
+
     def test_load_from_manifest_with_console_config(self, tmp_path):
         """Load config from manifest with console configuration."""
         manifest = {
@@ -1,10 +1,11 @@
 """Tests for log handlers.
 
-Tests ConsoleHandler, NullHandler, and RotatingFileHandler.
+Tests ConsoleHandler, NullHandler, RotatingFileHandler and QueueHandler.
 """
 
 from __future__ import annotations
 
+import threading
 from datetime import datetime
 from io import StringIO
 from unittest.mock import MagicMock, Mock
@@ -16,6 +17,7 @@ from adkflow_runner.logging import (
     LogLevel,
     LogRecord,
     NullHandler,
+    QueueHandler,
     RotatingFileHandler,
     reset_config,
     reset_loggers,
@@ -339,3 +341,253 @@ class TestRotatingFileHandlerClearOnInit:
         content = log_file.read_text()
         assert "Old content" in content
         assert "New message" in content
+
+
+def _record(message: str, level: LogLevel = LogLevel.INFO) -> LogRecord:
+    return LogRecord(
+        level=level, category="test", message=message, timestamp=datetime.now()
+    )
+
+
+class _GatedHandler(NullHandler):
+    """Collects batches; writes wait until the gate is opened."""
+
+    def __init__(self) -> None:
+        self.batches: list[list[str]] = []
+        self.gate = threading.Event()
+        self.gate.set()
+
+    def emit_batch(self, records) -> None:
+        self.gate.wait()
+        self.batches.append([r.message for r in records])
+
+
+class TestQueueHandler:
+    """Tests for QueueHandler background batched writes."""
+
+    def test_writes_queued_records_in_batches(self, tmp_path):
+        target = RotatingFileHandler(log_dir=tmp_path, filename="q.jsonl")
+        handler = QueueHandler(target, batch_size=10, flush_interval=10)
+
+        for i in range(25):
+            handler.emit(_record(f"message {i}"))
+        handler.flush()
+
+        lines = (tmp_path / "q.jsonl").read_text().splitlines()
+        assert len(lines) == 25
+        assert "message 24" in lines[-1]
+        handler.close()
+        assert handler.stats().written == 25
+
+    def test_batches_group_records(self):
+        target = _GatedHandler()
+        handler = QueueHandler(target, batch_size=4, flush_interval=10)
+        target.gate.clear()
+
+        for i in range(9):
+            handler.emit(_record(str(i)))
+        target.gate.set()
+        handler.close()
+
+        assert [m for batch in target.batches for m in batch] == [
+            str(i) for i in range(9)
+        ]
+        assert all(len(batch) <= 4 for batch in target.batches)
+        assert len(target.batches) < 9
+
+    def test_flush_interval_writes_partial_batch(self):
+        target = _GatedHandler()
+        handler = QueueHandler(target, batch_size=100, flush_interval=0.01)
+
+        handler.emit(_record("lonely"))
+        for _ in range(200):
+            if target.batches:
+                break
+            threading.Event().wait(0.01)
+
+        assert target.batches == [["lonely"]]
+        handler.close()
+
+    def test_drop_policy_counts_overflow(self):
+        target = _GatedHandler()
+        target.gate.clear()
+        handler = QueueHandler(target, max_queue=3, batch_size=1, flush_interval=0)
+
+        # The writer takes this one and waits at the gate
+        handler.emit(_record("taken by writer"))
+        for _ in range(200):
+            if handler.stats().queued == 0:
+                break
+            threading.Event().wait(0.01)
+        for i in range(5):
+            handler.emit(_record(str(i)))
+
+        stats = handler.stats()
+        assert stats.queued == 3
+        assert stats.dropped == 2
+        target.gate.set()
+        handler.close()
+        assert handler.stats().written == 4
+
+    def test_block_policy_waits_for_space(self):
+        target = _GatedHandler()
+        target.gate.clear()
+        handler = QueueHandler(
+            target, max_queue=1, batch_size=1, flush_interval=0, overflow="block"
+        )
+
+        def produce():
+            for i in range(4):
+                handler.emit(_record(str(i)))
+
+        producer = threading.Thread(target=produce)
+        producer.start()
+        producer.join(timeout=0.05)
+        assert producer.is_alive()
+
+        target.gate.set()
+        producer.join(timeout=5)
+        handler.close()
+
+        assert not producer.is_alive()
+        assert [m for batch in target.batches for m in batch] == ["0", "1", "2", "3"]
+        assert handler.stats().dropped == 0
+
+    def test_emit_after_close_is_dropped(self):
+        handler = QueueHandler(_GatedHandler())
+        handler.close()
+        handler.close()
+
+        handler.emit(_record("late"))
+
+        assert handler.stats().dropped == 1
+
+    def test_target_errors_are_counted(self):
+        class FailingHandler(NullHandler):
+            def emit_batch(self, records) -> None:
+                raise OSError("disk full")
+
+        handler = QueueHandler(FailingHandler())
+        handler.emit(_record("lost", LogLevel.ERROR))
+        handler.flush()
+
+        assert handler.stats().errors == 1
+        handler.close()
+
+    def test_logger_file_output_is_queued(self, tmp_path):
+        from adkflow_runner.logging import LogConfig, Logger, get_logger
+
+        config = LogConfig(project_path=tmp_path)
+        config.console.enabled = False
+        Logger.initialize(config=config)
+        [handler] = Logger._handlers
+        assert isinstance(handler, QueueHandler)
+
+        get_logger("runner").info("queued message")
+        Logger.flush()
+
+        content = (tmp_path / "logs" / "adkflow.jsonl").read_text()
+        assert "queued message" in content
+
+    def test_clear_discards_queued_records(self, tmp_path):
+        target = RotatingFileHandler(log_dir=tmp_path, filename="q.jsonl")
+        handler = QueueHandler(target, flush_interval=10)
+        handler.emit(_record("written"))
+        handler.flush()
+        handler.emit(_record("queued"))
+
+        handler.clear()
+        handler.emit(_record("after clear"))
+        handler.close()
+
+        lines = (tmp_path / "q.jsonl").read_text().splitlines()
+        assert len(lines) == 1
+        assert "after clear" in lines[0]
+
+
+class TestLoggerReinitialize:
+    """Tests for Logger.initialize being called once per run."""
+
+    @pytest.fixture
+    def config(self, tmp_path):
+        from adkflow_runner.logging import LogConfig
+
+        config = LogConfig(project_path=tmp_path)
+        config.console.enabled = False
+        return config
+
+    def test_unchanged_config_keeps_writer(self, config):
+        from adkflow_runner.logging import Logger
+
+        Logger.initialize(config=config)
+        [handler] = Logger._handlers
+        Logger.initialize(config=config)
+
+        assert Logger._handlers == [handler]
+        assert handler._thread.is_alive()
+
+    def test_clear_before_run_on_reuse(self, config, tmp_path):
+        from adkflow_runner.logging import Logger, get_logger
+
+        Logger.initialize(config=config)
+        [handler] = Logger._handlers
+        get_logger("runner").info("first run")
+        Logger.flush()
+
+        config.file.clear_before_run = True
+        Logger.initialize(config=config)
+        get_logger("runner").info("second run")
+        Logger.flush()
+
+        assert Logger._handlers == [handler]
+        content = (tmp_path / "logs" / "adkflow.jsonl").read_text()
+        assert "first run" not in content
+        assert "second run" in content
+
+    def test_changed_config_rebuilds_handlers(self, config):
+        from adkflow_runner.logging import Logger
+
+        Logger.initialize(config=config)
+        [handler] = Logger._handlers
+        config.file.durability = "fsync"
+        Logger.initialize(config=config)
+
+        assert Logger._handlers != [handler]
+        assert not handler._thread.is_alive()
+
+    def test_added_handler_rebuilds_handlers(self, config):
+        from adkflow_runner.logging import Logger
+
+        Logger.initialize(config=config)
+        Logger.add_handler(NullHandler())
+        Logger.initialize(config=config)
+
+        assert len(Logger._handlers) == 1
+
+
+class TestFileDurability:
+    """Tests for RotatingFileHandler durability levels."""
+
+    def test_none_buffers_until_flush(self, tmp_path):
+        handler = RotatingFileHandler(
+            log_dir=tmp_path, filename="d.jsonl", durability="none"
+        )
+        handler.emit(_record("buffered"))
+        assert (tmp_path / "d.jsonl").read_text() == ""
+
+        handler.flush()
+        assert "buffered" in (tmp_path / "d.jsonl").read_text()
+        handler.close()
+
+    def test_fsync_syncs_each_batch(self, tmp_path, monkeypatch):
+        synced = []
+        monkeypatch.setattr("os.fsync", synced.append)
+        handler = RotatingFileHandler(
+            log_dir=tmp_path, filename="d.jsonl", durability="fsync"
+        )
+
+        handler.emit_batch([_record("a"), _record("b")])
+
+        assert len(synced) == 1
+        assert len((tmp_path / "d.jsonl").read_text().splitlines()) == 2
+        handler.close()
@@ -0,0 +1,254 @@
+"""Tests for per-run log files and the run index."""
+
+from __future__ import annotations
+
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+from adkflow_runner.logging import (
+    LogConfig,
+    Logger,
+    LogLevel,
+    LogRecord,
+    NullHandler,
+    RunLogHandler,
+    get_logger,
+    read_run_index,
+    reset_config,
+    reset_loggers,
+    reset_registry,
+    retire_runs,
+    run_context,
+)
+from adkflow_runner.logging.constants import RUN_INDEX_FILE_NAME
+
+_START = datetime(2024, 1, 1, 10, 0, 0)
+
+
+@pytest.fixture(autouse=True)
+def reset_logging_state():
+    """Reset logging state before each test."""
+    reset_config()
+    reset_loggers()
+    reset_registry()
+    yield
+    reset_config()
+    reset_loggers()
+    reset_registry()
+
+
+class _Collector(NullHandler):
+    def __init__(self) -> None:
+        self.messages: list[str] = []
+
+    def emit_batch(self, records) -> None:
+        self.messages.extend(r.message for r in records)
+
+
+def _record(
+    message: str,
+    run_id: str | None,
+    level: LogLevel = LogLevel.INFO,
+    seconds: int = 0,
+) -> LogRecord:
+    return LogRecord(
+        timestamp=_START + timedelta(seconds=seconds),
+        level=level,
+        category="runner",
+        message=message,
+        context={"run_id": run_id} if run_id else {},
+    )
+
+
+class TestRunLogHandler:
+    """Tests for writing run records to their own files."""
+
+    def test_partitions_records_by_run(self, tmp_path):
+        fallback = _Collector()
+        handler = RunLogHandler(tmp_path, fallback=fallback)
+
+        handler.emit_batch(
+            [
+                _record("a1", "run-a"),
+                _record("b1", "run-b"),
+                _record("outside", None),
+                _record("a2", "run-a"),
+            ]
+        )
+        handler.close()
+
+        lines = (tmp_path / "run-a.jsonl").read_text().splitlines()
+        assert [json.loads(line)["message"] for line in lines] == ["a1", "a2"]
+        assert json.loads(lines[0])["run_id"] == "run-a"
+        assert (tmp_path / "run-b.jsonl").exists()
+        assert fallback.messages == ["outside"]
+
+    def test_unsafe_run_id_is_sanitized(self, tmp_path):
+        handler = RunLogHandler(tmp_path)
+        handler.emit(_record("x", "../escape"))
+        handler.close()
+
+        assert (tmp_path / ".._escape.jsonl").exists()
+        assert not (tmp_path.parent / "escape.jsonl").exists()
+
+    def test_closing_writes_index_segment(self, tmp_path):
+        handler = RunLogHandler(tmp_path)
+        handler.emit(_record("start", "r1", seconds=0))
+        handler.emit(_record("boom", "r1", LogLevel.ERROR, seconds=5))
+        handler.close_run("r1")
+
+        [segment] = [
+            json.loads(line)
+            for line in (tmp_path / RUN_INDEX_FILE_NAME).read_text().splitlines()
+        ]
+        assert segment["run_id"] == "r1"
+        assert segment["start_offset"] == 0
+        assert segment["end_offset"] == (tmp_path / "r1.jsonl").stat().st_size
+        assert segment["entry_count"] == 2
+        assert segment["level_counts"] == {"INFO": 1, "ERROR": 1}
+        assert segment["last_timestamp"] == (_START + timedelta(seconds=5)).isoformat()
+        handler.close()
+
+    def test_evicts_least_recently_used_run_file(self, tmp_path):
+        handler = RunLogHandler(tmp_path, max_open=2)
+        for run_id in ("r1", "r2", "r3"):
+            handler.emit(_record("x", run_id))
+
+        assert len(handler._open) == 2
+        assert "r1" in (tmp_path / RUN_INDEX_FILE_NAME).read_text()
+        handler.close()
+
+
+class TestReadRunIndex:
+    """Tests for summarizing run files from the index."""
+
+    def test_merges_segments_and_scans_unindexed_tail(self, tmp_path):
+        handler = RunLogHandler(tmp_path)
+        handler.emit(_record("first", "r1", seconds=0))
+        handler.close()
+
+        # Reopened and still being written: not in the index yet
+        handler = RunLogHandler(tmp_path)
+        handler.emit(_record("second", "r1", LogLevel.WARNING, seconds=1))
+        handler.emit(_record("other", "r2", seconds=10))
+
+        runs = read_run_index(tmp_path)
+        handler.close()
+
+        assert [r.run_id for r in runs] == ["r2", "r1"]
+        r1 = runs[1]
+        assert r1.entry_count == 2
+        assert r1.level_counts == {"INFO": 1, "WARNING": 1}
+        assert r1.first_timestamp == _START.isoformat()
+        assert r1.indexed_bytes == (tmp_path / "r1.jsonl").stat().st_size
+
+        # Once closed, the index alone covers both segments
+        index_lines = (tmp_path / RUN_INDEX_FILE_NAME).read_text().splitlines()
+        assert len(index_lines) == 3
+        assert [r.entry_count for r in read_run_index(tmp_path)] == [1, 2]
+
+    def test_replaced_file_is_rescanned(self, tmp_path):
+        handler = RunLogHandler(tmp_path)
+        for i in range(3):
+            handler.emit(_record(f"m{i}", "r1"))
+        handler.close()
+
+        (tmp_path / "r1.jsonl").write_text(
+            json.dumps({"timestamp": "t", "level": "ERROR", "message": "new"}) + "\n"
+        )
+
+        [run] = read_run_index(tmp_path)
+        assert run.entry_count == 1
+        assert run.level_counts == {"ERROR": 1}
+
+    def test_missing_directory(self, tmp_path):
+        assert read_run_index(tmp_path / "missing") == []
+
+
+class TestRetireRuns:
+    """Tests for deleting old run files."""
+
+    def test_keeps_newest_runs_and_compacts_index(self, tmp_path):
+        handler = RunLogHandler(tmp_path)
+        for i in range(4):
+            handler.emit(_record("x", f"r{i}", seconds=i))
+            handler.emit(_record("y", f"r{i}", seconds=i))
+        handler.close()
+
+        retired = retire_runs(tmp_path, keep=2)
+
+        assert sorted(retired) == ["r0", "r1"]
+        assert sorted(p.stem for p in tmp_path.glob("*.jsonl")) == ["r2", "r3"]
+        index_lines = (tmp_path / RUN_INDEX_FILE_NAME).read_text().splitlines()
+        assert len(index_lines) == 2
+        assert [r.entry_count for r in read_run_index(tmp_path)] == [2, 2]
+
+    def test_handler_retires_on_start(self, tmp_path):
+        handler = RunLogHandler(tmp_path)
+        for i in range(3):
+            handler.emit(_record("x", f"r{i}", seconds=i))
+        handler.close()
+
+        RunLogHandler(tmp_path, retain_runs=1).close()
+
+        assert [p.stem for p in tmp_path.glob("*.jsonl")] == ["r2"]
+
+    def test_handler_retires_when_run_closes(self, tmp_path):
+        handler = RunLogHandler(tmp_path, retain_runs=2)
+        handler.emit(_record("x", "active", seconds=0))
+        for i in range(1, 4):
+            handler.emit(_record("x", f"r{i}", seconds=i))
+            handler.close_run(f"r{i}")
+
+        # The oldest run is still being written, so it is never retired
+        assert sorted(p.stem for p in tmp_path.glob("*.jsonl")) == [
+            "active",
+            "r2",
+            "r3",
+        ]
+
+        # Once closed it is the oldest run and goes
+        handler.close_run("active")
+        assert [r.run_id for r in read_run_index(tmp_path)] == ["r3", "r2"]
+        handler.close()
+
+
+class TestLoggerPerRunLayout:
+    """Tests for FileConfig.per_run."""
+
+    def test_run_records_go_to_run_file(self, tmp_path):
+        config = LogConfig(project_path=tmp_path)
+        config.console.enabled = False
+        config.file.per_run = True
+        Logger.initialize(config=config)
+        log = get_logger("runner")
+
+        log.info("before run")
+        with run_context("abc123"):
+            log.info("inside run")
+        Logger.flush()
+
+        logs = tmp_path / "logs"
+        assert "inside run" in (logs / "runs" / "abc123.jsonl").read_text()
+        main = (logs / "adkflow.jsonl").read_text()
+        assert "before run" in main
+        assert "inside run" not in main
+
+    def test_close_run_indexes_queued_records(self, tmp_path):
+        config = LogConfig(project_path=tmp_path)
+        config.console.enabled = False
+        config.file.per_run = True
+        config.file.async_writes = True
+        Logger.initialize(config=config)
+        log = get_logger("runner")
+
+        with run_context("abc123"):
+            log.info("inside run")
+        Logger.close_run("abc123")
+
+        index = tmp_path / "logs" / "runs" / RUN_INDEX_FILE_NAME
+        [segment] = [json.loads(line) for line in index.read_text().splitlines()]
+        assert segment["run_id"] == "abc123"
+        assert segment["entry_count"] == 1
@@ -0,0 +1,158 @@
+"""Tests for the warm agent tree pool."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from adkflow_runner.errors import ExecutionError
+from adkflow_runner.ir import (
+    AgentIR,
+    CallbackConfig,
+    CallbackSourceIR,
+    WorkflowIR,
+)
+from adkflow_runner.runner.agent_factory import AgentFactory
+from adkflow_runner.runner.agent_pool import AgentTreePool, fingerprint_agent_tree
+
+
+def _workflow(project_path=None, instruction="Answer {topic}.") -> WorkflowIR:
+    """Sequential root with two LLM agents."""
+    first = AgentIR(
+        id="a1",
+        name="First",
+        type="llm",
+        instruction=instruction,
+        context_vars={"topic": "cats"},
+    )
+    second = AgentIR(id="a2", name="Second", type="llm", instruction="Summarize.")
+    root = AgentIR(id="root", name="Root", type="sequential", subagents=[first, second])
+    return WorkflowIR(
+        root_agent=root,
+        all_agents={"a1": first, "a2": second},
+        project_path=str(project_path) if project_path else None,
+    )
+
+
+class TestFingerprint:
+    """Tests for fingerprint_agent_tree."""
+
+    def test_stable_for_equal_ir(self):
+        assert fingerprint_agent_tree(_workflow()) == fingerprint_agent_tree(
+            _workflow()
+        )
+
+    def test_ignores_context_var_values(self):
+        ir = _workflow()
+        other = _workflow()
+        other.all_agents["a1"].context_vars["topic"] = "dogs"
+        assert fingerprint_agent_tree(ir) == fingerprint_agent_tree(other)
+
+    def test_context_var_names_matter(self):
+        ir = _workflow()
+        other = _workflow()
+        other.all_agents["a1"].context_vars["extra"] = ""
+        assert fingerprint_agent_tree(ir) != fingerprint_agent_tree(other)
+
+    def test_agent_config_matters(self):
+        assert fingerprint_agent_tree(_workflow()) != fingerprint_agent_tree(
+            _workflow(instruction="Answer {topic} briefly.")
+        )
+
+    def test_project_path_matters(self, tmp_path):
+        assert fingerprint_agent_tree(_workflow()) != fingerprint_agent_tree(
+            _workflow(tmp_path)
+        )
+
+    def test_callback_file_change_matters(self, tmp_path):
+        callback = tmp_path / "callbacks.py"
+        callback.write_text("def before_agent(ctx):\n    pass\n")
+        ir = _workflow(tmp_path)
+        ir.all_agents["a2"].callbacks = CallbackConfig(
+            before_agent=CallbackSourceIR(file_path="callbacks.py")
+        )
+        before = fingerprint_agent_tree(ir)
+
+        callback.write_text("def before_agent(ctx):\n    return None\n")
+        assert fingerprint_agent_tree(ir) != before
+
+
+class TestBindRun:
+    """Tests for AgentFactory.bind_run."""
+
+    def test_rebinds_emit_and_hooks(self):
+        factory = AgentFactory()
+        first_emit, first_hooks = MagicMock(), MagicMock()
+        root = factory.create_from_workflow(
+            _workflow(), emit=first_emit, hooks=first_hooks
+        )
+        assert all(h.emit is first_emit for h in factory._emit_handlers)
+
+        second_emit, second_hooks = MagicMock(), MagicMock()
+        assert factory.bind_run(emit=second_emit, hooks=second_hooks) is root
+        for handler in factory._emit_handlers:
+            assert handler.emit is second_emit
+        for handler in factory._hooks_handlers:
+            assert handler.hooks is second_hooks
+        assert len(factory._emit_handlers) == 2
+        assert len(factory._hooks_handlers) == 2
+
+    def test_clears_per_run_results(self):
+        factory = AgentFactory()
+        factory.create_from_workflow(_workflow())
+        factory._finish_reason_handlers["a1"]._last_finish_reason = {"name": "STOP"}
+        factory._response_handlers["a1"]._last_response = "old"
+
+        factory.bind_run()
+
+        assert factory.get_finish_reason("a1") is None
+        assert factory.get_response("a1") is None
+
+    def test_requires_built_tree(self):
+        with pytest.raises(ExecutionError, match="not been built"):
+            AgentFactory().bind_run()
+
+
+class TestAgentTreePool:
+    """Tests for AgentTreePool."""
+
+    def test_miss_then_hit(self):
+        pool = AgentTreePool()
+        ir = _workflow()
+        key = fingerprint_agent_tree(ir)
+        assert pool.acquire(key) is None
+
+        factory = AgentFactory()
+        factory.create_from_workflow(ir, emit=MagicMock())
+        pool.release(key, factory)
+
+        assert pool.acquire(key) is factory
+        assert pool.hits == 1 and pool.misses == 1
+        assert len(pool) == 0
+
+    def test_release_detaches_run(self):
+        pool = AgentTreePool()
+        factory = AgentFactory()
+        factory.create_from_workflow(_workflow(), emit=MagicMock(), hooks=MagicMock())
+
+        pool.release("key", factory)
+
+        assert factory.emit is None and factory.hooks is None
+        assert all(h.emit is None for h in factory._emit_handlers)
+
+    def test_idle_trees_per_key_are_bounded(self):
+        pool = AgentTreePool(max_idle_per_key=1)
+        for _ in range(3):
+            factory = AgentFactory()
+            factory.create_from_workflow(_workflow())
+            pool.release("key", factory)
+        assert len(pool) == 1
+
+    def test_lru_eviction_of_keys(self):
+        pool = AgentTreePool(max_keys=1)
+        for key in ("a", "b"):
+            factory = AgentFactory()
+            factory.create_from_workflow(_workflow())
+            pool.release(key, factory)
+
+        assert pool.acquire("a") is None
+        assert pool.acquire("b") is not None
@@ -0,0 +1,272 @@
+"""Tests for custom node concurrency and rate limits."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from adkflow_runner.compiler.node_transforms import transform_execution_limits
+from adkflow_runner.compiler.validator import WorkflowValidator
+from adkflow_runner.ir import (
+    AgentIR,
+    CustomNodeIR,
+    ExecutionLimitsIR,
+    UnitLimitsIR,
+    WorkflowIR,
+)
+from adkflow_runner.runner.concurrency import (
+    ConcurrencyLimiter,
+    TokenBucket,
+    UnitLimits,
+    get_shared_limiter,
+)
+from adkflow_runner.runner.graph_executor import (
+    ExecutionGraph,
+    ExecutionNode,
+    GraphExecutor,
+)
+
+
+def _custom_ir(node_id: str, unit_id: str = "test.unit", **kwargs) -> CustomNodeIR:
+    return CustomNodeIR(
+        id=node_id,
+        unit_id=unit_id,
+        name=node_id,
+        config={"id": node_id},
+        source_node_id=node_id,
+        output_node=True,
+        always_execute=True,
+        **kwargs,
+    )
+
+
+class PeakTracker:
+    """Records the highest number of concurrent executions."""
+
+    def __init__(self):
+        self.current = 0
+        self.peak = 0
+
+    async def run(self):
+        self.current += 1
+        self.peak = max(self.peak, self.current)
+        await asyncio.sleep(0.01)
+        self.current -= 1
+
+
+class TestTokenBucket:
+    """Tests for TokenBucket."""
+
+    def test_rejects_non_positive_rate(self):
+        with pytest.raises(ValueError):
+            TokenBucket(rate=0)
+
+    async def test_burst_then_throttle(self):
+        now = [0.0]
+        bucket = TokenBucket(rate=10, burst=2, clock=lambda: now[0])
+
+        await bucket.acquire()
+        await bucket.acquire()
+
+        async def fake_sleep(delay):
+            now[0] += delay
+
+        with patch("adkflow_runner.runner.concurrency.asyncio.sleep", fake_sleep):
+            await bucket.acquire()
+
+        # Third token needed a full refill interval
+        assert now[0] == pytest.approx(0.1)
+
+
+class TestConcurrencyLimiter:
+    """Tests for ConcurrencyLimiter."""
+
+    async def test_global_limit(self):
+        limiter = ConcurrencyLimiter(max_concurrency=2)
+        tracker = PeakTracker()
+
+        async def job():
+            async with limiter.slot("any.unit"):
+                await tracker.run()
+
+        await asyncio.gather(*(job() for _ in range(6)))
+        assert tracker.peak == 2
+        assert limiter.active == 0
+        assert limiter.waiting == 0
+
+    async def test_per_unit_limit(self):
+        limiter = ConcurrencyLimiter(
+            unit_limits={"slow.unit": UnitLimits(max_concurrency=1)}
+        )
+        limited = PeakTracker()
+        free = PeakTracker()
+
+        async def job(unit_id, tracker):
+            async with limiter.slot(unit_id):
+                await tracker.run()
+
+        await asyncio.gather(
+            *(job("slow.unit", limited) for _ in range(3)),
+            *(job("fast.unit", free) for _ in range(3)),
+        )
+        assert limited.peak == 1
+        assert free.peak == 3
+
+    async def test_fifo_order(self):
+        limiter = ConcurrencyLimiter(max_concurrency=1)
+        order: list[int] = []
+
+        async def job(i):
+            async with limiter.slot("any.unit"):
+                order.append(i)
+                await asyncio.sleep(0)
+
+        await asyncio.gather(*(job(i) for i in range(5)))
+        assert order == [0, 1, 2, 3, 4]
+
+    def test_from_ir_settings_override_class_defaults(self):
+        ir = WorkflowIR(
+            root_agent=AgentIR(id="a", name="a", type="llm"),
+            custom_nodes=[
+                _custom_ir("n1", "api.unit", max_concurrency=8, rate_limit=2.0),
+                _custom_ir("n2", "other.unit"),
+            ],
+            execution_limits=ExecutionLimitsIR(
+                max_concurrency=16,
+                units={"api.unit": UnitLimitsIR(max_concurrency=4)},
+            ),
+        )
+
+        limiter = ConcurrencyLimiter.from_ir(ir)
+
+        assert limiter.max_concurrency == 16
+        assert limiter.unit_limits["api.unit"].max_concurrency == 4
+        assert limiter.unit_limits["api.unit"].rate_limit == 2.0
+        assert limiter.unit_limits["other.unit"].max_concurrency is None
+
+    async def test_shared_limiter_per_project(self):
+        def make_ir(project_path: str, max_concurrency: int) -> WorkflowIR:
+            return WorkflowIR(
+                root_agent=AgentIR(id="a", name="a", type="llm"),
+                execution_limits=ExecutionLimitsIR(max_concurrency=max_concurrency),
+                project_path=project_path,
+            )
+
+        shared = get_shared_limiter(make_ir("/p1", 4))
+        assert get_shared_limiter(make_ir("/p1", 4)) is shared
+        assert get_shared_limiter(make_ir("/p2", 4)) is not shared
+
+        changed = get_shared_limiter(make_ir("/p1", 2))
+        assert changed is not shared
+        assert changed.max_concurrency == 2
+
+
+class TestValidateExecutionLimits:
+    """Tests for compile-time validation of limits."""
+
+    def _validate(self, execution_limits=None, custom_nodes=None):
+        ir = WorkflowIR(
+            root_agent=AgentIR(id="a", name="a", type="llm", model="m"),
+            custom_nodes=custom_nodes or [],
+            execution_limits=execution_limits or ExecutionLimitsIR(),
+        )
+        return WorkflowValidator().validate_ir(ir)
+
+    def test_valid_limits(self):
+        result = self._validate(
+            ExecutionLimitsIR(
+                max_concurrency=16,
+                units={"api.unit": UnitLimitsIR(4, 0.5, 2)},
+            )
+        )
+        assert result.valid
+
+    @pytest.mark.parametrize("value", [0, -1, "4", 2.5, True])
+    def test_invalid_global_limit(self, value):
+        result = self._validate(ExecutionLimitsIR(max_concurrency=value))
+        assert not result.valid
+        assert "maxConcurrency" in str(result.errors[0])
+
+    @pytest.mark.parametrize(
+        "unit", [UnitLimitsIR(rate_limit=0), UnitLimitsIR(rate_limit_burst=-2)]
+    )
+    def test_invalid_unit_limit(self, unit):
+        result = self._validate(ExecutionLimitsIR(units={"api.unit": unit}))
+        assert not result.valid
+        assert "api.unit" in str(result.errors[0])
+
+    def test_invalid_flow_unit_attribute(self):
+        result = self._validate(custom_nodes=[_custom_ir("n1", max_concurrency=0)])
+        assert not result.valid
+        assert "MAX_CONCURRENCY" in str(result.errors[0])
+
+
+class TestTransformExecutionLimits:
+    """Tests for reading limits from project settings."""
+
+    def test_empty_settings(self):
+        limits = transform_execution_limits({})
+        assert limits.max_concurrency is None
+        assert limits.units == {}
+
+    def test_reads_global_and_unit_limits(self):
+        limits = transform_execution_limits(
+            {
+                "customNodes": {
+                    "maxConcurrency": 16,
+                    "units": {
+                        "api.unit": {
+                            "maxConcurrency": 4,
+                            "rateLimit": 5,
+                            "rateLimitBurst": 2,
+                        }
+                    },
+                }
+            }
+        )
+        assert limits.max_concurrency == 16
+        assert limits.units["api.unit"] == UnitLimitsIR(
+            max_concurrency=4, rate_limit=5, rate_limit_burst=2
+        )
+
+
+class TestExecutorLimits:
+    """Tests for limits applied by GraphExecutor."""
+
+    async def test_executor_respects_global_limit(self, tmp_path):
+        tracker = PeakTracker()
+
+        class Unit:
+            @staticmethod
+            def is_changed(config, inputs):
+                return None
+
+            @staticmethod
+            def check_lazy_status(config, inputs):
+                return []
+
+            async def on_before_execute(self, context):
+                pass
+
+            async def run_process(self, inputs, config, context):
+                await tracker.run()
+                return {"output": config["id"]}
+
+            async def on_after_execute(self, context, outputs):
+                pass
+
+        nodes = {
+            f"n{i}": ExecutionNode(
+                id=f"n{i}", node_type="custom", ir=_custom_ir(f"n{i}")
+            )
+            for i in range(10)
+        }
+        executor = GraphExecutor(
+            emit=AsyncMock(), limiter=ConcurrencyLimiter(max_concurrency=3)
+        )
+
+        with patch.object(executor.registry, "get_unit", return_value=Unit):
+            results = await executor.execute(ExecutionGraph(nodes=nodes), {}, tmp_path)
+
+        assert len(results) == 10
+        assert tracker.peak == 3
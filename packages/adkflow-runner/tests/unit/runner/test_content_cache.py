@@ -0,0 +1,198 @@
+"""Tests for the content cache of context aggregator inputs."""
+
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from adkflow_runner.ir import ContextAggregatorIR
+from adkflow_runner.runner import context_aggregator_executor
+from adkflow_runner.runner.content_cache import ContentCache, file_version
+from adkflow_runner.runner.context_aggregator_executor import (
+    execute_context_aggregator,
+)
+
+
+def _touch(path: Path, content: str) -> None:
+    """Rewrite a file and make sure its version changes."""
+    st = path.stat()
+    path.write_text(content)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    """Fresh cache used by the aggregator executor."""
+    cache = ContentCache()
+    monkeypatch.setattr(context_aggregator_executor, "content_cache", cache)
+    return cache
+
+
+class TestReadText:
+    """Tests for ContentCache.read_text."""
+
+    def test_unchanged_file_is_cached(self, tmp_path):
+        path = tmp_path / "a.txt"
+        path.write_text("hello")
+        cache = ContentCache()
+
+        first = cache.read_text(path)
+        second = cache.read_text(path)
+
+        assert first is second
+        assert first.content == "hello"
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_modified_file_is_read_again(self, tmp_path):
+        path = tmp_path / "a.txt"
+        path.write_text("old")
+        cache = ContentCache()
+        cache.read_text(path)
+
+        _touch(path, "new content")
+
+        assert cache.read_text(path).content == "new content"
+
+    def test_latin1_fallback(self, tmp_path):
+        path = tmp_path / "a.txt"
+        path.write_bytes(b"caf\xe9")
+        cache = ContentCache()
+
+        text = cache.read_text(path)
+
+        assert text.content == "café"
+        assert text.encoding == "latin-1"
+
+    def test_newlines_are_translated(self, tmp_path):
+        path = tmp_path / "crlf.txt"
+        path.write_bytes(b"a\r\nb\rc\n")
+        cache = ContentCache()
+
+        assert cache.read_text(path).content == "a\nb\nc\n"
+        assert cache.read_text(path).content == path.read_text()
+
+    def test_no_fallback_raises_even_if_cached(self, tmp_path):
+        path = tmp_path / "a.txt"
+        path.write_bytes(b"caf\xe9")
+        cache = ContentCache()
+        cache.read_text(path)
+
+        with pytest.raises(UnicodeDecodeError):
+            cache.read_text(path, fallback=None)
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        paths = []
+        for name in "abc":
+            path = tmp_path / f"{name}.txt"
+            path.write_text(name * 1000)
+            paths.append(path)
+        cache = ContentCache(max_bytes=2500)
+
+        for path in paths:
+            cache.read_text(path)
+
+        assert len(cache) == 2
+        assert cache.memory_bytes <= 2500
+        cache.read_text(paths[0])
+        assert cache.hits == 0
+
+
+class TestOutputs:
+    """Tests for cached aggregator outputs."""
+
+    def test_valid_while_sources_unchanged(self, tmp_path):
+        path = tmp_path / "a.txt"
+        path.write_text("x")
+        cache = ContentCache()
+        cache.set_output("k", {"output": {"a": "x"}}, [file_version(path)])
+
+        assert cache.get_output("k") == {"output": {"a": "x"}}
+
+        _touch(path, "changed")
+
+        assert cache.get_output("k") is None
+        assert len(cache) == 0
+
+    def test_new_file_in_directory_invalidates(self, tmp_path):
+        cache = ContentCache()
+        cache.set_output("k", {"output": {}}, [file_version(tmp_path)])
+        st = tmp_path.stat()
+
+        (tmp_path / "new.txt").write_text("x")
+        os.utime(tmp_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+        assert cache.get_output("k") is None
+
+    def test_missing_file_version(self, tmp_path):
+        assert file_version(tmp_path / "missing") == (
+            str(tmp_path / "missing"),
+            -1,
+            -1,
+        )
+
+
+class TestAggregatorCaching:
+    """Tests for output reuse in execute_context_aggregator."""
+
+    def _ir(self, **input_config) -> ContextAggregatorIR:
+        return ContextAggregatorIR(
+            id="agg-1",
+            name="Cached",
+            config={"aggregationMode": "pass", "dynamicInputs": [input_config]},
+            input_connections={},
+        )
+
+    async def test_reuses_output_until_file_changes(self, tmp_path, cache):
+        path = tmp_path / "notes.md"
+        path.write_text("v1")
+        ir = self._ir(
+            id="f", inputType="file", variableName="notes", filePath="notes.md"
+        )
+
+        first = await execute_context_aggregator(ir, str(tmp_path), {})
+        with patch.object(cache, "read_text", side_effect=AssertionError):
+            second = await execute_context_aggregator(ir, str(tmp_path), {})
+        assert first == second == {"output": {"notes": "v1"}}
+
+        _touch(path, "v2")
+
+        third = await execute_context_aggregator(ir, str(tmp_path), {})
+        assert third == {"output": {"notes": "v2"}}
+
+    async def test_directory_output_sees_new_files(self, tmp_path, cache):
+        (tmp_path / "a.txt").write_text("a")
+        ir = self._ir(
+            id="d",
+            inputType="directory",
+            variableName="docs",
+            directoryPath=".",
+            globPattern="*.txt",
+            directoryAggregation="concatenate",
+        )
+
+        first = await execute_context_aggregator(ir, str(tmp_path), {})
+        st = tmp_path.stat()
+        (tmp_path / "b.txt").write_text("b")
+        os.utime(tmp_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        second = await execute_context_aggregator(ir, str(tmp_path), {})
+
+        assert "b" not in first["output"]["docs"]
+        assert "b" in second["output"]["docs"]
+
+    async def test_url_inputs_are_not_cached(self, tmp_path, cache):
+        calls = []
+
+        async def fake_fetch(url, include_metadata, cache_dir=None):
+            calls.append(url)
+            return f"page {len(calls)}", None
+
+        ir = self._ir(
+            id="u", inputType="url", variableName="page", url="https://x.test/"
+        )
+        with patch.object(context_aggregator_executor, "_fetch_url", fake_fetch):
+            await execute_context_aggregator(ir, str(tmp_path), {})
+            result = await execute_context_aggregator(ir, str(tmp_path), {})
+
+        assert len(calls) == 2
+        assert result == {"output": {"page": "page 2"}}
@@ -1,6 +1,8 @@
 """Tests for context aggregator executor."""
 
+import asyncio
 import tempfile
+import threading
 from pathlib import Path
 from unittest.mock import AsyncMock, patch
 
@@ -8,16 +10,18 @@ import pytest
 
 from adkflow_runner.ir import ContextAggregatorIR
 from adkflow_runner.runner.context_aggregator_executor import (
-    _check_limits,
+    MAX_CONCURRENT_INPUTS,
     _format_frontmatter,
     _format_separator_with_metadata,
     _get_file_metadata,
-    _matches_exclude_pattern,
+    _limit_warning,
     _read_file,
     _read_directory,
     _sanitize_relative_path,
     execute_context_aggregator,
 )
+from adkflow_runner.runner.content_cache import ContentCache
+from adkflow_runner.runner.directory_scan import scan_directory
 
 
 # -----------------------------------------------------------------------------
@@ -402,6 +406,20 @@ class TestExecuteContextAggregator:
         assert "upstream" in result["output"]
         assert result["output"]["upstream"] == "Content from upstream node"
 
+    @pytest.mark.asyncio
+    async def test_input_without_name_is_skipped(self, temp_project: Path):
+        """Inputs with neither a variable name nor an id are ignored."""
+        ir = ContextAggregatorIR(
+            id="agg-1",
+            name="Unnamed",
+            config={
+                "aggregationMode": "pass",
+                "dynamicInputs": [{"inputType": "file", "filePath": "file1.txt"}],
+            },
+        )
+        result = await execute_context_aggregator(ir, str(temp_project), {})
+        assert result["output"] == {}
+
     @pytest.mark.asyncio
     async def test_directory_input(self, temp_project: Path):
         """Should read directory contents."""
@@ -559,48 +577,34 @@ class TestHelperFunctions:
         # Should return original on KeyError
         assert result == separator
 
-    def test_matches_exclude_pattern(self, temp_project: Path):
-        """Should match files in excluded directories."""
-        git_file = temp_project / ".git" / "config"
-        assert _matches_exclude_pattern(git_file, temp_project, [".git"]) is True
-
-        normal_file = temp_project / "file1.txt"
-        assert _matches_exclude_pattern(normal_file, temp_project, [".git"]) is False
-
-    def test_matches_exclude_pattern_glob(self, temp_project: Path):
-        """Should match glob patterns."""
-        pyc_file = temp_project / "test.pyc"
-        pyc_file.touch()
-        assert _matches_exclude_pattern(pyc_file, temp_project, ["*.pyc"]) is True
-
     def test_sanitize_relative_path(self):
         """Should sanitize paths for variable names."""
         assert _sanitize_relative_path("dir/file.txt") == "dir_file"
         assert _sanitize_relative_path("a/b/c.py") == "a_b_c"
         assert _sanitize_relative_path("file.txt") == "file"
 
-    def test_check_limits_under_limit(self, temp_project: Path):
-        """Should pass through files under limits."""
-        files = [
-            temp_project / "file1.txt",
-            temp_project / "file2.txt",
-        ]
-        result, warning = _check_limits(files, max_files=10, max_file_size=1048576)
-        assert len(result) == 2
-        assert warning is None
-
-    def test_check_limits_over_count(self, temp_project: Path):
-        """Should limit file count."""
-        files = [
-            temp_project / "file1.txt",
-            temp_project / "file2.txt",
-            temp_project / "data.json",
-        ]
-        result, warning = _check_limits(files, max_files=2, max_file_size=1048576)
-        assert len(result) == 2
+    def test_limit_warning_under_limit(self, temp_project: Path):
+        """Should not warn when no file was left out."""
+        scan = scan_directory(temp_project, "*.txt", max_files=10)
+        assert len(scan.files) == 2
+        assert _limit_warning(scan, max_files=10, max_file_size=1048576) is None
+
+    def test_limit_warning_over_count(self, temp_project: Path):
+        """Should warn when the file count was limited."""
+        scan = scan_directory(temp_project, "*", max_files=2)
+        warning = _limit_warning(scan, max_files=2, max_file_size=1048576)
+        assert len(scan.files) == 2
         assert warning is not None
         assert "limited to 2" in warning
 
+    def test_limit_warning_large_files(self, temp_project: Path):
+        """Should warn about files over the size limit."""
+        scan = scan_directory(temp_project, "*.txt", max_file_size=5)
+        warning = _limit_warning(scan, max_files=100, max_file_size=5)
+        assert scan.files == []
+        assert warning is not None
+        assert "Skipped 2 file(s)" in warning
+
     def test_get_file_metadata(self, temp_project: Path):
         """Should extract file metadata."""
         file_path = temp_project / "file1.txt"
@@ -672,3 +676,116 @@ class TestMetadataInclusion:
         content = result["output"]["upstream"]
         assert "---\n" in content
         assert "source_name: My Upstream" in content
+
+
+# -----------------------------------------------------------------------------
+# Test concurrent input fetching
+# -----------------------------------------------------------------------------
+
+
+class TestConcurrentInputs:
+    """Tests for fetching aggregator inputs concurrently."""
+
+    @staticmethod
+    def _url_ir(count: int, mode: str = "concatenate") -> ContextAggregatorIR:
+        return ContextAggregatorIR(
+            id="agg-1",
+            name="URLs",
+            config={
+                "aggregationMode": mode,
+                "separator": "|",
+                "dynamicInputs": [
+                    {
+                        "id": f"url-{i}",
+                        "inputType": "url",
+                        "variableName": f"page_{i}",
+                        "url": f"https://example.com/{i}",
+                    }
+                    for i in range(count)
+                ],
+            },
+        )
+
+    @pytest.mark.asyncio
+    async def test_inputs_fetched_concurrently_in_order(self, temp_project: Path):
+        """Slow inputs overlap but results keep the configured order."""
+        active = 0
+        peak = 0
+
+        async def fake_fetch(url, include_metadata=False, cache_dir=None):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            # Later inputs finish first
+            await asyncio.sleep(0.01 * (20 - int(url.rsplit("/", 1)[1])))
+            active -= 1
+            return url.rsplit("/", 1)[1], None
+
+        with patch(
+            "adkflow_runner.runner.context_aggregator_executor._fetch_url",
+            side_effect=fake_fetch,
+        ):
+            result = await execute_context_aggregator(
+                self._url_ir(12), str(temp_project), {}
+            )
+
+        assert result["output"]["context"] == "|".join(str(i) for i in range(12))
+        assert peak == MAX_CONCURRENT_INPUTS
+
+    @pytest.mark.asyncio
+    async def test_mixed_inputs_pass_mode(self, temp_project: Path):
+        """File, directory and node inputs all land in their variables."""
+        ir = ContextAggregatorIR(
+            id="agg-1",
+            name="Mixed",
+            config={
+                "aggregationMode": "pass",
+                "dynamicInputs": [
+                    {
+                        "id": "f",
+                        "inputType": "file",
+                        "variableName": "doc",
+                        "filePath": "file1.txt",
+                    },
+                    {
+                        "id": "d",
+                        "inputType": "directory",
+                        "variableName": "sub",
+                        "directoryPath": "subdir",
+                        "globPattern": "*.txt",
+                        "directoryAggregation": "pass",
+                    },
+                    {"id": "n", "inputType": "node", "variableName": "upstream"},
+                    {"id": "x", "inputType": "node", "variableName": "skipped"},
+                ],
+            },
+        )
+
+        result = await execute_context_aggregator(
+            ir, str(temp_project), {"n": "from node", "x": {"not": "text"}}
+        )
+
+        assert result["output"] == {
+            "doc": "Content of file 1",
+            "sub_nested": "Nested content",
+            "upstream": "from node",
+        }
+
+    @pytest.mark.asyncio
+    async def test_disk_reads_run_off_event_loop(self, temp_project: Path):
+        """File reads happen on the context reader pool."""
+        threads = []
+        original = ContentCache.read_text
+
+        def recording_read_text(self, *args, **kwargs):
+            threads.append(threading.current_thread().name)
+            return original(self, *args, **kwargs)
+
+        with patch.object(ContentCache, "read_text", recording_read_text):
+            await _read_file("file1.txt", temp_project)
+            await _read_directory(
+                "subdir", "*", "concatenate", "file_name", "", "\n", "d", temp_project
+            )
+
+        assert len(threads) == 3
+        assert all(name.startswith("adkflow-context") for name in threads)
@@ -0,0 +1,164 @@
+"""Tests for the streaming directory scan."""
+
+import glob
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from adkflow_runner.runner import directory_scan
+from adkflow_runner.runner.directory_scan import scan_directory
+
+
+@pytest.fixture
+def tree(tmp_path: Path) -> Path:
+    """Directory tree with nested, hidden and excluded entries."""
+    for rel in [
+        "a.txt",
+        "a-b.txt",
+        "b.md",
+        ".hidden.txt",
+        "a/inner.txt",
+        "a/deep/leaf.txt",
+        "a/deep/leaf.md",
+        ".git/config",
+        "node_modules/pkg/index.txt",
+        "cache.pyc",
+    ]:
+        path = tmp_path / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(rel)
+    return tmp_path
+
+
+def _glob(root: Path, pattern: str) -> list[str]:
+    return [
+        f
+        for f in sorted(glob.glob(str(root / pattern), recursive=True))
+        if os.path.isfile(f)
+    ]
+
+
+def _paths(scan) -> list[str]:
+    return [str(f.path) for f in scan.files]
+
+
+class TestMatchesGlob:
+    """Results and ordering match sorted(glob(...))."""
+
+    @pytest.mark.parametrize(
+        "pattern, recursive",
+        [
+            ("*", False),
+            ("*", True),
+            ("*.txt", True),
+            ("a/*", False),
+            ("**/deep/*", False),
+            ("**", False),
+            (".*", False),
+        ],
+    )
+    def test_same_files_as_glob(self, tree, pattern, recursive):
+        scan = scan_directory(tree, pattern, recursive=recursive)
+        effective = f"**/{pattern}" if recursive else pattern
+        assert _paths(scan) == _glob(tree, effective)
+
+    def test_records_size_and_mtime(self, tree):
+        scan = scan_directory(tree, "b.md")
+        [scanned] = scan.files
+        assert scanned.size == len("b.md")
+        assert scanned.mtime == (tree / "b.md").stat().st_mtime
+
+    def test_parent_pattern_falls_back_to_glob(self, tree):
+        scan = scan_directory(tree / "a", "../*.md")
+        assert [f.path.name for f in scan.files] == ["b.md"]
+
+
+class TestExclusions:
+    """Tests for exclude_patterns."""
+
+    def test_excluded_directories_are_not_entered(self, tree):
+        scanned_dirs = []
+        original = os.scandir
+
+        def recording_scandir(path):
+            scanned_dirs.append(Path(path).name)
+            return original(path)
+
+        with patch.object(directory_scan.os, "scandir", recording_scandir):
+            scan = scan_directory(
+                tree, "*", recursive=True, exclude_patterns=["node_modules", "*.pyc"]
+            )
+
+        assert "node_modules" not in scanned_dirs
+        names = [f.path.name for f in scan.files]
+        assert "index.txt" not in names
+        assert "cache.pyc" not in names
+        assert "leaf.txt" in names
+
+    def test_directories_outside_pattern_are_pruned(self, tree):
+        scanned_dirs = []
+        original = os.scandir
+
+        def recording_scandir(path):
+            scanned_dirs.append(Path(path).name)
+            return original(path)
+
+        with patch.object(directory_scan.os, "scandir", recording_scandir):
+            scan_directory(tree, "a/*.txt")
+
+        assert "deep" not in scanned_dirs
+        assert "node_modules" not in scanned_dirs
+
+
+class TestLimits:
+    """Tests for max_files, max_file_size and count_limit."""
+
+    def test_stops_after_limit(self, tmp_path):
+        for d in range(10):
+            for i in range(5):
+                path = tmp_path / f"d{d}" / f"f{i}.txt"
+                path.parent.mkdir(exist_ok=True)
+                path.write_text("x")
+
+        scanned_dirs = []
+        original = os.scandir
+
+        def recording_scandir(path):
+            scanned_dirs.append(Path(path).name)
+            return original(path)
+
+        with patch.object(directory_scan.os, "scandir", recording_scandir):
+            scan = scan_directory(tmp_path, "*.txt", recursive=True, max_files=5)
+
+        assert [str(f.path.relative_to(tmp_path)) for f in scan.files] == [
+            f"d0/f{i}.txt" for i in range(5)
+        ]
+        assert scan.matched == 6
+        assert scan.complete is False
+        # The sixth file is in d1; later directories are never listed
+        assert scanned_dirs == [tmp_path.name, "d0", "d1"]
+
+    def test_count_limit_counts_past_max_files(self, tmp_path):
+        for i in range(10):
+            (tmp_path / f"f{i}.txt").write_text("x")
+
+        scan = scan_directory(tmp_path, "*.txt", max_files=3, count_limit=100)
+
+        assert len(scan.files) == 3
+        assert scan.matched == 10
+        assert scan.complete is True
+
+    def test_large_files_are_skipped(self, tmp_path):
+        (tmp_path / "small.txt").write_text("x")
+        (tmp_path / "large.txt").write_text("x" * 100)
+
+        scan = scan_directory(tmp_path, "*.txt", max_file_size=10)
+
+        assert [f.path.name for f in scan.files] == ["small.txt"]
+        assert scan.skipped_large == 1
+
+    def test_missing_directory(self, tmp_path):
+        scan = scan_directory(tmp_path / "missing", "*")
+        assert scan.files == [] and scan.matched == 0
@@ -0,0 +1,149 @@
+"""Tests for broadcasting run events through an EventHub."""
+
+import asyncio
+
+import pytest
+
+from adkflow_runner.errors import SlowConsumerError
+from adkflow_runner.runner.event_hub import EventHub
+from adkflow_runner.runner.event_store import EventStore
+from adkflow_runner.runner.types import EventType, RunEvent
+
+
+def _event(i: int) -> RunEvent:
+    return RunEvent(type=EventType.AGENT_OUTPUT, timestamp=float(i), data={"i": i})
+
+
+async def _drain(subscription) -> list[int]:
+    received = []
+    while (event := await subscription.get()) is not None:
+        received.append(event.data["i"])
+    return received
+
+
+class TestDelivery:
+    """Tests for publish and get."""
+
+    async def test_every_subscriber_gets_every_event(self):
+        hub = EventHub()
+        subscriptions = [hub.subscribe() for _ in range(3)]
+
+        async def publish():
+            for i in range(5):
+                await hub.publish(_event(i))
+                await asyncio.sleep(0)
+            hub.close()
+
+        results = await asyncio.gather(*(_drain(s) for s in subscriptions), publish())
+
+        assert results[:3] == [[0, 1, 2, 3, 4]] * 3
+
+    async def test_late_subscriber_replays_history(self):
+        hub = EventHub()
+        for i in range(3):
+            await hub.publish(_event(i))
+        hub.close()
+
+        assert await _drain(hub.subscribe()) == [0, 1, 2]
+        assert await _drain(hub.subscribe(start=2)) == [2]
+
+    async def test_replays_spilled_events(self, tmp_path):
+        hub = EventHub(EventStore(capacity=2, spill_path=tmp_path / "run.jsonl"))
+        for i in range(6):
+            await hub.publish(_event(i))
+        hub.close()
+
+        assert await _drain(hub.subscribe()) == list(range(6))
+
+    async def test_cancelled_get_does_not_lose_events(self):
+        hub = EventHub()
+        subscription = hub.subscribe()
+
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(subscription.get(), timeout=0.01)
+        await hub.publish(_event(0))
+
+        assert (await subscription.get()).data["i"] == 0
+
+    async def test_unsubscribe(self):
+        hub = EventHub()
+        subscription = hub.subscribe()
+        hub.unsubscribe(subscription)
+        assert hub.subscriber_count == 0
+        assert hub.stats() == []
+
+
+class TestSlowConsumers:
+    """Tests for slow-consumer policies and lag metrics."""
+
+    def test_unknown_policy_is_rejected(self):
+        with pytest.raises(ValueError, match="slow-consumer policy"):
+            EventHub(policy="ignore")  # type: ignore[arg-type]
+        with pytest.raises(ValueError, match="slow-consumer policy"):
+            EventHub().subscribe(policy="ignore")  # type: ignore[arg-type]
+
+    async def test_drop_skips_to_newest_events(self):
+        hub = EventHub(policy="drop", max_lag=3)
+        subscription = hub.subscribe()
+        for i in range(10):
+            await hub.publish(_event(i))
+        hub.close()
+
+        assert await _drain(subscription) == [7, 8, 9]
+        stats = subscription.stats()
+        assert stats.dropped == 7
+        assert stats.max_lag_seen == 10
+        assert stats.lag == 0
+
+    async def test_disconnect(self):
+        hub = EventHub(policy="disconnect", max_lag=3)
+        subscription = hub.subscribe()
+        for i in range(5):
+            await hub.publish(_event(i))
+
+        with pytest.raises(SlowConsumerError):
+            await subscription.get()
+        assert subscription.disconnected
+        assert hub.subscriber_count == 0
+
+    async def test_block_holds_publisher(self):
+        hub = EventHub(policy="block", max_lag=2)
+        subscription = hub.subscribe()
+
+        async def publish():
+            for i in range(5):
+                await hub.publish(_event(i))
+
+        publisher = asyncio.create_task(publish())
+        await asyncio.sleep(0.01)
+        assert len(hub.store) == 2
+        assert not publisher.done()
+
+        received = [(await subscription.get()).data["i"] for _ in range(5)]
+        await publisher
+        assert received == [0, 1, 2, 3, 4]
+        assert subscription.stats().max_lag_seen <= 2
+
+    async def test_unsubscribing_blocker_releases_publisher(self):
+        hub = EventHub(policy="block", max_lag=1)
+        subscription = hub.subscribe()
+        await hub.publish(_event(0))
+
+        publisher = asyncio.create_task(hub.publish(_event(1)))
+        await asyncio.sleep(0.01)
+        assert not publisher.done()
+
+        hub.unsubscribe(subscription)
+        assert await publisher == 1
+
+    async def test_stats_report_lag(self):
+        hub = EventHub()
+        subscription = hub.subscribe()
+        for i in range(4):
+            await hub.publish(_event(i))
+        await subscription.get()
+
+        [stats] = hub.stats()
+        assert stats.cursor == 1
+        assert stats.lag == 3
+        assert stats.policy == "drop"
@@ -0,0 +1,142 @@
+"""Tests for the bounded run event store."""
+
+from adkflow_runner.runner import event_store
+from adkflow_runner.runner.event_store import EventStore
+from adkflow_runner.runner.types import EventType, RunEvent
+
+
+def _event(i: int) -> RunEvent:
+    return RunEvent(type=EventType.AGENT_OUTPUT, timestamp=float(i), data={"i": i})
+
+
+def _indices(events) -> list[int]:
+    return [e.data["i"] for e in events]
+
+
+class TestInMemory:
+    """Tests without a spill file."""
+
+    def test_append_returns_offsets(self):
+        store = EventStore()
+        assert [store.append(_event(i)) for i in range(3)] == [0, 1, 2]
+        assert len(store) == 3
+        assert store.last_timestamp == 2.0
+        assert _indices(store) == [0, 1, 2]
+
+    def test_ring_drops_oldest(self):
+        store = EventStore(capacity=3)
+        for i in range(5):
+            store.append(_event(i))
+
+        assert len(store) == 5
+        assert store.first_offset == 2
+        assert _indices(store.replay()) == [2, 3, 4]
+        assert _indices(store.replay(3)) == [3, 4]
+
+    def test_replay_includes_events_appended_while_iterating(self):
+        store = EventStore(capacity=10)
+        store.append(_event(0))
+
+        seen = []
+        for event in store.replay():
+            seen.append(event.data["i"])
+            if len(store) < 3:
+                store.append(_event(len(store)))
+
+        assert seen == [0, 1, 2]
+
+
+class TestSpill:
+    """Tests with a spill file."""
+
+    def test_evicted_events_are_replayed_from_disk(self, tmp_path):
+        spill = tmp_path / "events" / "run.jsonl"
+        store = EventStore(capacity=2, spill_path=spill)
+        for i in range(5):
+            store.append(_event(i))
+
+        assert store.spilled == 3
+        assert store.first_offset == 0
+        assert _indices(store.replay()) == [0, 1, 2, 3, 4]
+        assert _indices(store.replay(1)) == [1, 2, 3, 4]
+        assert _indices(store.replay(4)) == [4]
+
+    def test_replayed_events_round_trip(self, tmp_path):
+        store = EventStore(capacity=1, spill_path=tmp_path / "run.jsonl")
+        first = RunEvent(
+            type=EventType.TOOL_CALL,
+            timestamp=1.5,
+            agent_id="a1",
+            agent_name="Agent",
+            data={"args": {"q": "x"}},
+        )
+        store.append(first)
+        store.append(_event(1))
+
+        assert next(iter(store)) == first
+
+    def test_eviction_while_iterating(self, tmp_path):
+        store = EventStore(capacity=2, spill_path=tmp_path / "run.jsonl")
+        store.append(_event(0))
+        store.append(_event(1))
+
+        seen = []
+        for event in store.replay():
+            seen.append(event.data["i"])
+            if len(store) < 6:
+                # Pushes events the iterator has not reached out of the ring
+                store.append(_event(len(store)))
+                store.append(_event(len(store)))
+
+        assert seen == list(range(len(store)))
+
+    def test_close_keeps_replay_and_appends(self, tmp_path):
+        spill = tmp_path / "run.jsonl"
+        store = EventStore(capacity=1, spill_path=spill)
+        for i in range(3):
+            store.append(_event(i))
+        store.close()
+        store.append(_event(3))
+
+        assert _indices(store) == [0, 1, 2, 3]
+
+        store.close(delete=True)
+        assert not spill.exists()
+
+    def test_spill_failure_drops_events(self, tmp_path):
+        blocker = tmp_path / "file"
+        blocker.write_text("")
+        store = EventStore(capacity=2, spill_path=blocker / "run.jsonl")
+        for i in range(4):
+            store.append(_event(i))
+
+        assert store.spilled == 0
+        assert _indices(store) == [2, 3]
+
+    def test_replay_seeks_via_index(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(event_store, "SPILL_INDEX_INTERVAL", 4)
+        store = EventStore(capacity=2, spill_path=tmp_path / "run.jsonl")
+        for i in range(20):
+            store.append(_event(i))
+
+        assert len(store._spill_index) == 5
+        for start in (0, 3, 4, 9, 17, 18):
+            assert _indices(store.replay(start)) == list(range(start, 20))
+
+    def test_index_survives_close_and_non_ascii(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(event_store, "SPILL_INDEX_INTERVAL", 2)
+        store = EventStore(capacity=1, spill_path=tmp_path / "run.jsonl")
+        for i in range(4):
+            store.append(
+                RunEvent(
+                    type=EventType.AGENT_OUTPUT,
+                    timestamp=float(i),
+                    data={"i": i, "text": "héllo ✓" * i},
+                )
+            )
+        store.close()
+        for i in range(4, 8):
+            store.append(_event(i))
+
+        assert _indices(store.replay(5)) == [5, 6, 7]
+        assert _indices(store.replay(2)) == list(range(2, 8))
@@ -0,0 +1,276 @@
+"""Tests for the two-tier execution cache."""
+
+import importlib
+import os
+import sys
+from collections import OrderedDict
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from adkflow_runner.ir import CustomNodeIR
+from adkflow_runner.runner.execution_cache import (
+    ExecutionCache,
+    PickleSerializer,
+    get_shared_cache,
+    unit_code_version,
+)
+from adkflow_runner.runner.graph_executor import (
+    ExecutionGraph,
+    ExecutionNode,
+    GraphExecutor,
+)
+
+
+class TestMemoryTier:
+    """Tests for the in-memory LRU tier."""
+
+    def test_entry_limit_evicts_oldest(self):
+        cache = ExecutionCache(max_entries=2)
+        cache.set("a", {"v": 1})
+        cache.set("b", {"v": 2})
+        cache.get("a")  # "a" becomes most recently used
+        cache.set("c", {"v": 3})
+
+        assert cache.get("a") == {"v": 1}
+        assert cache.get("b") is None
+        assert cache.get("c") == {"v": 3}
+
+    def test_byte_limit_evicts(self):
+        cache = ExecutionCache(max_bytes=100)
+        cache.set("a", {"v": "x" * 60})
+        cache.set("b", {"v": "y" * 60})
+
+        assert cache.get("a") is None
+        assert cache.get("b") is not None
+        assert cache.memory_bytes <= 100
+
+    def test_oversized_value_not_kept_in_memory(self):
+        cache = ExecutionCache(max_bytes=10)
+        cache.set("a", {"v": "x" * 100})
+        assert cache.get("a") is None
+
+    def test_overwrite_updates_size(self):
+        cache = ExecutionCache()
+        cache.set("a", {"v": "x" * 50})
+        cache.set("a", {"v": "x"})
+        assert cache.memory_bytes == len(b'{"v": "x"}')
+
+
+class TestDiskTier:
+    """Tests for the on-disk tier."""
+
+    def test_persists_across_instances(self, tmp_path):
+        ExecutionCache(cache_dir=tmp_path).set("abcdef", {"output": "value"})
+
+        fresh = ExecutionCache(cache_dir=tmp_path)
+        assert fresh.get("abcdef") == {"output": "value"}
+
+    def test_content_addressed_layout(self, tmp_path):
+        cache = ExecutionCache(cache_dir=tmp_path)
+        cache.set("abcdef", {"output": "value"})
+
+        assert (tmp_path / "ab" / "abcdef.json").exists()
+        # No temp files left behind by the atomic write
+        assert list(tmp_path.glob("**/.tmp-*")) == []
+
+    def test_unserializable_value_stays_in_memory(self, tmp_path):
+        cache = ExecutionCache(cache_dir=tmp_path)
+        value = {"output": object()}
+        cache.set("abcdef", value)
+
+        assert cache.get("abcdef") is value
+        assert not (tmp_path / "ab").exists()
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            {"output": (1, 2)},
+            {"output": {1: "a"}},
+            {"output": float("nan")},
+            {"output": OrderedDict(a=1)},
+        ],
+    )
+    def test_value_changed_by_json_stays_in_memory(self, tmp_path, value):
+        cache = ExecutionCache(cache_dir=tmp_path)
+        cache.set("abcdef", value)
+
+        assert cache.get("abcdef") is value
+        assert not (tmp_path / "ab").exists()
+
+    def test_json_values_round_trip_exactly(self, tmp_path):
+        value = {"output": [1, 2.5, True, None, {"nested": "x"}]}
+        ExecutionCache(cache_dir=tmp_path).set("abcdef", value)
+
+        assert ExecutionCache(cache_dir=tmp_path).get("abcdef") == value
+
+    def test_pickle_serializer(self, tmp_path):
+        ExecutionCache(cache_dir=tmp_path, serializer=PickleSerializer()).set(
+            "abcdef", {"output": (1, 2)}
+        )
+
+        fresh = ExecutionCache(cache_dir=tmp_path, serializer=PickleSerializer())
+        assert fresh.get("abcdef") == {"output": (1, 2)}
+
+    def test_corrupt_entry_is_a_miss(self, tmp_path):
+        (tmp_path / "ab").mkdir()
+        (tmp_path / "ab" / "abcdef.json").write_text("{not json")
+
+        assert ExecutionCache(cache_dir=tmp_path).get("abcdef") is None
+
+    def test_clear(self, tmp_path):
+        cache = ExecutionCache(cache_dir=tmp_path)
+        cache.set("abcdef", {"output": "value"})
+        cache.clear()
+
+        assert cache.get("abcdef") is None
+        assert cache.memory_bytes == 0
+
+    def test_entry_limit_prunes_least_recently_used(self, tmp_path):
+        cache = ExecutionCache(cache_dir=tmp_path, max_disk_entries=10)
+        for i in range(10):
+            key = f"{i:02d}key"
+            cache.set(key, {"v": i})
+            path = tmp_path / key[:2] / f"{key}.json"
+            os.utime(path, (1000 + i, 1000 + i))
+        cache.set("99key", {"v": 99})
+
+        remaining = sorted(p.stem for p in tmp_path.glob("*/*.json"))
+        assert len(remaining) == 9
+        assert "00key" not in remaining
+        assert "99key" in remaining
+
+    def test_byte_limit_prunes(self, tmp_path):
+        cache = ExecutionCache(cache_dir=tmp_path, max_disk_bytes=200)
+        for i in range(10):
+            cache.set(f"{i:02d}key", {"v": "x" * 30})
+
+        total = sum(p.stat().st_size for p in tmp_path.glob("*/*.json"))
+        assert 0 < total <= 200
+
+    def test_shared_cache_per_directory(self, tmp_path):
+        assert get_shared_cache(tmp_path) is get_shared_cache(tmp_path)
+        assert get_shared_cache(tmp_path) is not get_shared_cache(tmp_path / "x")
+
+
+class TestUnitCodeVersion:
+    """Tests for the FlowUnit code stamp in cache keys."""
+
+    def test_changes_when_source_file_changes(self, tmp_path, monkeypatch):
+        module_file = tmp_path / "stamped_unit.py"
+        module_file.write_text("class Unit:\n    VERSION = '1.0.0'\n")
+        monkeypatch.syspath_prepend(str(tmp_path))
+        module = importlib.import_module("stamped_unit")
+        try:
+            before = unit_code_version(module.Unit)
+            module_file.write_text("class Unit:\n    VERSION = '1.0.0'  # edited\n")
+            assert unit_code_version(module.Unit) != before
+        finally:
+            sys.modules.pop("stamped_unit", None)
+
+    def test_builtin_class_uses_version_only(self):
+        assert unit_code_version(int) == ""
+
+
+class TestCrossRunReuse:
+    """Tests for result reuse across GraphExecutor instances."""
+
+    @pytest.fixture
+    def counting_unit(self):
+        calls = {"count": 0}
+
+        class CountingUnit:
+            @staticmethod
+            def is_changed(config, inputs):
+                return None
+
+            @staticmethod
+            def check_lazy_status(config, inputs):
+                return []
+
+            async def on_before_execute(self, context):
+                pass
+
+            async def run_process(self, inputs, config, context):
+                calls["count"] += 1
+                return {"output": "result"}
+
+            async def on_after_execute(self, context, outputs):
+                pass
+
+        return CountingUnit, calls
+
+    @pytest.fixture
+    def graph(self):
+        ir = CustomNodeIR(
+            id="custom_1",
+            unit_id="test.unit",
+            name="Node",
+            source_node_id="custom_1",
+            config={"url": "https://example.com"},
+            input_connections={},
+            output_connections={},
+            output_node=True,
+        )
+        node = ExecutionNode(id="custom_1", node_type="custom", ir=ir)
+        return ExecutionGraph(nodes={"custom_1": node}, edges=[])
+
+    async def _run(self, executor, graph, unit, tmp_path):
+        with patch.object(executor.registry, "get_unit", return_value=unit):
+            return await executor.execute(graph, {}, tmp_path)
+
+    async def test_disk_hit_in_new_executor(self, graph, counting_unit, tmp_path):
+        unit, calls = counting_unit
+        cache_dir = tmp_path / "cache"
+
+        first = GraphExecutor(emit=AsyncMock(), cache_dir=cache_dir)
+        await self._run(first, graph, unit, tmp_path)
+
+        second = GraphExecutor(emit=AsyncMock(), cache_dir=cache_dir)
+        results = await self._run(second, graph, unit, tmp_path)
+
+        assert calls["count"] == 1
+        assert results["custom_1"] == {"output": "result"}
+
+    async def test_code_change_misses_cache(self, graph, counting_unit, tmp_path):
+        unit, calls = counting_unit
+        cache_dir = tmp_path / "cache"
+
+        first = GraphExecutor(emit=AsyncMock(), cache_dir=cache_dir)
+        await self._run(first, graph, unit, tmp_path)
+        unit.VERSION = "2.0.0"
+        second = GraphExecutor(emit=AsyncMock(), cache_dir=cache_dir)
+        await self._run(second, graph, unit, tmp_path)
+
+        assert calls["count"] == 2
+
+    async def test_unit_id_is_part_of_key(self, graph, counting_unit, tmp_path):
+        unit, calls = counting_unit
+        executor = GraphExecutor(emit=AsyncMock(), cache_dir=tmp_path / "cache")
+
+        await self._run(executor, graph, unit, tmp_path)
+        graph.nodes["custom_1"].ir.unit_id = "test.other"  # type: ignore[union-attr]
+        await self._run(executor, graph, unit, tmp_path)
+
+        assert calls["count"] == 2
+
+    async def test_nan_is_changed_always_executes(self, graph, counting_unit, tmp_path):
+        unit, calls = counting_unit
+        unit.is_changed = staticmethod(lambda config, inputs: float("nan"))
+        executor = GraphExecutor(emit=AsyncMock(), cache_dir=tmp_path / "cache")
+
+        await self._run(executor, graph, unit, tmp_path)
+        await self._run(executor, graph, unit, tmp_path)
+
+        assert calls["count"] == 2
+
+    async def test_always_execute_bypasses_cache(self, graph, counting_unit, tmp_path):
+        unit, calls = counting_unit
+        graph.nodes["custom_1"].ir.always_execute = True  # type: ignore[union-attr]
+        executor = GraphExecutor(emit=AsyncMock(), cache_dir=tmp_path / "cache")
+
+        await self._run(executor, graph, unit, tmp_path)
+        await self._run(executor, graph, unit, tmp_path)
+
+        assert calls["count"] == 2
+        assert not (tmp_path / "cache").exists()
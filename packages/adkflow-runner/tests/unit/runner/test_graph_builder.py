@@ -287,41 +287,6 @@ class TestGraphBuilderPortResolution:
         port = builder._find_source_port("c1", ir)
         assert port == "output"  # Default when no schema
 
-    def test_find_target_port_default(self):
-        """Find target port returns 'input' by default."""
-        builder = GraphBuilder()
-        root = AgentIR(id="root", name="Root", type="llm", model="gemini-2.0-flash")
-        ir = WorkflowIR(
-            project_path="/test",
-            root_agent=root,
-            all_agents={"root": root},
-            custom_nodes=[],
-        )
-        port = builder._find_target_port("unknown", ir)
-        assert port == "input"
-
-    def test_find_target_port_for_custom_node(self):
-        """Find target port for custom node."""
-        builder = GraphBuilder()
-        root = AgentIR(id="root", name="Root", type="llm", model="gemini-2.0-flash")
-        custom = CustomNodeIR(
-            id="c1",
-            unit_id="test_unit",
-            name="Custom",
-            source_node_id="c1_src",
-            config={},
-            input_connections={},
-            output_connections={},
-        )
-        ir = WorkflowIR(
-            project_path="/test",
-            root_agent=root,
-            all_agents={"root": root},
-            custom_nodes=[custom],
-        )
-        port = builder._find_target_port("c1", ir)
-        assert port == "input"  # Default when no schema
-
 
 class TestPartitionCustomNodes:
     """Tests for partition_custom_nodes function."""
@@ -0,0 +1,242 @@
+"""Tests for GraphExecutor scheduling modes."""
+
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from adkflow_runner.hooks import HookResult
+from adkflow_runner.ir import ConnectionSource, CustomNodeIR
+from adkflow_runner.runner.graph_executor import (
+    ExecutionEdge,
+    ExecutionGraph,
+    ExecutionNode,
+    GraphExecutor,
+)
+
+
+def _node(node_id: str, output_node: bool = False, upstream: str | None = None):
+    """Create a custom execution node, optionally fed by an upstream node."""
+    ir = CustomNodeIR(
+        id=node_id,
+        unit_id="test.unit",
+        name=node_id,
+        source_node_id=node_id,
+        config={"id": node_id},
+        input_connections={"input": [ConnectionSource(upstream)]} if upstream else {},
+        output_connections={},
+        output_node=output_node,
+        always_execute=True,
+    )
+    return ExecutionNode(id=node_id, node_type="custom", ir=ir)
+
+
+def _edge(source: str, target: str) -> ExecutionEdge:
+    return ExecutionEdge(
+        source_id=source, source_port="output", target_id=target, target_port="input"
+    )
+
+
+@pytest.fixture
+def fan_out_graph():
+    """slow and fast share layer 0; after_fast depends only on fast."""
+    nodes = {
+        "slow": _node("slow", output_node=True),
+        "fast": _node("fast"),
+        "after_fast": _node("after_fast", output_node=True, upstream="fast"),
+    }
+    return ExecutionGraph(nodes=nodes, edges=[_edge("fast", "after_fast")])
+
+
+def _make_unit(behaviors: dict[str, Any]):
+    """Create a FlowUnit-like class whose behavior is looked up per node."""
+
+    class Unit:
+        @staticmethod
+        def is_changed(config, inputs):
+            return None
+
+        @staticmethod
+        def check_lazy_status(config, inputs):
+            return []
+
+        async def on_before_execute(self, context):
+            pass
+
+        async def run_process(self, inputs, config, context):
+            behavior = behaviors.get(config["id"])
+            if behavior is not None:
+                await behavior()
+            return {"output": f"{config['id']}:{inputs.get('input', '')}"}
+
+        async def on_after_execute(self, context, outputs):
+            pass
+
+    return Unit
+
+
+class TestEagerScheduling:
+    """Tests for the dependency-driven scheduler."""
+
+    async def test_successor_does_not_wait_for_slow_sibling(
+        self, fan_out_graph, tmp_path
+    ):
+        released = asyncio.Event()
+
+        async def slow():
+            # Only finishes once after_fast has run, which would deadlock
+            # under the layered scheduler
+            await released.wait()
+
+        async def after_fast():
+            released.set()
+
+        unit = _make_unit({"slow": slow, "after_fast": after_fast})
+        executor = GraphExecutor(emit=AsyncMock(), scheduling="eager")
+
+        with patch.object(executor.registry, "get_unit", return_value=unit):
+            results = await asyncio.wait_for(
+                executor.execute(fan_out_graph, {}, tmp_path), timeout=2
+            )
+
+        assert results["after_fast"] == {"output": "after_fast:fast:"}
+        assert results["slow"] == {"output": "slow:"}
+
+    async def test_results_match_layered_mode(self, fan_out_graph, tmp_path):
+        unit = _make_unit({})
+        layered = GraphExecutor(emit=AsyncMock())
+        eager = GraphExecutor(emit=AsyncMock(), scheduling="eager")
+
+        with patch.object(layered.registry, "get_unit", return_value=unit):
+            expected = await layered.execute(fan_out_graph, {}, tmp_path)
+            actual = await eager.execute(fan_out_graph, {}, tmp_path)
+
+        assert actual == expected
+
+    async def test_error_propagates(self, fan_out_graph, tmp_path):
+        async def fail():
+            raise RuntimeError("boom")
+
+        unit = _make_unit({"fast": fail})
+        emit = AsyncMock()
+        executor = GraphExecutor(emit=emit, scheduling="eager")
+
+        with patch.object(executor.registry, "get_unit", return_value=unit):
+            with pytest.raises(RuntimeError, match="boom"):
+                await executor.execute(fan_out_graph, {}, tmp_path)
+
+        event_types = [call.args[0]["type"] for call in emit.call_args_list]
+        assert "node_error" in event_types
+
+    async def test_error_waits_for_cancelled_nodes(self, fan_out_graph, tmp_path):
+        slow_finished = asyncio.Event()
+
+        async def slow():
+            try:
+                await asyncio.sleep(10)
+            finally:
+                slow_finished.set()
+
+        async def fail():
+            raise RuntimeError("boom")
+
+        unit = _make_unit({"slow": slow, "fast": fail})
+        executor = GraphExecutor(emit=AsyncMock(), scheduling="eager")
+
+        with patch.object(executor.registry, "get_unit", return_value=unit):
+            with pytest.raises(RuntimeError, match="boom"):
+                await executor.execute(fan_out_graph, {}, tmp_path)
+
+        assert slow_finished.is_set()
+
+    async def test_layer_events_emitted_once_per_layer(self, fan_out_graph, tmp_path):
+        emit = AsyncMock()
+        executor = GraphExecutor(emit=emit, scheduling="eager")
+
+        with patch.object(executor.registry, "get_unit", return_value=_make_unit({})):
+            await executor.execute(fan_out_graph, {}, tmp_path)
+
+        event_types = [call.args[0]["type"] for call in emit.call_args_list]
+        assert event_types.count("layer_start") == 2
+        assert event_types.count("layer_end") == 2
+
+
+class TestEagerLayerHookShim:
+    """Tests for layer hook compatibility in eager mode."""
+
+    @pytest.fixture
+    def hooks(self):
+        hooks = MagicMock()
+        hooks.on_execution_plan = AsyncMock(
+            side_effect=lambda layers: (HookResult.continue_(), layers)
+        )
+        hooks.before_layer_execute = AsyncMock(
+            side_effect=lambda idx, layer: (HookResult.continue_(), layer)
+        )
+        hooks.after_layer_execute = AsyncMock(
+            side_effect=lambda idx, results: (HookResult.continue_(), results)
+        )
+        hooks.before_node_execute = AsyncMock(
+            side_effect=lambda **kw: (
+                HookResult.continue_(),
+                kw["inputs"],
+                kw["config"],
+            )
+        )
+        hooks.after_node_execute = AsyncMock(
+            side_effect=lambda **kw: (HookResult.continue_(), kw["outputs"])
+        )
+        return hooks
+
+    async def test_layer_hooks_called_once_per_layer(
+        self, fan_out_graph, hooks, tmp_path
+    ):
+        executor = GraphExecutor(emit=AsyncMock(), hooks=hooks, scheduling="eager")
+
+        with patch.object(executor.registry, "get_unit", return_value=_make_unit({})):
+            await executor.execute(fan_out_graph, {}, tmp_path)
+
+        hooks.on_execution_plan.assert_awaited_once()
+        assert [c.args[0] for c in hooks.before_layer_execute.call_args_list] == [0, 1]
+        after_calls = {
+            c.args[0]: c.args[1] for c in hooks.after_layer_execute.call_args_list
+        }
+        assert set(after_calls[0]) == {"slow", "fast"}
+        assert set(after_calls[1]) == {"after_fast"}
+
+    async def test_skipped_layer_releases_successors(
+        self, fan_out_graph, hooks, tmp_path
+    ):
+        hooks.before_layer_execute = AsyncMock(
+            side_effect=lambda idx, layer: (
+                (HookResult.skip(), layer)
+                if idx == 0
+                else (HookResult.continue_(), layer)
+            )
+        )
+        executor = GraphExecutor(emit=AsyncMock(), hooks=hooks, scheduling="eager")
+
+        with patch.object(executor.registry, "get_unit", return_value=_make_unit({})):
+            results = await executor.execute(fan_out_graph, {}, tmp_path)
+
+        assert "slow" not in results
+        assert "fast" not in results
+        assert results["after_fast"] == {"output": "after_fast:"}
+
+    async def test_nodes_dropped_from_layer_are_not_run(
+        self, fan_out_graph, hooks, tmp_path
+    ):
+        hooks.before_layer_execute = AsyncMock(
+            side_effect=lambda idx, layer: (
+                HookResult.continue_(),
+                [n for n in layer if n != "slow"],
+            )
+        )
+        executor = GraphExecutor(emit=AsyncMock(), hooks=hooks, scheduling="eager")
+
+        with patch.object(executor.registry, "get_unit", return_value=_make_unit({})):
+            results = await executor.execute(fan_out_graph, {}, tmp_path)
+
+        assert "slow" not in results
+        assert "after_fast" in results
@@ -0,0 +1,110 @@
+"""Tests for ExecutionGraph adjacency indexes and planning cost."""
+
+import random
+import time
+from unittest.mock import AsyncMock
+
+import pytest
+
+from adkflow_runner.ir import CustomNodeIR
+from adkflow_runner.runner.graph_executor import (
+    ExecutionEdge,
+    ExecutionGraph,
+    ExecutionNode,
+    GraphExecutor,
+)
+
+
+def _edge(source: str, target: str) -> ExecutionEdge:
+    return ExecutionEdge(
+        source_id=source, source_port="output", target_id=target, target_port="input"
+    )
+
+
+def _synthetic_graph(size: int, fan_in: int = 3, seed: int = 0) -> ExecutionGraph:
+    """Random DAG where each node reads from up to fan_in earlier nodes."""
+    rng = random.Random(seed)
+    nodes = {}
+    edges = []
+    for i in range(size):
+        node_id = f"n{i}"
+        ir = CustomNodeIR(
+            id=node_id,
+            unit_id="test.unit",
+            name=node_id,
+            source_node_id=node_id,
+            config={},
+            output_node=i == size - 1 or rng.random() < 0.01,
+        )
+        nodes[node_id] = ExecutionNode(id=node_id, node_type="custom", ir=ir)
+        for source in rng.sample(range(i), min(i, fan_in)):
+            edges.append(_edge(f"n{source}", node_id))
+    return ExecutionGraph(nodes=nodes, edges=edges)
+
+
+def _plan(executor: GraphExecutor, graph: ExecutionGraph) -> list[list[str]]:
+    outputs = executor._find_output_nodes(graph)
+    required = executor._trace_dependencies(graph, outputs)
+    return executor._topological_layers(required, graph)
+
+
+class TestAdjacencyIndexes:
+    """Tests for the indexes built on ExecutionGraph."""
+
+    def test_indexes_built_on_construction(self):
+        graph = ExecutionGraph(
+            nodes={},
+            edges=[_edge("a", "b"), _edge("a", "c"), _edge("b", "c")],
+        )
+        assert graph.successors["a"] == ["b", "c"]
+        assert graph.predecessors["c"] == ["a", "b"]
+
+    def test_reindex_after_mutation(self):
+        graph = ExecutionGraph(edges=[_edge("a", "b")])
+        graph.edges.append(_edge("b", "c"))
+        graph.reindex()
+        assert graph.successors["b"] == ["c"]
+
+    def test_indexes_not_part_of_equality(self):
+        assert ExecutionGraph(edges=[_edge("a", "b")]) == ExecutionGraph(
+            edges=[_edge("a", "b")]
+        )
+
+    def test_layers_respect_every_edge(self):
+        graph = _synthetic_graph(500)
+        layers = _plan(GraphExecutor(emit=AsyncMock()), graph)
+
+        depth = {n: i for i, layer in enumerate(layers) for n in layer}
+        for edge in graph.edges:
+            if edge.target_id in depth:
+                assert depth[edge.source_id] < depth[edge.target_id]
+        # Every node is placed in the layer right after its deepest input
+        for node_id, d in depth.items():
+            inputs = [depth[p] for p in graph.predecessors[node_id]]
+            assert d == (max(inputs) + 1 if inputs else 0)
+
+
+@pytest.mark.slow
+class TestPlanningBenchmark:
+    """Micro-benchmark for planning on large synthetic graphs."""
+
+    @staticmethod
+    def _best_of(runs: int, func) -> float:
+        best = float("inf")
+        for _ in range(runs):
+            start = time.perf_counter()
+            func()
+            best = min(best, time.perf_counter() - start)
+        return best
+
+    def test_planning_scales_linearly(self):
+        executor = GraphExecutor(emit=AsyncMock())
+        small = _synthetic_graph(1_000)
+        large = _synthetic_graph(10_000)
+
+        small_time = self._best_of(5, lambda: _plan(executor, small))
+        large_time = self._best_of(5, lambda: _plan(executor, large))
+
+        # 10x the nodes: linear planning costs ~10x, quadratic ~100x
+        assert large_time / small_time < 30
+        assert large_time < 1.0
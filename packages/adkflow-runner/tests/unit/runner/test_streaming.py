@@ -0,0 +1,150 @@
+"""Tests for streaming run events."""
+
+import asyncio
+import time
+
+from adkflow_runner.runner.streaming import (
+    EventChannel,
+    run_workflow_batches,
+    run_workflow_generator,
+)
+from adkflow_runner.runner.types import (
+    EventType,
+    RunConfig,
+    RunEvent,
+    RunResult,
+    RunStatus,
+)
+
+
+def _event(i: int) -> RunEvent:
+    return RunEvent(type=EventType.AGENT_OUTPUT, timestamp=time.time(), data={"i": i})
+
+
+class FakeRunner:
+    """Runner that emits a fixed number of events."""
+
+    def __init__(self, count: int, pause_every: int = 0):
+        self.count = count
+        self.pause_every = pause_every
+        self.config: RunConfig | None = None
+
+    async def run(self, config: RunConfig) -> RunResult:
+        self.config = config
+        assert config.callbacks is not None
+        for i in range(self.count):
+            await config.callbacks.on_event(_event(i))
+            if self.pause_every and (i + 1) % self.pause_every == 0:
+                await asyncio.sleep(0)
+        return RunResult(run_id="r1", status=RunStatus.COMPLETED, output="done")
+
+
+class TestEventChannel:
+    """Tests for EventChannel."""
+
+    async def test_iterates_until_closed(self):
+        channel = EventChannel()
+
+        async def produce():
+            for i in range(3):
+                channel.send(_event(i))
+                await asyncio.sleep(0)
+            channel.close()
+
+        producer = asyncio.create_task(produce())
+        received = [e.data["i"] async for e in channel]
+        await producer
+
+        assert received == [0, 1, 2]
+
+    async def test_get_batch_takes_buffered_events(self):
+        channel = EventChannel()
+        for i in range(5):
+            channel.send(_event(i))
+
+        assert [e.data["i"] for e in await channel.get_batch(3)] == [0, 1, 2]
+        assert [e.data["i"] for e in await channel.get_batch()] == [3, 4]
+
+        channel.close()
+        assert await channel.get_batch() == []
+
+    async def test_send_after_close_is_ignored(self):
+        channel = EventChannel()
+        channel.close()
+        channel.send(_event(0))
+        assert [e async for e in channel] == []
+
+
+class TestRunWorkflowGenerator:
+    """Tests for run_workflow_generator and run_workflow_batches."""
+
+    async def test_yields_events_then_result(self, tmp_path):
+        runner = FakeRunner(count=4)
+        config = RunConfig(project_path=tmp_path, run_id="r1", tab_id="t")
+
+        items = [item async for item in run_workflow_generator(runner, config)]
+
+        assert [e.data["i"] for e in items[:-1]] == [0, 1, 2, 3]
+        assert isinstance(items[-1], RunResult)
+        # Other settings are passed through unchanged
+        assert runner.config is not None
+        assert runner.config.run_id == "r1"
+        assert runner.config.tab_id == "t"
+
+    async def test_does_not_create_task_per_event(self, tmp_path):
+        runner = FakeRunner(count=200, pause_every=1)
+        before = len(asyncio.all_tasks())
+
+        peak = 0
+        async for _ in run_workflow_generator(runner, RunConfig(project_path=tmp_path)):
+            peak = max(peak, len(asyncio.all_tasks()) - before)
+
+        assert peak <= 1  # Only the run itself
+
+    async def test_batches(self, tmp_path):
+        runner = FakeRunner(count=10, pause_every=5)
+
+        items = [
+            item
+            async for item in run_workflow_batches(
+                runner, RunConfig(project_path=tmp_path)
+            )
+        ]
+
+        batches, result = items[:-1], items[-1]
+        assert isinstance(result, RunResult)
+        assert [len(b) for b in batches] == [5, 5]
+        assert [e.data["i"] for b in batches for e in b] == list(range(10))
+
+    async def test_max_batch_size(self, tmp_path):
+        runner = FakeRunner(count=10)
+
+        items = [
+            item
+            async for item in run_workflow_batches(
+                runner, RunConfig(project_path=tmp_path), max_batch_size=4
+            )
+        ]
+
+        assert [len(b) for b in items[:-1]] == [4, 4, 2]
+
+    async def test_closing_generator_cancels_run(self, tmp_path):
+        started = asyncio.Event()
+
+        class SlowRunner:
+            task: asyncio.Task | None = None
+
+            async def run(self, config):
+                self.task = asyncio.current_task()
+                await config.callbacks.on_event(_event(0))
+                started.set()
+                await asyncio.sleep(10)
+
+        runner = SlowRunner()
+        gen = run_workflow_generator(runner, RunConfig(project_path=tmp_path))
+        await gen.__anext__()
+        await started.wait()
+        await gen.aclose()
+        await asyncio.sleep(0)
+
+        assert runner.task is not None and runner.task.cancelled()
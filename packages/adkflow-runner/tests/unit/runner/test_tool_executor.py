@@ -0,0 +1,241 @@
+"""Tests for bounded sync tool executors."""
+
+import asyncio
+import contextvars
+import time
+
+import pytest
+
+from adkflow_runner.errors import ToolTimeoutError
+from adkflow_runner.ir import ToolIR
+from adkflow_runner.runner.tool_cache import ToolModuleCache
+from adkflow_runner.runner.tool_executor import (
+    DEFAULT_THREAD_WORKERS,
+    ToolExecutionSettings,
+    ToolExecutor,
+    ToolExecutorRegistry,
+)
+from adkflow_runner.runner.tool_loader import ToolLoader
+
+_marker: contextvars.ContextVar[str] = contextvars.ContextVar("marker", default="")
+
+
+@pytest.fixture
+def registry():
+    registry = ToolExecutorRegistry()
+    yield registry
+    registry.shutdown()
+
+
+class TestToolExecutionSettings:
+    """Tests for parsing ToolIR.config."""
+
+    def test_defaults(self):
+        settings = ToolExecutionSettings.from_config(None)
+        assert settings == ToolExecutionSettings("thread", None, None)
+
+    def test_parses_values(self):
+        settings = ToolExecutionSettings.from_config(
+            {"execution_mode": "process", "max_workers": "2", "timeout": 1.5}
+        )
+        assert settings == ToolExecutionSettings("process", 2, 1.5)
+
+    def test_ignores_invalid_values(self):
+        settings = ToolExecutionSettings.from_config(
+            {"execution_mode": "gpu", "max_workers": 0, "timeout": "soon"}
+        )
+        assert settings == ToolExecutionSettings()
+
+
+class TestToolExecutor:
+    """Tests for ToolExecutor.run."""
+
+    async def test_runs_call_with_caller_context(self):
+        executor = ToolExecutor("ctx", max_workers=1)
+        _marker.set("run-1")
+        try:
+            result = await executor.run(lambda x: (x, _marker.get()), 3)
+        finally:
+            executor.shutdown()
+        assert result == (3, "run-1")
+        assert executor.stats().completed == 1
+
+    async def test_timeout(self):
+        executor = ToolExecutor("slow", max_workers=1)
+        try:
+            with pytest.raises(ToolTimeoutError, match="timed out"):
+                await executor.run(time.sleep, 0.2, timeout=0.05)
+            stats = executor.stats()
+            # The worker is still busy with the timed-out call
+            assert stats.timed_out == 1
+            assert stats.in_flight == 1
+            assert stats.abandoned == 1
+
+            await asyncio.sleep(0.3)
+            stats = executor.stats()
+        finally:
+            executor.shutdown()
+        assert stats.in_flight == 0
+        assert stats.abandoned == 0
+
+    async def test_timeout_of_queued_call_frees_slot(self):
+        executor = ToolExecutor("queued", max_workers=1)
+        try:
+            running = asyncio.ensure_future(executor.run(time.sleep, 0.2))
+            await asyncio.sleep(0.02)
+            with pytest.raises(ToolTimeoutError):
+                await executor.run(time.sleep, 0.2, timeout=0.02)
+            # The queued call was dropped, only the running one remains
+            stats = executor.stats()
+            assert stats.in_flight == 1
+            assert stats.abandoned == 0
+            await running
+        finally:
+            executor.shutdown()
+        assert executor.stats().in_flight == 0
+
+    async def test_cancelled_running_call_stays_in_flight(self):
+        executor = ToolExecutor("cancel", max_workers=1)
+        try:
+            task = asyncio.ensure_future(executor.run(time.sleep, 0.2))
+            await asyncio.sleep(0.02)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            assert executor.stats().in_flight == 1
+
+            await asyncio.sleep(0.3)
+            stats = executor.stats()
+        finally:
+            executor.shutdown()
+        assert stats.in_flight == 0
+        assert stats.cancelled == 1
+        assert stats.failed == 0
+
+    async def test_failure_is_counted(self):
+        def fail():
+            raise ValueError("bad")
+
+        executor = ToolExecutor("fail", max_workers=1)
+        try:
+            with pytest.raises(ValueError):
+                await executor.run(fail)
+        finally:
+            executor.shutdown()
+        assert executor.stats().failed == 1
+
+    async def test_queue_depth(self):
+        executor = ToolExecutor("queue", max_workers=1)
+        try:
+            await asyncio.gather(*(executor.run(time.sleep, 0.02) for _ in range(3)))
+        finally:
+            executor.shutdown()
+        stats = executor.stats()
+        assert stats.max_queue_depth == 2
+        assert stats.queue_depth == 0
+        assert stats.completed == 3
+
+    async def test_bounded_concurrency(self):
+        active = []
+        peak = []
+
+        def work():
+            active.append(1)
+            peak.append(len(active))
+            time.sleep(0.02)
+            active.pop()
+
+        executor = ToolExecutor("bounded", max_workers=2)
+        try:
+            await asyncio.gather(*(executor.run(work) for _ in range(6)))
+        finally:
+            executor.shutdown()
+        assert max(peak) <= 2
+
+
+class TestToolExecutorRegistry:
+    """Tests for executor selection."""
+
+    def test_tools_share_project_pool(self, registry, tmp_path):
+        settings = ToolExecutionSettings()
+        first = registry.for_tool(tmp_path, "a", settings)
+        second = registry.for_tool(tmp_path, "b", settings)
+        assert first is second
+        assert first.max_workers == DEFAULT_THREAD_WORKERS
+
+    def test_projects_are_isolated(self, registry, tmp_path):
+        settings = ToolExecutionSettings()
+        assert registry.for_tool(tmp_path / "x", "a", settings) is not (
+            registry.for_tool(tmp_path / "y", "a", settings)
+        )
+
+    def test_max_workers_gives_dedicated_pool(self, registry, tmp_path):
+        shared = registry.for_tool(tmp_path, "a", ToolExecutionSettings())
+        dedicated = registry.for_tool(
+            tmp_path, "b", ToolExecutionSettings(max_workers=3)
+        )
+        assert dedicated is not shared
+        assert dedicated.max_workers == 3
+
+    def test_stats(self, registry, tmp_path):
+        registry.for_tool(tmp_path, "a", ToolExecutionSettings())
+        registry.for_tool(tmp_path, "b", ToolExecutionSettings(max_workers=1))
+        assert set(registry.stats()) == {
+            f"{tmp_path}:*:thread",
+            f"{tmp_path}:b:thread",
+        }
+
+    def test_shutdown_forgets_executors(self, registry, tmp_path):
+        settings = ToolExecutionSettings()
+        before = registry.for_tool(tmp_path, "a", settings)
+        registry.shutdown()
+
+        assert registry.stats() == {}
+        assert registry.for_tool(tmp_path, "a", settings) is not before
+
+
+class TestToolLoaderExecution:
+    """Tests for tools loaded through ToolLoader."""
+
+    def _loader(self, tmp_path, registry):
+        return ToolLoader(tmp_path, module_cache=ToolModuleCache(), executors=registry)
+
+    async def test_timeout_from_config_passed_to_model(self, tmp_path, registry):
+        tool_ir = ToolIR(
+            name="sleepy",
+            code="import time\n\ndef sleepy() -> str:\n    time.sleep(0.5)\n",
+            error_behavior="pass_to_model",
+            config={"timeout": 0.05},
+        )
+        func = self._loader(tmp_path, registry).load(tool_ir)
+
+        result = await func()
+        assert "timed out" in result["error"]
+
+    async def test_signature_is_preserved(self, tmp_path, registry):
+        import inspect
+
+        tool_ir = ToolIR(
+            name="typed",
+            code="def typed(city: str, days: int = 1) -> str:\n    return city\n",
+        )
+        func = self._loader(tmp_path, registry).load(tool_ir)
+        assert list(inspect.signature(func).parameters) == ["city", "days"]
+        assert await func(city="Oslo") == "Oslo"
+
+    @pytest.mark.slow
+    async def test_process_mode(self, tmp_path, registry):
+        (tmp_path / "tools").mkdir()
+        (tmp_path / "tools" / "pid_tool.py").write_text(
+            "import os\n\ndef pid_tool(x: int) -> tuple:\n    return os.getpid(), x * 2\n"
+        )
+        tool_ir = ToolIR(
+            name="pid_tool",
+            file_path="pid_tool.py",
+            config={"execution_mode": "process", "max_workers": 1, "timeout": 60},
+        )
+        func = self._loader(tmp_path, registry).load(tool_ir)
+
+        pid, doubled = await func(x=21)
+        assert doubled == 42
+        assert pid != __import__("os").getpid()
@@ -5,11 +5,18 @@ Tests loading tools from files and inline code.
 
 from __future__ import annotations
 
+import asyncio
+import linecache
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 
 from adkflow_runner.errors import ToolLoadError
 from adkflow_runner.ir import ToolIR
+from adkflow_runner.runner.tool_cache import ToolModuleCache
 from adkflow_runner.runner.tool_loader import BUILTIN_TOOLS, ToolLoader
 
 
@@ -129,6 +136,20 @@ class TestLoadFromCode:
         with pytest.raises(ToolLoadError):
             loader.load(tool_ir)
 
+    def test_failed_code_module_is_not_registered(self, tmp_path):
+        """A tool whose code raises leaves nothing in sys.modules or linecache."""
+        loader = ToolLoader(project_path=tmp_path)
+        tool_ir = ToolIR(
+            name="raising_tool",
+            code="def raising_tool():\n    pass\n\nraise RuntimeError('boom')",
+        )
+
+        with pytest.raises(ToolLoadError):
+            loader.load(tool_ir)
+
+        assert "adkflow_tool_raising_tool" not in sys.modules
+        assert "<adkflow_tool_raising_tool>" not in linecache.cache
+
 
 class TestToolValidation:
     """Tests for tool validation."""
@@ -386,3 +407,127 @@ class TestCodeValidation:
             # Should not raise - just warn
             result = loader.load(tool_ir)
             assert callable(result)
+
+
+class TestSharedModuleCache:
+    """Tests for module reuse across ToolLoader instances."""
+
+    def _counting_tool(self, tmp_path, name="counted"):
+        """Tool file that counts how often its module is executed."""
+        (tmp_path / "tools").mkdir(exist_ok=True)
+        path = tmp_path / "tools" / f"{name}.py"
+        path.write_text(
+            "import builtins\n"
+            "builtins.__dict__.setdefault('_adkflow_exec_count', [])"
+            f".append('{name}')\n"
+            f"def {name}() -> str:\n    return 'v1'\n"
+        )
+        return path
+
+    def _exec_count(self, name):
+        import builtins
+
+        return builtins.__dict__.get("_adkflow_exec_count", []).count(name)
+
+    def test_file_module_executed_once_across_loaders(self, tmp_path):
+        self._counting_tool(tmp_path, "shared_once")
+        cache = ToolModuleCache()
+        tool_ir = ToolIR(name="shared_once", file_path="shared_once.py")
+
+        ToolLoader(tmp_path, module_cache=cache).load(tool_ir)
+        ToolLoader(tmp_path, module_cache=cache).load(tool_ir)
+
+        assert self._exec_count("shared_once") == 1
+        assert cache.hits == 1
+
+    def test_file_change_reloads_module(self, tmp_path):
+        path = self._counting_tool(tmp_path, "changing")
+        cache = ToolModuleCache()
+        tool_ir = ToolIR(name="changing", file_path="changing.py")
+        ToolLoader(tmp_path, module_cache=cache).load(tool_ir)
+
+        st = path.stat()
+        path.write_text("def changing() -> str:\n    return 'version two'\n")
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+        func = ToolLoader(tmp_path, module_cache=cache).load(tool_ir)
+        assert asyncio.run(func()) == "version two"
+
+    def test_inline_code_cached_by_hash(self, tmp_path):
+        cache = ToolModuleCache()
+        code = "def hashed(x: int) -> int:\n    return x * 2\n"
+
+        ToolLoader(tmp_path, module_cache=cache).load(ToolIR(name="hashed", code=code))
+        ToolLoader(tmp_path, module_cache=cache).load(ToolIR(name="hashed", code=code))
+        ToolLoader(tmp_path, module_cache=cache).load(
+            ToolIR(name="hashed", code=code + "\n# edited\n")
+        )
+
+        assert cache.hits == 1
+        assert len(cache) == 2
+
+    def test_inline_code_is_not_written_to_disk(self, tmp_path, monkeypatch):
+        import tempfile
+
+        def fail(*args, **kwargs):
+            raise AssertionError("inline tools must not use temp files")
+
+        monkeypatch.setattr(tempfile, "NamedTemporaryFile", fail)
+        tool_ir = ToolIR(
+            name="in_memory", code="def in_memory() -> str:\n    return 'ok'\n"
+        )
+        func = ToolLoader(tmp_path, module_cache=ToolModuleCache()).load(tool_ir)
+        assert asyncio.run(func()) == "ok"
+
+    def test_inline_source_available_for_inspect(self, tmp_path):
+        import inspect
+
+        code = "def sourced() -> str:\n    return 'ok'\n"
+        loader = ToolLoader(tmp_path, module_cache=ToolModuleCache())
+        func = loader.load(ToolIR(name="sourced", code=code))
+        assert inspect.getsource(inspect.unwrap(func)) == code
+
+    def test_failed_load_is_not_cached(self, tmp_path):
+        cache = ToolModuleCache()
+        tool_ir = ToolIR(name="boom", code="raise RuntimeError('boom')\n")
+
+        for _ in range(2):
+            with pytest.raises(ToolLoadError, match="boom"):
+                ToolLoader(tmp_path, module_cache=cache).load(tool_ir)
+        assert len(cache) == 0
+
+    def test_load_timings(self, tmp_path):
+        cache = ToolModuleCache()
+        ToolLoader(tmp_path, module_cache=cache).load(
+            ToolIR(name="timed", code="def timed() -> None:\n    pass\n")
+        )
+
+        (timing,) = cache.load_timings()
+        assert timing.key.startswith("code:")
+        assert timing.module_name == "adkflow_tool_timed"
+        assert timing.duration_ms >= 0
+
+    def test_concurrent_loads_execute_once(self):
+        cache = ToolModuleCache()
+        calls = []
+
+        def load():
+            calls.append(1)
+            time.sleep(0.05)
+            return object()
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(
+                pool.map(lambda _: cache.get_or_load("k", None, load), range(4))
+            )
+
+        assert len(calls) == 1
+        assert all(r is results[0] for r in results)
+
+    def test_lru_eviction(self):
+        cache = ToolModuleCache(max_entries=1)
+        cache.get_or_load("a", None, object)
+        cache.get_or_load("b", None, object)
+
+        assert len(cache) == 1
+        assert [t.key for t in cache.load_timings()] == ["b"]
@@ -126,6 +126,16 @@ class TestRunEvent:
         assert d["agent_name"] == "Agent1"
         assert d["data"]["output"] == "Hello"
 
+    def test_event_from_dict(self):
+        """Round-trip event through to_dict."""
+        event = RunEvent(
+            type=EventType.TOOL_CALL,
+            timestamp=1234567890.0,
+            agent_id="a1",
+            data={"tool_name": "search"},
+        )
+        assert RunEvent.from_dict(event.to_dict()) == event
+
 
 class TestRunResult:
     """Tests for RunResult dataclass."""
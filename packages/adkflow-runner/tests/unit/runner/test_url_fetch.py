@@ -0,0 +1,186 @@
+"""Tests for pooled, cached URL fetching against a local HTTP server."""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from adkflow_runner.ir import ContextAggregatorIR
+from adkflow_runner.runner.context_aggregator_executor import (
+    URL_CACHE_DIR,
+    execute_context_aggregator,
+)
+from adkflow_runner.runner.url_fetch import HttpClientPool, fetch_url
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # Keep-alive
+
+    def do_GET(self):
+        server = self.server
+        server.requests.append((self.path, dict(self.headers), self.client_address))
+        etag = server.etags.get(self.path)
+        if etag and self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        body = f"body of {self.path} {etag or ''}".encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        if etag:
+            self.send_header("ETag", etag)
+        for name, value in server.extra_headers.get(self.path, {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    """Local stand-in HTTP server recording every request."""
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    httpd.requests = []
+    httpd.etags = {}
+    httpd.extra_headers = {}
+    httpd.base = f"http://127.0.0.1:{httpd.server_address[1]}"
+    thread = threading.Thread(
+        target=httpd.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True
+    )
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+async def pool():
+    pool = HttpClientPool()
+    yield pool
+    await pool.aclose()
+
+
+class TestClientPool:
+    """Tests for HttpClientPool."""
+
+    async def test_same_client_within_loop(self, pool):
+        assert pool.client() is pool.client()
+
+    async def test_connections_are_reused(self, server, pool):
+        for _ in range(3):
+            response = await fetch_url(f"{server.base}/page", pool=pool)
+            assert response.status_code == 200
+
+        client_ports = {address for _, _, address in server.requests}
+        assert len(server.requests) == 3
+        assert len(client_ports) == 1
+
+    async def test_aclose_replaces_client(self, pool):
+        first = pool.client()
+        await pool.aclose()
+        assert first.is_closed
+        assert pool.client() is not first
+
+
+class TestResponseCache:
+    """Tests for the on-disk conditional-GET cache."""
+
+    async def test_etag_revalidation_returns_cached_body(self, server, pool, tmp_path):
+        server.etags["/doc"] = '"v1"'
+        url = f"{server.base}/doc"
+
+        first = await fetch_url(url, cache_dir=tmp_path, pool=pool)
+        second = await fetch_url(url, cache_dir=tmp_path, pool=pool)
+
+        assert first.text == second.text == 'body of /doc "v1"'
+        assert second.status_code == 200
+        assert "If-None-Match" not in server.requests[0][1]
+        assert server.requests[1][1]["If-None-Match"] == '"v1"'
+
+    async def test_changed_etag_replaces_entry(self, server, pool, tmp_path):
+        url = f"{server.base}/doc"
+        server.etags["/doc"] = '"v1"'
+        await fetch_url(url, cache_dir=tmp_path, pool=pool)
+
+        server.etags["/doc"] = '"v2"'
+        changed = await fetch_url(url, cache_dir=tmp_path, pool=pool)
+        again = await fetch_url(url, cache_dir=tmp_path, pool=pool)
+
+        assert changed.text == again.text == 'body of /doc "v2"'
+        assert server.requests[-1][1]["If-None-Match"] == '"v2"'
+
+    async def test_fresh_entry_skips_request(self, server, pool, tmp_path):
+        server.extra_headers["/static"] = {"Cache-Control": "max-age=60"}
+        url = f"{server.base}/static"
+
+        first = await fetch_url(url, cache_dir=tmp_path, pool=pool)
+        second = await fetch_url(url, cache_dir=tmp_path, pool=pool)
+
+        assert len(server.requests) == 1
+        assert second.text == first.text
+        assert second.headers["content-type"] == "text/plain; charset=utf-8"
+
+    async def test_no_store_is_not_cached(self, server, pool, tmp_path):
+        server.etags["/private"] = '"v1"'
+        server.extra_headers["/private"] = {"Cache-Control": "no-store"}
+        url = f"{server.base}/private"
+
+        await fetch_url(url, cache_dir=tmp_path, pool=pool)
+        await fetch_url(url, cache_dir=tmp_path, pool=pool)
+
+        assert "If-None-Match" not in server.requests[1][1]
+        assert not list(tmp_path.rglob("*.http"))
+
+    async def test_response_without_validators_is_not_cached(
+        self, server, pool, tmp_path
+    ):
+        url = f"{server.base}/dynamic"
+        await fetch_url(url, cache_dir=tmp_path, pool=pool)
+        await fetch_url(url, cache_dir=tmp_path, pool=pool)
+
+        assert len(server.requests) == 2
+        assert not list(tmp_path.rglob("*.http"))
+
+    async def test_no_cache_dir_disables_cache(self, server, pool):
+        server.extra_headers["/static"] = {"Cache-Control": "max-age=60"}
+        url = f"{server.base}/static"
+
+        await fetch_url(url, pool=pool)
+        await fetch_url(url, pool=pool)
+
+        assert len(server.requests) == 2
+
+
+class TestAggregatorUrlInput:
+    """URL inputs of context aggregators use the project's cache."""
+
+    async def test_second_run_revalidates(self, server, tmp_path):
+        server.etags["/docs"] = '"v1"'
+        ir = ContextAggregatorIR(
+            id="agg-1",
+            name="Docs",
+            config={
+                "aggregationMode": "pass",
+                "dynamicInputs": [
+                    {
+                        "id": "u",
+                        "inputType": "url",
+                        "variableName": "docs",
+                        "url": f"{server.base}/docs",
+                    }
+                ],
+            },
+        )
+
+        first = await execute_context_aggregator(ir, str(tmp_path), {})
+        second = await execute_context_aggregator(ir, str(tmp_path), {})
+
+        assert first == second == {"output": {"docs": 'body of /docs "v1"'}}
+        assert server.requests[1][1]["If-None-Match"] == '"v1"'
+        assert list((tmp_path / URL_CACHE_DIR).rglob("*.http"))
@@ -332,6 +332,28 @@ class TestWorkflowRunnerRun:
             assert len(complete_events) == 1
             assert complete_events[0].data["output"] == "Test output"
 
+    @pytest.mark.asyncio
+    async def test_run_without_collecting_events(self, simple_project, mock_adk):
+        """collect_events=False leaves RunResult.events empty."""
+        callbacks = MockCallbacks()
+
+        with patch.object(
+            WorkflowRunner, "_execute", new_callable=AsyncMock
+        ) as mock_execute:
+            mock_execute.return_value = "Test output"
+
+            runner = WorkflowRunner()
+            config = RunConfig(
+                project_path=simple_project,
+                callbacks=callbacks,
+                collect_events=False,
+            )
+
+            result = await runner.run(config)
+
+        assert result.events == []
+        assert len(callbacks.events) == 2  # RUN_START and RUN_COMPLETE
+
     @pytest.mark.asyncio
     async def test_run_handles_cancellation(self, simple_project, mock_adk):
         """Run handles asyncio.CancelledError gracefully."""
@@ -430,6 +452,8 @@ class TestRunAsyncGenerator:
 
             # Verify we got items and didn't hang
             assert len(items) > 0
+            assert isinstance(items[-1], RunResult)
+            assert items[-1].output == "Output"
 
     @pytest.mark.asyncio
     async def test_generator_cancellation_cleanup(self, simple_project, mock_adk):
@@ -5,11 +5,12 @@ Tests collect_context_vars_for_session function and related session state logic.
 
 from __future__ import annotations
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from adkflow_runner.ir import AgentIR, WorkflowIR
+from adkflow_runner.ir import AgentIR, ContextAggregatorIR, WorkflowIR
 from adkflow_runner.runner.types import RunConfig
 from adkflow_runner.runner.workflow_runner import (
     WorkflowRunner,
@@ -351,3 +352,56 @@ class TestSessionStateInitialization:
             call_kwargs = mock_adk["session_service"].create_session.call_args[1]
             assert "state" in call_kwargs
             assert call_kwargs["state"] == {"topic": "nature"}
+
+    @pytest.mark.asyncio
+    async def test_context_aggregators_run_concurrently(
+        self, tmp_path, mock_adk, mock_hooks
+    ):
+        """Independent context aggregators overlap and feed their agents."""
+        agent = AgentIR(
+            id="a1",
+            name="Agent1",
+            type="llm",
+            model="gemini-2.0-flash",
+            instruction="{first} {second}",
+            context_var_sources=["agg-1", "agg-2"],
+        )
+        ir = WorkflowIR(
+            root_agent=agent,
+            all_agents={"a1": agent},
+            context_aggregators=[
+                ContextAggregatorIR(id="agg-1", name="First", config={}),
+                ContextAggregatorIR(id="agg-2", name="Second", config={}),
+            ],
+        )
+        active = 0
+        peak = 0
+
+        async def slow_aggregator(aggregator_ir, project_path, node_inputs):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            name = "first" if aggregator_ir.id == "agg-1" else "second"
+            return {"output": {name: aggregator_ir.name}}
+
+        async def mock_event_stream(*args, **kwargs):
+            return
+            yield
+
+        mock_adk["runner"].run_async = mock_event_stream
+
+        with (
+            patch(
+                "adkflow_runner.runner.workflow_runner.execute_context_aggregator",
+                side_effect=slow_aggregator,
+            ),
+            patch("adkflow_runner.runner.workflow_runner.AgentFactory"),
+        ):
+            runner = WorkflowRunner()
+            config = RunConfig(project_path=tmp_path, input_data={})
+            await runner._execute(ir, config, AsyncMock(), "run-123", mock_hooks)
+
+        assert peak == 2
+        assert agent.context_vars == {"first": "First", "second": "Second"}
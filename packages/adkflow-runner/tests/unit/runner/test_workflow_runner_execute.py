@@ -537,6 +537,66 @@ class TestWorkflowRunnerExecute:
 
             mock_format_error.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_execute_reuses_agent_tree_across_runs(
+        self, tmp_path, mock_adk, simple_ir, mock_hooks
+    ):
+        """A successful run returns its agent tree for the next run to rebind."""
+        with patch(
+            "adkflow_runner.runner.workflow_runner.AgentFactory"
+        ) as mock_factory_cls:
+            mock_agent = MagicMock()
+            mock_factory = MagicMock()
+            mock_factory.create_from_workflow.return_value = mock_agent
+            mock_factory.bind_run.return_value = mock_agent
+            mock_factory_cls.return_value = mock_factory
+
+            async def mock_event_stream(*args, **kwargs):
+                return
+                yield  # Make it an async generator
+
+            mock_adk["runner"].run_async = mock_event_stream
+
+            runner = WorkflowRunner()
+            config = RunConfig(project_path=tmp_path, input_data={})
+            first_emit, second_emit = AsyncMock(), AsyncMock()
+
+            await runner._execute(simple_ir, config, first_emit, "run-1", mock_hooks)
+            await runner._execute(simple_ir, config, second_emit, "run-2", mock_hooks)
+
+            mock_factory.create_from_workflow.assert_called_once()
+            mock_factory.bind_run.assert_any_call(emit=second_emit, hooks=mock_hooks)
+            assert runner.agent_pool is not None
+            assert runner.agent_pool.hits == 1
+
+    @pytest.mark.asyncio
+    async def test_execute_without_cache_builds_every_run(
+        self, tmp_path, mock_adk, simple_ir, mock_hooks
+    ):
+        """With caching disabled every run builds a fresh agent tree."""
+        with patch(
+            "adkflow_runner.runner.workflow_runner.AgentFactory"
+        ) as mock_factory_cls:
+            mock_factory = MagicMock()
+            mock_factory_cls.return_value = mock_factory
+
+            async def mock_event_stream(*args, **kwargs):
+                return
+                yield  # Make it an async generator
+
+            mock_adk["runner"].run_async = mock_event_stream
+
+            runner = WorkflowRunner(enable_cache=False)
+            config = RunConfig(project_path=tmp_path, input_data={})
+
+            for run_id in ("run-1", "run-2"):
+                await runner._execute(
+                    simple_ir, config, AsyncMock(), run_id, mock_hooks
+                )
+
+            assert mock_factory.create_from_workflow.call_count == 2
+            mock_factory.bind_run.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_execute_with_post_agent_custom_nodes_includes_finish_reason(
         self, tmp_path, mock_adk, mock_hooks
@@ -0,0 +1,173 @@
+"""Tests for edge rule compilation in ExecutionConfig."""
+
+import time
+
+import pytest
+
+from adkflow_runner.config import (
+    DEFAULT_EDGE_RULES,
+    SEMANTICS_CACHE_SIZE,
+    EdgeRule,
+    EdgeSemantics,
+    ExecutionConfig,
+)
+
+_EDGE_KINDS = [
+    ("prompt", "agent", "output", "input"),
+    ("agent", "agent", "output", "agent-input"),
+    ("agent", "agent", "plug", "sub-agents"),
+    ("tool", "agent", "output", "tools"),
+    ("agent", "callback", "after_model_callback", "input"),
+    ("custom:thing", "agent", "out", "in"),
+]
+
+
+def _linear_lookup(
+    rules: list[EdgeRule],
+    source_type: str,
+    target_type: str,
+    source_handle: str | None,
+    target_handle: str | None,
+) -> EdgeSemantics:
+    """Reference implementation: scan rules sorted by priority."""
+    for rule in sorted(rules, key=lambda r: -r.priority):
+        if (
+            rule.source_type == source_type
+            and rule.target_type == target_type
+            and rule.source_handle in (None, source_handle)
+            and rule.target_handle in (None, target_handle)
+        ):
+            return rule.semantics
+    return EdgeSemantics.UNKNOWN
+
+
+class TestEdgeSemantics:
+    """Tests for ExecutionConfig.get_edge_semantics."""
+
+    def test_matches_reference_for_default_rules(self):
+        config = ExecutionConfig()
+        types = {r.source_type for r in DEFAULT_EDGE_RULES} | {
+            r.target_type for r in DEFAULT_EDGE_RULES
+        }
+        handles = {None, "output", "input", "agent-input", "plug", "sub-agents"}
+        handles |= {r.source_handle for r in DEFAULT_EDGE_RULES}
+        handles |= {r.target_handle for r in DEFAULT_EDGE_RULES}
+
+        for source_type in types:
+            for target_type in types:
+                for source_handle in handles:
+                    for target_handle in ("input", "agent-input", None):
+                        assert config.get_edge_semantics(
+                            source_type, target_type, source_handle, target_handle
+                        ) == _linear_lookup(
+                            DEFAULT_EDGE_RULES,
+                            source_type,
+                            target_type,
+                            source_handle,
+                            target_handle,
+                        )
+
+    def test_handle_specific_override_by_priority(self):
+        config = ExecutionConfig(edge_rules=[])
+        config.add_rule(EdgeRule("a", "b", semantics=EdgeSemantics.CONTEXT, priority=1))
+        config.add_rule(
+            EdgeRule(
+                "a",
+                "b",
+                source_handle="special",
+                semantics=EdgeSemantics.TOOL,
+                priority=5,
+            )
+        )
+
+        assert config.get_edge_semantics("a", "b", "special") == EdgeSemantics.TOOL
+        assert config.get_edge_semantics("a", "b", "other") == EdgeSemantics.CONTEXT
+
+    def test_equal_priority_keeps_declaration_order(self):
+        config = ExecutionConfig(
+            edge_rules=[
+                EdgeRule("a", "b", semantics=EdgeSemantics.CONTEXT),
+                EdgeRule("a", "b", semantics=EdgeSemantics.TOOL),
+            ]
+        )
+        assert config.get_edge_semantics("a", "b") == EdgeSemantics.CONTEXT
+
+    def test_add_rule_invalidates_cached_result(self):
+        config = ExecutionConfig()
+        assert config.get_edge_semantics("foo", "agent") == EdgeSemantics.UNKNOWN
+
+        config.add_rule(EdgeRule("foo", "agent", semantics=EdgeSemantics.CONTEXT))
+        assert config.get_edge_semantics("foo", "agent") == EdgeSemantics.CONTEXT
+
+    def test_remove_rules_for_invalidates_cached_result(self):
+        config = ExecutionConfig()
+        assert config.get_edge_semantics("prompt", "agent") == EdgeSemantics.INSTRUCTION
+
+        config.remove_rules_for("prompt", "agent")
+        assert config.get_edge_semantics("prompt", "agent") == EdgeSemantics.UNKNOWN
+
+    def test_direct_append_is_picked_up(self):
+        config = ExecutionConfig()
+        config.get_edge_semantics("foo", "agent")
+
+        config.edge_rules.append(
+            EdgeRule("foo", "agent", semantics=EdgeSemantics.CONTEXT)
+        )
+        assert config.get_edge_semantics("foo", "agent") == EdgeSemantics.CONTEXT
+
+    def test_default_rules_not_shared(self):
+        config = ExecutionConfig()
+        config.add_rule(EdgeRule("foo", "agent", semantics=EdgeSemantics.CONTEXT))
+        assert ExecutionConfig().get_edge_semantics("foo", "agent") == (
+            EdgeSemantics.UNKNOWN
+        )
+
+    def test_semantics_cache_is_bounded(self):
+        config = ExecutionConfig()
+        for i in range(SEMANTICS_CACHE_SIZE + 100):
+            config.get_edge_semantics("agent", "agent", f"handle_{i}")
+
+        assert len(config._semantics_cache) == SEMANTICS_CACHE_SIZE
+        assert config.get_edge_semantics("agent", "agent", "handle_0") == (
+            _linear_lookup(DEFAULT_EDGE_RULES, "agent", "agent", "handle_0", None)
+        )
+
+
+class TestEdgeSemanticsLargeManifest:
+    """Compiled lookups agree with the rule scan on large manifests."""
+
+    def test_classifies_tens_of_thousands_of_edges(self):
+        edges = [_EDGE_KINDS[i % len(_EDGE_KINDS)] for i in range(50_000)]
+        config = ExecutionConfig()
+
+        compiled = [config.get_edge_semantics(*edge) for edge in edges]
+        reference = [_linear_lookup(DEFAULT_EDGE_RULES, *edge) for edge in edges]
+
+        assert compiled == reference
+
+
+@pytest.mark.slow
+class TestEdgeSemanticsBenchmark:
+    """Micro-benchmark for classifying large manifests."""
+
+    @staticmethod
+    def _best_of(runs: int, func) -> float:
+        best = float("inf")
+        for _ in range(runs):
+            start = time.perf_counter()
+            func()
+            best = min(best, time.perf_counter() - start)
+        return best
+
+    def test_compiled_lookup_beats_rule_scan(self):
+        edges = [_EDGE_KINDS[i % len(_EDGE_KINDS)] for i in range(50_000)]
+        config = ExecutionConfig()
+
+        compiled_time = self._best_of(
+            3, lambda: [config.get_edge_semantics(*edge) for edge in edges]
+        )
+        reference_time = self._best_of(
+            3, lambda: [_linear_lookup(DEFAULT_EDGE_RULES, *e) for e in edges]
+        )
+
+        assert compiled_time < reference_time